@@ -0,0 +1,118 @@
+"""Сравнение циклов событий и резолверов при большом числе соединений.
+
+Запуск: `uv run python -m benchmarks.loop_dns [--requests N] [--concurrency N]`.
+Локальный HTTP-сервер работает в отдельном потоке, а клиент открывает
+новое соединение на каждый запрос, чтобы каждый раз разрешалось имя хоста.
+"""
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    AsyncHTTPTransport,
+    Limits,
+    Timeout,
+)
+
+from videos_cleaner.adapters.repositories.network import caching_transport
+from videos_cleaner.controller.loop import run
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok"
+
+
+async def _respond(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    _ = await reader.readuntil(b"\r\n\r\n")
+    writer.write(RESPONSE)
+    await writer.drain()
+    writer.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@contextmanager
+def _server(port: int) -> Iterator[None]:
+    try:
+        import uvloop  # noqa: PLC0415
+
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = asyncio.run_coroutine_threadsafe(
+        asyncio.start_server(_respond, "localhost", port, backlog=4096), loop
+    ).result()
+    try:
+        yield
+    finally:
+        _ = loop.call_soon_threadsafe(server.close)
+        _ = loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+async def _sweep(
+    url: str, requests: int, concurrency: int, *, async_dns: bool
+) -> float:
+    transport: AsyncBaseTransport = (
+        caching_transport(0, async_dns=True) if async_dns else AsyncHTTPTransport()
+    )
+    limits = Limits(max_connections=concurrency, max_keepalive_connections=0)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request() -> None:
+        async with semaphore:
+            _ = (await client.get(url)).raise_for_status()
+
+    async with AsyncClient(
+        transport=transport, limits=limits, timeout=Timeout(60)
+    ) as client:
+        started = time.perf_counter()
+        _ = await asyncio.gather(*(request() for _ in range(requests)))
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    """Вывести время и пропускную способность для каждой конфигурации."""
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument("--requests", type=int, default=5000)
+    _ = parser.add_argument("--concurrency", type=int, default=500)
+    args = parser.parse_args()
+    port = _free_port()
+    url = f"http://localhost:{port}/"
+
+    with _server(port):
+        print(f"{'loop':<8} {'resolver':<9} {'seconds':>8} {'req/s':>8}")
+        for fast_loop in (False, True):
+            for async_dns in (False, True):
+                elapsed = run(
+                    partial(
+                        _sweep,
+                        url,
+                        args.requests,
+                        args.concurrency,
+                        async_dns=async_dns,
+                    ),
+                    fast_loop=fast_loop,
+                )
+                print(
+                    f"{'uvloop' if fast_loop else 'asyncio':<8} "
+                    f"{'aiodns' if async_dns else 'system':<9} "
+                    f"{elapsed:>8.2f} {args.requests / elapsed:>8.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
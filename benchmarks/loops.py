@@ -0,0 +1,114 @@
+"""Сравнение обхода одним и несколькими циклами событий в потоках.
+
+Запуск: `uv run python -m benchmarks.loops [--videos N] [--loops N]`.
+API видео — локальный HTTP-сервер в отдельном потоке, ответы oEmbed
+подставляются без сети. Выигрыш от нескольких циклов возможен только в
+сборке Python без GIL (`python3.13t`); с GIL запускается один цикл.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlsplit
+
+import respx
+import structlog
+from httpx import Response
+
+from videos_cleaner.controller.runner import CleanerConfig, SweepSettings
+from videos_cleaner.controller.threads import (
+    gil_enabled,
+    loop_count,
+    sweep_threaded,
+)
+
+
+def _page(target: str, total: int) -> bytes:
+    query = parse_qs(urlsplit(target).query)
+    skip = int(query.get("skip", ["0"])[0])
+    limit = int(query.get("limit", ["50"])[0])
+    body = json.dumps(
+        [
+            {"slug": f"video-{i}", "yt_id": f"yt-{i}", "deleted": False}
+            for i in range(skip, min(skip + limit, total))
+        ]
+    ).encode()
+    return (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        + f"X-Total-Count: {total}\r\nContent-Length: {len(body)}\r\n".encode()
+        + b"Connection: close\r\n\r\n"
+        + body
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@contextmanager
+def _server(port: int, total: int) -> Iterator[None]:
+    async def respond(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        head = await reader.readuntil(b"\r\n\r\n")
+        target = head.split(b" ", 2)[1].decode()
+        writer.write(_page(target, total))
+        await writer.drain()
+        writer.close()
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = asyncio.run_coroutine_threadsafe(
+        asyncio.start_server(respond, "127.0.0.1", port, backlog=4096), loop
+    ).result()
+    try:
+        yield
+    finally:
+        _ = loop.call_soon_threadsafe(server.close)
+        _ = loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+def main() -> None:
+    """Вывести время и пропускную способность для каждого числа циклов."""
+    parser = argparse.ArgumentParser()
+    _ = parser.add_argument("--videos", type=int, default=20_000)
+    _ = parser.add_argument("--batch-size", type=int, default=500)
+    _ = parser.add_argument("--loops", type=int, default=4)
+    args = parser.parse_args()
+    port = _free_port()
+    settings = SweepSettings(
+        main_api_url=f"http://127.0.0.1:{port}",
+        limit=None,
+        batch_size=args.batch_size,
+    )
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+    print(f"GIL: {'включён' if gil_enabled() else 'выключен'}")
+    with _server(port, args.videos), respx.mock:
+        _ = respx.route(host="127.0.0.1").pass_through()
+        _ = respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        print(f"{'loops':<6} {'seconds':>8} {'videos/s':>9}")
+        for loops in dict.fromkeys((1, loop_count(args.loops))):
+            started = time.perf_counter()
+            stats = sweep_threaded(CleanerConfig(), settings, loops)
+            elapsed = time.perf_counter() - started
+            print(f"{loops:<6} {elapsed:>8.2f} {stats.total / elapsed:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
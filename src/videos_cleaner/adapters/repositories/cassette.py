@@ -0,0 +1,160 @@
+import asyncio
+import base64
+import json
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from enum import StrEnum
+from pathlib import Path
+from typing import TextIO, TypedDict, final, override
+
+from httpx import AsyncBaseTransport, Request, Response
+
+CASSETTE = "cassette.jsonl"
+SECRET_PARAMS = frozenset({"key"})
+
+
+class ReplayLatency(StrEnum):
+    """Задержка ответов при воспроизведении."""
+
+    ORIGINAL = "original"
+    ZERO = "zero"
+
+
+class Interaction(TypedDict):
+    """Записанный запрос и ответ."""
+
+    method: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    content: str
+    elapsed: float
+
+
+class CassetteMissError(LookupError):
+    """Запрос отсутствует в записи."""
+
+    def __init__(self, request: Request) -> None:
+        super().__init__(f"Запрос не найден в записи: {request.method} {_url(request)}")
+
+
+def read_cassette(directory: Path) -> Iterator[Interaction]:
+    """Записанные запросы и ответы по порядку.
+
+    Args:
+        directory: Каталог записи.
+    """
+    with (directory / CASSETTE).open(encoding="utf-8") as file:
+        for line in file:
+            interaction: Interaction = json.loads(line)
+            yield interaction
+
+
+def _url(request: Request) -> str:
+    """URL запроса без секретных параметров (ключей API)."""
+    url = request.url
+    for param in SECRET_PARAMS & set(url.params.keys()):
+        url = url.copy_remove_param(param)
+    return str(url)
+
+
+@final
+class RecordingTransport(AsyncBaseTransport):
+    """Транспорт, записывающий запросы, ответы и их длительность."""
+
+    def __init__(self, transport: AsyncBaseTransport, directory: Path) -> None:
+        """Конструктор.
+
+        Args:
+            transport: Транспорт, выполняющий запросы.
+            directory: Каталог записи.
+        """
+        self._transport = transport
+        self._directory = directory
+        self._file: TextIO | None = None
+
+    def _write(self, interaction: Interaction) -> None:
+        if self._file is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._file = (self._directory / CASSETTE).open("a", encoding="utf-8")
+        _ = self._file.write(json.dumps(interaction, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        if response.is_stream_consumed:
+            content = response.content
+        else:
+            try:
+                content = b"".join([chunk async for chunk in response.aiter_raw()])
+            finally:
+                await response.aclose()
+        elapsed = time.perf_counter() - started
+
+        self._write(
+            Interaction(
+                method=request.method,
+                url=_url(request),
+                status=response.status_code,
+                headers=response.headers.multi_items(),
+                content=base64.b64encode(content).decode(),
+                elapsed=elapsed,
+            )
+        )
+        return Response(
+            response.status_code,
+            headers=response.headers,
+            content=content,
+            extensions=response.extensions,
+        )
+
+    @override
+    async def aclose(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        await self._transport.aclose()
+
+
+@final
+class ReplayTransport(AsyncBaseTransport):
+    """Транспорт, отвечающий записанными ответами без обращения к сети.
+
+    Одинаковые запросы получают записанные ответы по порядку, последний
+    ответ повторяется.
+    """
+
+    def __init__(
+        self, directory: Path, latency: ReplayLatency = ReplayLatency.ORIGINAL
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            directory: Каталог записи.
+            latency: Задержка ответов.
+        """
+        self._latency = latency
+        self._interactions: defaultdict[tuple[str, str], deque[Interaction]] = (
+            defaultdict(deque)
+        )
+        for interaction in read_cassette(directory):
+            key = (interaction["method"], interaction["url"])
+            self._interactions[key].append(interaction)
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        recorded = self._interactions.get((request.method, _url(request)))
+        if not recorded:
+            raise CassetteMissError(request)
+        interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+        if self._latency == ReplayLatency.ORIGINAL:
+            await asyncio.sleep(interaction["elapsed"])
+        return Response(
+            interaction["status"],
+            headers=interaction["headers"],
+            content=base64.b64decode(interaction["content"]),
+        )
@@ -0,0 +1,166 @@
+from collections.abc import Sequence
+from itertools import batched
+from typing import Any, Literal, TypedDict, final, override
+from xml.etree import ElementTree as ET
+
+from httpx import AsyncClient, codes
+
+from videos_cleaner.adapters.repositories.meta_repository import (
+    QUOTA_REASONS,
+    error_reasons,
+)
+from videos_cleaner.adapters.repositories.network import YOUTUBE_DATA_API_URL
+from videos_cleaner.adapters.repositories.quota import QuotaAccountant
+from videos_cleaner.domain.interfaces.channel_repository import IChannelRepository
+from videos_cleaner.domain.interfaces.meta_repository import (
+    MetaRepositoryError,
+    UnauthorizedError,
+)
+
+FEED_NAMESPACES = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+}
+
+type PlaylistItem = dict[
+    Literal["contentDetails", "status"], dict[Literal["videoId", "privacyStatus"], str]
+]
+
+
+class VideoItem(TypedDict):
+    """Видео из ответа `videos.list` YouTube Data API."""
+
+    id: str
+    status: dict[Literal["embeddable"], bool]
+
+
+class VideosPage(TypedDict, total=False):
+    """Ответ `videos.list` YouTube Data API."""
+
+    items: list[VideoItem]
+
+
+class PlaylistPage(TypedDict, total=False):
+    """Страница плейлиста YouTube Data API."""
+
+    nextPageToken: str
+    items: list[PlaylistItem]
+
+
+def uploads_playlist(channel_id: str) -> str:
+    """Плейлист загрузок канала (UCxxx → UUxxx)."""
+    return f"UU{channel_id.removeprefix('UC')}"
+
+
+@final
+class YoutubeDataApiChannelRepository(IChannelRepository):
+    """Списки видео каналов из плейлиста загрузок YouTube Data API.
+
+    Один запрос (1 единица квоты) возвращает до 50 видео. Встраивание
+    публичных видео проверяется запросами `videos.list` по 50 видео (ещё
+    1 единица); видео с запретом встраивания в список не попадают.
+    """
+
+    def __init__(
+        self,
+        key: str | Sequence[str],
+        client: AsyncClient,
+        quota: QuotaAccountant | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            key: Ключ или несколько ключей YouTube Data API.
+            client: HTTP клиент.
+            quota: Учёт квоты (по умолчанию — в памяти по переданным ключам).
+        """
+        keys = [key] if isinstance(key, str) else list(key)
+        self._quota = quota or QuotaAccountant(keys)
+        self._client = client
+
+    async def _get(self, url: str, params: dict[str, str | int]) -> Any:  # noqa: ANN401
+        """Выполнить запрос, переходя к следующему ключу при исчерпании квоты."""
+        while True:
+            key = self._quota.acquire()
+            response = await self._client.get(url, params={**params, "key": key})
+            match response.status_code:
+                case 200:
+                    return response.json()
+                case 403 if error_reasons(response) & QUOTA_REASONS:
+                    self._quota.exhaust(key)
+                case 403:
+                    raise UnauthorizedError
+                case code:
+                    raise MetaRepositoryError(response.text, code)
+
+    async def _public_ids(self, channel_id: str) -> list[str]:
+        """Публичные видео плейлиста загрузок канала."""
+        result: list[str] = []
+        page_token = ""
+        while True:
+            data: PlaylistPage = await self._get(
+                f"{YOUTUBE_DATA_API_URL}/youtube/v3/playlistItems",
+                {
+                    "part": "contentDetails,status",
+                    "playlistId": uploads_playlist(channel_id),
+                    "maxResults": 50,
+                    "pageToken": page_token,
+                    "fields": "nextPageToken,"
+                    "items(contentDetails/videoId,status/privacyStatus)",
+                },
+            )
+            result.extend(
+                item["contentDetails"]["videoId"]
+                for item in data.get("items", [])
+                if item["status"]["privacyStatus"] == "public"
+            )
+            page_token = data.get("nextPageToken", "")
+            if not page_token:
+                return result
+
+    @override
+    async def live_ids(self, channel_id: str) -> set[str]:
+        result: set[str] = set()
+        for ids in batched(await self._public_ids(channel_id), 50, strict=False):
+            data: VideosPage = await self._get(
+                f"{YOUTUBE_DATA_API_URL}/youtube/v3/videos",
+                {
+                    "part": "status",
+                    "id": ",".join(ids),
+                    "maxResults": 50,
+                    "fields": "items(id,status/embeddable)",
+                },
+            )
+            result.update(
+                item["id"]
+                for item in data.get("items", [])
+                if item["status"]["embeddable"]
+            )
+        return result
+
+
+@final
+class FeedChannelRepository(IChannelRepository):
+    """Списки видео каналов из публичной ленты канала.
+
+    Не расходует квоту, но лента содержит только 15 последних видео.
+    """
+
+    def __init__(self, client: AsyncClient) -> None:
+        self._client = client
+
+    @override
+    async def live_ids(self, channel_id: str) -> set[str]:
+        response = await self._client.get(
+            "https://www.youtube.com/feeds/videos.xml",
+            params={"channel_id": channel_id},
+        )
+        if response.status_code != codes.OK:
+            raise MetaRepositoryError(response.text, response.status_code)
+
+        root = ET.fromstring(response.content)  # noqa: S314
+        return {
+            element.text
+            for element in root.iterfind("atom:entry/yt:videoId", FEED_NAMESPACES)
+            if element.text
+        }
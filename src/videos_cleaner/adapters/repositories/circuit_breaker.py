@@ -0,0 +1,307 @@
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from enum import Enum, auto
+from typing import Annotated, final, override
+
+import structlog
+from httpx import HTTPError
+from wireup import Inject, service
+
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+    MetaRepositoryError,
+    MetaRepositoryUnavailableError,
+)
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoRepositoryUnavailableError,
+    VideoRepostiryError,
+)
+from videos_cleaner.entities.cleaner import HedgeCounters
+from videos_cleaner.entities.video import Video, VideoList, VideoStream
+
+logger = structlog.stdlib.get_logger(__name__)
+
+TOO_MANY_REQUESTS = 429
+SERVER_ERROR = 500
+
+
+class CircuitState(Enum):
+    """Состояние предохранителя."""
+
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+@final
+class CircuitBreaker:
+    """Предохранитель для вызовов внешнего сервиса.
+
+    Размыкается, когда доля ошибок в скользящем окне последних вызовов
+    достигает порога. Через `reset_timeout` секунд пропускает один пробный
+    вызов: успех замыкает предохранитель, ошибка снова размыкает.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        *,
+        error_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            name: Название сервиса (для логов).
+            error_ratio: Доля ошибок, при которой предохранитель размыкается.
+            window: Размер скользящего окна вызовов.
+            min_calls: Минимальное количество вызовов в окне для оценки.
+            reset_timeout: Время в секундах до пробного вызова.
+            clock: Источник монотонного времени.
+        """
+        self.name = name
+        self._error_ratio = error_ratio
+        self._min_calls = min(min_calls, window)
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Текущее состояние с учётом истечения таймаута."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Можно ли выполнить вызов."""
+        match self.state:
+            case CircuitState.CLOSED:
+                return True
+            case CircuitState.HALF_OPEN if not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            case _:
+                return False
+
+    def record_success(self) -> None:
+        """Зафиксировать успешный вызов."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info("Предохранитель замкнут", upstream=self.name)
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Зафиксировать ошибку вызова."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+
+        self._outcomes.append(False)
+        failures = self._outcomes.count(False)
+        if (
+            self._state == CircuitState.CLOSED
+            and len(self._outcomes) >= self._min_calls
+            and failures / len(self._outcomes) >= self._error_ratio
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        logger.warning("Предохранитель разомкнут", upstream=self.name)
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._outcomes.clear()
+
+
+def _is_upstream_failure(code: int) -> bool:
+    return code == TOO_MANY_REQUESTS or code >= SERVER_ERROR
+
+
+def _record_error(breaker: CircuitBreaker, error: VideoRepostiryError) -> None:
+    """Учесть ошибку API видео: сбоем считаются только ошибки сервиса."""
+    if _is_upstream_failure(error.code):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+@final
+@service
+class CircuitBreakerMetaRepository(IMetaRepository):
+    """Репозиторий мета информации, защищённый предохранителем."""
+
+    def __init__(
+        self,
+        repo: Annotated[IMetaRepository, Inject(qualifier="probe")],
+        error_ratio: Annotated[float, Inject(param="breaker_error_ratio")] = 0.5,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            repo: Защищаемый репозиторий.
+            error_ratio: Доля ошибок, при которой предохранитель размыкается.
+        """
+        self._repo = repo
+        self.breaker = CircuitBreaker(type(repo).__name__, error_ratio=error_ratio)
+
+    async def _guard[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        if not self.breaker.allow():
+            raise MetaRepositoryUnavailableError
+        try:
+            result = await call()
+        except HTTPError as e:
+            self.breaker.record_failure()
+            raise MetaRepositoryUnavailableError(str(e)) from e
+        except MetaRepositoryError as e:
+            if _is_upstream_failure(e.code):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return result
+
+    @override
+    async def is_exists(self, yt_id: str) -> ExistsStatus:
+        return await self._guard(lambda: self._repo.is_exists(yt_id))
+
+    @override
+    async def is_embeddable(self, yt_id: str) -> bool:
+        return await self._guard(lambda: self._repo.is_embeddable(yt_id))
+
+    @override
+    def remaining_quota(self) -> int | None:
+        return self._repo.remaining_quota()
+
+    @override
+    def hedge_counters(self) -> HedgeCounters | None:
+        return self._repo.hedge_counters()
+
+
+@final
+class _GuardedVideos(AsyncIterator[Video]):
+    """Видео страницы, ошибки чтения которых учитывает предохранитель.
+
+    Страница считается прочитанной успешно, если тело ответа дочитано или
+    закрыто без ошибки (например, после достижения лимита).
+    """
+
+    def __init__(self, videos: AsyncIterator[Video], breaker: CircuitBreaker) -> None:
+        self._videos = videos
+        self._breaker = breaker
+        self._settled = False
+
+    @override
+    async def __anext__(self) -> Video:
+        try:
+            return await anext(self._videos)
+        except StopAsyncIteration:
+            self.settle()
+            raise
+        except HTTPError as e:
+            self._settled = True
+            self._breaker.record_failure()
+            raise VideoRepositoryUnavailableError(str(e)) from e
+        except VideoRepostiryError as e:
+            self._settled = True
+            _record_error(self._breaker, e)
+            raise
+
+    def settle(self) -> None:
+        """Учесть успешное чтение, если исход страницы ещё не учтён."""
+        if not self._settled:
+            self._settled = True
+            self._breaker.record_success()
+
+
+@final
+class CircuitBreakerVideoRepository(IVideoRepository):
+    """Репозиторий видео, защищённый предохранителями.
+
+    Чтение списка и изменения видео защищены разными предохранителями:
+    ошибки изменений не останавливают чтение страниц, и наоборот.
+    """
+
+    def __init__(self, repo: IVideoRepository, error_ratio: float = 0.5) -> None:
+        """Конструктор.
+
+        Args:
+            repo: Защищаемый репозиторий.
+            error_ratio: Доля ошибок, при которой предохранитель размыкается.
+        """
+        self._repo = repo
+        name = type(repo).__name__
+        self.breaker = CircuitBreaker(name, error_ratio=error_ratio)
+        self.read_breaker = CircuitBreaker(f"{name}.read", error_ratio=error_ratio)
+
+    @staticmethod
+    async def _guard[T](
+        breaker: CircuitBreaker,
+        call: Callable[[], Awaitable[T]],
+        *,
+        settle: bool = True,
+    ) -> T:
+        if not breaker.allow():
+            raise VideoRepositoryUnavailableError
+        try:
+            result = await call()
+        except HTTPError as e:
+            breaker.record_failure()
+            raise VideoRepositoryUnavailableError(str(e)) from e
+        except VideoRepostiryError as e:
+            _record_error(breaker, e)
+            raise
+        if settle:
+            breaker.record_success()
+        return result
+
+    @override
+    async def get_all(self, offset: int = 0, *, limit: int = 50) -> VideoList:
+        return await self._guard(
+            self.read_breaker, lambda: self._repo.get_all(offset, limit=limit)
+        )
+
+    @override
+    @asynccontextmanager
+    async def stream(
+        self, offset: int = 0, *, limit: int = 50
+    ) -> AsyncIterator[VideoStream]:
+        async with AsyncExitStack() as stack:
+            page = await self._guard(
+                self.read_breaker,
+                lambda: stack.enter_async_context(
+                    self._repo.stream(offset, limit=limit)
+                ),
+                settle=False,
+            )
+            videos = _GuardedVideos(page.videos, self.read_breaker)
+            try:
+                yield VideoStream(total_count=page.total_count, videos=videos)
+            finally:
+                videos.settle()
+
+    @override
+    async def delete(self, slug: str, *, temporary: bool = True) -> None:
+        await self._guard(
+            self.breaker, lambda: self._repo.delete(slug, temporary=temporary)
+        )
+
+    @override
+    async def restore(self, slug: str) -> None:
+        await self._guard(self.breaker, lambda: self._repo.restore(slug))
@@ -0,0 +1,118 @@
+import sqlite3
+from datetime import datetime
+from typing import final, override
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.dead_letter_repository import (
+    IDeadLetterRepository,
+)
+from videos_cleaner.entities.dead_letter import DeadLetter
+from videos_cleaner.entities.video import Video
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    target TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    yt_id TEXT NOT NULL,
+    deleted INTEGER NOT NULL,
+    error TEXT NOT NULL,
+    first_failed TEXT NOT NULL,
+    last_failed TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    PRIMARY KEY (target, slug)
+);
+CREATE INDEX IF NOT EXISTS dead_letters_last_failed
+    ON dead_letters (target, last_failed);
+"""
+
+COLUMNS = "slug, yt_id, deleted, error, first_failed, last_failed, attempts"
+
+type Row = tuple[str, str, int, str, str, str, int]
+
+
+def _to_letter(row: Row) -> DeadLetter:
+    slug, yt_id, deleted, error, first_failed, last_failed, attempts = row
+    return DeadLetter(
+        slug,
+        yt_id,
+        bool(deleted),
+        error,
+        datetime.fromisoformat(first_failed),
+        datetime.fromisoformat(last_failed),
+        attempts,
+    )
+
+
+@final
+class DeadLetterRepository(IDeadLetterRepository):
+    """Хранилище неудачно обработанных видео в локальной базе состояния."""
+
+    def __init__(
+        self,
+        state: StateDatabase,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+            target: API видео, к которому относятся записи.
+        """
+        self._state = state
+        self._target = target
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def record(self, video: Video, error: str, now: datetime) -> DeadLetter:
+        connection = self._connection()
+        with connection:
+            row: Row | None = connection.execute(
+                f"SELECT {COLUMNS} FROM dead_letters WHERE target = ? AND slug = ?",  # noqa: S608
+                (self._target, video.slug),
+            ).fetchone()
+            letter = (
+                _to_letter(row).fail(video, error, now)
+                if row
+                else DeadLetter.first(video, error, now)
+            )
+            _ = connection.execute(
+                "INSERT OR REPLACE INTO dead_letters VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._target,
+                    letter.slug,
+                    letter.yt_id,
+                    letter.deleted,
+                    letter.error,
+                    letter.first_failed.isoformat(),
+                    letter.last_failed.isoformat(),
+                    letter.attempts,
+                ),
+            )
+        return letter
+
+    @override
+    async def discard(self, slug: str) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "DELETE FROM dead_letters WHERE target = ? AND slug = ?",
+                (self._target, slug),
+            )
+
+    @override
+    async def due(
+        self, failed_before: datetime, max_attempts: int, limit: int
+    ) -> list[DeadLetter]:
+        rows: list[Row] = (
+            self._connection()
+            .execute(
+                f"SELECT {COLUMNS} FROM dead_letters "  # noqa: S608
+                "WHERE target = ? AND last_failed < ? AND attempts < ? "
+                "ORDER BY last_failed LIMIT ?",
+                (self._target, failed_before.isoformat(), max_attempts, limit),
+            )
+            .fetchall()
+        )
+        return [_to_letter(row) for row in rows]
@@ -0,0 +1,57 @@
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import final, override
+
+from wireup import service
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.dirty_set import IDirtySet
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirty_videos (
+    yt_id TEXT PRIMARY KEY,
+    marked TEXT NOT NULL
+);
+"""
+
+
+@final
+@service
+class DirtySetRepository(IDirtySet):
+    """Изменившиеся видео в локальной базе состояния."""
+
+    def __init__(self, state: StateDatabase) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+        """
+        self._state = state
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def mark(self, yt_ids: Iterable[str], now: datetime) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.executemany(
+                "INSERT INTO dirty_videos (yt_id, marked) VALUES (?, ?) "
+                "ON CONFLICT (yt_id) DO UPDATE SET marked = excluded.marked",
+                ((yt_id, now.isoformat()) for yt_id in yt_ids),
+            )
+
+    @override
+    async def pending(self) -> frozenset[str]:
+        rows = self._connection().execute("SELECT yt_id FROM dirty_videos")
+        return frozenset(yt_id for (yt_id,) in rows)
+
+    @override
+    async def clear(self, yt_ids: Iterable[str], before: datetime) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.executemany(
+                "DELETE FROM dirty_videos WHERE yt_id = ? AND marked < ?",
+                ((yt_id, before.isoformat()) for yt_id in yt_ids),
+            )
@@ -1,11 +1,68 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Annotated
 
-from httpx import AsyncClient
-from wireup import service
+from httpx import AsyncBaseTransport, AsyncClient, AsyncHTTPTransport
+from wireup import Inject, service
+
+from videos_cleaner.adapters.repositories.cassette import (
+    RecordingTransport,
+    ReplayLatency,
+    ReplayTransport,
+)
+from videos_cleaner.adapters.repositories.network import (
+    HTTP_LIMITS,
+    GaugedTransport,
+    RequestGauge,
+    caching_transport,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
 
 
 @service
-async def make_http_client() -> AsyncIterator[AsyncClient]:
-    """Создаёт http клиент."""
-    async with AsyncClient() as client:
+async def make_http_client(  # noqa: PLR0913, PLR0917
+    gauge: RequestGauge,
+    record: Annotated[str | None, Inject(param="record")] = None,
+    replay: Annotated[str | None, Inject(param="replay")] = None,
+    replay_latency: Annotated[
+        ReplayLatency, Inject(param="replay_latency")
+    ] = ReplayLatency.ORIGINAL,
+    dns_ttl: Annotated[float, Inject(param="dns_ttl")] = 0,
+    async_dns: Annotated[bool, Inject(param="async_dns")] = False,  # noqa: FBT002
+) -> AsyncIterator[AsyncClient]:
+    """Создаёт http клиент.
+
+    Args:
+        gauge: Учёт выполняющихся запросов.
+        record: Каталог для записи запросов и ответов.
+        replay: Каталог с записью, ответы из которой заменяют сеть.
+        replay_latency: Задержка ответов при воспроизведении.
+        dns_ttl: Время жизни записей кэша DNS в секундах (0 — без кэша).
+        async_dns: Получать адреса хостов через асинхронный резолвер.
+    """
+    transport: AsyncBaseTransport | None = None
+    if replay:
+        transport = ReplayTransport(Path(replay), replay_latency)
+    else:
+        if dns_ttl > 0 or async_dns:
+            transport = caching_transport(dns_ttl, async_dns=async_dns)
+        if record:
+            transport = RecordingTransport(
+                transport or AsyncHTTPTransport(limits=HTTP_LIMITS), Path(record)
+            )
+
+    transport = GaugedTransport(
+        transport or AsyncHTTPTransport(limits=HTTP_LIMITS), gauge
+    )
+    async with AsyncClient(transport=transport) as client:
         yield client
+
+
+@service
+def make_state_database(
+    path: Annotated[str, Inject(param="state_path")],
+) -> Iterator[StateDatabase]:
+    """Создаёт базу состояния."""
+    database = StateDatabase(path)
+    yield database
+    database.close()
@@ -0,0 +1,145 @@
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Annotated, final, override
+
+import structlog
+from wireup import Inject, service
+
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+)
+from videos_cleaner.entities.cleaner import HedgeCounters
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@final
+class LatencyWindow:
+    """Скользящее окно длительностей запросов."""
+
+    def __init__(self, size: int = 200, min_samples: int = 20) -> None:
+        """Конструктор.
+
+        Args:
+            size: Количество последних запросов в окне.
+            min_samples: Минимальное количество замеров для оценки.
+        """
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+
+    def add(self, elapsed: float) -> None:
+        """Добавить длительность запроса."""
+        self._samples.append(elapsed)
+
+    def percentile(self, q: float) -> float | None:
+        """Перцентиль длительности (None, пока замеров недостаточно).
+
+        Args:
+            q: Доля от 0 до 1.
+        """
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+@final
+@service(qualifier="probe")
+class HedgingMetaRepository(IMetaRepository):
+    """Репозиторий мета информации с дублирующими (hedged) запросами.
+
+    Если проверка не ответила за `percentile` наблюдаемых длительностей,
+    отправляется такой же запрос; используется первый ответ, второй
+    запрос отменяется. Дублирующих запросов не больше `budget` от всех.
+    При `percentile` 0 запросы передаются как есть.
+    """
+
+    def __init__(
+        self,
+        repo: Annotated[IMetaRepository, Inject(qualifier="oembed")],
+        percentile: Annotated[float, Inject(param="hedge_percentile")] = 0.95,
+        budget: Annotated[float, Inject(param="hedge_budget")] = 0.05,
+        window: LatencyWindow | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            repo: Репозиторий, запросы которого дублируются.
+            percentile: Перцентиль длительности, после которого запрос
+                дублируется (0 — не дублировать).
+            budget: Наибольшая доля дублирующих запросов.
+            window: Окно длительностей запросов.
+        """
+        self._repo = repo
+        self._percentile = percentile
+        self._budget = budget
+        self._window = window or LatencyWindow()
+        self._requests = 0
+        self._hedges = 0
+        self._wins = 0
+
+    def _delay(self) -> float | None:
+        """Задержка перед дублирующим запросом (None — не дублировать)."""
+        if self._hedges + 1 > self._budget * self._requests:
+            return None
+        return self._window.percentile(self._percentile)
+
+    async def _first_success[T](self, tasks: set[asyncio.Task[T]]) -> asyncio.Task[T]:
+        """Первый успешно завершившийся запрос (или последний с ошибкой)."""
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if not pending or task.exception() is None:
+                    return task
+
+    async def _hedged[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        if self._percentile <= 0:
+            return await call()
+        self._requests += 1
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(call())
+        tasks = {primary}
+        try:
+            delay = self._delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    self._hedges += 1
+                    tasks.add(asyncio.ensure_future(call()))
+
+            winner = await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                _ = task.cancel()
+            _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+        if winner is not primary:
+            self._wins += 1
+            logger.debug("Дублирующий запрос ответил первым")
+        self._window.add(time.perf_counter() - started)
+        return winner.result()
+
+    @override
+    async def is_exists(self, yt_id: str) -> ExistsStatus:
+        return await self._hedged(lambda: self._repo.is_exists(yt_id))
+
+    @override
+    async def is_embeddable(self, yt_id: str) -> bool:
+        return await self._repo.is_embeddable(yt_id)
+
+    @override
+    def remaining_quota(self) -> int | None:
+        return self._repo.remaining_quota()
+
+    @override
+    def hedge_counters(self) -> HedgeCounters | None:
+        if self._percentile <= 0:
+            return None
+        return HedgeCounters(self._requests, self._hedges, self._wins)
@@ -0,0 +1,80 @@
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import final, override
+
+from wireup import service
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.history_repository import IHistoryRepository
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+from videos_cleaner.entities.history import CheckHistory
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS check_history (
+    yt_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_checked TEXT NOT NULL,
+    last_change TEXT NOT NULL,
+    streak INTEGER NOT NULL,
+    changes INTEGER NOT NULL
+);
+"""
+
+
+def _to_history(row: tuple[str, str, str, str, str, int, int]) -> CheckHistory:
+    yt_id, status, first_seen, last_checked, last_change, streak, changes = row
+    return CheckHistory(
+        yt_id,
+        ExistsStatus[status],
+        datetime.fromisoformat(first_seen),
+        datetime.fromisoformat(last_checked),
+        datetime.fromisoformat(last_change),
+        streak,
+        changes,
+    )
+
+
+@final
+@service
+class HistoryRepository(IHistoryRepository):
+    """Репозиторий истории проверок в локальной базе состояния."""
+
+    def __init__(self, state: StateDatabase) -> None:
+        self._state = state
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def get_many(self, yt_ids: Iterable[str]) -> dict[str, CheckHistory]:
+        ids = list(set(yt_ids))
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" * len(ids))
+        query = f"SELECT * FROM check_history WHERE yt_id IN ({placeholders})"  # noqa: S608
+        rows: list[tuple[str, str, str, str, str, int, int]] = (
+            self._connection().execute(query, ids).fetchall()
+        )
+        return {row[0]: _to_history(row) for row in rows}
+
+    @override
+    async def save_many(self, histories: Iterable[CheckHistory]) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.executemany(
+                "INSERT OR REPLACE INTO check_history VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        history.yt_id,
+                        history.status.name,
+                        history.first_seen.isoformat(),
+                        history.last_checked.isoformat(),
+                        history.last_change.isoformat(),
+                        history.streak,
+                        history.changes,
+                    )
+                    for history in histories
+                ],
+            )
@@ -0,0 +1,48 @@
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from json import JSONDecodeError, JSONDecoder
+
+_decoder = JSONDecoder()
+_separators = re.compile(r"[\s,]*")
+
+
+async def iter_json_array(chunks: AsyncIterable[str]) -> AsyncIterator[object]:
+    """Разобрать JSON массив по частям, отдавая элементы по мере получения.
+
+    В памяти хранится только текущий недополученный элемент.
+
+    Args:
+        chunks: Части текста ответа.
+
+    Raises:
+        JSONDecodeError: ответ не является JSON массивом.
+    """
+    buffer = ""
+    pos = 0
+    opened = False
+
+    async for chunk in chunks:
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+        while True:
+            pos = _separators.match(buffer, pos).end()  # pyright: ignore[reportOptionalMemberAccess]
+            if pos >= len(buffer):
+                break
+            if not opened:
+                if buffer[pos] != "[":
+                    msg = "Ожидался JSON массив"
+                    raise JSONDecodeError(msg, buffer, pos)
+                opened = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = _decoder.raw_decode(buffer, pos)
+            except JSONDecodeError:
+                break
+            yield item
+
+    msg = "Неожиданный конец JSON массива"
+    raise JSONDecodeError(msg, buffer, pos)
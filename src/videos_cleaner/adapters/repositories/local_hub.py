@@ -0,0 +1,94 @@
+import secrets
+from collections import defaultdict
+from typing import final, override
+from urllib.parse import parse_qs
+
+from httpx import AsyncBaseTransport, AsyncClient, HTTPError, Request, Response
+
+from videos_cleaner.adapters.repositories.websub import sign
+
+
+@final
+class LocalHub(AsyncBaseTransport):
+    """Локальная замена хаба WebSub для проверки подписчика без сети.
+
+    Используется как транспорт http клиента подписчика: запросы подписки
+    обрабатываются на месте, намерение подтверждается запросом на адрес
+    подписчика до ответа (у настоящего хаба — позже). `publish` рассылает
+    уведомление всем подписчикам ленты.
+    """
+
+    def __init__(self, client: AsyncClient | None = None) -> None:
+        """Конструктор.
+
+        Args:
+            client: http клиент для запросов к подписчикам.
+        """
+        self._client = client or AsyncClient()
+        self.subscriptions: defaultdict[str, dict[str, str | None]] = defaultdict(dict)
+
+    async def _verify(self, callback: str, mode: str, topic: str) -> bool:
+        challenge = secrets.token_hex(8)
+        try:
+            response = await self._client.get(
+                callback,
+                params={
+                    "hub.mode": mode,
+                    "hub.topic": topic,
+                    "hub.challenge": challenge,
+                    "hub.lease_seconds": "0",
+                },
+            )
+        except HTTPError:
+            return False
+        return response.is_success and response.text == challenge
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        form = {
+            key: values[0]
+            for key, values in parse_qs((await request.aread()).decode()).items()
+        }
+        callback = form.get("hub.callback", "")
+        topic = form.get("hub.topic", "")
+        mode = form.get("hub.mode", "")
+        if request.method != "POST" or not callback or not topic:
+            return Response(400)
+        if mode not in {"subscribe", "unsubscribe"}:
+            return Response(400)
+        if not await self._verify(callback, mode, topic):
+            return Response(409)
+
+        if mode == "subscribe":
+            self.subscriptions[topic][callback] = form.get("hub.secret")
+        else:
+            _ = self.subscriptions[topic].pop(callback, None)
+        return Response(202)
+
+    async def publish(self, topic: str, body: bytes) -> int:
+        """Разослать уведомление подписчикам ленты.
+
+        Args:
+            topic: Адрес ленты.
+            body: Лента Atom с изменениями.
+
+        Returns:
+            Сколько подписчиков приняли уведомление.
+        """
+        delivered = 0
+        for callback, secret in self.subscriptions[topic].items():
+            headers = {"content-type": "application/atom+xml"}
+            if secret:
+                headers["x-hub-signature"] = sign(secret, body)
+            try:
+                response = await self._client.post(
+                    callback, content=body, headers=headers
+                )
+            except HTTPError:
+                continue
+            delivered += response.is_success
+        return delivered
+
+    @override
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -1,8 +1,11 @@
+from collections.abc import Sequence
+from json import JSONDecodeError
 from typing import Literal, final, override
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from wireup import service
 
+from videos_cleaner.adapters.repositories.quota import QuotaAccountant
 from videos_cleaner.domain.interfaces.meta_repository import (
     ExistsStatus,
     IMetaRepository,
@@ -12,7 +15,7 @@ from videos_cleaner.domain.interfaces.meta_repository import (
 
 
 @final
-@service
+@service(qualifier="oembed")
 class MetaRepostiory(IMetaRepository):
     """Репозиторий информации о youtube видео с помощью OEmbed api youtube."""
 
@@ -42,12 +45,38 @@ class MetaRepostiory(IMetaRepository):
         return await super().is_embeddable(yt_id)
 
 
+QUOTA_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+
+
+def error_reasons(response: Response) -> set[str]:
+    """Причины ошибки из ответа Google API."""
+    try:
+        body: dict[str, dict[str, list[dict[str, str]]]] = response.json()
+    except JSONDecodeError:
+        return set()
+    errors = body.get("error", {}).get("errors", [])
+    return {error.get("reason", "") for error in errors}
+
+
 @final
 class YoutubeDataApiRepository(IMetaRepository):
     """Репозиторий информации о youtube видео с помощью YouTube Data API."""
 
-    def __init__(self, key: str, client: AsyncClient) -> None:
-        self._key = key
+    def __init__(
+        self,
+        key: str | Sequence[str],
+        client: AsyncClient,
+        quota: QuotaAccountant | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            key: Ключ или несколько ключей YouTube Data API.
+            client: HTTP клиент.
+            quota: Учёт квоты (по умолчанию — в памяти по переданным ключам).
+        """
+        keys = [key] if isinstance(key, str) else list(key)
+        self._quota = quota or QuotaAccountant(keys)
         self._client = client
         super().__init__()
 
@@ -57,20 +86,30 @@ class YoutubeDataApiRepository(IMetaRepository):
 
     @override
     async def is_embeddable(self, yt_id: str) -> bool:
-        response = await self._client.get(
-            f"https://youtube.googleapis.com/youtube/v3/videos?part=status&id={yt_id}&fields=items(status/embeddable)&key={self._key}"
-        )
+        while True:
+            key = self._quota.acquire()
+            response = await self._client.get(
+                f"https://youtube.googleapis.com/youtube/v3/videos?part=status&id={yt_id}&fields=items(status/embeddable)&key={key}"
+            )
 
-        match response.status_code:
-            case 200:
-                data: dict[
-                    Literal["items"],
-                    list[dict[Literal["status"], dict[Literal["embeddable"], bool]]],
-                ] = response.json()
-                if item := data["items"]:
-                    return item[0]["status"]["embeddable"]
-                return False
-            case 403:
-                raise UnauthorizedError
-            case code:
-                raise MetaRepositoryError(response.text, code)
+            match response.status_code:
+                case 200:
+                    data: dict[
+                        Literal["items"],
+                        list[
+                            dict[Literal["status"], dict[Literal["embeddable"], bool]]
+                        ],
+                    ] = response.json()
+                    if item := data["items"]:
+                        return item[0]["status"]["embeddable"]
+                    return False
+                case 403 if error_reasons(response) & QUOTA_REASONS:
+                    self._quota.exhaust(key)
+                case 403:
+                    raise UnauthorizedError
+                case code:
+                    raise MetaRepositoryError(response.text, code)
+
+    @override
+    def remaining_quota(self) -> int | None:
+        return self._quota.remaining
@@ -0,0 +1,135 @@
+import sqlite3
+from datetime import datetime
+from typing import final, override
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.mutation_journal import IMutationJournal
+from videos_cleaner.entities.journal import JournalEntry, MutationKind
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mutation_journal (
+    target TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    enqueued TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt TEXT NOT NULL,
+    last_error TEXT,
+    PRIMARY KEY (target, slug)
+);
+CREATE INDEX IF NOT EXISTS mutation_journal_due
+    ON mutation_journal (target, next_attempt);
+"""
+
+
+def _to_entry(row: tuple[str, str, str, int, str, str | None]) -> JournalEntry:
+    slug, kind, enqueued, attempts, next_attempt, last_error = row
+    return JournalEntry(
+        slug,
+        MutationKind(kind),
+        datetime.fromisoformat(enqueued),
+        attempts,
+        datetime.fromisoformat(next_attempt),
+        last_error,
+    )
+
+
+@final
+class MutationJournalRepository(IMutationJournal):
+    """Журнал изменений видео в локальной базе состояния.
+
+    Записи хранятся отдельно для каждого API видео.
+    """
+
+    def __init__(
+        self,
+        state: StateDatabase,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+            target: API видео, к которому применяются изменения.
+        """
+        self._state = state
+        self._target = target
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def append(self, slug: str, kind: MutationKind, now: datetime) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "INSERT INTO mutation_journal "
+                "(target, slug, kind, enqueued, next_attempt) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (target, slug) DO UPDATE SET "
+                "kind = excluded.kind, enqueued = excluded.enqueued, "
+                "attempts = 0, next_attempt = excluded.next_attempt, "
+                "last_error = NULL "
+                "WHERE mutation_journal.kind != excluded.kind",
+                (self._target, slug, kind.value, now.isoformat(), now.isoformat()),
+            )
+
+    @override
+    async def due(self, now: datetime, limit: int) -> list[JournalEntry]:
+        rows = self._connection().execute(
+            "SELECT slug, kind, enqueued, attempts, next_attempt, last_error "
+            "FROM mutation_journal WHERE target = ? AND next_attempt <= ? "
+            "ORDER BY enqueued LIMIT ?",
+            (self._target, now.isoformat(), limit),
+        )
+        return [_to_entry(row) for row in rows]
+
+    @override
+    async def complete(self, entry: JournalEntry) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "DELETE FROM mutation_journal "
+                "WHERE target = ? AND slug = ? AND enqueued = ?",
+                (self._target, entry.slug, entry.enqueued.isoformat()),
+            )
+
+    @override
+    async def retry(self, entry: JournalEntry, at: datetime, error: str) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "UPDATE mutation_journal "
+                "SET attempts = attempts + 1, next_attempt = ?, last_error = ? "
+                "WHERE target = ? AND slug = ? AND enqueued = ?",
+                (
+                    at.isoformat(),
+                    error,
+                    self._target,
+                    entry.slug,
+                    entry.enqueued.isoformat(),
+                ),
+            )
+
+    @override
+    async def resume(self, now: datetime) -> int:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "UPDATE mutation_journal SET next_attempt = ? "
+                "WHERE target = ? AND next_attempt > ?",
+                (now.isoformat(), self._target, now.isoformat()),
+            )
+        return await self.pending()
+
+    @override
+    async def pending(self) -> int:
+        (count,) = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM mutation_journal WHERE target = ?",
+                (self._target,),
+            )
+            .fetchone()
+        )
+        return count
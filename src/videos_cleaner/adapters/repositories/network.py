@@ -0,0 +1,345 @@
+import asyncio
+import socket
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from functools import partial
+from typing import final, override
+
+import anyio
+import httpcore
+import structlog
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncClient,
+    AsyncHTTPTransport,
+    HTTPError,
+    Limits,
+    Request,
+    Response,
+)
+from wireup import service
+
+try:
+    import aiodns
+except ImportError:  # pragma: no cover
+    aiodns = None
+
+logger = structlog.stdlib.get_logger(__name__)
+
+OEMBED_URL = "https://www.youtube.com"
+YOUTUBE_DATA_API_URL = "https://youtube.googleapis.com"
+
+# Ограничения пула соединений httpx по умолчанию, заданные явно: прогрев
+# открывает не больше соединений, чем пул оставляет открытыми.
+KEEPALIVE_CONNECTIONS = 20
+HTTP_LIMITS = Limits(
+    max_connections=100, max_keepalive_connections=KEEPALIVE_CONNECTIONS
+)
+
+type Lookup = Callable[[str, int], Awaitable[str]]
+
+
+async def threaded_lookup(host: str, port: int) -> str:
+    """Получить адрес хоста через системный getaddrinfo в пуле потоков."""
+    infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return str(infos[0][4][0])
+
+
+@final
+class AsyncLookup:
+    """Получение адреса хоста через c-ares (aiodns) без пула потоков."""
+
+    def __init__(self) -> None:
+        self._resolver: aiodns.DNSResolver | None = None
+
+    async def __call__(self, host: str, port: int) -> str:
+        """Получить адрес хоста.
+
+        Raises:
+            OSError: адрес не найден.
+        """
+        if aiodns is None:
+            msg = "aiodns не установлен"
+            raise RuntimeError(msg)
+        # Резолвер привязывается к циклу событий, поэтому создаётся при первом запросе.
+        self._resolver = self._resolver or aiodns.DNSResolver()
+        try:
+            result = await self._resolver.getaddrinfo(
+                host, port=port, type=socket.SOCK_STREAM
+            )
+        except aiodns.error.DNSError as e:
+            raise socket.gaierror(str(e)) from e
+        # Как и системный резолвер по умолчанию, IPv4 предпочтительнее IPv6.
+        node = min(result.nodes, key=lambda node: node.family != socket.AF_INET)
+        address: bytes | str = node.addr[0]
+        return address.decode() if isinstance(address, bytes) else address
+
+
+@final
+class CachingResolver:
+    """Кэш DNS на время жизни процесса.
+
+    Адрес хоста запрашивается заново по истечении `ttl` секунд.
+    Одновременные подключения к одному хосту ожидают уже запущенный
+    запрос адреса.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        *,
+        lookup: Lookup = threaded_lookup,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            ttl: Время жизни записи в секундах (0 — без кэширования).
+            lookup: Получение адреса хоста.
+            clock: Источник монотонного времени.
+        """
+        self._ttl = ttl
+        self._lookup = lookup
+        self._clock = clock
+        self._addresses: dict[tuple[str, int], tuple[str, float]] = {}
+        self._pending: dict[tuple[str, int], asyncio.Task[str]] = {}
+
+    def _forget(self, key: tuple[str, int], task: asyncio.Task[str]) -> None:
+        """Убрать завершённый запрос адреса из выполняющихся."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            _ = task.exception()
+
+    async def resolve(self, host: str, port: int) -> str:
+        """Получить адрес хоста.
+
+        Args:
+            host: Имя хоста.
+            port: Порт.
+
+        Raises:
+            httpcore.ConnectError: адрес не найден.
+        """
+        key = (host, port)
+        cached = self._addresses.get(key)
+        if cached and cached[1] > self._clock():
+            return cached[0]
+
+        if (task := self._pending.get(key)) is None:
+            task = asyncio.ensure_future(self._lookup(host, port))
+            self._pending[key] = task
+            task.add_done_callback(partial(self._forget, key))
+        try:
+            address = await asyncio.shield(task)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+        if self._ttl > 0:
+            self._addresses[key] = (address, self._clock() + self._ttl)
+        return address
+
+
+@final
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Сетевой бэкенд httpcore, подключающийся по адресам из кэша DNS.
+
+    TLS устанавливается с исходным именем хоста, поэтому проверка
+    сертификата не меняется.
+    """
+
+    def __init__(
+        self,
+        resolver: CachingResolver,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            resolver: Кэш DNS.
+            backend: Бэкенд, выполняющий подключения.
+        """
+        self._resolver = resolver
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    @override
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self._resolver.resolve(host, port)
+        return await self._backend.connect_tcp(
+            address, port, timeout, local_address, socket_options
+        )
+
+    @override
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    @override
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+@final
+@service
+class RequestGauge:
+    """Количество выполняющихся запросов к каждому хосту."""
+
+    def __init__(self) -> None:
+        """Конструктор."""
+        self._in_flight: Counter[str] = Counter()
+
+    def started(self, host: str) -> None:
+        """Отметить начало запроса."""
+        self._in_flight[host] += 1
+
+    def finished(self, host: str) -> None:
+        """Отметить окончание запроса (ответ прочитан или закрыт)."""
+        self._in_flight[host] -= 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Выполняющиеся запросы по хостам."""
+        return {host: count for host, count in self._in_flight.items() if count}
+
+
+@final
+class _TrackedStream(AsyncByteStream):
+    """Тело ответа, при закрытии которого запрос считается завершённым."""
+
+    def __init__(self, stream: AsyncByteStream, done: Callable[[], None]) -> None:
+        self._stream = stream
+        self._done: Callable[[], None] | None = done
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    @override
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._done:
+                self._done()
+                self._done = None
+
+
+@final
+class GaugedTransport(AsyncBaseTransport):
+    """Транспорт, учитывающий выполняющиеся запросы в RequestGauge."""
+
+    def __init__(self, transport: AsyncBaseTransport, gauge: RequestGauge) -> None:
+        """Конструктор.
+
+        Args:
+            transport: Транспорт, выполняющий запросы.
+            gauge: Учёт выполняющихся запросов.
+        """
+        self._transport = transport
+        self._gauge = gauge
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        host = request.url.host
+        self._gauge.started(host)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._gauge.finished(host)
+            raise
+        stream = response.stream
+        if not isinstance(stream, AsyncByteStream):  # pragma: no cover
+            self._gauge.finished(host)
+            return response
+        return Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(stream, lambda: self._gauge.finished(host)),
+            extensions=response.extensions,
+        )
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def caching_transport(ttl: float, *, async_dns: bool = False) -> AsyncHTTPTransport:
+    """HTTP транспорт с кэшем DNS.
+
+    Args:
+        ttl: Время жизни записи кэша в секундах (0 — без кэширования).
+        async_dns: Получать адреса через aiodns, если он установлен.
+    """
+    lookup: Lookup = threaded_lookup
+    if async_dns and aiodns is None:
+        logger.warning("aiodns не установлен, используется системный резолвер")
+    elif async_dns:
+        lookup = AsyncLookup()
+
+    transport = AsyncHTTPTransport(limits=HTTP_LIMITS)
+    resolver = CachingResolver(ttl, lookup=lookup)
+    # httpx не позволяет передать бэкенд в пул соединений транспорта.
+    transport._pool._network_backend = CachingNetworkBackend(resolver)  # pyright: ignore[reportPrivateUsage, reportAttributeAccessIssue]
+    return transport
+
+
+async def warm_up(
+    client: AsyncClient,
+    urls: Iterable[str],
+    connections: int,
+    *,
+    keepalive: int = KEEPALIVE_CONNECTIONS,
+) -> None:
+    """Заранее открыть соединения с сервисами.
+
+    Для каждого сервиса одновременно отправляется `connections` запросов
+    HEAD, после которых соединения остаются в пуле клиента. Пул оставляет
+    открытыми не больше `keepalive` соединений на все сервисы, поэтому
+    соединений на сервис открывается не больше их доли в этом пределе.
+
+    Args:
+        client: HTTP клиент.
+        urls: Адреса сервисов.
+        connections: Количество соединений на сервис.
+        keepalive: Сколько соединений пул клиента держит открытыми.
+    """
+
+    async def touch(url: str) -> None:
+        try:
+            _ = await client.head(url)
+        except HTTPError as e:
+            logger.warning("Не удалось открыть соединение", url=url, error=str(e))
+
+    started = time.perf_counter()
+    targets = list(dict.fromkeys(urls))
+    if not targets:
+        return
+    limit = max(keepalive // len(targets), 1)
+    if connections > limit:
+        logger.warning(
+            "Пул не держит столько открытых соединений",
+            requested=connections,
+            connections=limit,
+        )
+        connections = limit
+    _ = await asyncio.gather(
+        *(touch(url) for url in targets for _ in range(connections))
+    )
+    logger.info(
+        "Соединения открыты",
+        upstreams=len(targets),
+        connections=connections,
+        duration=round(time.perf_counter() - started, 3),
+    )
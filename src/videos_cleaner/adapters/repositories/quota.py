@@ -0,0 +1,224 @@
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, timedelta, timezone
+from enum import StrEnum
+from pathlib import Path
+from typing import final
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import anyio
+import structlog
+
+from videos_cleaner.domain.interfaces.meta_repository import QuotaExceededError
+
+logger = structlog.stdlib.get_logger(__name__)
+
+try:
+    PACIFIC = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:
+    PACIFIC = timezone(timedelta(hours=-8))
+
+DAILY_QUOTA = 10_000
+
+
+class KeyRotation(StrEnum):
+    """Стратегия выбора ключа YouTube Data API."""
+
+    ROUND_ROBIN = "round-robin"
+    LEAST_USED = "least-used"
+
+
+def _pacific_today() -> date:
+    return datetime.now(UTC).astimezone(PACIFIC).date()
+
+
+def _fingerprint(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Блокировка файла состояния, общая для процессов."""
+    with path.with_suffix(".lock").open("a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+@final
+class QuotaAccountant:
+    """Учёт расхода дневной квоты YouTube Data API.
+
+    Квота сбрасывается в полночь по тихоокеанскому времени. Расход
+    хранится по отпечаткам ключей, сами ключи в файл не попадают.
+    Операции выполняются под блокировкой, поэтому один учёт можно
+    использовать из циклов событий разных потоков.
+
+    Списание квоты не обращается к файлу: расход сохраняется `save`
+    (периодически — `keep_saved`) и складывается с расходом других
+    процессов, записанным в файл под файловой блокировкой.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        keys: Sequence[str],
+        *,
+        state_path: Path | None = None,
+        daily_limit: int = DAILY_QUOTA,
+        reserve: int = 100,
+        rotation: KeyRotation = KeyRotation.ROUND_ROBIN,
+        today: Callable[[], date] = _pacific_today,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            keys: Ключи YouTube Data API.
+            state_path: Файл состояния (None — учёт только в памяти).
+            daily_limit: Дневная квота одного ключа в единицах.
+            reserve: Неприкосновенный запас единиц на ключ.
+            rotation: Стратегия выбора ключа.
+            today: Текущая дата по тихоокеанскому времени.
+        """
+        self._keys = list(keys)
+        self._state_path = state_path
+        self._budget = daily_limit - reserve
+        self._rotation = rotation
+        self._today = today
+        self._next = 0
+        self._lock = threading.Lock()
+        self._day = today()
+        self._spent: dict[str, int] = dict.fromkeys(map(_fingerprint, self._keys), 0)
+        self._unsaved: Counter[str] = Counter()
+        self._exhausted: set[str] = set()
+        if self._state_path:
+            self._refresh(self._day, self._read(self._day))
+
+    def _read(self, day: date) -> dict[str, int]:
+        """Расход за сутки `day` из файла состояния."""
+        if not self._state_path or not self._state_path.exists():
+            return {}
+        try:
+            state: dict[str, str | dict[str, int]] = json.loads(
+                self._state_path.read_text()
+            )
+        except (OSError, ValueError):
+            logger.warning(
+                "Не удалось прочитать состояние квоты", path=self._state_path
+            )
+            return {}
+        spent = state.get("spent")
+        if state.get("day") != day.isoformat() or not isinstance(spent, dict):
+            return {}
+        return spent
+
+    def _refresh(self, day: date, stored: dict[str, int]) -> None:
+        """Учесть сохранённый расход всех процессов (под блокировкой)."""
+        if day != self._day:
+            return
+        for fingerprint in self._spent:
+            spent = stored.get(fingerprint, 0) + self._unsaved[fingerprint]
+            if fingerprint in self._exhausted:
+                spent = max(spent, self._budget)
+            self._spent[fingerprint] = spent
+
+    def save(self) -> None:
+        """Сохранить расход в файл состояния.
+
+        Несохранённый расход добавляется к записанному в файле другими
+        процессами, а учёт обновляется их расходом.
+        """
+        if not self._state_path:
+            return
+        with self._lock:
+            self._rollover()
+            day = self._day
+            unsaved, self._unsaved = self._unsaved, Counter()
+            exhausted, self._exhausted = self._exhausted, set()
+
+        with _file_lock(self._state_path):
+            stored = self._read(day)
+            for fingerprint, units in unsaved.items():
+                stored[fingerprint] = stored.get(fingerprint, 0) + units
+            for fingerprint in exhausted:
+                stored[fingerprint] = max(stored.get(fingerprint, 0), self._budget)
+            if unsaved or exhausted:
+                tmp = self._state_path.with_suffix(".tmp")
+                _ = tmp.write_text(
+                    json.dumps({"day": day.isoformat(), "spent": stored})
+                )
+                os.replace(tmp, self._state_path)
+
+        with self._lock:
+            self._refresh(day, stored)
+
+    async def keep_saved(self, interval: float = 5.0) -> None:
+        """Сохранять расход каждые `interval` секунд в пуле потоков.
+
+        Выполняется до отмены, после которой расход сохраняется последний раз.
+        """
+        try:
+            while True:
+                await anyio.sleep(interval)
+                await anyio.to_thread.run_sync(self.save)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(self.save)
+
+    def _rollover(self) -> None:
+        if (today := self._today()) != self._day:
+            self._day = today
+            self._spent = dict.fromkeys(self._spent, 0)
+            self._unsaved.clear()
+            self._exhausted.clear()
+
+    def _left(self, key: str) -> int:
+        return self._budget - self._spent[_fingerprint(key)]
+
+    def acquire(self, units: int = 1) -> str:
+        """Списать единицы квоты и получить ключ для запроса.
+
+        Args:
+            units: Стоимость запроса в единицах.
+
+        Raises:
+            QuotaExceededError: бюджет всех ключей исчерпан.
+        """
+        with self._lock:
+            self._rollover()
+            if self._rotation == KeyRotation.LEAST_USED:
+                key = max(self._keys, key=self._left)
+            else:
+                order = self._keys[self._next :] + self._keys[: self._next]
+                key = next((key for key in order if self._left(key) >= units), order[0])
+                self._next = (self._keys.index(key) + 1) % len(self._keys)
+
+            if self._left(key) < units:
+                raise QuotaExceededError
+
+            fingerprint = _fingerprint(key)
+            self._spent[fingerprint] += units
+            self._unsaved[fingerprint] += units
+            return key
+
+    def exhaust(self, key: str) -> None:
+        """Пометить ключ исчерпанным до конца текущих суток."""
+        logger.warning("Квота ключа YouTube Data API исчерпана")
+        with self._lock:
+            fingerprint = _fingerprint(key)
+            self._spent[fingerprint] = self._budget
+            self._exhausted.add(fingerprint)
+
+    @property
+    def remaining(self) -> int:
+        """Оставшийся бюджет всех ключей в единицах."""
+        with self._lock:
+            self._rollover()
+            return sum(max(self._left(key), 0) for key in self._keys)
@@ -0,0 +1,112 @@
+import sqlite3
+from datetime import datetime
+from typing import final, override
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.removal_repository import IRemovalRepository
+from videos_cleaner.entities.removal import PendingRemoval
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_removals (
+    target TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    yt_id TEXT NOT NULL,
+    deleted INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_confirmed TEXT NOT NULL,
+    confirmations INTEGER NOT NULL,
+    PRIMARY KEY (target, slug)
+);
+CREATE INDEX IF NOT EXISTS pending_removals_last_confirmed
+    ON pending_removals (target, last_confirmed);
+"""
+
+COLUMNS = "slug, yt_id, deleted, first_seen, last_confirmed, confirmations"
+
+type Row = tuple[str, str, int, str, str, int]
+
+
+def _to_removal(row: Row) -> PendingRemoval:
+    slug, yt_id, deleted, first_seen, last_confirmed, confirmations = row
+    return PendingRemoval(
+        slug,
+        yt_id,
+        bool(deleted),
+        datetime.fromisoformat(first_seen),
+        datetime.fromisoformat(last_confirmed),
+        confirmations,
+    )
+
+
+@final
+class RemovalRepository(IRemovalRepository):
+    """Очередь подтверждения удалений в локальной базе состояния."""
+
+    def __init__(
+        self,
+        state: StateDatabase,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+            target: API видео, к которому относится очередь.
+        """
+        self._state = state
+        self._target = target
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def get(self, slug: str) -> PendingRemoval | None:
+        row: Row | None = (
+            self._connection()
+            .execute(
+                f"SELECT {COLUMNS} FROM pending_removals WHERE target = ? AND slug = ?",  # noqa: S608
+                (self._target, slug),
+            )
+            .fetchone()
+        )
+        return _to_removal(row) if row else None
+
+    @override
+    async def save(self, removal: PendingRemoval) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "INSERT OR REPLACE INTO pending_removals VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._target,
+                    removal.slug,
+                    removal.yt_id,
+                    removal.deleted,
+                    removal.first_seen.isoformat(),
+                    removal.last_confirmed.isoformat(),
+                    removal.confirmations,
+                ),
+            )
+
+    @override
+    async def discard(self, slug: str) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "DELETE FROM pending_removals WHERE target = ? AND slug = ?",
+                (self._target, slug),
+            )
+
+    @override
+    async def due(self, confirmed_before: datetime, limit: int) -> list[PendingRemoval]:
+        rows: list[Row] = (
+            self._connection()
+            .execute(
+                f"SELECT {COLUMNS} FROM pending_removals "  # noqa: S608
+                "WHERE target = ? AND last_confirmed <= ? "
+                "ORDER BY last_confirmed LIMIT ?",
+                (self._target, confirmed_before.isoformat(), limit),
+            )
+            .fetchall()
+        )
+        return [_to_removal(row) for row in rows]
@@ -0,0 +1,92 @@
+import sqlite3
+from datetime import datetime
+from typing import final, override
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.run_lock import IRunLock
+from videos_cleaner.entities.work import RunLease
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_leases (
+    target TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    started TEXT NOT NULL,
+    expires TEXT NOT NULL
+);
+"""
+
+
+@final
+class RunLockRepository(IRunLock):
+    """Аренда обхода в локальной базе состояния.
+
+    Запуски на одной машине (или с общим файлом базы) видят аренды друг
+    друга. Для общего хранилища достаточно другой реализации IRunLock.
+    """
+
+    def __init__(
+        self,
+        state: StateDatabase,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+            target: API видео, обход которого арендуется.
+        """
+        self._state = state
+        self._target = target
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def acquire(self, owner: str, now: datetime, until: datetime) -> RunLease:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "INSERT INTO run_leases (target, owner, started, expires) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (target) DO UPDATE SET "
+                "owner = excluded.owner, started = excluded.started, "
+                "expires = excluded.expires "
+                "WHERE run_leases.expires <= ? OR run_leases.owner = excluded.owner",
+                (
+                    self._target,
+                    owner,
+                    now.isoformat(),
+                    until.isoformat(),
+                    now.isoformat(),
+                ),
+            )
+            row: tuple[str, str, str] = connection.execute(
+                "SELECT owner, started, expires FROM run_leases WHERE target = ?",
+                (self._target,),
+            ).fetchone()
+        holder, started, expires = row
+        return RunLease(
+            self._target,
+            holder,
+            datetime.fromisoformat(started),
+            datetime.fromisoformat(expires),
+        )
+
+    @override
+    async def extend(self, lease: RunLease, until: datetime) -> bool:
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "UPDATE run_leases SET expires = ? WHERE target = ? AND owner = ?",
+                (until.isoformat(), self._target, lease.owner),
+            )
+        return cursor.rowcount > 0
+
+    @override
+    async def release(self, lease: RunLease) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "DELETE FROM run_leases WHERE target = ? AND owner = ?",
+                (self._target, lease.owner),
+            )
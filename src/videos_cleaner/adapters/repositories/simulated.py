@@ -0,0 +1,267 @@
+import asyncio
+import base64
+import json
+import random
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import final, override
+
+from videos_cleaner.adapters.repositories.cassette import read_cassette
+from videos_cleaner.adapters.repositories.network import (
+    OEMBED_URL,
+    YOUTUBE_DATA_API_URL,
+)
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+    UnauthorizedError,
+)
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoIsAlreadyDeletedError,
+    VideoIsNotDeletedError,
+    VideoNotFoundError,
+)
+from videos_cleaner.entities.simulation import (
+    LatencyProfile,
+    SimulationProfile,
+    UpstreamLoad,
+)
+from videos_cleaner.entities.video import Video, VideoList, VideoStream
+
+VIDEO_API = "video_api"
+OEMBED = "oembed"
+DATA_API = "data_api"
+
+
+@final
+class Upstream:
+    """Имитируемый сервис: задержка ответа и учёт нагрузки."""
+
+    def __init__(
+        self,
+        latency: LatencyProfile,
+        rng: random.Random,
+        total: UpstreamLoad,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            latency: Распределение длительности запросов.
+            rng: Генератор случайных чисел.
+            total: Нагрузка на все сервисы вместе.
+        """
+        self._latency = latency
+        self._rng = rng
+        self._total = total
+        self.load = UpstreamLoad()
+
+    async def request(self) -> None:
+        """Выполнить запрос (дождаться ответа)."""
+        self.load.enter()
+        self._total.enter()
+        try:
+            await asyncio.sleep(self._latency.sample(self._rng))
+        finally:
+            self.load.leave()
+            self._total.leave()
+
+
+@dataclass(frozen=True)
+class SimulatedVideo:
+    """Видео имитируемого каталога."""
+
+    video: Video
+    status: ExistsStatus
+    unauthorized: bool = False
+
+
+def make_catalogue(
+    profile: SimulationProfile, rng: random.Random
+) -> list[SimulatedVideo]:
+    """Создать каталог с долями статусов из профиля.
+
+    Args:
+        profile: Профиль имитации.
+        rng: Генератор случайных чисел.
+    """
+    catalogue: list[SimulatedVideo] = []
+    for number in range(profile.catalogue_size):
+        roll = rng.random()
+        if roll < profile.hidden_share:
+            status = ExistsStatus.HIDDEN
+        elif roll < profile.hidden_share + profile.removed_share:
+            status = ExistsStatus.REMOVED
+        else:
+            status = ExistsStatus.EXISTS
+        slug = f"sim-{number}"
+        catalogue.append(
+            SimulatedVideo(
+                Video(
+                    deleted=rng.random() < profile.deleted_share,
+                    slug=slug,
+                    yt_id=slug,
+                ),
+                status,
+                unauthorized=rng.random() < profile.unauthorized_share,
+            )
+        )
+    return catalogue
+
+
+@final
+class SimulatedVideoRepository(IVideoRepository):
+    """API видео поверх имитируемого каталога."""
+
+    def __init__(self, catalogue: list[SimulatedVideo], upstream: Upstream) -> None:
+        """Конструктор.
+
+        Args:
+            catalogue: Каталог (изменяется при скрытии и восстановлении).
+            upstream: Имитируемый сервис.
+        """
+        self._catalogue = catalogue
+        self._index = {item.video.slug: i for i, item in enumerate(catalogue)}
+        self._upstream = upstream
+
+    def _page(self, offset: int, limit: int) -> list[Video]:
+        return [item.video for item in self._catalogue[offset : offset + limit]]
+
+    @override
+    async def get_all(self, offset: int = 0, *, limit: int = 50) -> VideoList:
+        await self._upstream.request()
+        return VideoList(
+            total_count=len(self._catalogue), videos=self._page(offset, limit)
+        )
+
+    @override
+    @asynccontextmanager
+    async def stream(
+        self, offset: int = 0, *, limit: int = 50
+    ) -> AsyncIterator[VideoStream]:
+        await self._upstream.request()
+
+        async def videos() -> AsyncIterator[Video]:
+            for video in self._page(offset, limit):
+                yield video
+
+        yield VideoStream(total_count=len(self._catalogue), videos=videos())
+
+    def _set_deleted(self, slug: str, *, deleted: bool) -> None:
+        if slug not in self._index:
+            raise VideoNotFoundError
+        index = self._index[slug]
+        item = self._catalogue[index]
+        if item.video.deleted == deleted:
+            raise VideoIsAlreadyDeletedError if deleted else VideoIsNotDeletedError
+        video = item.video.model_copy(update={"deleted": deleted})
+        self._catalogue[index] = replace(item, video=video)
+
+    @override
+    async def delete(self, slug: str, *, temporary: bool = True) -> None:
+        await self._upstream.request()
+        if temporary:
+            self._set_deleted(slug, deleted=True)
+        elif slug not in self._index:
+            raise VideoNotFoundError
+
+    @override
+    async def restore(self, slug: str) -> None:
+        await self._upstream.request()
+        self._set_deleted(slug, deleted=False)
+
+
+@final
+class SimulatedMetaRepository(IMetaRepository):
+    """Источник информации о youtube видео поверх имитируемого каталога."""
+
+    def __init__(
+        self,
+        catalogue: list[SimulatedVideo],
+        upstream: Upstream,
+        *,
+        fallback: bool = False,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            catalogue: Каталог.
+            upstream: Имитируемый сервис.
+            fallback: Резервный источник (YouTube Data API): отвечает на
+                все запросы, включая видео, недоступные через oEmbed.
+        """
+        self._statuses = {item.video.yt_id: item for item in catalogue}
+        self._upstream = upstream
+        self._fallback = fallback
+
+    @override
+    async def is_exists(self, yt_id: str) -> ExistsStatus:
+        await self._upstream.request()
+        item = self._statuses[yt_id]
+        if item.unauthorized and not self._fallback:
+            raise UnauthorizedError
+        return item.status
+
+    @override
+    async def is_embeddable(self, yt_id: str) -> bool:
+        await self._upstream.request()
+        return self._statuses[yt_id].status == ExistsStatus.EXISTS
+
+
+def _upstream_of(url: str) -> str | None:
+    """Имитируемый сервис запроса (None — запрос не относится к обходу)."""
+    if url.startswith(f"{OEMBED_URL}/oembed"):
+        return OEMBED
+    if url.startswith(YOUTUBE_DATA_API_URL):
+        return DATA_API
+    if url.startswith(OEMBED_URL):
+        return None
+    return VIDEO_API
+
+
+def profile_from_recording(
+    directory: Path, catalogue_size: int | None = None
+) -> SimulationProfile:
+    """Профиль имитации по записи прошлого обхода (`--record`).
+
+    Длительности запросов берутся по каждому сервису, доли статусов — по
+    ответам oEmbed, доля удалённых в API видео — по страницам списка видео.
+
+    Args:
+        directory: Каталог записи.
+        catalogue_size: Размер каталога (по умолчанию — из записи).
+    """
+    elapsed: defaultdict[str, list[float]] = defaultdict(list)
+    oembed_codes: defaultdict[int, int] = defaultdict(int)
+    listed = deleted = total_count = 0
+    for interaction in read_cassette(directory):
+        upstream = _upstream_of(interaction["url"])
+        if upstream is None:
+            continue
+        elapsed[upstream].append(interaction["elapsed"])
+        if upstream == OEMBED:
+            oembed_codes[interaction["status"]] += 1
+        elif upstream == VIDEO_API and interaction["method"] == "GET":
+            headers = dict(interaction["headers"])
+            total_count = max(total_count, int(headers.get("x-total-count", 0)))
+            page: list[dict[str, object]] = json.loads(
+                base64.b64decode(interaction["content"]) or b"[]"
+            )
+            listed += len(page)
+            deleted += sum(1 for item in page if item.get("deleted"))
+
+    probes = sum(oembed_codes.values()) or 1
+    default = SimulationProfile()
+    return SimulationProfile(
+        catalogue_size=catalogue_size or total_count or default.catalogue_size,
+        deleted_share=deleted / listed if listed else 0.0,
+        hidden_share=oembed_codes[403] / probes,
+        removed_share=oembed_codes[404] / probes,
+        unauthorized_share=oembed_codes[401] / probes,
+        video_api=LatencyProfile.from_samples(elapsed[VIDEO_API]) or default.video_api,
+        oembed=LatencyProfile.from_samples(elapsed[OEMBED]) or default.oembed,
+        data_api=LatencyProfile.from_samples(elapsed[DATA_API]) or default.data_api,
+    )
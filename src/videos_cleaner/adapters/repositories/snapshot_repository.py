@@ -0,0 +1,83 @@
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import final, override
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.snapshot_repository import ISnapshotRepository
+from videos_cleaner.entities.snapshot import VideoSnapshot
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS video_snapshots (
+    target TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    deleted INTEGER NOT NULL,
+    observed TEXT NOT NULL,
+    PRIMARY KEY (target, slug)
+);
+"""
+
+
+@final
+class SnapshotRepository(ISnapshotRepository):
+    """Снимок состояния видео в локальной базе состояния."""
+
+    def __init__(
+        self,
+        state: StateDatabase,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+            target: API видео, к которому относится снимок.
+        """
+        self._state = state
+        self._target = target
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def get_many(self, slugs: Iterable[str]) -> dict[str, VideoSnapshot]:
+        keys = list(set(slugs))
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        rows: list[tuple[str, int, str]] = (
+            self._connection()
+            .execute(
+                "SELECT slug, deleted, observed FROM video_snapshots "  # noqa: S608
+                f"WHERE target = ? AND slug IN ({placeholders})",
+                [self._target, *keys],
+            )
+            .fetchall()
+        )
+        return {
+            slug: VideoSnapshot(slug, bool(deleted), datetime.fromisoformat(observed))
+            for slug, deleted, observed in rows
+        }
+
+    @override
+    async def save(self, snapshot: VideoSnapshot) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "INSERT OR REPLACE INTO video_snapshots VALUES (?, ?, ?, ?)",
+                (
+                    self._target,
+                    snapshot.slug,
+                    snapshot.deleted,
+                    snapshot.observed.isoformat(),
+                ),
+            )
+
+    @override
+    async def discard_many(self, slugs: Iterable[str]) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.executemany(
+                "DELETE FROM video_snapshots WHERE target = ? AND slug = ?",
+                [(self._target, slug) for slug in slugs],
+            )
@@ -0,0 +1,49 @@
+import sqlite3
+from typing import final
+
+
+@final
+class StateDatabase:
+    """Локальная база состояния чистильщика (SQLite).
+
+    Соединение открывается при первом обращении, поэтому путь можно
+    поменять после создания сервиса.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Конструктор.
+
+        Args:
+            path: Путь к файлу базы (":memory:" — без сохранения между запусками).
+        """
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._schemas: set[str] = set()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Соединение с базой."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            _ = self._connection.execute("PRAGMA journal_mode=WAL")
+            _ = self._connection.execute("PRAGMA synchronous=NORMAL")
+        return self._connection
+
+    def prepare(self, schema: str) -> sqlite3.Connection:
+        """Соединение с базой, в которой создана схема.
+
+        Args:
+            schema: DDL таблиц (выполняется один раз).
+        """
+        connection = self.connection
+        if schema not in self._schemas:
+            _ = connection.executescript(schema)
+            self._schemas.add(schema)
+        return connection
+
+    def close(self) -> None:
+        """Закрыть соединение."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            self._schemas.clear()
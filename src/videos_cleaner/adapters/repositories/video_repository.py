@@ -1,29 +1,47 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from json import JSONDecodeError
-from typing import Annotated, final, override
+from typing import final, override
 
-from httpx import AsyncClient, Response
+from httpx import AsyncClient, HTTPError, Response
 from pydantic import TypeAdapter
-from wireup import Inject, service
 
+from videos_cleaner.adapters.repositories.json_stream import iter_json_array
 from videos_cleaner.domain.interfaces.video_repository import (
     IVideoRepository,
     VideoIsAlreadyDeletedError,
     VideoIsNotDeletedError,
     VideoNotFoundError,
+    VideoRepositoryUnavailableError,
     VideoRepostiryError,
 )
-from videos_cleaner.entities.video import Video, VideoList
+from videos_cleaner.entities.video import Video, VideoList, VideoStream
+
+videos_adapter = TypeAdapter(list[Video])
+
+
+def _total_count(response: Response) -> int:
+    x_total: str = response.headers.get("x-total-count", "0")  # pyright: ignore[reportAny]
+    return int(x_total)
+
+
+async def _iter_videos(response: Response) -> AsyncIterator[Video]:
+    try:
+        async for item in iter_json_array(response.aiter_text()):
+            yield Video.model_validate(item)
+    except (HTTPError, JSONDecodeError) as e:
+        # Ответ оборван на середине: как и ошибка соединения, это сбой API.
+        raise VideoRepositoryUnavailableError(str(e)) from e
 
 
 @final
-@service
 class VideoRepository(IVideoRepository):
     """Репозиторий видео API edm.su."""
 
     def __init__(
         self,
         client: AsyncClient,
-        base_url: Annotated[str, Inject(param="video_url")] = "http://localhost",
+        base_url: str = "http://localhost",
     ) -> None:
         self._client = client
         self.base_url = base_url
@@ -37,17 +55,29 @@ class VideoRepository(IVideoRepository):
         )
         match response.status_code:
             case 200:
-                adapter = TypeAdapter(list[Video])
-
-                videos = adapter.validate_json(response.text)
-                x_total: str = response.headers.get("x-total-count", "0")  # pyright: ignore[reportAny]
-                count = int(x_total)
-
-                return VideoList(total_count=count, videos=videos)
+                videos = videos_adapter.validate_json(response.content)
+                return VideoList(total_count=_total_count(response), videos=videos)
             case _:
                 self._raise_unknown_error(response)
                 return VideoList(total_count=0, videos=[])
 
+    @override
+    @asynccontextmanager
+    async def stream(
+        self, offset: int = 0, *, limit: int = 50
+    ) -> AsyncIterator[VideoStream]:
+        async with self._client.stream(
+            "GET",
+            f"{self.base_url}/videos",
+            params={"include_deleted": True, "skip": offset, "limit": limit},
+        ) as response:
+            if response.status_code != 200:  # noqa: PLR2004
+                _ = await response.aread()
+                self._raise_unknown_error(response)
+            yield VideoStream(
+                total_count=_total_count(response), videos=_iter_videos(response)
+            )
+
     @override
     async def restore(self, slug: str) -> None:
         response = await self._client.post(f"{self.base_url}/videos/{slug}/restore")
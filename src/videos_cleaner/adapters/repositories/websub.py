@@ -0,0 +1,150 @@
+import hashlib
+import hmac
+from collections.abc import Iterable
+from typing import final
+from urllib.parse import urlencode
+from xml.etree import ElementTree as ET
+
+from httpx import AsyncClient
+
+from videos_cleaner.adapters.repositories.channel_repository import FEED_NAMESPACES
+
+HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
+TOPIC_URL = "https://www.youtube.com/xml/feeds/videos.xml"
+NOTIFICATION_NAMESPACES = {
+    **FEED_NAMESPACES,
+    "at": "http://purl.org/atompub/tombstones/1.0",
+}
+DELETED_PREFIX = "yt:video:"
+
+
+def channel_topic(channel_id: str) -> str:
+    """Адрес ленты канала, на которую подписываются в хабе."""
+    return f"{TOPIC_URL}?{urlencode({'channel_id': channel_id})}"
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Подпись уведомления (значение заголовка X-Hub-Signature)."""
+    digest = hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()
+    return f"sha1={digest}"
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """Проверить подпись уведомления.
+
+    Args:
+        secret: Секрет подписки.
+        body: Тело уведомления.
+        signature: Заголовок X-Hub-Signature.
+    """
+    return signature is not None and hmac.compare_digest(sign(secret, body), signature)
+
+
+def parse_notification(body: bytes) -> set[str]:
+    """Видео, затронутые уведомлением: опубликованные, изменённые и удалённые.
+
+    Raises:
+        ET.ParseError: тело не является лентой Atom.
+    """
+    root = ET.fromstring(body)  # noqa: S314
+    changed = {
+        element.text
+        for element in root.iterfind("atom:entry/yt:videoId", NOTIFICATION_NAMESPACES)
+        if element.text
+    }
+    for element in root.iterfind("at:deleted-entry", NOTIFICATION_NAMESPACES):
+        ref = element.get("ref", "")
+        if ref.startswith(DELETED_PREFIX):
+            changed.add(ref.removeprefix(DELETED_PREFIX))
+    return changed
+
+
+def notification_feed(
+    channel_id: str, *, updated: Iterable[str] = (), deleted: Iterable[str] = ()
+) -> bytes:
+    """Уведомление в формате, который присылает хаб youtube.
+
+    Args:
+        channel_id: Канал.
+        updated: Опубликованные или изменённые видео.
+        deleted: Удалённые видео.
+    """
+    ET.register_namespace("", NOTIFICATION_NAMESPACES["atom"])
+    ET.register_namespace("yt", NOTIFICATION_NAMESPACES["yt"])
+    ET.register_namespace("at", NOTIFICATION_NAMESPACES["at"])
+    atom = f"{{{NOTIFICATION_NAMESPACES['atom']}}}"
+    yt = f"{{{NOTIFICATION_NAMESPACES['yt']}}}"
+    feed = ET.Element(f"{atom}feed")
+    ET.SubElement(feed, f"{atom}title").text = "YouTube video feed"
+    for yt_id in deleted:
+        _ = ET.SubElement(
+            feed,
+            f"{{{NOTIFICATION_NAMESPACES['at']}}}deleted-entry",
+            ref=f"{DELETED_PREFIX}{yt_id}",
+        )
+    for yt_id in updated:
+        entry = ET.SubElement(feed, f"{atom}entry")
+        ET.SubElement(entry, f"{yt}videoId").text = yt_id
+        ET.SubElement(entry, f"{yt}channelId").text = channel_id
+    return ET.tostring(feed, xml_declaration=True, encoding="utf-8")
+
+
+@final
+class WebSubSubscriber:
+    """Подписка на ленты каналов в хабе WebSub (PubSubHubbub)."""
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        callback_url: str,
+        *,
+        hub_url: str = HUB_URL,
+        secret: str | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            client: http клиент.
+            callback_url: Публичный адрес, на который хаб присылает уведомления.
+            hub_url: Адрес хаба.
+            secret: Секрет для подписи уведомлений.
+        """
+        self._client = client
+        self._callback_url = callback_url
+        self._hub_url = hub_url
+        self._secret = secret
+
+    async def _request(self, mode: str, topic: str, lease_seconds: int) -> None:
+        form = {
+            "hub.callback": self._callback_url,
+            "hub.topic": topic,
+            "hub.mode": mode,
+            "hub.verify": "async",
+            "hub.lease_seconds": str(lease_seconds),
+        }
+        if self._secret:
+            form["hub.secret"] = self._secret
+        response = await self._client.post(self._hub_url, data=form)
+        _ = response.raise_for_status()
+
+    async def subscribe(self, topic: str, lease_seconds: int) -> None:
+        """Подписаться (или продлить подписку) на ленту.
+
+        Хаб подтверждает подписку отдельным запросом на `callback_url`.
+
+        Args:
+            topic: Адрес ленты.
+            lease_seconds: Срок подписки в секундах.
+
+        Raises:
+            httpx.HTTPStatusError: хаб отклонил запрос.
+        """
+        await self._request("subscribe", topic, lease_seconds)
+
+    async def unsubscribe(self, topic: str) -> None:
+        """Отписаться от ленты.
+
+        Args:
+            topic: Адрес ленты.
+        """
+        await self._request("unsubscribe", topic, 0)
@@ -0,0 +1,277 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import final, override
+from uuid import uuid4
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.work_queue import IWorkQueue
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+from videos_cleaner.entities.work import PageRange, QueueSummary, WorkLease
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    target TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    worker TEXT,
+    token TEXT,
+    expires TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    stats TEXT,
+    PRIMARY KEY (target, start)
+);
+"""
+
+
+@final
+class WorkQueueRepository(IWorkQueue):
+    """Очередь страниц в локальной базе состояния.
+
+    Обработчики в разных процессах используют один файл базы, аренда
+    выдаётся одним запросом UPDATE, поэтому страница не достанется двоим.
+    Продление, возврат и подтверждение проверяют токен аренды.
+    """
+
+    def __init__(
+        self,
+        state: StateDatabase,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            state: База состояния.
+            target: API видео, к которому относится очередь.
+        """
+        self._state = state
+        self._target = target
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._state.prepare(SCHEMA)
+
+    @override
+    async def put_many(self, pages: Iterable[PageRange]) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "DELETE FROM work_items WHERE target = ?", (self._target,)
+            )
+            _ = connection.executemany(
+                "INSERT INTO work_items (target, start, size) VALUES (?, ?, ?)",
+                [(self._target, page.offset, page.size) for page in pages],
+            )
+
+    @override
+    async def lease(
+        self, worker: str, now: datetime, until: datetime
+    ) -> WorkLease | None:
+        token = uuid4().hex
+        connection = self._connection()
+        with connection:
+            row: tuple[int, int, int] | None = connection.execute(
+                "UPDATE work_items "
+                "SET worker = ?, token = ?, expires = ?, attempts = attempts + 1 "
+                "WHERE target = ? AND start = ("
+                "    SELECT start FROM work_items"
+                "    WHERE target = ? AND done = 0"
+                "    AND (expires IS NULL OR expires <= ?)"
+                "    ORDER BY start LIMIT 1"
+                ") RETURNING start, size, attempts",
+                (
+                    worker,
+                    token,
+                    until.isoformat(),
+                    self._target,
+                    self._target,
+                    now.isoformat(),
+                ),
+            ).fetchone()
+        if row is None:
+            return None
+        start, size, attempts = row
+        return WorkLease(PageRange(start, size), worker, until, attempts, token)
+
+    @override
+    async def extend(self, lease: WorkLease, until: datetime) -> bool:
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "UPDATE work_items SET expires = ? "
+                "WHERE target = ? AND start = ? AND token = ? AND done = 0",
+                (until.isoformat(), self._target, lease.page.offset, lease.token),
+            )
+        return cursor.rowcount > 0
+
+    @override
+    async def release(self, lease: WorkLease) -> None:
+        connection = self._connection()
+        with connection:
+            _ = connection.execute(
+                "UPDATE work_items SET worker = NULL, token = NULL, expires = NULL "
+                "WHERE target = ? AND start = ? AND token = ? AND done = 0",
+                (self._target, lease.page.offset, lease.token),
+            )
+
+    @override
+    async def dead_letter(self, lease: WorkLease, error: str) -> bool:
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "UPDATE work_items "
+                "SET done = 1, failed = 1, error = ?, expires = NULL "
+                "WHERE target = ? AND start = ? AND token = ? AND done = 0",
+                (error, self._target, lease.page.offset, lease.token),
+            )
+        return cursor.rowcount > 0
+
+    @override
+    async def ack(self, lease: WorkLease, stats: VideoCleanerStats) -> bool:
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "UPDATE work_items "
+                "SET done = 1, expires = NULL, stats = ? "
+                "WHERE target = ? AND start = ? AND token = ? AND done = 0",
+                (
+                    json.dumps(stats.as_dict()),
+                    self._target,
+                    lease.page.offset,
+                    lease.token,
+                ),
+            )
+        return cursor.rowcount > 0
+
+    @override
+    async def summary(self, now: datetime) -> QueueSummary:
+        rows: list[tuple[str | None, int, int, str | None]] = (
+            self._connection()
+            .execute(
+                "SELECT expires, done, failed, stats FROM work_items WHERE target = ?",
+                (self._target,),
+            )
+            .fetchall()
+        )
+        summary = QueueSummary()
+        for expires, done, failed, stats in rows:
+            if failed:
+                summary.failed += 1
+            elif done:
+                summary.done += 1
+                summary.stats.merge(
+                    VideoCleanerStats.from_dict(json.loads(stats or "{}"))
+                )
+            elif expires is not None and expires > now.isoformat():
+                summary.leased += 1
+            else:
+                summary.pending += 1
+        return summary
+
+
+@dataclass
+class _Item:
+    """Страница очереди в памяти."""
+
+    page: PageRange
+    token: str | None = None
+    expires: datetime | None = None
+    attempts: int = 0
+    done: bool = False
+    failed: bool = False
+
+
+@final
+class MemoryWorkQueue(IWorkQueue):
+    """Очередь страниц в памяти процесса, общая для нескольких потоков.
+
+    Операции выполняются под блокировкой, поэтому очередь используют циклы
+    событий разных потоков; статистика подтверждённых страниц суммируется
+    там же.
+    """
+
+    def __init__(self) -> None:
+        """Конструктор."""
+        self._lock = threading.Lock()
+        self._items: dict[int, _Item] = {}
+        self._stats = VideoCleanerStats()
+
+    def _owned(self, lease: WorkLease) -> _Item | None:
+        item = self._items.get(lease.page.offset)
+        if item is None or item.done or item.token != lease.token:
+            return None
+        return item
+
+    @override
+    async def put_many(self, pages: Iterable[PageRange]) -> None:
+        with self._lock:
+            self._items = {page.offset: _Item(page) for page in pages}
+            self._stats = VideoCleanerStats()
+
+    @override
+    async def lease(
+        self, worker: str, now: datetime, until: datetime
+    ) -> WorkLease | None:
+        with self._lock:
+            for item in self._items.values():
+                if item.done or (item.expires is not None and item.expires > now):
+                    continue
+                lease = WorkLease(item.page, worker, until, item.attempts + 1)
+                item.token, item.expires = lease.token, until
+                item.attempts = lease.attempts
+                return lease
+        return None
+
+    @override
+    async def extend(self, lease: WorkLease, until: datetime) -> bool:
+        with self._lock:
+            if item := self._owned(lease):
+                item.expires = until
+                return True
+        return False
+
+    @override
+    async def release(self, lease: WorkLease) -> None:
+        with self._lock:
+            if item := self._owned(lease):
+                item.token = item.expires = None
+
+    @override
+    async def dead_letter(self, lease: WorkLease, error: str) -> bool:
+        with self._lock:
+            if item := self._owned(lease):
+                item.done = item.failed = True
+                item.expires = None
+                return True
+        return False
+
+    @override
+    async def ack(self, lease: WorkLease, stats: VideoCleanerStats) -> bool:
+        with self._lock:
+            item = self._owned(lease)
+            if item is None:
+                return False
+            item.done, item.expires = True, None
+            self._stats.merge(stats)
+            return True
+
+    @override
+    async def summary(self, now: datetime) -> QueueSummary:
+        with self._lock:
+            summary = QueueSummary()
+            for item in self._items.values():
+                if item.failed:
+                    summary.failed += 1
+                elif item.done:
+                    summary.done += 1
+                elif item.expires is not None and item.expires > now:
+                    summary.leased += 1
+                else:
+                    summary.pending += 1
+            summary.stats.merge(self._stats)
+            return summary
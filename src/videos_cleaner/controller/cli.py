@@ -1,19 +1,48 @@
+import asyncio
+import sys
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import timedelta
 from functools import partial
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, override
 
+import click
 import structlog
 import typer
-from asyncer import syncify
 from httpx import AsyncClient
-from wireup import create_async_container
+from typer.core import TyperGroup
 
-from videos_cleaner.adapters import repositories
-from videos_cleaner.adapters.repositories.meta_repository import (
-    YoutubeDataApiRepository,
+from videos_cleaner.adapters.repositories.cassette import ReplayLatency
+from videos_cleaner.adapters.repositories.quota import DAILY_QUOTA, KeyRotation
+from videos_cleaner.adapters.repositories.simulated import profile_from_recording
+from videos_cleaner.adapters.repositories.websub import (
+    HUB_URL,
+    WebSubSubscriber,
+    channel_topic,
 )
-from videos_cleaner.adapters.repositories.video_repository import VideoRepository
-from videos_cleaner.domain.use_cases import video_use_case
-from videos_cleaner.domain.use_cases.video_use_case import VideoCleanerUseCase
+from videos_cleaner.controller.loop import run
+from videos_cleaner.controller.progress import ProgressBar, log_progress
+from videos_cleaner.controller.runner import (
+    CleanerConfig,
+    CleanerRunner,
+    SweepSettings,
+    default_run_name,
+)
+from videos_cleaner.controller.simulation import simulate as simulate_sweep
+from videos_cleaner.controller.threads import loop_count, sweep_threaded
+from videos_cleaner.controller.websub import (
+    WebSubCallback,
+    WebSubSettings,
+    keep_subscribed,
+    serve_callback,
+)
+from videos_cleaner.domain.interfaces.dirty_set import IDirtySet
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+from videos_cleaner.domain.use_cases.pipeline import PipelineSettings
+from videos_cleaner.domain.use_cases.run_guard import OverlapPolicy, RunInProgressError
+from videos_cleaner.entities.cleaner import ProgressSnapshot, VideoCleanerStats
+from videos_cleaner.entities.simulation import SimulationProfile
 
 structlog.configure(
     processors=[
@@ -28,58 +57,941 @@ structlog.configure(
     cache_logger_on_first_use=False,
 )
 
-app = typer.Typer()
-container = create_async_container(
-    [repositories, video_use_case],
-    parameters={"video_url": "http://localhost", "youtube_data_api_repo": None},
-)
+
+class _DefaultCommandGroup(TyperGroup):
+    """Группа команд, запускающая очистку, если команда не указана."""
+
+    @override
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (
+            args[0] not in self.commands and args[0] not in ctx.help_option_names
+        ):
+            args = [CLEAN, *args]
+        return super().parse_args(ctx, args)
+
+
+CLEAN = "clean"
+
+app = typer.Typer(cls=_DefaultCommandGroup)
+
+MainApiUrls = Annotated[
+    list[str],
+    typer.Option(
+        envvar="MAIN_API_URL",
+        help="URL API работы с видео (можно указать несколько)",
+    ),
+]
+YoutubeDataApiKeys = Annotated[
+    list[str] | None,
+    typer.Option(
+        envvar="YOUTUBE_DATA_API_KEY",
+        help="Ключ доступа к YouTube Data API (можно указать несколько)",
+    ),
+]
+YoutubeDataApiQuota = Annotated[
+    int,
+    typer.Option(
+        envvar="YOUTUBE_DATA_API_QUOTA",
+        help="Дневная квота одного ключа YouTube Data API в единицах",
+    ),
+]
+YoutubeDataApiKeyRotation = Annotated[
+    KeyRotation,
+    typer.Option(
+        envvar="YOUTUBE_DATA_API_KEY_ROTATION",
+        help="Стратегия выбора ключа YouTube Data API",
+    ),
+]
+QuotaState = Annotated[
+    Path | None,
+    typer.Option(
+        envvar="QUOTA_STATE",
+        help="Файл учёта расхода квоты YouTube Data API",
+    ),
+]
+FastLoop = Annotated[
+    bool,
+    typer.Option(
+        "--fast-loop",
+        envvar="FAST_LOOP",
+        help="Использовать uvloop (если установлен)",
+    ),
+]
+Channels = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--channel",
+        envvar="CHANNEL",
+        help="youtube канал, опубликованные видео которого не проверяются "
+        "по одному (можно указать несколько)",
+    ),
+]
+Limit = Annotated[
+    int,
+    typer.Option(
+        envvar="LIMIT",
+        help="Количество последних видео, которые нужно проверить",
+    ),
+]
+State = Annotated[
+    Path | None,
+    typer.Option(
+        envvar="STATE",
+        help="Файл базы состояния (история проверок)",
+    ),
+]
+SharedState = Annotated[
+    Path,
+    typer.Option(
+        "--state",
+        envvar="STATE",
+        help="Файл базы состояния с общей очередью (один для всех обработчиков)",
+    ),
+]
+RemovalConfirmations = Annotated[
+    int,
+    typer.Option(
+        envvar="REMOVAL_CONFIRMATIONS",
+        help="Сколько раз подряд видео должно оказаться удалённым на youtube "
+        "до окончательного удаления",
+    ),
+]
+RemovalConfirmationGap = Annotated[
+    int,
+    typer.Option(
+        envvar="REMOVAL_CONFIRMATION_GAP",
+        help="Минимальный интервал между подтверждениями удаления (в минутах)",
+    ),
+]
+RetryBudget = Annotated[
+    float,
+    typer.Option(
+        envvar="RETRY_BUDGET",
+        min=0,
+        help="Сколько секунд в конце обхода повторять видео, обработка которых "
+        "не удалась (0 — повторять только в начале следующего обхода)",
+    ),
+]
+BatchSize = Annotated[
+    int,
+    typer.Option(
+        envvar="BATCH_SIZE",
+        help="Размер страницы API видео (начальный при --adaptive-batch-size)",
+    ),
+]
+ForceAll = Annotated[
+    bool,
+    typer.Option(
+        "--force-all",
+        envvar="FORCE_ALL",
+        help="Проверить все видео, не учитывая историю проверок",
+    ),
+]
+
+AdaptiveBatch = Annotated[
+    bool,
+    typer.Option(
+        "--adaptive-batch-size",
+        envvar="ADAPTIVE_BATCH_SIZE",
+        help="Подбирать размер страницы по времени загрузки и проверок",
+    ),
+]
+StreamPages = Annotated[
+    bool,
+    typer.Option(
+        "--stream-pages",
+        envvar="STREAM_PAGES",
+        help="Разбирать страницы API видео по мере загрузки",
+    ),
+]
+Pipeline = Annotated[
+    bool,
+    typer.Option(
+        "--pipeline",
+        envvar="PIPELINE",
+        help="Обрабатывать видео конвейером стадий с параллельными обработчиками",
+    ),
+]
+ProbeWorkers = Annotated[
+    int,
+    typer.Option(
+        envvar="PROBE_WORKERS",
+        help="Обработчиков проверки через oEmbed (с --pipeline)",
+    ),
+]
+FallbackWorkers = Annotated[
+    int,
+    typer.Option(
+        envvar="FALLBACK_WORKERS",
+        help="Обработчиков проверки через YouTube Data API (с --pipeline)",
+    ),
+]
+RestoreWorkers = Annotated[
+    int,
+    typer.Option(
+        envvar="RESTORE_WORKERS",
+        help="Обработчиков восстановления видео (с --pipeline)",
+    ),
+]
+DeleteWorkers = Annotated[
+    int,
+    typer.Option(
+        envvar="DELETE_WORKERS",
+        help="Обработчиков окончательного удаления видео (с --pipeline)",
+    ),
+]
+HideWorkers = Annotated[
+    int,
+    typer.Option(
+        envvar="HIDE_WORKERS",
+        help="Обработчиков скрытия видео (с --pipeline)",
+    ),
+]
+RequestSlots = Annotated[
+    int,
+    typer.Option(
+        envvar="REQUEST_SLOTS",
+        help="Одновременных запросов проверки и изменения (с --pipeline)",
+    ),
+]
+WriteBehind = Annotated[
+    bool,
+    typer.Option(
+        "--write-behind",
+        envvar="WRITE_BEHIND",
+        help="Записывать изменения видео в журнал базы состояния и применять "
+        "их к API видео отдельно от проверок",
+    ),
+]
+FlushWorkers = Annotated[
+    int,
+    typer.Option(
+        envvar="FLUSH_WORKERS",
+        help="Одновременных изменений из журнала (с --write-behind)",
+    ),
+]
+
+
+@app.command(CLEAN)
+def main(  # noqa: PLR0913, PLR0917
+    main_api_url: MainApiUrls,
+    limit: Limit = 500,
+    youtube_data_api_key: YoutubeDataApiKeys = None,
+    youtube_data_api_quota: YoutubeDataApiQuota = DAILY_QUOTA,
+    youtube_data_api_key_rotation: YoutubeDataApiKeyRotation = KeyRotation.ROUND_ROBIN,
+    quota_state: QuotaState = None,
+    channel: Channels = None,
+    state: State = None,
+    removal_confirmations: RemovalConfirmations = 1,
+    removal_confirmation_gap: RemovalConfirmationGap = 15,
+    retry_budget: RetryBudget = 30,
+    record: Annotated[
+        Path | None,
+        typer.Option(
+            envvar="RECORD",
+            help="Каталог для записи запросов к API и их длительности",
+        ),
+    ] = None,
+    replay: Annotated[
+        Path | None,
+        typer.Option(
+            envvar="REPLAY",
+            help="Каталог с записью: ответы берутся из неё вместо сети",
+        ),
+    ] = None,
+    replay_latency: Annotated[
+        ReplayLatency,
+        typer.Option(
+            envvar="REPLAY_LATENCY",
+            help="Задержка ответов при воспроизведении записи",
+        ),
+    ] = ReplayLatency.ORIGINAL,
+    dns_ttl: Annotated[
+        float,
+        typer.Option(
+            envvar="DNS_TTL",
+            help="Кэшировать адреса хостов на указанное число секунд (0 — без кэша)",
+        ),
+    ] = 0,
+    warm_connections: Annotated[
+        int,
+        typer.Option(
+            envvar="WARM_CONNECTIONS",
+            help="Сколько соединений открыть с каждым сервисом до начала обхода",
+        ),
+    ] = 0,
+    hedge_percentile: Annotated[
+        float,
+        typer.Option(
+            envvar="HEDGE_PERCENTILE",
+            help="Дублировать проверку через oEmbed, если она дольше этого "
+            "перцентиля длительностей (например, 0.95; 0 — не дублировать)",
+        ),
+    ] = 0,
+    hedge_budget: Annotated[
+        float,
+        typer.Option(
+            envvar="HEDGE_BUDGET",
+            help="Наибольшая доля дублирующих запросов проверки",
+        ),
+    ] = 0.05,
+    batch_size: BatchSize = 50,
+    adaptive_batch_size: AdaptiveBatch = False,  # noqa: FBT002
+    stream_pages: StreamPages = False,  # noqa: FBT002
+    pipeline: Pipeline = False,  # noqa: FBT002
+    probe_workers: ProbeWorkers = 8,
+    fallback_workers: FallbackWorkers = 2,
+    restore_workers: RestoreWorkers = 2,
+    delete_workers: DeleteWorkers = 1,
+    hide_workers: HideWorkers = 1,
+    request_slots: RequestSlots = 100,
+    write_behind: WriteBehind = False,  # noqa: FBT002
+    flush_workers: FlushWorkers = 4,
+    fast_loop: FastLoop = False,  # noqa: FBT002
+    async_dns: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--async-dns",
+            envvar="ASYNC_DNS",
+            help="Получать адреса хостов через aiodns (если установлен)",
+        ),
+    ] = False,
+    force_all: ForceAll = False,  # noqa: FBT002
+    on_overlap: Annotated[
+        OverlapPolicy | None,
+        typer.Option(
+            envvar="ON_OVERLAP",
+            help="Если обход того же API уже выполняется (по базе состояния): "
+            "пропустить запуск, дождаться его окончания или присоединиться "
+            "через общую очередь",
+        ),
+    ] = None,
+    loops: Annotated[
+        int,
+        typer.Option(
+            envvar="LOOPS",
+            min=1,
+            help="Циклов событий в отдельных потоках (больше одного — только "
+            "в сборке Python без GIL)",
+        ),
+    ] = 1,
+    progress_interval: Annotated[
+        float,
+        typer.Option(
+            envvar="PROGRESS_INTERVAL",
+            help="Сообщать о ходе обхода (обработано, скорость, оставшееся "
+            "время) каждые N секунд (0 — не сообщать)",
+        ),
+    ] = 0,
+) -> None:
+    """Очистка видео. Если limit указан 0, то происходит очистка всех видео."""
+    if on_overlap is not None and state is None:
+        msg = "аренда обхода хранится в базе состояния, укажите --state"
+        raise typer.BadParameter(msg, param_hint="--on-overlap")
+    if loops > 1 and len(set(main_api_url)) > 1:
+        # Результаты проверок общие только для обходов в одном цикле событий.
+        msg = "несколько циклов событий обходят только один API"
+        raise typer.BadParameter(msg, param_hint="--loops")
+    config = CleanerConfig(
+        youtube_data_api_keys=tuple(youtube_data_api_key or ()),
+        youtube_data_api_quota=youtube_data_api_quota,
+        youtube_data_api_key_rotation=youtube_data_api_key_rotation,
+        quota_state=quota_state,
+        state=state,
+        record=record,
+        replay=replay,
+        replay_latency=replay_latency,
+        dns_ttl=dns_ttl,
+        async_dns=async_dns,
+        warm_connections=warm_connections,
+        hedge_percentile=hedge_percentile,
+        hedge_budget=hedge_budget,
+        channels=tuple(channel or ()),
+        on_overlap=on_overlap,
+        progress=_progress_sink(targets=len(set(main_api_url)))
+        if progress_interval > 0
+        else None,
+        progress_interval=progress_interval,
+        write_behind=write_behind,
+        flush_workers=flush_workers,
+    )
+    settings = [
+        SweepSettings(
+            main_api_url=url,
+            limit=limit,
+            force_all=force_all,
+            batch_size=batch_size,
+            adaptive_batch_size=adaptive_batch_size,
+            stream_pages=stream_pages,
+            pipeline=PipelineSettings(
+                probe_workers=probe_workers,
+                fallback_workers=fallback_workers,
+                restore_workers=restore_workers,
+                delete_workers=delete_workers,
+                hide_workers=hide_workers,
+                request_slots=request_slots,
+            )
+            if pipeline
+            else None,
+            removal_confirmations=removal_confirmations,
+            removal_confirmation_gap=timedelta(minutes=removal_confirmation_gap),
+            retry_budget=timedelta(seconds=retry_budget),
+        )
+        for url in dict.fromkeys(main_api_url)
+    ]
+    if (loops := loop_count(loops)) > 1:
+        _clean_threaded(config, settings[0], loops, fast_loop=fast_loop)
+        return
+    run(partial(_clean, config, settings), fast_loop=fast_loop)
+
+
+def _clean_threaded(
+    config: CleanerConfig,
+    settings: SweepSettings,
+    loops: int,
+    *,
+    fast_loop: bool,
+) -> None:
+    logger = structlog.stdlib.get_logger()
+    result = sweep_threaded(config, settings, loops, fast_loop=fast_loop)
+    _log_stats(logger, result, target=settings.main_api_url)
+
+
+def _progress_sink(targets: int) -> Callable[[ProgressSnapshot], None]:
+    """Строка в терминале для одного API, иначе журнал."""
+    if targets == 1 and sys.stderr.isatty():
+        return ProgressBar(sys.stderr)
+    return log_progress
+
+
+async def _clean(config: CleanerConfig, settings: list[SweepSettings]) -> None:
+    logger = structlog.stdlib.get_logger()
+    async with CleanerRunner(config) as runner:
+        await runner.warm_up(item.main_api_url for item in settings)
+        if len(settings) == 1:
+            try:
+                _log_stats(logger, await runner.sweep(settings[0]))
+            except RunInProgressError as e:
+                _log_skipped(logger, e)
+            return
+        results = await runner.sweep_targets(settings)
+
+    failed = False
+    for url, result in results.items():
+        if isinstance(result, RunInProgressError):
+            _log_skipped(logger, result)
+        elif isinstance(result, BaseException):
+            logger.error("Ошибка обработки API", target=url, exc_info=result)
+            failed = True
+        else:
+            _log_stats(logger, result, target=url)
+
+    if failed:
+        raise typer.Exit(1)
+
+
+def _log_skipped(
+    logger: structlog.stdlib.BoundLogger, error: RunInProgressError
+) -> None:
+    logger.info(
+        "Обход пропущен",
+        target=error.holder.target,
+        owner=error.holder.owner,
+        started=error.holder.started.isoformat(),
+    )
 
 
 @app.command()
-@partial(syncify, raise_sync_error=False)
-async def main(
-    main_api_url: Annotated[
-        str,
-        typer.Option(envvar="MAIN_API_URL", help="URL API работы с видео"),
-    ],
-    limit: Annotated[
+def sample(  # noqa: PLR0913, PLR0917
+    main_api_url: MainApiUrls,
+    size: Annotated[
         int,
+        typer.Option(envvar="SAMPLE_SIZE", help="Размер случайной выборки видео"),
+    ] = 100,
+    confidence: Annotated[
+        float,
+        typer.Option(
+            envvar="SAMPLE_CONFIDENCE",
+            min=0.5,
+            max=0.999,
+            help="Уровень доверия интервалов",
+        ),
+    ] = 0.95,
+    seed: Annotated[
+        int | None,
+        typer.Option(
+            envvar="SAMPLE_SEED",
+            help="Начальное значение генератора (для воспроизводимой выборки)",
+        ),
+    ] = None,
+    youtube_data_api_key: YoutubeDataApiKeys = None,
+    youtube_data_api_quota: YoutubeDataApiQuota = DAILY_QUOTA,
+    youtube_data_api_key_rotation: YoutubeDataApiKeyRotation = KeyRotation.ROUND_ROBIN,
+    quota_state: QuotaState = None,
+    fast_loop: FastLoop = False,  # noqa: FBT002
+) -> None:
+    """Оценить долю существующих, скрытых и удалённых видео по выборке.
+
+    Видео не изменяются.
+    """
+    config = CleanerConfig(
+        youtube_data_api_keys=tuple(youtube_data_api_key or ()),
+        youtube_data_api_quota=youtube_data_api_quota,
+        youtube_data_api_key_rotation=youtube_data_api_key_rotation,
+        quota_state=quota_state,
+    )
+    run(
+        partial(
+            _sample,
+            config,
+            list(dict.fromkeys(main_api_url)),
+            size,
+            confidence,
+            seed,
+        ),
+        fast_loop=fast_loop,
+    )
+
+
+async def _sample(
+    config: CleanerConfig,
+    urls: list[str],
+    size: int,
+    confidence: float,
+    seed: int | None,
+) -> None:
+    logger = structlog.stdlib.get_logger()
+    async with CleanerRunner(config) as runner:
+        for url in urls:
+            report = await runner.sample(url, size, confidence=confidence, seed=seed)
+            logger.info(
+                "Оценка состояния каталога",
+                target=url,
+                population=report.population,
+                sample=report.size,
+                failed=report.failed,
+                confidence=report.confidence,
+                exists=str(report.estimate(ExistsStatus.EXISTS)),
+                hidden=str(report.estimate(ExistsStatus.HIDDEN)),
+                removed=str(report.estimate(ExistsStatus.REMOVED)),
+            )
+
+
+@app.command()
+def simulate(  # noqa: PLR0913, PLR0917
+    size: Annotated[
+        int | None,
+        typer.Option(
+            envvar="SIMULATION_SIZE",
+            help="Размер каталога (по умолчанию — из записи или 10000)",
+        ),
+    ] = None,
+    recording: Annotated[
+        Path | None,
         typer.Option(
-            envvar="LIMIT",
-            help="Количество последних видео, которые нужно проверить",
+            envvar="RECORDING",
+            help="Каталог записи прошлого обхода (--record): длительности "
+            "запросов и доли статусов",
         ),
-    ] = 500,
-    youtube_data_api_key: Annotated[
+    ] = None,
+    deleted_share: Annotated[
+        float | None,
+        typer.Option(
+            envvar="SIMULATION_DELETED_SHARE",
+            min=0,
+            max=1,
+            help="Доля видео, удалённых в API видео (по умолчанию — из записи или 0)",
+        ),
+    ] = None,
+    hidden_share: Annotated[
+        float | None,
+        typer.Option(
+            envvar="SIMULATION_HIDDEN_SHARE",
+            min=0,
+            max=1,
+            help="Доля видео, скрытых на youtube (по умолчанию — из записи или 0)",
+        ),
+    ] = None,
+    removed_share: Annotated[
+        float | None,
+        typer.Option(
+            envvar="SIMULATION_REMOVED_SHARE",
+            min=0,
+            max=1,
+            help="Доля видео, удалённых с youtube (по умолчанию — из записи или 0)",
+        ),
+    ] = None,
+    unauthorized_share: Annotated[
+        float | None,
+        typer.Option(
+            envvar="SIMULATION_UNAUTHORIZED_SHARE",
+            min=0,
+            max=1,
+            help="Доля видео, недоступных через oEmbed и проверяемых через "
+            "YouTube Data API (по умолчанию — из записи или 0)",
+        ),
+    ] = None,
+    seed: Annotated[
+        int | None,
+        typer.Option(
+            envvar="SIMULATION_SEED",
+            help="Начальное значение генератора (для воспроизводимой имитации)",
+        ),
+    ] = None,
+    limit: Limit = 0,
+    batch_size: BatchSize = 50,
+    adaptive_batch_size: AdaptiveBatch = False,  # noqa: FBT002
+    stream_pages: StreamPages = False,  # noqa: FBT002
+    pipeline: Pipeline = False,  # noqa: FBT002
+    probe_workers: ProbeWorkers = 8,
+    fallback_workers: FallbackWorkers = 2,
+    restore_workers: RestoreWorkers = 2,
+    delete_workers: DeleteWorkers = 1,
+    hide_workers: HideWorkers = 1,
+    request_slots: RequestSlots = 100,
+    removal_confirmations: RemovalConfirmations = 1,
+) -> None:
+    """Оценить длительность обхода и нагрузку на сервисы без обращения к ним.
+
+    Настоящий UseCase обходит имитируемый каталог, время идёт виртуально.
+    """
+    profile = (
+        profile_from_recording(recording, size)
+        if recording
+        else SimulationProfile(
+            catalogue_size=size or SimulationProfile().catalogue_size
+        )
+    )
+    overrides = {
+        "deleted_share": deleted_share,
+        "hidden_share": hidden_share,
+        "removed_share": removed_share,
+        "unauthorized_share": unauthorized_share,
+    }
+    profile = replace(
+        profile,
+        **{name: value for name, value in overrides.items() if value is not None},
+    )
+    settings = SweepSettings(
+        main_api_url="simulation",
+        limit=limit,
+        batch_size=batch_size,
+        adaptive_batch_size=adaptive_batch_size,
+        stream_pages=stream_pages,
+        pipeline=PipelineSettings(
+            probe_workers=probe_workers,
+            fallback_workers=fallback_workers,
+            restore_workers=restore_workers,
+            delete_workers=delete_workers,
+            hide_workers=hide_workers,
+            request_slots=request_slots,
+        )
+        if pipeline
+        else None,
+        removal_confirmations=removal_confirmations,
+    )
+    run(partial(_simulate, settings, profile, seed), virtual_clock=True)
+
+
+async def _simulate(
+    settings: SweepSettings, profile: SimulationProfile, seed: int | None
+) -> None:
+    logger = structlog.stdlib.get_logger()
+    report = await simulate_sweep(settings, profile, seed=seed)
+    logger.info(
+        "Оценка обхода",
+        catalogue_size=profile.catalogue_size,
+        wall_time=str(timedelta(seconds=round(report.wall_time))),
+        requests=report.total.requests,
+        peak_concurrency=report.total.peak_concurrency,
+        total=report.stats.total,
+        **report.stats.counters(),
+    )
+    for name, load in report.upstreams.items():
+        logger.info(
+            "Нагрузка на сервис",
+            upstream=name,
+            requests=load.requests,
+            peak_concurrency=load.peak_concurrency,
+        )
+
+
+@app.command()
+def enqueue(
+    main_api_url: MainApiUrls,
+    state: SharedState,
+    limit: Limit = 0,
+    batch_size: BatchSize = 50,
+) -> None:
+    """Поставить страницы API видео в общую очередь для `cleaner worker`.
+
+    Очередь хранится в базе состояния. Если limit указан 0, в очередь
+    ставятся все видео.
+    """
+    config = CleanerConfig(state=state)
+    settings = [
+        SweepSettings(main_api_url=url, limit=limit, batch_size=batch_size)
+        for url in dict.fromkeys(main_api_url)
+    ]
+    run(partial(_enqueue, config, settings))
+
+
+async def _enqueue(config: CleanerConfig, settings: list[SweepSettings]) -> None:
+    async with CleanerRunner(config) as runner:
+        for item in settings:
+            _ = await runner.enqueue(item)
+
+
+@app.command()
+def worker(  # noqa: PLR0913, PLR0917
+    main_api_url: MainApiUrls,
+    state: SharedState,
+    name: Annotated[
         str | None,
         typer.Option(
-            envvar="YOUTUBE_DATA_API_KEY", help="Ключ доступа к YouTube Data API"
+            envvar="WORKER_NAME",
+            help="Имя обработчика (по умолчанию — хост и номер процесса)",
         ),
     ] = None,
+    lease_time: Annotated[
+        int,
+        typer.Option(
+            envvar="LEASE_TIME",
+            help="Время аренды страницы в секундах",
+        ),
+    ] = 300,
+    youtube_data_api_key: YoutubeDataApiKeys = None,
+    youtube_data_api_quota: YoutubeDataApiQuota = DAILY_QUOTA,
+    youtube_data_api_key_rotation: YoutubeDataApiKeyRotation = KeyRotation.ROUND_ROBIN,
+    quota_state: QuotaState = None,
+    channel: Channels = None,
+    removal_confirmations: RemovalConfirmations = 1,
+    removal_confirmation_gap: RemovalConfirmationGap = 15,
+    write_behind: WriteBehind = False,  # noqa: FBT002
+    flush_workers: FlushWorkers = 4,
+    fast_loop: FastLoop = False,  # noqa: FBT002
+    force_all: ForceAll = False,  # noqa: FBT002
+) -> None:
+    """Обрабатывать страницы из общей очереди, пока она не опустеет."""
+    config = CleanerConfig(
+        youtube_data_api_keys=tuple(youtube_data_api_key or ()),
+        youtube_data_api_quota=youtube_data_api_quota,
+        youtube_data_api_key_rotation=youtube_data_api_key_rotation,
+        quota_state=quota_state,
+        state=state,
+        channels=tuple(channel or ()),
+        write_behind=write_behind,
+        flush_workers=flush_workers,
+    )
+    settings = [
+        SweepSettings(
+            main_api_url=url,
+            force_all=force_all,
+            removal_confirmations=removal_confirmations,
+            removal_confirmation_gap=timedelta(minutes=removal_confirmation_gap),
+        )
+        for url in dict.fromkeys(main_api_url)
+    ]
+    run(
+        partial(
+            _work,
+            config,
+            settings,
+            name or default_run_name(),
+            timedelta(seconds=lease_time),
+        ),
+        fast_loop=fast_loop,
+    )
+
+
+async def _work(
+    config: CleanerConfig,
+    settings: list[SweepSettings],
+    name: str,
+    lease_time: timedelta,
 ) -> None:
-    """Очистка видео. Если limit указан 0, то происходит очистка всех видео."""
     logger = structlog.stdlib.get_logger()
-    cleaner_use_case = await container.get(VideoCleanerUseCase)
-    video_repository = await container.get(VideoRepository)
+    async with CleanerRunner(config) as runner:
+        results = await asyncio.gather(
+            *(runner.work(item, name, lease_time) for item in settings)
+        )
+        for item, result in zip(settings, results, strict=True):
+            _log_stats(logger, result, target=item.main_api_url, worker=name)
+            summary = await runner.queue_summary(item.main_api_url)
+            logger.info(
+                "Статистика всех обработчиков",
+                target=item.main_api_url,
+                pages=summary.done,
+                failed_pages=summary.failed,
+                total=summary.stats.total,
+                **summary.stats.counters(),
+            )
+
+
+@app.command()
+def daemon(  # noqa: PLR0913, PLR0917
+    main_api_url: MainApiUrls,
+    callback_url: Annotated[
+        str,
+        typer.Option(
+            envvar="WEBSUB_CALLBACK_URL",
+            help="Публичный адрес, на который хаб присылает уведомления",
+        ),
+    ],
+    channel: Channels = None,
+    state: State = None,
+    host: Annotated[
+        str,
+        typer.Option(envvar="WEBSUB_HOST", help="Адрес для приёма уведомлений"),
+    ] = "127.0.0.1",
+    port: Annotated[
+        int,
+        typer.Option(envvar="WEBSUB_PORT", help="Порт для приёма уведомлений"),
+    ] = 8080,
+    hub_url: Annotated[
+        str,
+        typer.Option(envvar="WEBSUB_HUB_URL", help="Адрес хаба WebSub"),
+    ] = HUB_URL,
+    secret: Annotated[
+        str | None,
+        typer.Option(
+            envvar="WEBSUB_SECRET",
+            help="Секрет подписки: уведомления без верной подписи игнорируются",
+        ),
+    ] = None,
+    lease_seconds: Annotated[
+        int,
+        typer.Option(envvar="WEBSUB_LEASE_SECONDS", help="Срок подписки в секундах"),
+    ] = 5 * 24 * 60 * 60,
+    sweep_interval: Annotated[
+        float,
+        typer.Option(
+            envvar="SWEEP_INTERVAL", help="Интервал между обходами в секундах"
+        ),
+    ] = 600,
+    background_sample: Annotated[
+        float,
+        typer.Option(
+            envvar="BACKGROUND_SAMPLE",
+            min=0,
+            max=1,
+            help="Доля видео без уведомлений, проверяемых в каждом обходе",
+        ),
+    ] = 0.01,
+    youtube_data_api_key: YoutubeDataApiKeys = None,
+    youtube_data_api_quota: YoutubeDataApiQuota = DAILY_QUOTA,
+    youtube_data_api_key_rotation: YoutubeDataApiKeyRotation = KeyRotation.ROUND_ROBIN,
+    quota_state: QuotaState = None,
+    removal_confirmations: RemovalConfirmations = 1,
+    removal_confirmation_gap: RemovalConfirmationGap = 15,
+    retry_budget: RetryBudget = 30,
+    batch_size: BatchSize = 50,
+    write_behind: WriteBehind = False,  # noqa: FBT002
+    flush_workers: FlushWorkers = 4,
+    fast_loop: FastLoop = False,  # noqa: FBT002
+) -> None:
+    """Следить за каналами через WebSub и проверять только изменившиеся видео.
+
+    Уведомления хаба о публикации, изменении и удалении видео каналов
+    отмечают видео в базе состояния; обходы каждые `sweep-interval` секунд
+    проверяют отмеченные видео и небольшую случайную долю остальных.
+    """
+    config = CleanerConfig(
+        youtube_data_api_keys=tuple(youtube_data_api_key or ()),
+        youtube_data_api_quota=youtube_data_api_quota,
+        youtube_data_api_key_rotation=youtube_data_api_key_rotation,
+        quota_state=quota_state,
+        state=state,
+        channels=tuple(channel or ()),
+        write_behind=write_behind,
+        flush_workers=flush_workers,
+    )
+    settings = [
+        SweepSettings(
+            main_api_url=url,
+            limit=0,
+            batch_size=batch_size,
+            removal_confirmations=removal_confirmations,
+            removal_confirmation_gap=timedelta(minutes=removal_confirmation_gap),
+            retry_budget=timedelta(seconds=retry_budget),
+        )
+        for url in dict.fromkeys(main_api_url)
+    ]
+    websub = WebSubSettings(
+        callback_url=callback_url,
+        host=host,
+        port=port,
+        hub_url=hub_url,
+        secret=secret,
+        lease_seconds=lease_seconds,
+        sweep_interval=sweep_interval,
+        background_sample=background_sample,
+    )
+    run(partial(_daemon, config, settings, websub), fast_loop=fast_loop)
 
-    video_repository.base_url = main_api_url
 
-    if youtube_data_api_key:
-        http_client = await container.get(AsyncClient)
-        youtube_data_api_repository = YoutubeDataApiRepository(
-            youtube_data_api_key, http_client
+async def _daemon(
+    config: CleanerConfig, settings: list[SweepSettings], websub: WebSubSettings
+) -> None:
+    logger = structlog.stdlib.get_logger()
+    topics = [channel_topic(channel_id) for channel_id in config.channels]
+    async with CleanerRunner(config) as runner:
+        dirty = await runner.container.get(IDirtySet)
+        server = await serve_callback(
+            WebSubCallback(dirty, topics, secret=websub.secret),
+            websub.host,
+            websub.port,
         )
-        cleaner_use_case.youtube_data_api_repo = youtube_data_api_repository
+        subscriber = WebSubSubscriber(
+            await runner.container.get(AsyncClient),
+            websub.callback_url,
+            hub_url=websub.hub_url,
+            secret=websub.secret,
+        )
+        async with server:
+            renewals = asyncio.create_task(
+                keep_subscribed(subscriber, topics, websub.lease_seconds)
+            )
+            try:
+                while True:
+                    results = await runner.sweep_dirty(
+                        settings, dirty, background_sample=websub.background_sample
+                    )
+                    for url, result in results.items():
+                        if isinstance(result, RunInProgressError):
+                            _log_skipped(logger, result)
+                        elif isinstance(result, BaseException):
+                            logger.error(
+                                "Ошибка обработки API", target=url, exc_info=result
+                            )
+                        else:
+                            _log_stats(logger, result, target=url)
+                    await asyncio.sleep(websub.sweep_interval)
+            finally:
+                _ = renewals.cancel()
 
-    result = await cleaner_use_case.execute(limit)
 
+def _log_stats(
+    logger: structlog.stdlib.BoundLogger, result: VideoCleanerStats, **context: str
+) -> None:
     logger.info(
         "Обработка видео завершена",
+        **context,
         total=result.total,
         hidden=result.hidden,
         deleted=result.deleted,
         restored=result.restored,
+        skipped=result.skipped,
+        pending=result.pending,
+        reconciled=result.reconciled,
+        failed=result.failed,
+        discovered=result.discovered,
+        hedges=result.hedges,
+        hedge_wins=result.hedge_wins,
+        quota_remaining=result.quota_remaining,
+        batch_sizes=result.batch_sizes,
+        time_to_first_verdict=result.time_to_first_verdict,
     )
-    await container.close()
 
 
 if __name__ == "__main__":
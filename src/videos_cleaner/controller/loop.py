@@ -0,0 +1,76 @@
+import asyncio
+import importlib.util
+import selectors
+from collections.abc import Awaitable, Callable
+from typing import final, override
+
+import anyio
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@final
+class _VirtualSelector(selectors.DefaultSelector):
+    """Селектор, который вместо ожидания таймеров сдвигает время цикла."""
+
+    def __init__(self, loop: "VirtualClockEventLoop") -> None:
+        super().__init__()
+        self._loop = loop
+
+    @override
+    def select(
+        self, timeout: float | None = None
+    ) -> list[tuple[selectors.SelectorKey, int]]:
+        events = super().select(0)
+        if events or timeout is None:
+            # Ждать нечего, кроме событий из других потоков.
+            return events or super().select(timeout)
+        self._loop.advance(timeout)
+        return events
+
+
+@final
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Цикл событий с виртуальным временем.
+
+    Когда готовых задач нет, время сразу сдвигается к ближайшему таймеру,
+    поэтому `asyncio.sleep` не задерживает выполнение. Используется для
+    имитации обхода: длительность ответов задаётся задержками.
+    """
+
+    def __init__(self) -> None:
+        """Конструктор."""
+        self._now = 0.0
+        super().__init__(_VirtualSelector(self))
+
+    @override
+    def time(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Сдвинуть время цикла."""
+        self._now += max(seconds, 0.0)
+
+
+def run[T](
+    func: Callable[[], Awaitable[T]],
+    *,
+    fast_loop: bool = False,
+    virtual_clock: bool = False,
+) -> T:
+    """Выполнить асинхронную функцию в новом цикле событий.
+
+    Args:
+        func: Асинхронная функция.
+        fast_loop: Использовать uvloop, если он установлен.
+        virtual_clock: Использовать цикл с виртуальным временем.
+    """
+    if virtual_clock:
+        return anyio.run(func, backend_options={"loop_factory": VirtualClockEventLoop})
+    backend_options: dict[str, bool] = {}
+    if fast_loop and importlib.util.find_spec("uvloop") is None:
+        logger.warning("uvloop не установлен, используется стандартный цикл событий")
+    elif fast_loop:
+        backend_options["use_uvloop"] = True
+    return anyio.run(func, backend_options=backend_options)
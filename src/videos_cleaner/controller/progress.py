@@ -0,0 +1,72 @@
+from typing import TextIO, final
+
+import structlog
+
+from videos_cleaner.entities.cleaner import ProgressSnapshot
+
+logger = structlog.stdlib.get_logger(__name__)
+
+BAR_WIDTH = 30
+
+
+def _duration(seconds: float | None) -> str:
+    """Длительность в виде ЧЧ:ММ:СС ("--:--:--", если неизвестна)."""
+    if seconds is None:
+        return "--:--:--"
+    minutes, secs = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02}:{minutes:02}:{secs:02}"
+
+
+def log_progress(snapshot: ProgressSnapshot) -> None:
+    """Записать ход обхода в журнал (итог обхода записывается отдельно)."""
+    if snapshot.finished:
+        return
+    logger.info(
+        "Прогресс обхода",
+        target=snapshot.target,
+        processed=snapshot.processed,
+        expected=snapshot.expected,
+        rate=round(snapshot.rate, 2),
+        eta=_duration(snapshot.eta),
+        in_flight=snapshot.in_flight,
+        **snapshot.counters,
+    )
+
+
+@final
+class ProgressBar:
+    """Строка хода обхода в терминале, перерисовываемая на месте."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Конструктор.
+
+        Args:
+            stream: Терминал (обычно stderr).
+        """
+        self._stream = stream
+
+    def render(self, snapshot: ProgressSnapshot) -> str:
+        """Строка хода обхода."""
+        fraction = snapshot.fraction
+        if fraction is None:
+            bar = "?" * BAR_WIDTH
+        else:
+            filled = round(fraction * BAR_WIDTH)
+            bar = "#" * filled + "." * (BAR_WIDTH - filled)
+        expected = "?" if snapshot.expected is None else str(snapshot.expected)
+        in_flight = sum(snapshot.in_flight.values())
+        counters = " ".join(
+            f"{name}={value}" for name, value in snapshot.counters.items() if value
+        )
+        return (
+            f"[{bar}] {snapshot.processed}/{expected} "
+            f"{snapshot.rate:.1f}/с ETA {_duration(snapshot.eta)} "
+            f"запросов {in_flight} {counters}"
+        ).rstrip()
+
+    def __call__(self, snapshot: ProgressSnapshot) -> None:
+        """Перерисовать строку (после итогового отчёта — перевести строку)."""
+        end = "\n" if snapshot.finished else ""
+        _ = self._stream.write(f"\r\033[K{self.render(snapshot)}{end}")
+        self._stream.flush()
@@ -0,0 +1,637 @@
+import asyncio
+import os
+import socket
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import TracebackType
+from typing import Self, final
+
+import structlog
+from httpx import AsyncClient
+from wireup import AsyncContainer, create_async_container
+
+from videos_cleaner.adapters import repositories
+from videos_cleaner.adapters.repositories.cassette import ReplayLatency
+from videos_cleaner.adapters.repositories.channel_repository import (
+    FeedChannelRepository,
+    YoutubeDataApiChannelRepository,
+)
+from videos_cleaner.adapters.repositories.circuit_breaker import (
+    CircuitBreakerMetaRepository,
+    CircuitBreakerVideoRepository,
+)
+from videos_cleaner.adapters.repositories.dead_letter_repository import (
+    DeadLetterRepository,
+)
+from videos_cleaner.adapters.repositories.meta_repository import (
+    YoutubeDataApiRepository,
+)
+from videos_cleaner.adapters.repositories.mutation_journal import (
+    MutationJournalRepository,
+)
+from videos_cleaner.adapters.repositories.network import (
+    OEMBED_URL,
+    YOUTUBE_DATA_API_URL,
+    RequestGauge,
+    warm_up,
+)
+from videos_cleaner.adapters.repositories.quota import (
+    DAILY_QUOTA,
+    KeyRotation,
+    QuotaAccountant,
+)
+from videos_cleaner.adapters.repositories.removal_repository import (
+    RemovalRepository,
+)
+from videos_cleaner.adapters.repositories.run_lock import RunLockRepository
+from videos_cleaner.adapters.repositories.snapshot_repository import (
+    SnapshotRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.adapters.repositories.video_repository import VideoRepository
+from videos_cleaner.adapters.repositories.work_queue import WorkQueueRepository
+from videos_cleaner.domain.interfaces.dirty_set import IDirtySet
+from videos_cleaner.domain.interfaces.history_repository import IHistoryRepository
+from videos_cleaner.domain.interfaces.meta_repository import IMetaRepository
+from videos_cleaner.domain.interfaces.mutation_journal import IMutationJournal
+from videos_cleaner.domain.interfaces.video_repository import IVideoRepository
+from videos_cleaner.domain.interfaces.work_queue import IWorkQueue
+from videos_cleaner.domain.use_cases.batch_sizer import AdaptiveBatchSize
+from videos_cleaner.domain.use_cases.channel_discovery import discover_live
+from videos_cleaner.domain.use_cases.mutation_flusher import MutationFlusher
+from videos_cleaner.domain.use_cases.pipeline import PipelineSettings
+from videos_cleaner.domain.use_cases.progress import ProgressReporter
+from videos_cleaner.domain.use_cases.queue_worker import QueueWorker, enqueue_pages
+from videos_cleaner.domain.use_cases.run_guard import (
+    OverlapPolicy,
+    RunGuard,
+    RunInProgressError,
+)
+from videos_cleaner.domain.use_cases.sampler import CatalogueSampler
+from videos_cleaner.domain.use_cases.verdict_cache import VerdictCache
+from videos_cleaner.domain.use_cases.video_use_case import (
+    CleanerSettings,
+    VideoCleanerUseCase,
+)
+from videos_cleaner.entities.cleaner import ProgressSnapshot, VideoCleanerStats
+from videos_cleaner.entities.sample import SampleReport
+from videos_cleaner.entities.work import QueueSummary
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def default_run_name() -> str:
+    """Имя запуска по умолчанию: хост и номер процесса."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class CleanerConfig:
+    """Настройки процесса, общие для всех обходов."""
+
+    youtube_data_api_keys: tuple[str, ...] = ()
+    youtube_data_api_quota: int = DAILY_QUOTA
+    youtube_data_api_key_rotation: KeyRotation = KeyRotation.ROUND_ROBIN
+    quota_state: Path | None = None
+    state: Path | None = None
+    breaker_error_ratio: float = 0.5
+    hedge_percentile: float = 0
+    hedge_budget: float = 0.05
+    record: Path | None = None
+    replay: Path | None = None
+    replay_latency: ReplayLatency = ReplayLatency.ORIGINAL
+    dns_ttl: float = 0
+    async_dns: bool = False
+    warm_connections: int = 0
+    channels: tuple[str, ...] = ()
+    on_overlap: OverlapPolicy | None = None
+    run_name: str = field(default_factory=default_run_name)
+    progress: Callable[[ProgressSnapshot], None] | None = None
+    progress_interval: float = 10.0
+    write_behind: bool = False
+    flush_workers: int = 4
+
+
+@dataclass(frozen=True)
+class SweepSettings:
+    """Настройки одного обхода API видео."""
+
+    main_api_url: str = "http://localhost"
+    limit: int | None = 500
+    force_all: bool = False
+    batch_size: int = 50
+    adaptive_batch_size: bool = False
+    stream_pages: bool = False
+    pipeline: PipelineSettings | None = None
+    removal_confirmations: int = 1
+    removal_confirmation_gap: timedelta = field(
+        default_factory=lambda: timedelta(minutes=15)
+    )
+    retry_budget: timedelta = field(default_factory=lambda: timedelta(seconds=30))
+
+
+def cleaner_settings(settings: SweepSettings) -> CleanerSettings:
+    """Настройки UseCase для обхода.
+
+    Args:
+        settings: Настройки обхода.
+    """
+    return CleanerSettings(
+        batch_size=settings.batch_size,
+        stream_pages=settings.stream_pages,
+        pipeline=settings.pipeline,
+        removal_confirmations=settings.removal_confirmations,
+        removal_confirmation_gap=settings.removal_confirmation_gap,
+        retry_budget=settings.retry_budget,
+    )
+
+
+def batch_sizer(settings: SweepSettings) -> AdaptiveBatchSize | None:
+    """Подбор размера страницы, если он включён в настройках обхода."""
+    if not settings.adaptive_batch_size:
+        return None
+    return AdaptiveBatchSize(settings.batch_size)
+
+
+def quota_accountant(config: CleanerConfig) -> QuotaAccountant:
+    """Учёт квоты YouTube Data API по настройкам процесса."""
+    return QuotaAccountant(
+        config.youtube_data_api_keys,
+        state_path=config.quota_state,
+        daily_limit=config.youtube_data_api_quota,
+        rotation=config.youtube_data_api_key_rotation,
+    )
+
+
+@final
+class CleanerRunner:
+    """Запуск обходов с общим пулом соединений, источниками и состоянием.
+
+    Пример:
+        async with CleanerRunner(config) as runner:
+            stats = await runner.sweep(SweepSettings(main_api_url=url))
+    """
+
+    def __init__(
+        self,
+        config: CleanerConfig | None = None,
+        *,
+        quota: QuotaAccountant | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            config: Настройки процесса.
+            quota: Учёт квоты YouTube Data API, общий с другими запусками
+                (по умолчанию создаётся свой).
+        """
+        self.config = config or CleanerConfig()
+        self._shared_quota = quota
+        self._container: AsyncContainer | None = None
+        self._data_api_repo: IMetaRepository | None = None
+        self._video_repos: dict[str, IVideoRepository] = {}
+        self._quota: QuotaAccountant | None = None
+        self._quota_saver: asyncio.Task[None] | None = None
+        self._known_live: asyncio.Task[frozenset[str]] | None = None
+        self._warmed: float | None = None
+        self._started: float | None = None
+        self._replayed: set[str] = set()
+
+    @property
+    def container(self) -> AsyncContainer:
+        """Контейнер зависимостей (доступен внутри `async with`)."""
+        if self._container is None:
+            msg = "CleanerRunner не запущен"
+            raise RuntimeError(msg)
+        return self._container
+
+    async def __aenter__(self) -> Self:
+        """Создать контейнер и общие источники."""
+        self._container = create_async_container(
+            [repositories],
+            parameters={
+                "breaker_error_ratio": self.config.breaker_error_ratio,
+                "hedge_percentile": self.config.hedge_percentile,
+                "hedge_budget": self.config.hedge_budget,
+                "state_path": str(self.config.state or ":memory:"),
+                "record": str(self.config.record) if self.config.record else None,
+                "replay": str(self.config.replay) if self.config.replay else None,
+                "replay_latency": self.config.replay_latency,
+                "dns_ttl": self.config.dns_ttl,
+                "async_dns": self.config.async_dns,
+            },
+        )
+
+        if keys := self.config.youtube_data_api_keys:
+            client = await self.container.get(AsyncClient)
+            self._quota = self._shared_quota or quota_accountant(self.config)
+            self._quota_saver = asyncio.create_task(self._quota.keep_saved())
+            self._data_api_repo = CircuitBreakerMetaRepository(
+                YoutubeDataApiRepository(keys, client, self._quota),
+                error_ratio=self.config.breaker_error_ratio,
+            )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Сохранить расход квоты, закрыть контейнер и соединения."""
+        if self._quota_saver is not None:
+            _ = self._quota_saver.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._quota_saver
+            self._quota_saver = None
+        await self.container.close()
+        self._container = None
+        self._data_api_repo = None
+        self._quota = None
+        self._known_live = None
+        self._replayed.clear()
+        self._video_repos.clear()
+
+    async def warm_up(self, main_api_urls: Iterable[str]) -> None:
+        """Открыть соединения с API видео и youtube до начала обходов.
+
+        Ничего не делает, если прогрев не настроен или ответы
+        воспроизводятся из записи.
+
+        Args:
+            main_api_urls: Адреса API видео.
+        """
+        if self.config.warm_connections <= 0 or self.config.replay:
+            return
+        self._warmed = time.perf_counter()
+        urls = [*main_api_urls, OEMBED_URL]
+        if self.config.youtube_data_api_keys:
+            urls.append(YOUTUBE_DATA_API_URL)
+        await warm_up(
+            await self.container.get(AsyncClient),
+            urls,
+            self.config.warm_connections,
+        )
+
+    def _begin_sweep(self) -> None:
+        """Начать обход (или несколько одновременных обходов).
+
+        Списки каналов запрашиваются заново, а время до первого результата
+        отсчитывается от начала обхода или прогрева соединений перед ним.
+        """
+        self._known_live = None
+        self._started = self._warmed or time.perf_counter()
+        self._warmed = None
+
+    async def _discover(self) -> frozenset[str]:
+        client = await self.container.get(AsyncClient)
+        repo = (
+            YoutubeDataApiChannelRepository(
+                self.config.youtube_data_api_keys, client, self._quota
+            )
+            if self.config.youtube_data_api_keys
+            else FeedChannelRepository(client)
+        )
+        return await discover_live(repo, self.config.channels)
+
+    async def known_live(self) -> frozenset[str]:
+        """Опубликованные видео каналов из настроек.
+
+        Запрашиваются один раз на обход и общие для его API видео.
+        """
+        if not self.config.channels:
+            return frozenset()
+        if self._known_live is None:
+            self._known_live = asyncio.ensure_future(self._discover())
+        return await self._known_live
+
+    async def _video_repo(self, url: str) -> IVideoRepository:
+        if url not in self._video_repos:
+            client = await self.container.get(AsyncClient)
+            self._video_repos[url] = CircuitBreakerVideoRepository(
+                VideoRepository(client, url),
+                error_ratio=self.config.breaker_error_ratio,
+            )
+        return self._video_repos[url]
+
+    async def use_case(
+        self,
+        settings: SweepSettings,
+        *,
+        verdicts: VerdictCache | None = None,
+        journal: IMutationJournal | None = None,
+        dirty: frozenset[str] | None = None,
+        background_sample: float = 0.01,
+    ) -> VideoCleanerUseCase:
+        """Собрать UseCase для обхода.
+
+        Args:
+            settings: Настройки обхода.
+            verdicts: Результаты проверок, общие с другими обходами.
+            journal: Журнал изменений (write-behind).
+            dirty: Изменившиеся видео (обход только по уведомлениям).
+            background_sample: Доля остальных видео, проверяемых при `dirty`.
+        """
+        state = await self.container.get(StateDatabase)
+        progress = None
+        if self.config.progress:
+            gauge = await self.container.get(RequestGauge)
+            progress = ProgressReporter(
+                self.config.progress,
+                interval=self.config.progress_interval,
+                in_flight=gauge.snapshot,
+                target=settings.main_api_url,
+            )
+        return VideoCleanerUseCase(
+            await self._video_repo(settings.main_api_url),
+            await self.container.get(IMetaRepository),
+            self._data_api_repo,
+            await self.container.get(IHistoryRepository),
+            RemovalRepository(state, settings.main_api_url),
+            SnapshotRepository(state, settings.main_api_url),
+            replace(
+                cleaner_settings(settings),
+                known_live=await self.known_live(),
+                dirty=dirty,
+                background_sample=background_sample,
+            ),
+            verdicts=verdicts,
+            journal=journal,
+            dead_letters=DeadLetterRepository(state, settings.main_api_url),
+            progress=progress,
+            batch_sizer=batch_sizer(settings),
+            started=self._started,
+        )
+
+    @asynccontextmanager
+    async def _mutations(self, url: str) -> AsyncIterator[IMutationJournal | None]:
+        """Применять изменения обхода через журнал, если включён write-behind.
+
+        Изменения, оставшиеся в журнале с прошлого запуска, применяются в
+        первом обходе API без задержки.
+
+        Yields:
+            Журнал изменений для UseCase или None без write-behind.
+        """
+        if not self.config.write_behind:
+            yield None
+            return
+        state = await self.container.get(StateDatabase)
+        journal = MutationJournalRepository(state, url)
+        flusher = MutationFlusher(
+            await self._video_repo(url),
+            journal,
+            SnapshotRepository(state, url),
+            workers=self.config.flush_workers,
+        )
+        replay = url not in self._replayed
+        self._replayed.add(url)
+        async with flusher.running(replay=replay):
+            yield journal
+
+    async def sweep(
+        self, settings: SweepSettings, verdicts: VerdictCache | None = None
+    ) -> VideoCleanerStats:
+        """Выполнить один обход.
+
+        Если в настройках процесса задано `on_overlap`, обход выполняется
+        под арендой: пока она у другого запуска, обход пропускается, ждёт
+        её освобождения или присоединяется к обходу через общую очередь.
+
+        Args:
+            settings: Настройки обхода.
+            verdicts: Результаты проверок, общие с другими обходами.
+
+        Raises:
+            RunInProgressError: обход выполняет другой запуск (`skip`).
+        """
+        self._begin_sweep()
+        return await self._guarded_sweep(settings, verdicts)
+
+    async def _guarded_sweep(
+        self, settings: SweepSettings, verdicts: VerdictCache | None
+    ) -> VideoCleanerStats:
+        policy = self.config.on_overlap
+        if policy is None:
+            return await self._sweep(settings, verdicts)
+
+        guard = await self._run_guard(settings.main_api_url)
+        lease = await guard.acquire(wait=policy == OverlapPolicy.WAIT)
+        if not guard.owns(lease):
+            if policy != OverlapPolicy.JOIN:
+                raise RunInProgressError(lease)
+            logger.info("Присоединение к обходу", target=settings.main_api_url)
+            return await self.work(settings, self.config.run_name)
+
+        async with guard.holding(lease):
+            if policy == OverlapPolicy.JOIN:
+                _ = await self.enqueue(settings)
+                return await self.work(settings, self.config.run_name)
+            return await self._sweep(settings, verdicts)
+
+    async def _run_guard(self, main_api_url: str) -> RunGuard:
+        return RunGuard(
+            RunLockRepository(await self.container.get(StateDatabase), main_api_url),
+            self.config.run_name,
+        )
+
+    async def _sweep(
+        self, settings: SweepSettings, verdicts: VerdictCache | None
+    ) -> VideoCleanerStats:
+        async with self._mutations(settings.main_api_url) as journal:
+            use_case = await self.use_case(settings, verdicts=verdicts, journal=journal)
+            return await use_case.execute(settings.limit, force_all=settings.force_all)
+
+    async def sample(
+        self,
+        main_api_url: str,
+        size: int,
+        *,
+        confidence: float = 0.95,
+        seed: int | None = None,
+    ) -> SampleReport:
+        """Оценить состояние каталога по случайной выборке без изменений.
+
+        Args:
+            main_api_url: Адрес API видео.
+            size: Размер выборки.
+            confidence: Уровень доверия интервалов.
+            seed: Начальное значение генератора.
+        """
+        sampler = CatalogueSampler(
+            await self._video_repo(main_api_url),
+            await self.container.get(IMetaRepository),
+            self._data_api_repo,
+        )
+        return await sampler.execute(size, confidence=confidence, seed=seed)
+
+    async def _work_queue(self, url: str) -> WorkQueueRepository:
+        return WorkQueueRepository(await self.container.get(StateDatabase), url)
+
+    async def enqueue(
+        self, settings: SweepSettings, queue: IWorkQueue | None = None
+    ) -> int:
+        """Поставить страницы API видео в общую очередь обработчиков.
+
+        Args:
+            settings: Настройки обхода (адрес, лимит и размер страницы).
+            queue: Очередь (по умолчанию — в базе состояния).
+
+        Returns:
+            Количество страниц.
+        """
+        return await enqueue_pages(
+            queue or await self._work_queue(settings.main_api_url),
+            await self._video_repo(settings.main_api_url),
+            batch_size=settings.batch_size,
+            limit=settings.limit,
+        )
+
+    async def work(
+        self,
+        settings: SweepSettings,
+        name: str,
+        lease_time: timedelta = timedelta(minutes=5),
+        *,
+        queue: IWorkQueue | None = None,
+        poll_interval: float = 5.0,
+    ) -> VideoCleanerStats:
+        """Обрабатывать страницы из общей очереди, пока она не опустеет.
+
+        Args:
+            settings: Настройки обхода.
+            name: Имя обработчика.
+            lease_time: Время аренды страницы.
+            queue: Очередь (по умолчанию — в базе состояния).
+            poll_interval: Интервал ожидания страниц других обработчиков.
+
+        Returns:
+            Статистика страниц, обработанных этим обработчиком.
+        """
+        queue = queue or await self._work_queue(settings.main_api_url)
+        async with self._mutations(settings.main_api_url) as journal:
+            use_case = await self.use_case(settings, journal=journal)
+            worker = QueueWorker(queue, use_case, name)
+            worker.lease_time = lease_time
+            worker.poll_interval = poll_interval
+            return await worker.execute(force_all=settings.force_all)
+
+    async def queue_summary(self, main_api_url: str) -> QueueSummary:
+        """Состояние общей очереди и статистика всех обработчиков.
+
+        Args:
+            main_api_url: Адрес API видео.
+        """
+        queue = await self._work_queue(main_api_url)
+        return await queue.summary(datetime.now(UTC))
+
+    async def sweep_many(
+        self, settings: Iterable[SweepSettings]
+    ) -> list[VideoCleanerStats]:
+        """Выполнить несколько обходов параллельно.
+
+        Args:
+            settings: Настройки обходов.
+        """
+        self._begin_sweep()
+        return list(
+            await asyncio.gather(
+                *(self._guarded_sweep(item, None) for item in settings)
+            )
+        )
+
+    async def sweep_targets(
+        self, settings: Iterable[SweepSettings]
+    ) -> dict[str, VideoCleanerStats | BaseException]:
+        """Обойти несколько API видео, проверяя каждое youtube видео один раз.
+
+        Результат проверки применяется к каждому API, где встречается видео.
+        Ошибка одного API не прерывает обход остальных.
+
+        Args:
+            settings: Настройки обходов (по одному на API).
+
+        Returns:
+            Статистика или ошибка для каждого API.
+        """
+        targets = {item.main_api_url: item for item in settings}
+        verdicts = VerdictCache()
+        self._begin_sweep()
+        results = await asyncio.gather(
+            *(self._guarded_sweep(item, verdicts) for item in targets.values()),
+            return_exceptions=True,
+        )
+        logger.info(
+            "Проверки youtube видео",
+            checked=len(verdicts),
+            reused=verdicts.hits,
+        )
+        return dict(zip(targets, results, strict=True))
+
+    async def sweep_dirty(
+        self,
+        settings: Iterable[SweepSettings],
+        dirty: IDirtySet,
+        *,
+        background_sample: float = 0.01,
+    ) -> dict[str, VideoCleanerStats | BaseException]:
+        """Обойти API видео, проверяя только видео из уведомлений об изменениях.
+
+        Кроме них проверяется случайная доля `background_sample` остальных
+        видео (изменения, о которых уведомление не пришло) и видео без
+        истории проверок. Отметки снимаются, только если все API обойдены
+        без ошибок.
+
+        Каждый API обходится под арендой, как обход с `on_overlap`: API,
+        который обходит другой запуск, пропускается (`wait` — ожидается),
+        а его отметки остаются до следующего обхода.
+
+        Args:
+            settings: Настройки обходов (по одному на API).
+            dirty: Изменившиеся видео.
+            background_sample: Доля остальных видео, проверяемых в каждом обходе.
+
+        Returns:
+            Статистика или ошибка для каждого API.
+        """
+        started = datetime.now(UTC)
+        changed = await dirty.pending()
+        targets = {item.main_api_url: item for item in settings}
+        verdicts = VerdictCache()
+        self._begin_sweep()
+
+        async def sweep(item: SweepSettings) -> VideoCleanerStats:
+            guard = await self._run_guard(item.main_api_url)
+            lease = await guard.acquire(
+                wait=self.config.on_overlap == OverlapPolicy.WAIT
+            )
+            if not guard.owns(lease):
+                raise RunInProgressError(lease)
+            async with (
+                guard.holding(lease),
+                self._mutations(item.main_api_url) as journal,
+            ):
+                use_case = await self.use_case(
+                    item,
+                    verdicts=verdicts,
+                    journal=journal,
+                    dirty=changed,
+                    background_sample=background_sample,
+                )
+                return await use_case.execute(item.limit, force_all=item.force_all)
+
+        results = await asyncio.gather(
+            *map(sweep, targets.values()), return_exceptions=True
+        )
+        if not any(isinstance(result, BaseException) for result in results):
+            await dirty.clear(changed, started)
+        logger.info(
+            "Проверка изменившихся видео",
+            changed=len(changed),
+            checked=len(verdicts),
+        )
+        return dict(zip(targets, results, strict=True))
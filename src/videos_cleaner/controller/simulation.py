@@ -0,0 +1,88 @@
+import asyncio
+import random
+
+from videos_cleaner.adapters.repositories.history_repository import (
+    HistoryRepository,
+)
+from videos_cleaner.adapters.repositories.removal_repository import (
+    RemovalRepository,
+)
+from videos_cleaner.adapters.repositories.simulated import (
+    DATA_API,
+    OEMBED,
+    VIDEO_API,
+    SimulatedMetaRepository,
+    SimulatedVideoRepository,
+    Upstream,
+    make_catalogue,
+)
+from videos_cleaner.adapters.repositories.snapshot_repository import (
+    SnapshotRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.controller.runner import (
+    SweepSettings,
+    batch_sizer,
+    cleaner_settings,
+)
+from videos_cleaner.domain.use_cases.video_use_case import VideoCleanerUseCase
+from videos_cleaner.entities.simulation import (
+    SimulationProfile,
+    SimulationReport,
+    UpstreamLoad,
+)
+
+
+async def simulate(
+    settings: SweepSettings,
+    profile: SimulationProfile,
+    *,
+    seed: int | None = None,
+) -> SimulationReport:
+    """Имитировать обход каталога с настоящим UseCase.
+
+    Сервисы заменяются имитацией с задержками из профиля, история
+    проверок хранится в памяти. Длительность берётся по часам цикла
+    событий, поэтому в цикле с виртуальным временем (`run(...,
+    virtual_clock=True)`) обход большого каталога занимает секунды.
+
+    Args:
+        settings: Настройки обхода.
+        profile: Каталог и поведение сервисов.
+        seed: Начальное значение генератора (для воспроизводимости).
+    """
+    rng = random.Random(seed)  # noqa: S311
+    catalogue = make_catalogue(profile, rng)
+    total = UpstreamLoad()
+    upstreams = {
+        VIDEO_API: Upstream(profile.video_api, rng, total),
+        OEMBED: Upstream(profile.oembed, rng, total),
+        DATA_API: Upstream(profile.data_api, rng, total),
+    }
+
+    state = StateDatabase()
+    try:
+        use_case = VideoCleanerUseCase(
+            SimulatedVideoRepository(catalogue, upstreams[VIDEO_API]),
+            SimulatedMetaRepository(catalogue, upstreams[OEMBED]),
+            SimulatedMetaRepository(catalogue, upstreams[DATA_API], fallback=True),
+            HistoryRepository(state),
+            RemovalRepository(state, settings.main_api_url),
+            SnapshotRepository(state, settings.main_api_url),
+            cleaner_settings(settings),
+            batch_sizer=batch_sizer(settings),
+        )
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        stats = await use_case.execute(settings.limit, force_all=settings.force_all)
+        wall_time = loop.time() - started
+    finally:
+        state.close()
+
+    return SimulationReport(
+        wall_time,
+        total,
+        {name: upstream.load for name, upstream in upstreams.items()},
+        stats,
+    )
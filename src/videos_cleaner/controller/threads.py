@@ -0,0 +1,123 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import structlog
+
+from videos_cleaner.adapters.repositories.quota import QuotaAccountant
+from videos_cleaner.adapters.repositories.work_queue import MemoryWorkQueue
+from videos_cleaner.controller.loop import run
+from videos_cleaner.controller.runner import (
+    CleanerConfig,
+    CleanerRunner,
+    SweepSettings,
+    quota_accountant,
+)
+from videos_cleaner.domain.interfaces.work_queue import IWorkQueue
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def gil_enabled() -> bool:
+    """Включена ли глобальная блокировка интерпретатора (GIL)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if callable(is_gil_enabled) else True
+
+
+def loop_count(requested: int) -> int:
+    """Сколько циклов событий запускать.
+
+    При включённом GIL потоки не выполняют Python-код параллельно, поэтому
+    используется один цикл.
+
+    Args:
+        requested: Запрошенное количество циклов.
+    """
+    if requested > 1 and gil_enabled():
+        logger.warning(
+            "GIL включён, используется один цикл событий", requested=requested
+        )
+        return 1
+    return max(requested, 1)
+
+
+async def _sweep(config: CleanerConfig, settings: SweepSettings) -> VideoCleanerStats:
+    async with CleanerRunner(config) as runner:
+        await runner.warm_up([settings.main_api_url])
+        return await runner.sweep(settings)
+
+
+async def _enqueue(
+    config: CleanerConfig, settings: SweepSettings, queue: IWorkQueue
+) -> int:
+    async with CleanerRunner(config) as runner:
+        return await runner.enqueue(settings, queue)
+
+
+async def _work(
+    config: CleanerConfig,
+    settings: SweepSettings,
+    queue: IWorkQueue,
+    name: str,
+    quota: QuotaAccountant | None,
+) -> VideoCleanerStats:
+    async with CleanerRunner(config, quota=quota) as runner:
+        await runner.warm_up([settings.main_api_url])
+        return await runner.work(settings, name, queue=queue, poll_interval=0.05)
+
+
+def sweep_threaded(
+    config: CleanerConfig,
+    settings: SweepSettings,
+    loops: int,
+    *,
+    fast_loop: bool = False,
+) -> VideoCleanerStats:
+    """Обойти API видео несколькими циклами событий в отдельных потоках.
+
+    Страницы ставятся в общую очередь в памяти; каждый поток со своим
+    циклом, http клиентом и предохранителями берёт из неё страницы, пока
+    они не закончатся. Учёт дневной квоты YouTube Data API общий для всех
+    потоков. С одним циклом (или при включённом GIL) выполняется обычный
+    обход.
+
+    Args:
+        config: Настройки процесса.
+        settings: Настройки обхода.
+        loops: Количество циклов событий (потоков).
+        fast_loop: Использовать uvloop, если он установлен.
+
+    Returns:
+        Суммарная статистика всех потоков.
+    """
+    loops = loop_count(loops)
+    if loops == 1:
+        return run(partial(_sweep, config, settings), fast_loop=fast_loop)
+
+    queue = MemoryWorkQueue()
+    pages = run(partial(_enqueue, config, settings, queue), fast_loop=fast_loop)
+    quota = quota_accountant(config) if config.youtube_data_api_keys else None
+    logger.info("Обход в нескольких потоках", loops=loops, pages=pages)
+    with ThreadPoolExecutor(loops, thread_name_prefix="cleaner-loop") as pool:
+        futures = [
+            pool.submit(
+                run,
+                partial(
+                    _work,
+                    config,
+                    settings,
+                    queue,
+                    f"{config.run_name}-{number}",
+                    quota,
+                ),
+                fast_loop=fast_loop,
+            )
+            for number in range(loops)
+        ]
+        results = [future.result() for future in futures]
+
+    stats = VideoCleanerStats()
+    for result in results:
+        stats.merge(result)
+    return stats
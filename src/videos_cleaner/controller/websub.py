@@ -0,0 +1,198 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from http import HTTPStatus
+from typing import final
+from urllib.parse import parse_qs, urlsplit
+from xml.etree import ElementTree as ET
+
+import structlog
+from httpx import HTTPError
+
+from videos_cleaner.adapters.repositories.websub import (
+    HUB_URL,
+    WebSubSubscriber,
+    parse_notification,
+    verify_signature,
+)
+from videos_cleaner.domain.interfaces.dirty_set import IDirtySet
+
+logger = structlog.stdlib.get_logger(__name__)
+
+MAX_BODY = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class WebSubSettings:
+    """Настройки подписки на уведомления об изменениях в каналах."""
+
+    callback_url: str
+    host: str = "127.0.0.1"
+    port: int = 8080
+    hub_url: str = HUB_URL
+    secret: str | None = None
+    lease_seconds: int = 5 * 24 * 60 * 60
+    sweep_interval: float = 600.0
+    background_sample: float = 0.01
+
+
+@final
+class WebSubCallback:
+    """Адрес подписчика: подтверждение подписок и приём уведомлений."""
+
+    def __init__(
+        self,
+        dirty: IDirtySet,
+        topics: Iterable[str],
+        *,
+        secret: str | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            dirty: Куда отмечать изменившиеся видео.
+            topics: Ленты, на которые оформлена подписка.
+            secret: Секрет подписки (уведомления без верной подписи
+                игнорируются).
+            clock: Источник текущего времени.
+        """
+        self._dirty = dirty
+        self._topics = frozenset(topics)
+        self._secret = secret
+        self._clock = clock
+
+    async def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, bytes]:
+        """Обработать запрос хаба.
+
+        Args:
+            method: Метод запроса.
+            target: Путь с параметрами.
+            headers: Заголовки (имена в нижнем регистре).
+            body: Тело запроса.
+
+        Returns:
+            Код и тело ответа.
+        """
+        if method == "GET":
+            params = parse_qs(urlsplit(target).query)
+            return self._verify({key: values[0] for key, values in params.items()})
+        if method == "POST":
+            return await self._notify(headers, body)
+        return HTTPStatus.METHOD_NOT_ALLOWED, b""
+
+    def _verify(self, params: dict[str, str]) -> tuple[int, bytes]:
+        mode = params.get("hub.mode")
+        topic = params.get("hub.topic")
+        if mode == "denied":
+            logger.warning(
+                "Хаб отклонил подписку", topic=topic, reason=params.get("hub.reason")
+            )
+            return HTTPStatus.OK, b""
+        if mode not in {"subscribe", "unsubscribe"} or topic not in self._topics:
+            return HTTPStatus.NOT_FOUND, b""
+        logger.info(
+            "Подписка подтверждена",
+            mode=mode,
+            topic=topic,
+            lease_seconds=params.get("hub.lease_seconds"),
+        )
+        return HTTPStatus.OK, params.get("hub.challenge", "").encode()
+
+    async def _notify(self, headers: dict[str, str], body: bytes) -> tuple[int, bytes]:
+        if self._secret and not verify_signature(
+            self._secret, body, headers.get("x-hub-signature")
+        ):
+            # Без успешного ответа доставка будет повторяться.
+            logger.warning("Уведомление с неверной подписью")
+            return HTTPStatus.ACCEPTED, b""
+        try:
+            changed = parse_notification(body)
+        except ET.ParseError:
+            return HTTPStatus.BAD_REQUEST, b""
+        await self._dirty.mark(changed, self._clock())
+        logger.debug("Уведомление об изменениях", videos=sorted(changed))
+        return HTTPStatus.NO_CONTENT, b""
+
+
+async def _serve_connection(
+    callback: WebSubCallback,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Обработать одно соединение: один запрос HTTP/1.1 без keep-alive."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_line, *lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        method, target, _ = request_line.split(" ", 2)
+        headers = {
+            name.strip().lower(): value.strip()
+            for name, _, value in (line.partition(":") for line in lines)
+        }
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_BODY:
+            status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b""
+        else:
+            body = await reader.readexactly(length)
+            status, payload = await callback.handle(method, target, headers, body)
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+        status, payload = HTTPStatus.BAD_REQUEST, b""
+
+    writer.write(
+        (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: text/plain\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode()
+        + payload
+    )
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def serve_callback(
+    callback: WebSubCallback, host: str, port: int
+) -> asyncio.Server:
+    """Запустить http сервер адреса подписчика.
+
+    Сервер принимает только запросы хаба, поэтому обходится без
+    веб-фреймворка. Снаружи его обычно закрывает обратный прокси с TLS.
+
+    Args:
+        callback: Обработчик запросов.
+        host: Адрес для прослушивания.
+        port: Порт (0 — любой свободный).
+    """
+    return await asyncio.start_server(partial(_serve_connection, callback), host, port)
+
+
+async def keep_subscribed(
+    subscriber: WebSubSubscriber, topics: Iterable[str], lease_seconds: int
+) -> None:
+    """Подписаться на ленты и продлевать подписки до отмены.
+
+    Подписки продлеваются после 80% срока; ошибка хаба повторяется
+    при следующем продлении, обход тем временем опирается на фоновую
+    выборку.
+
+    Args:
+        subscriber: Подписчик.
+        topics: Ленты.
+        lease_seconds: Срок подписки в секундах.
+    """
+    topics = list(topics)
+    while True:
+        for topic in topics:
+            try:
+                await subscriber.subscribe(topic, lease_seconds)
+            except HTTPError as e:
+                logger.warning("Не удалось подписаться", topic=topic, error=str(e))
+        await asyncio.sleep(lease_seconds * 0.8)
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class IChannelRepository(ABC):
+    """Репозиторий списков видео youtube каналов."""
+
+    @abstractmethod
+    async def live_ids(self, channel_id: str) -> set[str]:
+        """Идентификаторы опубликованных (публичных) видео канала.
+
+        Args:
+            channel_id: идентификатор youtube канала.
+
+        Raises:
+            MetaRepositoryError: общая ошибка репозитория.
+        """
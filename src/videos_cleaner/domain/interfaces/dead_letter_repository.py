@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from wireup import abstract
+
+from videos_cleaner.entities.dead_letter import DeadLetter
+from videos_cleaner.entities.video import Video
+
+
+@abstract
+class IDeadLetterRepository(ABC):
+    """Хранилище видео, обработка которых не удалась."""
+
+    @abstractmethod
+    async def record(self, video: Video, error: str, now: datetime) -> DeadLetter:
+        """Записать неудачную попытку обработки видео.
+
+        Args:
+            video: Видео.
+            error: Класс ошибки.
+            now: Время попытки.
+
+        Returns:
+            Запись с учётом всех попыток.
+        """
+
+    @abstractmethod
+    async def discard(self, slug: str) -> None:
+        """Убрать видео из хранилища после успешной обработки.
+
+        Args:
+            slug: Идентификатор видео.
+        """
+
+    @abstractmethod
+    async def due(
+        self, failed_before: datetime, max_attempts: int, limit: int
+    ) -> list[DeadLetter]:
+        """Видео для повторной попытки, сначала самые старые.
+
+        Args:
+            failed_before: Последняя попытка раньше этого момента.
+            max_attempts: Видео с этим числом попыток больше не повторяются.
+            limit: Ограничение на количество.
+        """
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+
+from wireup import abstract
+
+
+@abstract
+class IDirtySet(ABC):
+    """Youtube видео, о которых пришло уведомление об изменении."""
+
+    @abstractmethod
+    async def mark(self, yt_ids: Iterable[str], now: datetime) -> None:
+        """Отметить видео изменившимися.
+
+        Args:
+            yt_ids: Идентификаторы youtube видео.
+            now: Время уведомления.
+        """
+
+    @abstractmethod
+    async def pending(self) -> frozenset[str]:
+        """Видео, ожидающие проверки."""
+
+    @abstractmethod
+    async def clear(self, yt_ids: Iterable[str], before: datetime) -> None:
+        """Снять отметки после проверки.
+
+        Отметки, поставленные не раньше `before` (уведомления, пришедшие во
+        время обхода), сохраняются до следующего обхода.
+
+        Args:
+            yt_ids: Проверенные видео.
+            before: Время начала обхода.
+        """
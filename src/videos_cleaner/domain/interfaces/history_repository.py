@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from wireup import abstract
+
+from videos_cleaner.entities.history import CheckHistory
+
+
+@abstract
+class IHistoryRepository(ABC):
+    """Репозиторий истории проверок youtube видео."""
+
+    @abstractmethod
+    async def get_many(self, yt_ids: Iterable[str]) -> dict[str, CheckHistory]:
+        """Получить историю проверок.
+
+        Args:
+            yt_ids: идентификаторы youtube видео.
+
+        Returns:
+            История по идентификаторам (видео без истории пропускаются).
+        """
+
+    @abstractmethod
+    async def save_many(self, histories: Iterable[CheckHistory]) -> None:
+        """Сохранить историю проверок.
+
+        Args:
+            histories: обновлённая история.
+        """
@@ -4,6 +4,8 @@ from typing import override
 
 from wireup import abstract
 
+from videos_cleaner.entities.cleaner import HedgeCounters
+
 
 class MetaRepositoryError(Exception):
     """Ошибка репозитория мета информации о Youtube видео."""
@@ -25,6 +27,21 @@ class UnauthorizedError(MetaRepositoryError):
         super().__init__("Нет доступа", 401)
 
 
+class MetaRepositoryUnavailableError(MetaRepositoryError):
+    """Источник мета информации временно недоступен."""
+
+    def __init__(self, message: str = "Сервис недоступен") -> None:
+        super().__init__(message, 503)
+
+
+class QuotaExceededError(MetaRepositoryUnavailableError):
+    """Дневная квота источника исчерпана."""
+
+    def __init__(self) -> None:
+        super().__init__("Квота исчерпана")
+        self.code = 403
+
+
 class ExistsStatus(Enum):
     """Статус существования."""
 
@@ -58,3 +75,11 @@ class IMetaRepository(ABC):
         Raises:
             MetaRepositoryError: общая ошибка репозитория.
         """
+
+    def remaining_quota(self) -> int | None:
+        """Оставшийся дневной бюджет запросов (None — без ограничений)."""
+        return None
+
+    def hedge_counters(self) -> HedgeCounters | None:
+        """Счётчики дублирующих запросов (None — запросы не дублируются)."""
+        return None
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from wireup import abstract
+
+from videos_cleaner.entities.journal import JournalEntry, MutationKind
+
+
+@abstract
+class IMutationJournal(ABC):
+    """Журнал решённых изменений видео (write-behind).
+
+    Обход записывает изменения в журнал и продолжает проверки, а
+    изменения применяются к API видео отдельно. Не применённые записи
+    сохраняются до следующего запуска.
+    """
+
+    @abstractmethod
+    async def append(self, slug: str, kind: MutationKind, now: datetime) -> None:
+        """Записать изменение видео.
+
+        Если по видео уже есть запись с другим изменением, она заменяется.
+
+        Args:
+            slug: Идентификатор видео.
+            kind: Изменение.
+            now: Время решения.
+        """
+
+    @abstractmethod
+    async def due(self, now: datetime, limit: int) -> list[JournalEntry]:
+        """Записи, готовые к применению (в порядке записи).
+
+        Args:
+            now: Текущее время.
+            limit: Ограничение на количество.
+        """
+
+    @abstractmethod
+    async def complete(self, entry: JournalEntry) -> None:
+        """Убрать применённую (или отброшенную) запись.
+
+        Запись, заменённая новым решением, сохраняется.
+
+        Args:
+            entry: Запись.
+        """
+
+    @abstractmethod
+    async def retry(self, entry: JournalEntry, at: datetime, error: str) -> None:
+        """Отложить запись после ошибки.
+
+        Args:
+            entry: Запись.
+            at: Время следующей попытки.
+            error: Описание ошибки.
+        """
+
+    @abstractmethod
+    async def resume(self, now: datetime) -> int:
+        """Сделать все записи готовыми к применению (при запуске).
+
+        Args:
+            now: Текущее время.
+
+        Returns:
+            Количество записей в журнале.
+        """
+
+    @abstractmethod
+    async def pending(self) -> int:
+        """Количество не применённых записей."""
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from wireup import abstract
+
+from videos_cleaner.entities.removal import PendingRemoval
+
+
+@abstract
+class IRemovalRepository(ABC):
+    """Очередь подтверждения окончательного удаления видео."""
+
+    @abstractmethod
+    async def get(self, slug: str) -> PendingRemoval | None:
+        """Получить ожидающее подтверждения удаление.
+
+        Args:
+            slug: Идентификатор видео.
+        """
+
+    @abstractmethod
+    async def save(self, removal: PendingRemoval) -> None:
+        """Сохранить ожидающее подтверждения удаление.
+
+        Args:
+            removal: Удаление.
+        """
+
+    @abstractmethod
+    async def discard(self, slug: str) -> None:
+        """Убрать видео из очереди.
+
+        Args:
+            slug: Идентификатор видео.
+        """
+
+    @abstractmethod
+    async def due(self, confirmed_before: datetime, limit: int) -> list[PendingRemoval]:
+        """Удаления, готовые к очередной проверке.
+
+        Args:
+            confirmed_before: Последнее подтверждение раньше этого момента.
+            limit: Ограничение на количество.
+        """
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from wireup import abstract
+
+from videos_cleaner.entities.work import RunLease
+
+
+@abstract
+class IRunLock(ABC):
+    """Аренда обхода API видео, общая для всех запусков.
+
+    Пока владелец продлевает аренду, другие запуски видят обход
+    выполняющимся. Аренда упавшего запуска истекает сама.
+    """
+
+    @abstractmethod
+    async def acquire(self, owner: str, now: datetime, until: datetime) -> RunLease:
+        """Взять аренду, если она свободна, истекла или уже принадлежит владельцу.
+
+        Args:
+            owner: Имя запуска.
+            now: Текущее время.
+            until: Окончание аренды.
+
+        Returns:
+            Действующая аренда: своя, если она получена, иначе чужая.
+        """
+
+    @abstractmethod
+    async def extend(self, lease: RunLease, until: datetime) -> bool:
+        """Продлить аренду.
+
+        Args:
+            lease: Аренда.
+            until: Новое окончание аренды.
+
+        Returns:
+            False, если аренду уже взял другой запуск.
+        """
+
+    @abstractmethod
+    async def release(self, lease: RunLease) -> None:
+        """Освободить аренду.
+
+        Args:
+            lease: Аренда.
+        """
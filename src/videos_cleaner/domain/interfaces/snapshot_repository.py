@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from wireup import abstract
+
+from videos_cleaner.entities.snapshot import VideoSnapshot
+
+
+@abstract
+class ISnapshotRepository(ABC):
+    """Локальный снимок состояния видео в API."""
+
+    @abstractmethod
+    async def get_many(self, slugs: Iterable[str]) -> dict[str, VideoSnapshot]:
+        """Получить известные состояния видео.
+
+        Args:
+            slugs: Идентификаторы видео.
+
+        Returns:
+            Состояния по идентификаторам (неизвестные видео пропускаются).
+        """
+
+    @abstractmethod
+    async def save(self, snapshot: VideoSnapshot) -> None:
+        """Сохранить состояние видео.
+
+        Args:
+            snapshot: Состояние видео.
+        """
+
+    @abstractmethod
+    async def discard_many(self, slugs: Iterable[str]) -> None:
+        """Забыть состояния видео.
+
+        Args:
+            slugs: Идентификаторы видео.
+        """
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import final, override
 
 from wireup import abstract
 
-from videos_cleaner.entities.video import VideoList
+from videos_cleaner.entities.video import VideoList, VideoStream
 
 
 class VideoRepostiryError(Exception):
@@ -49,6 +50,16 @@ class VideoIsNotDeletedError(VideoRepostiryError):
         super().__init__(self.message, self.code)
 
 
+@final
+class VideoRepositoryUnavailableError(VideoRepostiryError):
+    """API видео временно недоступно."""
+
+    def __init__(self, message: str = "Сервис недоступен") -> None:
+        self.message = message
+        self.code = 503
+        super().__init__(self.message, self.code)
+
+
 @abstract
 class IVideoRepository(ABC):
     """Интерфейс репозитория видео."""
@@ -69,6 +80,29 @@ class IVideoRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def stream(
+        self, offset: int = 0, *, limit: int = 50
+    ) -> AbstractAsyncContextManager[VideoStream]:
+        """Получить страницу видео с разбором ответа по мере загрузки.
+
+        Соединение с API остаётся занятым, пока страница не дочитана или
+        контекст не закрыт, поэтому время его удержания растёт с размером
+        страницы и длительностью обработки её видео.
+
+        Args:
+            offset: Отступ.
+            limit: Ограничение на количество.
+
+        Returns:
+            Контекстный менеджер страницы, видео доступны внутри контекста.
+
+        Raises:
+            VideoRepositoryError: Неизвестная ошибка (в том числе при чтении
+                видео страницы).
+        """
+        ...
+
     @abstractmethod
     async def delete(self, slug: str, *, temporary: bool = True) -> None:
         """Удалить видео.
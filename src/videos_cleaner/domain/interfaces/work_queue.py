@@ -0,0 +1,95 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+
+from wireup import abstract
+
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+from videos_cleaner.entities.work import PageRange, QueueSummary, WorkLease
+
+
+@abstract
+class IWorkQueue(ABC):
+    """Общая очередь страниц API видео для нескольких обработчиков.
+
+    Страница выдаётся одному обработчику на время аренды. Если обработчик
+    не подтвердил её до истечения аренды, страницу получит другой.
+    """
+
+    @abstractmethod
+    async def put_many(self, pages: Iterable[PageRange]) -> None:
+        """Поставить страницы в очередь заново.
+
+        Args:
+            pages: Страницы.
+        """
+
+    @abstractmethod
+    async def lease(
+        self, worker: str, now: datetime, until: datetime
+    ) -> WorkLease | None:
+        """Взять свободную страницу или страницу с истёкшей арендой.
+
+        Args:
+            worker: Имя обработчика.
+            now: Текущее время.
+            until: Окончание аренды.
+
+        Returns:
+            Аренда или None, если свободных страниц нет.
+        """
+
+    @abstractmethod
+    async def extend(self, lease: WorkLease, until: datetime) -> bool:
+        """Продлить аренду.
+
+        Args:
+            lease: Аренда.
+            until: Новое окончание аренды.
+
+        Returns:
+            False, если страница уже передана другому обработчику.
+        """
+
+    @abstractmethod
+    async def release(self, lease: WorkLease) -> None:
+        """Вернуть страницу в очередь без обработки.
+
+        Args:
+            lease: Аренда.
+        """
+
+    @abstractmethod
+    async def dead_letter(self, lease: WorkLease, error: str) -> bool:
+        """Отложить страницу, обработка которой снова и снова завершается ошибкой.
+
+        Отложенная страница больше не выдаётся обработчикам.
+
+        Args:
+            lease: Аренда.
+            error: Последняя ошибка.
+
+        Returns:
+            False, если аренда уже не принадлежит обработчику.
+        """
+
+    @abstractmethod
+    async def ack(self, lease: WorkLease, stats: VideoCleanerStats) -> bool:
+        """Подтвердить обработку страницы.
+
+        Args:
+            lease: Аренда.
+            stats: Статистика обработки страницы.
+
+        Returns:
+            False, если аренда уже не принадлежит обработчику: страницу
+            взял или подтвердил другой (статистика не учитывается повторно).
+        """
+
+    @abstractmethod
+    async def summary(self, now: datetime) -> QueueSummary:
+        """Состояние очереди и суммарная статистика подтверждённых страниц.
+
+        Args:
+            now: Текущее время.
+        """
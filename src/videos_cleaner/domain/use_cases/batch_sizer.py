@@ -0,0 +1,62 @@
+from typing import final
+
+from videos_cleaner.entities.cleaner import PageProfile
+
+
+@final
+class AdaptiveBatchSize:
+    """Подбор размера страницы API видео по замерам предыдущих страниц.
+
+    Страница удваивается, пока её загрузка занимает заметную долю времени
+    обработки, и уменьшается вдвое, если загрузка или проверка одной
+    страницы длится слишком долго.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        initial: int = 50,
+        *,
+        minimum: int = 10,
+        maximum: int = 500,
+        fetch_share: float = 0.2,
+        max_fetch_time: float = 5.0,
+        max_check_time: float = 60.0,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            initial: Размер первой страницы.
+            minimum: Минимальный размер страницы.
+            maximum: Максимальный размер страницы.
+            fetch_share: Доля загрузки во времени обработки страницы,
+                выше которой страница увеличивается.
+            max_fetch_time: Предельное время загрузки страницы в секундах.
+            max_check_time: Предельное время проверки страницы в секундах.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self._fetch_share = fetch_share
+        self._max_fetch_time = max_fetch_time
+        self._max_check_time = max_check_time
+        self.size = self._clamp(initial)
+
+    def _clamp(self, size: int) -> int:
+        return max(self.minimum, min(size, self.maximum))
+
+    def observe(self, page: PageProfile) -> int:
+        """Учесть замеры страницы и получить размер следующей.
+
+        Args:
+            page: Замеры обработанной страницы.
+        """
+        if page.received < page.size:
+            return self.size
+
+        if (
+            page.fetch_time > self._max_fetch_time
+            or page.check_time > self._max_check_time
+        ):
+            self.size = self._clamp(page.size // 2)
+        elif page.fetch_time > self._fetch_share * (page.fetch_time + page.check_time):
+            self.size = self._clamp(page.size * 2)
+        return self.size
@@ -0,0 +1,32 @@
+from collections.abc import Iterable
+
+import structlog
+
+from videos_cleaner.domain.interfaces.channel_repository import IChannelRepository
+from videos_cleaner.domain.interfaces.meta_repository import MetaRepositoryError
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+async def discover_live(
+    repo: IChannelRepository, channels: Iterable[str]
+) -> frozenset[str]:
+    """Собрать идентификаторы опубликованных видео каналов.
+
+    Ошибка одного канала логируется и не прерывает остальные: видео
+    такого канала будут проверены по одному.
+
+    Args:
+        repo: Репозиторий списков видео каналов.
+        channels: Идентификаторы youtube каналов.
+    """
+    live: set[str] = set()
+    for channel_id in dict.fromkeys(channels):
+        try:
+            ids = await repo.live_ids(channel_id)
+        except MetaRepositoryError as e:
+            logger.warning("Видео канала не получены", channel=channel_id, error=str(e))
+            continue
+        logger.info("Видео канала получены", channel=channel_id, videos=len(ids))
+        live |= ids
+    return frozenset(live)
@@ -0,0 +1,165 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime, timedelta
+from typing import final
+
+import structlog
+
+from videos_cleaner.domain.interfaces.mutation_journal import IMutationJournal
+from videos_cleaner.domain.interfaces.snapshot_repository import ISnapshotRepository
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoIsAlreadyDeletedError,
+    VideoIsNotDeletedError,
+    VideoNotFoundError,
+    VideoRepostiryError,
+)
+from videos_cleaner.entities.journal import FlushStats, JournalEntry, MutationKind
+from videos_cleaner.entities.snapshot import VideoSnapshot
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@final
+class MutationFlusher:
+    """Применение изменений из журнала к API видео.
+
+    Работает независимо от проверок: изменения применяются `workers`
+    обработчиками, после ошибки API запись откладывается с экспоненциально
+    растущей задержкой и отбрасывается после `max_attempts` попыток
+    (следующий обход примет решение заново).
+    """
+
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        journal: IMutationJournal,
+        snapshot_repo: ISnapshotRepository,
+        *,
+        workers: int = 4,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            video_repo: Репозиторий видео.
+            journal: Журнал изменений.
+            snapshot_repo: Снимок состояния видео, известного из конфликтов.
+            workers: Количество одновременных изменений.
+            clock: Источник текущего времени.
+        """
+        self._video_repo = video_repo
+        self._journal = journal
+        self._snapshot_repo = snapshot_repo
+        self._workers = workers
+        self._clock = clock
+        self.max_attempts = 8
+        self.retry_delay = timedelta(seconds=1)
+        self.max_retry_delay = timedelta(minutes=5)
+        self.poll_interval = 0.5
+        self.stats = FlushStats()
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return min(self.retry_delay * 2**attempts, self.max_retry_delay)
+
+    async def _mutate(self, entry: JournalEntry) -> None:
+        match entry.kind:
+            case MutationKind.RESTORE:
+                await self._video_repo.restore(entry.slug)
+            case MutationKind.HIDE:
+                await self._video_repo.delete(entry.slug, temporary=True)
+            case MutationKind.DELETE:
+                await self._video_repo.delete(entry.slug, temporary=False)
+
+    async def _reconcile(self, entry: JournalEntry, *, deleted: bool) -> None:
+        logger.info("Список видео устарел", slug=entry.slug, deleted=deleted)
+        await self._snapshot_repo.save(
+            VideoSnapshot(entry.slug, deleted, self._clock())
+        )
+        self.stats.reconciled += 1
+
+    async def _apply(self, entry: JournalEntry) -> None:
+        try:
+            await self._mutate(entry)
+        except VideoIsAlreadyDeletedError:
+            await self._reconcile(entry, deleted=True)
+        except VideoIsNotDeletedError:
+            await self._reconcile(entry, deleted=False)
+        except VideoNotFoundError:
+            logger.warning("Видео не найдено", slug=entry.slug, kind=entry.kind)
+            self.stats.dropped += 1
+        except VideoRepostiryError as e:
+            attempts = entry.attempts + 1
+            if attempts < self.max_attempts:
+                await self._journal.retry(
+                    entry, self._clock() + self._backoff(attempts), str(e)
+                )
+                self.stats.retried += 1
+                return
+            logger.exception(
+                "Изменение отброшено",
+                slug=entry.slug,
+                kind=entry.kind,
+                attempts=attempts,
+            )
+            self.stats.dropped += 1
+        else:
+            self.stats.applied += 1
+        await self._journal.complete(entry)
+
+    async def flush_due(self) -> int:
+        """Применить записи, готовые к применению.
+
+        Returns:
+            Количество обработанных записей.
+        """
+        entries = await self._journal.due(self._clock(), self._workers * 10)
+        slots = asyncio.Semaphore(self._workers)
+
+        async def apply(entry: JournalEntry) -> None:
+            async with slots:
+                await self._apply(entry)
+
+        _ = await asyncio.gather(*map(apply, entries))
+        return len(entries)
+
+    async def _run(self, stop: asyncio.Event) -> None:
+        """Применять записи, пока не установлен `stop` и есть готовые записи."""
+        while True:
+            if await self.flush_due():
+                continue
+            if stop.is_set():
+                return
+            with suppress(TimeoutError):
+                async with asyncio.timeout(self.poll_interval):
+                    _ = await stop.wait()
+
+    @asynccontextmanager
+    async def running(self, *, replay: bool = False) -> AsyncIterator[None]:
+        """Применять изменения в фоне, пока выполняется обход.
+
+        При выходе применяются все готовые записи; отложенные после ошибок
+        остаются в журнале до следующего запуска.
+
+        Args:
+            replay: Сразу применить записи прошлых запусков, не дожидаясь
+                окончания задержки после ошибок.
+        """
+        if replay and (left := await self._journal.resume(self._clock())):
+            logger.info("Применение изменений прошлого запуска", entries=left)
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._run(stop))
+        try:
+            yield
+        finally:
+            stop.set()
+            await task
+            logger.info(
+                "Отложенные изменения",
+                applied=self.stats.applied,
+                retried=self.stats.retried,
+                dropped=self.stats.dropped,
+                reconciled=self.stats.reconciled,
+                pending=await self._journal.pending(),
+            )
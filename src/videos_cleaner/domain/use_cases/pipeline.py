@@ -0,0 +1,204 @@
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, final
+
+from videos_cleaner.entities.cleaner import StageMetrics
+
+
+def _now() -> float:
+    """Время по часам цикла событий (виртуальное при имитации обхода)."""
+    return asyncio.get_running_loop().time()
+
+
+@dataclass(frozen=True)
+class PipelineSettings:
+    """Количество обработчиков стадий конвейера и размер очередей.
+
+    `request_slots` ограничивает общее число одновременных запросов
+    стадий проверки и изменения.
+    """
+
+    filter_workers: int = 1
+    probe_workers: int = 8
+    fallback_workers: int = 2
+    decide_workers: int = 1
+    restore_workers: int = 2
+    delete_workers: int = 1
+    hide_workers: int = 1
+    audit_workers: int = 1
+    queue_size: int = 100
+    request_slots: int = 100
+
+
+class Priority(IntEnum):
+    """Приоритет полосы: меньшее значение обслуживается раньше."""
+
+    RESTORE = 0
+    DELETE = 1
+    HIDE = 2
+    PROBE = 3
+
+
+@final
+class PriorityLimiter:
+    """Ограничение числа одновременных запросов с очередью по приоритетам.
+
+    Освободившееся место получает ожидающий с наименьшим значением
+    приоритета, при равных приоритетах — пришедший раньше.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Конструктор.
+
+        Args:
+            capacity: Количество мест.
+        """
+        self._free = capacity
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Занять место на время выполнения блока."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (priority, next(self._order), future)
+        heapq.heappush(self._waiters, waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Место уже передано этому ожидающему: передаём следующему.
+                self._release()
+            elif waiter in self._waiters:
+                # Отменённого ожидающего могло уже пропустить освобождение.
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+
+@final
+class Stage[T]:
+    """Стадия конвейера: ограниченная очередь и обработчики.
+
+    Когда очередь заполнена, предыдущая стадия ждёт освобождения места.
+    Стадии с общим ограничителем получают места для запросов в порядке
+    приоритета. Обработчик занимает место только на время запроса
+    (`request`), а не передачи элемента следующей стадии: иначе стадии,
+    ожидающие места друг у друга, останавливают конвейер.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        handler: Callable[[T], Awaitable[None]],
+        *,
+        workers: int = 1,
+        queue_size: int = 100,
+        limiter: PriorityLimiter | None = None,
+        priority: int = 0,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            name: Название стадии.
+            handler: Обработка одного элемента.
+            workers: Количество параллельных обработчиков.
+            queue_size: Размер очереди на входе стадии.
+            limiter: Ограничитель одновременных запросов.
+            priority: Приоритет стадии в ограничителе.
+        """
+        self._handler = handler
+        self._limiter = limiter
+        self._priority = priority
+        self._queue: asyncio.Queue[tuple[float, T]] = asyncio.Queue(queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self._started = 0.0
+        self.metrics = StageMetrics(name, workers)
+
+    async def put(self, item: T) -> None:
+        """Передать элемент стадии."""
+        await self._queue.put((_now(), item))
+        self.metrics.max_depth = max(self.metrics.max_depth, self._queue.qsize())
+
+    def request(self) -> AbstractAsyncContextManager[None]:
+        """Место в ограничителе на время одного запроса стадии."""
+        if self._limiter is None:
+            return nullcontext()
+        return self._limiter.slot(self._priority)
+
+    async def _work(self) -> None:
+        while True:
+            queued, item = await self._queue.get()
+            started = _now()
+            self.metrics.max_wait = max(self.metrics.max_wait, started - queued)
+            try:
+                await self._handler(item)
+            finally:
+                self.metrics.processed += 1
+                self.metrics.busy_time += _now() - started
+                self._queue.task_done()
+
+    def start(self, group: asyncio.TaskGroup) -> None:
+        """Запустить обработчики."""
+        self._started = _now()
+        self._workers = [
+            group.create_task(self._work()) for _ in range(self.metrics.workers)
+        ]
+
+    async def close(self) -> None:
+        """Дождаться обработки очереди и остановить обработчики."""
+        await self._queue.join()
+        self.metrics.elapsed = _now() - self._started
+        for worker in self._workers:
+            _ = worker.cancel()
+
+
+async def run_pipeline(
+    source: Callable[[], Awaitable[None]], stages: Sequence[Stage[Any]]
+) -> None:
+    """Выполнить конвейер.
+
+    Стадии закрываются по порядку после завершения источника, поэтому
+    стадия может передавать элементы только следующим за ней.
+
+    Args:
+        source: Источник, передающий элементы первым стадиям.
+        stages: Стадии в порядке следования.
+
+    Raises:
+        Exception: ошибка источника или обработчика стадии.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            for stage in stages:
+                stage.start(group)
+            await source()
+            for stage in stages:
+                await stage.close()
+    except ExceptionGroup as e:
+        if len(e.exceptions) == 1:
+            raise e.exceptions[0] from None
+        raise
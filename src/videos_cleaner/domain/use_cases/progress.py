@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from typing import final
+
+from videos_cleaner.entities.cleaner import ProgressSnapshot, VideoCleanerStats
+
+
+@final
+class ProgressReporter:
+    """Периодический отчёт о ходе обхода.
+
+    Скорость сглаживается экспоненциальным скользящим средним по
+    интервалам между отчётами, оставшееся время считается по ней.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[ProgressSnapshot], None],
+        *,
+        interval: float = 10.0,
+        smoothing: float = 0.3,
+        in_flight: Callable[[], dict[str, int]] = dict,
+        target: str = "",
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            sink: Получатель отчётов (журнал, строка в терминале).
+            interval: Интервал между отчётами в секундах.
+            smoothing: Вес последнего интервала в средней скорости (0..1].
+            in_flight: Выполняющиеся запросы по сервисам.
+            target: Адрес API видео.
+        """
+        self._sink = sink
+        self._smoothing = smoothing
+        self._in_flight = in_flight
+        self.interval = interval
+        self.target = target
+        self._rate: float | None = None
+        self._started = 0.0
+        self._last = (0.0, 0)
+
+    def start(self, now: float) -> None:
+        """Начать отсчёт.
+
+        Args:
+            now: Время по часам цикла событий.
+        """
+        self._rate = None
+        self._started = now
+        self._last = (now, 0)
+
+    def snapshot(
+        self,
+        stats: VideoCleanerStats,
+        limit: int | None,
+        now: float,
+        *,
+        finished: bool = False,
+    ) -> ProgressSnapshot:
+        """Отчёт о ходе обхода.
+
+        Args:
+            stats: Статистика обхода.
+            limit: Ограничение на общее количество.
+            now: Время по часам цикла событий.
+            finished: Обход завершён.
+        """
+        processed = stats.total
+        last_time, last_processed = self._last
+        if now > last_time:
+            current = (processed - last_processed) / (now - last_time)
+            self._rate = (
+                current
+                if self._rate is None
+                else self._smoothing * current + (1 - self._smoothing) * self._rate
+            )
+            self._last = (now, processed)
+
+        expected = stats.total_count
+        if limit:
+            expected = min(limit, expected) if expected is not None else limit
+        rate = self._rate or 0.0
+        eta = None
+        if finished:
+            eta = 0.0
+        elif expected is not None and rate > 0:
+            eta = max(0, expected - processed) / rate
+
+        return ProgressSnapshot(
+            target=self.target,
+            processed=processed,
+            expected=expected,
+            rate=rate,
+            eta=eta,
+            elapsed=now - self._started,
+            counters=stats.counters(),
+            in_flight=self._in_flight(),
+            finished=finished,
+        )
+
+    async def _report(self, stats: VideoCleanerStats, limit: int | None) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval)
+            self._sink(self.snapshot(stats, limit, loop.time()))
+
+    @asynccontextmanager
+    async def running(
+        self, stats: VideoCleanerStats, limit: int | None
+    ) -> AsyncIterator[None]:
+        """Отправлять отчёты, пока выполняется обход, и итоговый после него.
+
+        Args:
+            stats: Статистика обхода.
+            limit: Ограничение на общее количество.
+        """
+        loop = asyncio.get_running_loop()
+        self.start(loop.time())
+        task = asyncio.create_task(self._report(stats, limit))
+        try:
+            yield
+        finally:
+            _ = task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            self._sink(self.snapshot(stats, limit, loop.time(), finished=True))
@@ -0,0 +1,173 @@
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import final
+
+import structlog
+
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoRepostiryError,
+)
+from videos_cleaner.domain.interfaces.work_queue import IWorkQueue
+from videos_cleaner.domain.use_cases.video_use_case import VideoCleanerUseCase
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+from videos_cleaner.entities.work import PageRange, WorkLease
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+async def enqueue_pages(
+    queue: IWorkQueue,
+    video_repo: IVideoRepository,
+    *,
+    batch_size: int = 50,
+    limit: int | None = None,
+) -> int:
+    """Поставить страницы API видео в очередь заново.
+
+    Args:
+        queue: Очередь страниц.
+        video_repo: Репозиторий видео.
+        batch_size: Размер страницы.
+        limit: Ограничение на количество видео (None — все видео).
+
+    Returns:
+        Количество страниц.
+
+    Raises:
+        VideoRepostiryError: не удалось получить размер каталога.
+    """
+    total = (await video_repo.get_all(0, limit=1)).total_count
+    if limit:
+        total = min(total, limit)
+    pages = [
+        PageRange(offset, min(batch_size, total - offset))
+        for offset in range(0, total, batch_size)
+    ]
+    await queue.put_many(pages)
+    logger.info("Страницы поставлены в очередь", pages=len(pages), videos=total)
+    return len(pages)
+
+
+@final
+class QueueWorker:
+    """Обработчик страниц из общей очереди.
+
+    Пока страница обрабатывается, аренда продлевается. Если страниц без
+    аренды нет, но другие обработчики ещё не закончили, обработчик ждёт:
+    страницы с истёкшей арендой (например, упавшего процесса) он заберёт.
+    После ошибки API видео страница возвращается в очередь, а обработчик
+    выжидает растущую задержку; после `max_attempts` выдач страница
+    откладывается.
+    """
+
+    def __init__(
+        self,
+        queue: IWorkQueue,
+        use_case: VideoCleanerUseCase,
+        name: str,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            queue: Очередь страниц.
+            use_case: UseCase обработки страницы.
+            name: Имя обработчика.
+            clock: Источник текущего времени.
+        """
+        self._queue = queue
+        self._use_case = use_case
+        self._clock = clock
+        self.name = name
+        self.lease_time = timedelta(minutes=5)
+        self.poll_interval = 5.0
+        self.max_attempts = 5
+        self.retry_delay = timedelta(seconds=1)
+        self.max_retry_delay = timedelta(minutes=1)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
+
+    async def _keep_alive(self, lease: WorkLease) -> None:
+        """Продлевать аренду, пока страница обрабатывается."""
+        while True:
+            await asyncio.sleep(self.lease_time.total_seconds() / 3)
+            if not await self._queue.extend(lease, self._clock() + self.lease_time):
+                logger.warning("Аренда страницы утеряна", offset=lease.page.offset)
+                return
+
+    async def _process(self, lease: WorkLease, *, force_all: bool) -> VideoCleanerStats:
+        keep_alive = asyncio.create_task(self._keep_alive(lease))
+        try:
+            return await self._use_case.execute_page(
+                lease.page.offset, lease.page.size, force_all=force_all
+            )
+        except VideoRepostiryError:
+            raise
+        except BaseException:
+            await self._queue.release(lease)
+            raise
+        finally:
+            _ = keep_alive.cancel()
+
+    async def _fail(self, lease: WorkLease, error: VideoRepostiryError) -> None:
+        """Вернуть страницу в очередь или отложить её после `max_attempts`."""
+        if lease.attempts >= self.max_attempts:
+            if await self._queue.dead_letter(lease, repr(error)):
+                logger.error(
+                    "Страница отложена после ошибок",
+                    worker=self.name,
+                    offset=lease.page.offset,
+                    attempts=lease.attempts,
+                    error=repr(error),
+                )
+            return
+        await self._queue.release(lease)
+        delay = self._backoff(lease.attempts)
+        logger.warning(
+            "Ошибка обработки страницы",
+            worker=self.name,
+            offset=lease.page.offset,
+            attempts=lease.attempts,
+            delay=delay.total_seconds(),
+            error=repr(error),
+        )
+        await asyncio.sleep(delay.total_seconds())
+
+    async def execute(self, *, force_all: bool = False) -> VideoCleanerStats:
+        """Обрабатывать страницы, пока очередь не опустеет.
+
+        Args:
+            force_all: Проверить все видео, не учитывая историю проверок.
+
+        Returns:
+            Статистика страниц, подтверждённых этим обработчиком.
+        """
+        stats = VideoCleanerStats()
+        while True:
+            now = self._clock()
+            lease = await self._queue.lease(self.name, now, now + self.lease_time)
+            if lease is None:
+                if (await self._queue.summary(now)).finished:
+                    return stats
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            logger.debug(
+                "Страница взята в работу",
+                worker=self.name,
+                offset=lease.page.offset,
+                attempts=lease.attempts,
+            )
+            try:
+                page_stats = await self._process(lease, force_all=force_all)
+            except VideoRepostiryError as e:
+                await self._fail(lease, e)
+                continue
+            if await self._queue.ack(lease, page_stats):
+                stats.merge(page_stats)
+            else:
+                logger.info("Страница уже обработана", offset=lease.page.offset)
@@ -0,0 +1,111 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import final
+
+import structlog
+
+from videos_cleaner.domain.interfaces.run_lock import IRunLock
+from videos_cleaner.entities.work import RunLease
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class OverlapPolicy(StrEnum):
+    """Поведение запуска, если обход того же API уже выполняется."""
+
+    SKIP = "skip"
+    WAIT = "wait"
+    JOIN = "join"
+
+
+class RunInProgressError(Exception):
+    """Обход уже выполняется другим запуском."""
+
+    def __init__(self, holder: RunLease) -> None:
+        self.holder: RunLease = holder
+        super().__init__(f"Обход {holder.target} уже выполняет {holder.owner}")
+
+
+@final
+class RunGuard:
+    """Защита от одновременных обходов одного API видео.
+
+    Аренда продлевается, пока обход выполняется, и освобождается после
+    него. Если запуск упал, аренда истекает через `lease_time`.
+    """
+
+    def __init__(
+        self,
+        lock: IRunLock,
+        owner: str,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            lock: Хранилище аренды.
+            owner: Имя запуска.
+            clock: Источник текущего времени.
+        """
+        self._lock = lock
+        self._clock = clock
+        self.owner = owner
+        self.lease_time = timedelta(minutes=5)
+        self.poll_interval = 5.0
+
+    def owns(self, lease: RunLease) -> bool:
+        """Аренда принадлежит этому запуску."""
+        return lease.owner == self.owner
+
+    async def acquire(self, *, wait: bool = False) -> RunLease:
+        """Взять аренду обхода.
+
+        Args:
+            wait: Ждать освобождения чужой аренды.
+
+        Returns:
+            Своя аренда или аренда запуска, который выполняет обход.
+        """
+        seen = ""
+        while True:
+            now = self._clock()
+            lease = await self._lock.acquire(self.owner, now, now + self.lease_time)
+            if self.owns(lease):
+                return lease
+            if lease.owner != seen:
+                logger.info(
+                    "Обход уже выполняется",
+                    target=lease.target,
+                    owner=lease.owner,
+                    started=lease.started.isoformat(),
+                )
+                seen = lease.owner
+            if not wait:
+                return lease
+            await asyncio.sleep(self.poll_interval)
+
+    async def _keep_alive(self, lease: RunLease) -> None:
+        """Продлевать аренду, пока обход выполняется."""
+        while True:
+            await asyncio.sleep(self.lease_time.total_seconds() / 3)
+            if not await self._lock.extend(lease, self._clock() + self.lease_time):
+                logger.warning("Аренда обхода утеряна", target=lease.target)
+                return
+
+    @asynccontextmanager
+    async def holding(self, lease: RunLease) -> AsyncIterator[None]:
+        """Продлевать аренду внутри контекста и освободить её после.
+
+        Args:
+            lease: Своя аренда.
+        """
+        keep_alive = asyncio.create_task(self._keep_alive(lease))
+        try:
+            yield
+        finally:
+            _ = keep_alive.cancel()
+            await self._lock.release(lease)
@@ -0,0 +1,108 @@
+import asyncio
+import random
+from typing import final
+
+import structlog
+
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+    MetaRepositoryError,
+    MetaRepositoryUnavailableError,
+    UnauthorizedError,
+)
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoRepostiryError,
+)
+from videos_cleaner.entities.sample import SampleReport
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@final
+class CatalogueSampler:
+    """Оценка доли существующих, скрытых и удалённых видео по выборке.
+
+    Видео не изменяются, история проверок не записывается.
+    """
+
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        meta_repo: IMetaRepository,
+        youtube_data_api_repo: IMetaRepository | None = None,
+    ) -> None:
+        """Конструктор.
+
+        Args:
+            video_repo: Репозиторий видео.
+            meta_repo: Репозиторий информации о youtube видео.
+            youtube_data_api_repo: Репозиторий Youtube Data API.
+        """
+        self._video_repo = video_repo
+        self._meta_repo = meta_repo
+        self._youtube_data_api_repo = youtube_data_api_repo
+        self.concurrency = 10
+
+    async def _probe(self, yt_id: str) -> ExistsStatus | None:
+        """Проверить статус видео с переходом на резервный источник.
+
+        Raises:
+            MetaRepositoryError: ошибка резервного источника.
+        """
+        try:
+            return await self._meta_repo.is_exists(yt_id)
+        except (UnauthorizedError, MetaRepositoryUnavailableError):
+            if not self._youtube_data_api_repo:
+                return None
+        if await self._youtube_data_api_repo.is_embeddable(yt_id):
+            return ExistsStatus.EXISTS
+        return ExistsStatus.HIDDEN
+
+    async def _sample_one(self, offset: int) -> ExistsStatus | None:
+        try:
+            page = await self._video_repo.get_all(offset, limit=1)
+            if not page.videos:
+                return None
+            return await self._probe(page.videos[0].yt_id)
+        except (MetaRepositoryError, VideoRepostiryError) as e:
+            logger.warning("Видео выборки не проверено", offset=offset, error=str(e))
+            return None
+
+    async def execute(
+        self,
+        size: int,
+        *,
+        confidence: float = 0.95,
+        seed: int | None = None,
+    ) -> SampleReport:
+        """Проверить случайную выборку видео.
+
+        Смещения выбираются равномерно без повторов из `total_count`
+        API видео, каждое видео запрашивается отдельно.
+
+        Args:
+            size: Размер выборки.
+            confidence: Уровень доверия интервалов.
+            seed: Начальное значение генератора (для воспроизводимости).
+
+        Raises:
+            VideoRepostiryError: не удалось получить размер каталога.
+        """
+        population = (await self._video_repo.get_all(0, limit=1)).total_count
+        offsets = random.Random(seed).sample(range(population), min(size, population))  # noqa: S311
+        report = SampleReport(population, len(offsets), confidence)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(offset: int) -> ExistsStatus | None:
+            async with semaphore:
+                return await self._sample_one(offset)
+
+        for status in await asyncio.gather(*map(check, offsets)):
+            if status is None:
+                report.failed += 1
+            else:
+                report.counts[status] += 1
+        return report
@@ -0,0 +1,76 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import final
+
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+
+type Verdict = ExistsStatus | None
+
+
+@final
+class VerdictCache:
+    """Результаты проверок youtube видео, общие для нескольких обходов.
+
+    Каждое видео проверяется один раз: одновременные запросы одного и того
+    же `yt_id` ожидают уже запущенную проверку. Неудачные проверки (ошибка
+    или неустановленный статус) не запоминаются. История проверок видео,
+    встречающегося в нескольких обходах, записывается только одним из них.
+    """
+
+    def __init__(self) -> None:
+        self._verdicts: dict[str, asyncio.Task[Verdict]] = {}
+        self._observed: set[str] = set()
+        self.hits = 0
+
+    def _forget_failed(self, yt_id: str, task: asyncio.Task[Verdict]) -> None:
+        """Забыть проверку, если она не установила статус."""
+        if self._verdicts.get(yt_id) is not task:
+            return
+        if task.cancelled() or task.exception() is not None or task.result() is None:
+            del self._verdicts[yt_id]
+
+    async def get_or_check(
+        self,
+        yt_id: str,
+        check: Callable[[str], Awaitable[Verdict]],
+        *,
+        fresh: bool = False,
+    ) -> Verdict:
+        """Получить результат проверки, выполнив её при первом обращении.
+
+        Args:
+            yt_id: идентификатор youtube видео.
+            check: проверка видео.
+            fresh: Проверить заново, не используя запомненный результат
+                (например, для независимого подтверждения удаления).
+
+        Raises:
+            MetaRepositoryError: ошибка проверки (общая для одновременных
+                обращений).
+        """
+        if fresh or (task := self._verdicts.get(yt_id)) is None:
+            task = asyncio.ensure_future(check(yt_id))
+            self._verdicts[yt_id] = task
+            task.add_done_callback(partial(self._forget_failed, yt_id))
+        else:
+            self.hits += 1
+        return await asyncio.shield(task)
+
+    def claim_observation(self, yt_id: str) -> bool:
+        """Закрепить запись истории проверок видео за текущим обходом.
+
+        Args:
+            yt_id: идентификатор youtube видео.
+
+        Returns:
+            True, если наблюдение за видео ещё не записано другим обходом.
+        """
+        if yt_id in self._observed:
+            return False
+        self._observed.add(yt_id)
+        return True
+
+    def __len__(self) -> int:
+        """Количество проверенных видео."""
+        return len(self._verdicts)
@@ -1,43 +1,99 @@
-from typing import Annotated, final
+import asyncio
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from itertools import batched
+from typing import Any, final
 
 import structlog
-from wireup import Inject, service
 
+from videos_cleaner.domain.interfaces.dead_letter_repository import (
+    IDeadLetterRepository,
+)
+from videos_cleaner.domain.interfaces.history_repository import IHistoryRepository
 from videos_cleaner.domain.interfaces.meta_repository import (
     ExistsStatus,
     IMetaRepository,
     MetaRepositoryError,
+    MetaRepositoryUnavailableError,
     UnauthorizedError,
 )
+from videos_cleaner.domain.interfaces.mutation_journal import IMutationJournal
+from videos_cleaner.domain.interfaces.removal_repository import IRemovalRepository
+from videos_cleaner.domain.interfaces.snapshot_repository import ISnapshotRepository
 from videos_cleaner.domain.interfaces.video_repository import (
     IVideoRepository,
+    VideoIsAlreadyDeletedError,
+    VideoIsNotDeletedError,
+    VideoRepositoryUnavailableError,
     VideoRepostiryError,
 )
-from videos_cleaner.entities.cleaner import VideoCleanerStats
+from videos_cleaner.domain.use_cases.batch_sizer import AdaptiveBatchSize
+from videos_cleaner.domain.use_cases.pipeline import (
+    PipelineSettings,
+    Priority,
+    PriorityLimiter,
+    Stage,
+    run_pipeline,
+)
+from videos_cleaner.domain.use_cases.progress import ProgressReporter
+from videos_cleaner.domain.use_cases.verdict_cache import VerdictCache
+from videos_cleaner.entities.cleaner import PageProfile, VideoCleanerStats
+from videos_cleaner.entities.history import CheckHistory, StabilityPolicy
+from videos_cleaner.entities.journal import MutationKind
+from videos_cleaner.entities.removal import PendingRemoval
+from videos_cleaner.entities.snapshot import VideoSnapshot
 from videos_cleaner.entities.video import Video
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
-class RepositoryAlreadyInstalledError(ValueError):
-    """Ошибка уже установленного репозитория."""
+@dataclass(frozen=True)
+class CleanerSettings:
+    """Настройки обхода UseCase чистильщика."""
 
-    def __init__(self) -> None:
-        super().__init__("Репозиторий уже установлен")
+    batch_size: int = 50
+    stream_pages: bool = False
+    stream_chunk_size: int = 50
+    pipeline: PipelineSettings | None = None
+    stability: StabilityPolicy = field(default_factory=StabilityPolicy)
+    removal_confirmations: int = 1
+    removal_confirmation_gap: timedelta = field(
+        default_factory=lambda: timedelta(minutes=15)
+    )
+    snapshot_ttl: timedelta = field(default_factory=lambda: timedelta(days=1))
+    known_live: frozenset[str] = frozenset()
+    dirty: frozenset[str] | None = None
+    background_sample: float = 0.01
+    max_failed_attempts: int = 5
+    failed_retry_limit: int = 1000
+    retry_budget: timedelta = field(default_factory=lambda: timedelta(seconds=30))
 
 
 @final
-@service
 class VideoCleanerUseCase:
     """UseCase чистильщика видео."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         video_repo: IVideoRepository,
         meta_repo: IMetaRepository,
-        youtube_data_api_repo: Annotated[
-            IMetaRepository | None, Inject(param="youtube_data_api_repo")
-        ],
+        youtube_data_api_repo: IMetaRepository | None,
+        history_repo: IHistoryRepository,
+        removal_repo: IRemovalRepository,
+        snapshot_repo: ISnapshotRepository,
+        settings: CleanerSettings | None = None,
+        *,
+        verdicts: VerdictCache | None = None,
+        journal: IMutationJournal | None = None,
+        dead_letters: IDeadLetterRepository | None = None,
+        progress: ProgressReporter | None = None,
+        batch_sizer: AdaptiveBatchSize | None = None,
+        rng: random.Random | None = None,
+        started: float | None = None,
     ) -> None:
         """Конструктор.
 
@@ -45,22 +101,106 @@ class VideoCleanerUseCase:
             video_repo: Репозиторий видео.
             meta_repo: Репозиторий информации о youtube видео.
             youtube_data_api_repo: Репозиторий Youtube Data API.
+            history_repo: Репозиторий истории проверок.
+            removal_repo: Очередь подтверждения окончательных удалений.
+            snapshot_repo: Снимок состояния видео, известного из конфликтов.
+            settings: Настройки обхода.
+            verdicts: Результаты проверок, общие с другими обходами.
+            journal: Журнал изменений: изменения записываются в него
+                вместо API видео.
+            dead_letters: Видео, обработка которых не удалась.
+            progress: Отчёты о ходе обхода.
+            batch_sizer: Подбор размера страницы по времени её обработки.
+            rng: Генератор случайной доли проверяемых видео.
+            started: Начало обхода по `time.perf_counter` для отсчёта времени
+                до первого результата (по умолчанию — запуск `execute`).
         """
         self._video_repo = video_repo
         self._meta_repo = meta_repo
         self._youtube_data_api_repo = youtube_data_api_repo
-        self.batch_size = 50
+        self._history_repo = history_repo
+        self._removal_repo = removal_repo
+        self._snapshot_repo = snapshot_repo
+        self.settings = settings or CleanerSettings()
+        self._verdicts = verdicts
+        self._journal = journal
+        self._dead_letters = dead_letters
+        self._reporter = progress
+        self._batch_sizer = batch_sizer
+        self._rng = rng or random.Random()  # noqa: S311
+        self._sampled: set[str] = set()
+        self._started = started
 
     @property
     def youtube_data_api_repo(self) -> IMetaRepository | None:
         """Получить YouTube Data API репозиторий."""
         return self._youtube_data_api_repo
 
-    @youtube_data_api_repo.setter
-    def youtube_data_api_repo(self, new_value: IMetaRepository | None) -> None:
-        if self._youtube_data_api_repo:
-            raise RepositoryAlreadyInstalledError
-        self._youtube_data_api_repo = new_value
+    @staticmethod
+    def _needs_action(video: Video, status: ExistsStatus) -> bool:
+        """Требует ли статус изменения видео."""
+        if video.deleted:
+            return status != ExistsStatus.HIDDEN
+        return status != ExistsStatus.EXISTS
+
+    def _is_due(self, video: Video, history: CheckHistory, now: datetime) -> bool:
+        """Нужно ли проверять видео в этом обходе.
+
+        Если задан `dirty`, проверяются только видео из уведомлений об
+        изменениях и случайная доля `background_sample` остальных.
+        Видео из этой доли проверяются, даже если опубликованы на канале.
+        """
+        if self._needs_action(video, history.status):
+            return True
+        if self.settings.dirty is None:
+            return self.settings.stability.is_due(history, now)
+        if video.yt_id in self.settings.dirty:
+            return True
+        if self._rng.random() < self.settings.background_sample:
+            self._sampled.add(video.yt_id)
+            return True
+        return False
+
+    async def _mutate(self, video: Video, kind: MutationKind) -> None:
+        """Изменить видео в API или записать изменение в журнал (`journal`)."""
+        if self._journal is not None:
+            await self._journal.append(video.slug, kind, datetime.now(UTC))
+            return
+        match kind:
+            case MutationKind.RESTORE:
+                await self._video_repo.restore(video.slug)
+            case MutationKind.HIDE:
+                await self._video_repo.delete(video.slug, temporary=True)
+            case MutationKind.DELETE:
+                await self._video_repo.delete(video.slug, temporary=False)
+
+    async def _remove(self, video: Video, stats: VideoCleanerStats) -> None:
+        """Окончательно удалить видео после необходимого числа подтверждений."""
+        if self.settings.removal_confirmations <= 1:
+            await self._mutate(video, MutationKind.DELETE)
+            stats.deleted += 1
+            return
+
+        now = datetime.now(UTC)
+        removal = await self._removal_repo.get(video.slug)
+        if removal is None:
+            removal = PendingRemoval.first(video, now)
+        elif now - removal.last_confirmed >= self.settings.removal_confirmation_gap:
+            removal = removal.confirm(video, now)
+
+        if removal.confirmations < self.settings.removal_confirmations:
+            logger.debug(
+                "Удаление ожидает подтверждения",
+                slug=video.slug,
+                confirmations=removal.confirmations,
+            )
+            await self._removal_repo.save(removal)
+            stats.pending += 1
+            return
+
+        await self._mutate(video, MutationKind.DELETE)
+        await self._removal_repo.discard(video.slug)
+        stats.deleted += 1
 
     async def _process_video(
         self,
@@ -69,78 +209,789 @@ class VideoCleanerUseCase:
         stats: VideoCleanerStats,
     ) -> None:
         """Обработать одно видео."""
-        if video.deleted and status == ExistsStatus.EXISTS:
-            await self._video_repo.restore(video.slug)
-            stats.restored += 1
-        elif video.deleted and status == ExistsStatus.REMOVED:
-            await self._video_repo.delete(video.slug, temporary=False)
-            stats.deleted += 1
-        elif not video.deleted and status != ExistsStatus.EXISTS:
-            await self._video_repo.delete(
-                video.slug, temporary=status == ExistsStatus.HIDDEN
-            )
+        if status != ExistsStatus.REMOVED and self.settings.removal_confirmations > 1:
+            await self._removal_repo.discard(video.slug)
 
-            if status == ExistsStatus.HIDDEN:
+        try:
+            if video.deleted and status == ExistsStatus.EXISTS:
+                await self._mutate(video, MutationKind.RESTORE)
+                stats.restored += 1
+            elif status == ExistsStatus.REMOVED:
+                await self._remove(video, stats)
+            elif not video.deleted and status == ExistsStatus.HIDDEN:
+                await self._mutate(video, MutationKind.HIDE)
                 stats.hidden += 1
             else:
-                stats.deleted += 1
-        else:
-            stats.unchanged += 1
+                stats.unchanged += 1
+        except VideoIsAlreadyDeletedError:
+            await self._reconcile(video, stats, deleted=True)
+        except VideoIsNotDeletedError:
+            await self._reconcile(video, stats, deleted=False)
+
+        if self._dead_letters is not None:
+            await self._dead_letters.discard(video.slug)
+
+    async def _reconcile(
+        self, video: Video, stats: VideoCleanerStats, *, deleted: bool
+    ) -> None:
+        """Запомнить состояние видео, которое API сообщил в ответ на изменение."""
+        logger.info("Список видео устарел", slug=video.slug, deleted=deleted)
+        await self._snapshot_repo.save(
+            VideoSnapshot(video.slug, deleted, datetime.now(UTC))
+        )
+        stats.reconciled += 1
+
+    async def _apply_snapshots(self, videos: list[Video], now: datetime) -> list[Video]:
+        """Исправить устаревшие видео списка по локальному снимку.
+
+        Состояние из снимка забывается, когда список его догнал или
+        истёк срок хранения.
+        """
+        snapshots = await self._snapshot_repo.get_many(video.slug for video in videos)
+        if not snapshots:
+            return videos
+
+        result: list[Video] = []
+        outdated: list[str] = []
+        for video in videos:
+            snapshot = snapshots.get(video.slug)
+            if snapshot is None:
+                result.append(video)
+            elif (
+                snapshot.deleted == video.deleted
+                or now - snapshot.observed >= self.settings.snapshot_ttl
+            ):
+                outdated.append(video.slug)
+                result.append(video)
+            else:
+                logger.debug("Состояние видео взято из снимка", slug=video.slug)
+                result.append(snapshot.apply(video))
+        await self._snapshot_repo.discard_many(outdated)
+        return result
+
+    def _discovered(
+        self, video: Video, stats: VideoCleanerStats
+    ) -> ExistsStatus | None:
+        """Статус видео, найденного среди опубликованных видео каналов."""
+        if (
+            video.yt_id not in self.settings.known_live
+            or video.yt_id in self._sampled
+            or (self.settings.dirty and video.yt_id in self.settings.dirty)
+        ):
+            return None
+        stats.discovered += 1
+        return ExistsStatus.EXISTS
+
+    async def _check(self, yt_id: str, *, fresh: bool = False) -> ExistsStatus | None:
+        """Проверить статус видео, используя общие результаты проверок.
+
+        Args:
+            yt_id: Идентификатор youtube видео.
+            fresh: Проверить заново, не используя общий результат.
+
+        Returns:
+            Статус видео или None, если статус установить не удалось.
+
+        Raises:
+            MetaRepositoryError: ошибка резервного источника.
+        """
+        if self._verdicts is None:
+            return await self._probe(yt_id)
+        return await self._verdicts.get_or_check(yt_id, self._probe, fresh=fresh)
+
+    def _claim_observation(self, yt_id: str) -> bool:
+        """Записывает ли этот обход историю проверок видео.
+
+        Видео, общее для нескольких обходов, наблюдается один раз за обход.
+        """
+        return self._verdicts is None or self._verdicts.claim_observation(yt_id)
+
+    async def _probe(self, yt_id: str) -> ExistsStatus | None:
+        """Проверить статус видео с переходом на резервный источник.
+
+        Returns:
+            Статус видео или None, если статус установить не удалось.
+
+        Raises:
+            MetaRepositoryError: ошибка резервного источника.
+        """
+        try:
+            return await self._meta_repo.is_exists(yt_id)
+        except UnauthorizedError:
+            logger.debug("Доступ не авторизован", yt_id=yt_id)
+        except MetaRepositoryUnavailableError:
+            logger.debug("Основной источник недоступен", yt_id=yt_id)
+        return await self._fallback(yt_id)
 
-    async def execute(self, limit: int | None = None) -> VideoCleanerStats:
+    async def _fallback(self, yt_id: str) -> ExistsStatus | None:
+        """Проверить статус видео через резервный источник.
+
+        Returns:
+            Статус видео или None, если резервный источник не настроен.
+
+        Raises:
+            MetaRepositoryError: ошибка резервного источника.
+        """
+        if not self._youtube_data_api_repo:
+            return None
+
+        if await self._youtube_data_api_repo.is_embeddable(yt_id):
+            return ExistsStatus.EXISTS
+        return ExistsStatus.HIDDEN
+
+    async def _fail(
+        self, video: Video, error: Exception, stats: VideoCleanerStats
+    ) -> None:
+        """Учесть неудачную обработку видео и запомнить его для повтора."""
+        stats.failed += 1
+        if self._dead_letters is not None:
+            _ = await self._dead_letters.record(
+                video, type(error).__name__, datetime.now(UTC)
+            )
+
+    @asynccontextmanager
+    async def _errors(
+        self, video: Video, stats: VideoCleanerStats
+    ) -> AsyncIterator[None]:
+        """Залогировать ошибку источников и учесть видео как неудачное."""
+        try:
+            yield
+        except MetaRepositoryUnavailableError as error:
+            logger.warning("Источники недоступны", yt_id=video.yt_id)
+            await self._fail(video, error, stats)
+        except MetaRepositoryError as error:
+            logger.exception("Ошибка мета репозитория", yt_id=video.yt_id)
+            await self._fail(video, error, stats)
+        except VideoRepositoryUnavailableError as error:
+            logger.warning("Изменения приостановлены", slug=video.slug)
+            await self._fail(video, error, stats)
+        except VideoRepostiryError as error:
+            logger.exception("Ошибка видео репозитория", slug=video.slug)
+            await self._fail(video, error, stats)
+
+    @contextmanager
+    def _hedges(self, stats: VideoCleanerStats) -> Iterator[None]:
+        """Учесть дублирующие запросы проверки, отправленные за время обхода."""
+        before = self._meta_repo.hedge_counters()
+        try:
+            yield
+        finally:
+            after = self._meta_repo.hedge_counters()
+            if before is not None and after is not None:
+                delta = after - before
+                stats.hedges += delta.hedges
+                stats.hedge_wins += delta.wins
+
+    @asynccontextmanager
+    async def _progress(
+        self, stats: VideoCleanerStats, limit: int | None
+    ) -> AsyncIterator[None]:
+        """Отчитываться о ходе обхода, если настроен отчёт."""
+        if self._reporter is None:
+            yield
+            return
+        async with self._reporter.running(stats, limit):
+            yield
+
+    async def _handle(
+        self, video: Video, stats: VideoCleanerStats, *, fresh: bool = False
+    ) -> ExistsStatus | None:
+        """Проверить и обработать одно видео.
+
+        Args:
+            video: Видео.
+            stats: Статистика обхода.
+            fresh: Проверить видео заново, не используя общие результаты
+                проверок и видео каналов (подтверждение удаления, повтор
+                неудачной обработки).
+
+        Returns:
+            Установленный статус видео или None, если проверка не удалась.
+        """
+        status = None
+        async with self._errors(video, stats):
+            status = (None if fresh else self._discovered(video, stats)) or (
+                await self._check(video.yt_id, fresh=fresh)
+            )
+            if status is None:
+                stats.unchanged += 1
+            else:
+                stats.verdict()
+                await self._process_video(video, status, stats)
+        return status
+
+    async def execute(
+        self, limit: int | None = None, *, force_all: bool = False
+    ) -> VideoCleanerStats:
         """Выполнить очистку.
 
         Args:
             limit: Ограничение на общее количество (None значит не ограничен).
+            force_all: Проверить все видео, не учитывая историю проверок.
 
         Returns:
             VideoCleanerStats: статистика выполнения.
         """
-        offset = 0
+        stats = (
+            VideoCleanerStats()
+            if self._started is None
+            else VideoCleanerStats(started=self._started)
+        )
+        async with self._progress(stats, limit):
+            with self._hedges(stats):
+                if self.settings.pipeline:
+                    await self._run_pipeline(
+                        self.settings.pipeline, limit, stats, force_all=force_all
+                    )
+                else:
+                    await self._sweep(
+                        partial(
+                            self._process_batch,
+                            stats=stats,
+                            limit=limit,
+                            force_all=force_all,
+                        ),
+                        partial(self._handle, stats=stats, fresh=True),
+                        lambda: limit - stats.total if limit else None,
+                        stats,
+                        partial(
+                            self._process_batch,
+                            stats=stats,
+                            limit=limit,
+                            force_all=True,
+                            fresh=True,
+                        ),
+                        late_retry=True,
+                    )
+
+        if self._youtube_data_api_repo:
+            stats.quota_remaining = self._youtube_data_api_repo.remaining_quota()
+        return stats
+
+    async def execute_page(
+        self, offset: int, size: int, *, force_all: bool = False
+    ) -> VideoCleanerStats:
+        """Обработать одну страницу (например, взятую из общей очереди).
+
+        Удаления, ожидающие подтверждения, повторно не проверяются: видео
+        подтверждаются при обработке своих страниц.
+
+        Args:
+            offset: Отступ страницы.
+            size: Размер страницы.
+            force_all: Проверить все видео, не учитывая историю проверок.
+        """
         stats = VideoCleanerStats()
+        with self._hedges(stats):
+            _ = await self._sweep_page(
+                offset,
+                size,
+                partial(
+                    self._process_batch, stats=stats, limit=None, force_all=force_all
+                ),
+                stats,
+            )
+        if self._youtube_data_api_repo:
+            stats.quota_remaining = self._youtube_data_api_repo.remaining_quota()
+        return stats
 
-        while True:
-            videos = await self._video_repo.get_all(offset, limit=self.batch_size)
-            total_counter = videos.total_count
-
-            for video in videos.videos:
-                try:
-                    status = await self._meta_repo.is_exists(video.yt_id)
-                    await self._process_video(video, status, stats)
-
-                except UnauthorizedError:
-                    logger.debug("Доступ не авторизован", yt_id=video.yt_id)
-
-                    if self._youtube_data_api_repo:
-                        try:
-                            status = (
-                                ExistsStatus.EXISTS
-                                if await self._youtube_data_api_repo.is_embeddable(
-                                    video.yt_id
-                                )
-                                else ExistsStatus.HIDDEN
-                            )
-                            await self._process_video(video, status, stats)
-                        except MetaRepositoryError:
-                            logger.exception(
-                                "Ошибка мета репозитория", yt_id=video.yt_id
-                            )
-                            stats.unchanged += 1
-                    else:
-                        stats.unchanged += 1
-                except MetaRepositoryError:
-                    logger.exception("Ошибка мета репозитория", yt_id=video.yt_id)
-                    stats.unchanged += 1
-                except VideoRepostiryError:
-                    logger.exception("Ошибка видео репозитория", slug=video.slug)
-                    stats.unchanged += 1
+    async def _drain_removals(
+        self, recheck: Callable[[Video], Awaitable[object]], rechecked: set[str]
+    ) -> None:
+        """Повторно проверить удаления, ожидающие подтверждения.
+
+        Каждое удаление проверяется не больше одного раза за обход: если
+        проверка не удалась, удаление остаётся в очереди до следующего обхода.
+
+        Args:
+            recheck: Повторная проверка удаления.
+            rechecked: Удаления (slug), уже проверенные в этом обходе.
+        """
+        if self.settings.removal_confirmations <= 1:
+            return
+        confirmed_before = datetime.now(UTC) - self.settings.removal_confirmation_gap
+        due = await self._removal_repo.due(
+            confirmed_before, self.settings.batch_size + len(rechecked)
+        )
+        for removal in due:
+            if removal.slug in rechecked:
+                continue
+            rechecked.add(removal.slug)
+            _ = await recheck(removal.video)
+
+    async def _retry_failed(
+        self,
+        retry: Callable[[list[Video]], Awaitable[bool]],
+        budget: timedelta | None = None,
+    ) -> bool:
+        """Повторить обработку видео, которая не удалась раньше.
+
+        Каждое видео повторяется не больше одного раза за вызов. Видео, не
+        обработанные за `max_failed_attempts` попыток, больше не
+        повторяются и проверяются только в обычном обходе.
+
+        Args:
+            retry: Обработка части видео (True — лимит достигнут).
+            budget: Время на повторы (None — без ограничения).
+
+        Returns:
+            True, если достигнут лимит.
+        """
+        if self._dead_letters is None:
+            return False
+        started = datetime.now(UTC)
+        letters = await self._dead_letters.due(
+            started, self.settings.max_failed_attempts, self.settings.failed_retry_limit
+        )
+        if letters:
+            logger.info("Повтор неудачно обработанных видео", count=len(letters))
+        for chunk in batched(letters, self.settings.batch_size, strict=False):
+            if budget is not None and datetime.now(UTC) - started >= budget:
+                logger.info("Время на повторы истекло")
+                break
+            if await retry([letter.video for letter in chunk]):
+                return True
+        return False
+
+    async def _process_batch(
+        self,
+        videos: list[Video],
+        stats: VideoCleanerStats,
+        limit: int | None,
+        *,
+        force_all: bool,
+        fresh: bool = False,
+    ) -> bool:
+        """Обработать часть страницы.
+
+        Args:
+            videos: Видео.
+            stats: Статистика обхода.
+            limit: Ограничение на общее количество.
+            force_all: Проверить все видео, не учитывая историю проверок.
+            fresh: Проверить видео заново, не используя общие результаты.
+
+        Returns:
+            True, если достигнут лимит.
+        """
+        now = datetime.now(UTC)
+        videos = await self._apply_snapshots(videos, now)
+        history = await self._history_repo.get_many(video.yt_id for video in videos)
+        observed: dict[str, CheckHistory] = {}
+
+        try:
+            for video in videos:
+                known = history.get(video.yt_id)
+                if not force_all and known and not self._is_due(video, known, now):
+                    stats.skipped += 1
+                elif status := await self._handle(video, stats, fresh=fresh):
+                    history[video.yt_id] = (
+                        known.observe(status, now)
+                        if known
+                        else CheckHistory.first(video.yt_id, status, now)
+                    )
+                    if self._claim_observation(video.yt_id):
+                        observed[video.yt_id] = history[video.yt_id]
 
                 if limit and stats.total >= limit:
-                    return stats
+                    return True
+        finally:
+            await self._history_repo.save_many(observed.values())
+        return False
+
+    def _next_size(self, remaining: int | None) -> int:
+        """Размер следующей страницы."""
+        if self._batch_sizer is None:
+            return self.settings.batch_size
+        size = self._batch_sizer.size
+        if remaining is not None:
+            size = min(size, max(remaining, self._batch_sizer.minimum))
+        return size
 
-            offset += self.batch_size
+    @asynccontextmanager
+    async def _open_page(
+        self, offset: int, size: int
+    ) -> AsyncIterator[tuple[int, AsyncIterator[list[Video]]]]:
+        """Загрузить страницу.
+
+        Yields:
+            Общее количество видео и части страницы.
+        """
+        if self.settings.stream_pages:
+            async with self._video_repo.stream(offset, limit=size) as page:
+                yield (
+                    page.total_count,
+                    _batched(page.videos, self.settings.stream_chunk_size),
+                )
+        else:
+            videos = await self._video_repo.get_all(offset, limit=size)
+            yield videos.total_count, _whole(videos.videos)
+
+    async def _sweep_page(
+        self,
+        offset: int,
+        size: int,
+        process: Callable[[list[Video]], Awaitable[bool]],
+        stats: VideoCleanerStats,
+    ) -> tuple[int, bool]:
+        """Загрузить и обработать одну страницу.
+
+        Returns:
+            Общее количество видео и признак достижения лимита.
+        """
+        clock = asyncio.get_running_loop().time
+        started = clock()
+        received = 0
+        done = False
+
+        async with self._open_page(offset, size) as (total_counter, chunks):
+            fetch_time = clock() - started
+            async for videos in chunks:
+                received += len(videos)
+                if done := await process(videos):
+                    break
+
+        profile = PageProfile(
+            offset=offset,
+            size=size,
+            received=received,
+            fetch_time=fetch_time,
+            check_time=clock() - started - fetch_time,
+        )
+        stats.pages.append(profile)
+        logger.debug("Страница обработана", **asdict(profile))
+        if self._batch_sizer and not done:
+            _ = self._batch_sizer.observe(profile)
+        return total_counter, done
+
+    async def _sweep(  # noqa: PLR0913
+        self,
+        process: Callable[[list[Video]], Awaitable[bool]],
+        recheck: Callable[[Video], Awaitable[object]],
+        remaining: Callable[[], int | None],
+        stats: VideoCleanerStats,
+        retry: Callable[[list[Video]], Awaitable[bool]],
+        *,
+        late_retry: bool,
+    ) -> None:
+        """Обойти видео постранично, пока не будет достигнут лимит.
+
+        Неудачно обработанные раньше видео повторяются в начале обхода, а
+        если лимит не достигнут — и в конце, не дольше `retry_budget`.
+
+        Args:
+            process: Обработка части страницы (True — лимит достигнут).
+            recheck: Повторная проверка удаления, ожидающего подтверждения.
+            remaining: Сколько видео осталось до лимита (None — без лимита).
+            stats: Статистика обхода.
+            retry: Повторная обработка неудачных видео (True — лимит
+                достигнут).
+            late_retry: Повторить неудачи этого обхода в конце.
+        """
+        offset = 0
+        rechecked: set[str] = set()
+        if await self._retry_failed(retry):
+            return
+        await self._drain_removals(recheck, rechecked)
+
+        while True:
+            size = self._next_size(remaining())
+            total_counter, done = await self._sweep_page(offset, size, process, stats)
+            stats.total_count = total_counter
+            if done:
+                return
+
+            await self._drain_removals(recheck, rechecked)
+
+            offset += size
 
             if offset >= total_counter:
                 break
 
-        return stats
+        if late_retry and self.settings.retry_budget > timedelta(0):
+            _ = await self._retry_failed(retry, self.settings.retry_budget)
+
+    async def _run_pipeline(
+        self,
+        settings: PipelineSettings,
+        limit: int | None,
+        stats: VideoCleanerStats,
+        *,
+        force_all: bool,
+    ) -> None:
+        """Обойти видео конвейером стадий."""
+        pipeline = _Pipeline(self, settings, stats, force_all=force_all)
+        try:
+            await run_pipeline(
+                partial(
+                    self._sweep,
+                    partial(pipeline.process, limit=limit),
+                    pipeline.recheck,
+                    lambda: limit - pipeline.emitted if limit else None,
+                    stats,
+                    partial(pipeline.process, limit=limit, force=True),
+                    late_retry=False,
+                ),
+                pipeline.stages,
+            )
+        finally:
+            await self._history_repo.save_many(pipeline.observed)
+            stats.stages = [stage.metrics for stage in pipeline.stages]
+            for metrics in stats.stages:
+                logger.info(
+                    "Стадия конвейера",
+                    stage=metrics.name,
+                    workers=metrics.workers,
+                    processed=metrics.processed,
+                    max_depth=metrics.max_depth,
+                    max_wait=round(metrics.max_wait, 3),
+                    throughput=round(metrics.throughput, 2),
+                    utilization=round(metrics.utilization, 2),
+                )
+
+
+@dataclass
+class _Job:
+    """Видео, проходящее через конвейер."""
+
+    video: Video
+    known: CheckHistory | None = None
+    audit: bool = True
+    fresh: bool = False
+    status: ExistsStatus | None = None
+
+
+@final
+class _Pipeline:
+    """Стадии обхода видео конвейером.
+
+    Список → фильтр (повторы и история) → проверка oEmbed → проверка
+    YouTube Data API → решение → изменение → запись истории. Стадии
+    связаны ограниченными очередями и обрабатывают видео параллельно.
+
+    Изменения разделены на полосы восстановления, удаления и скрытия со
+    своими обработчиками. Места для запросов выдаются в порядке
+    восстановление > удаление > скрытие > проверка, поэтому изменения не
+    ждут в очереди за проверками.
+    """
+
+    def __init__(
+        self,
+        use_case: VideoCleanerUseCase,
+        settings: PipelineSettings,
+        stats: VideoCleanerStats,
+        *,
+        force_all: bool,
+    ) -> None:
+        self._use_case = use_case
+        self._stats = stats
+        self._force_all = force_all
+        self._seen: set[str] = set()
+        self._forced: set[str] = set()
+        self.observed: list[CheckHistory] = []
+        self.emitted = 0
+
+        size = settings.queue_size
+        limiter = PriorityLimiter(settings.request_slots)
+        self._filter = Stage(
+            "filter",
+            self._filter_videos,
+            workers=settings.filter_workers,
+            queue_size=size,
+        )
+        self._probe = Stage(
+            "probe",
+            self._probe_video,
+            workers=settings.probe_workers,
+            queue_size=size,
+            limiter=limiter,
+            priority=Priority.PROBE,
+        )
+        self._fallback = Stage(
+            "fallback",
+            self._fallback_video,
+            workers=settings.fallback_workers,
+            queue_size=size,
+            limiter=limiter,
+            priority=Priority.PROBE,
+        )
+        self._decide = Stage(
+            "decide",
+            self._decide_video,
+            workers=settings.decide_workers,
+            queue_size=size,
+        )
+        self._restore = Stage(
+            "restore",
+            self._mutate_video,
+            workers=settings.restore_workers,
+            queue_size=size,
+            limiter=limiter,
+            priority=Priority.RESTORE,
+        )
+        self._delete = Stage(
+            "delete",
+            self._mutate_video,
+            workers=settings.delete_workers,
+            queue_size=size,
+            limiter=limiter,
+            priority=Priority.DELETE,
+        )
+        self._hide = Stage(
+            "hide",
+            self._mutate_video,
+            workers=settings.hide_workers,
+            queue_size=size,
+            limiter=limiter,
+            priority=Priority.HIDE,
+        )
+        self._audit = Stage(
+            "audit", self._audit_video, workers=settings.audit_workers, queue_size=size
+        )
+        self.stages: list[Stage[Any]] = [
+            self._filter,
+            self._probe,
+            self._fallback,
+            self._decide,
+            self._restore,
+            self._delete,
+            self._hide,
+            self._audit,
+        ]
+
+    async def process(
+        self, videos: list[Video], *, limit: int | None, force: bool = False
+    ) -> bool:
+        """Передать часть страницы конвейеру.
+
+        Args:
+            videos: Видео.
+            limit: Ограничение на общее количество.
+            force: Проверить видео, не учитывая историю проверок.
+
+        Returns:
+            True, если достигнут лимит.
+        """
+        if limit:
+            videos = videos[: limit - self.emitted]
+        if force:
+            self._forced.update(video.slug for video in videos)
+        self.emitted += len(videos)
+        await self._filter.put(videos)
+        return bool(limit) and self.emitted >= limit
+
+    async def recheck(self, video: Video) -> None:
+        """Передать на проверку удаление, ожидающее подтверждения."""
+        await self._probe.put(_Job(video, audit=False, fresh=True))
+
+    async def _filter_videos(self, videos: list[Video]) -> None:
+        use_case = self._use_case
+        now = datetime.now(UTC)
+        videos = await use_case._apply_snapshots(videos, now)
+        history = await use_case._history_repo.get_many(video.yt_id for video in videos)
+        for video in videos:
+            if video.slug in self._seen:
+                continue
+            self._seen.add(video.slug)
+            known = history.get(video.yt_id)
+            if (
+                not self._force_all
+                and video.slug not in self._forced
+                and known
+                and not use_case._is_due(video, known, now)
+            ):
+                self._stats.skipped += 1
+            else:
+                await self._probe.put(
+                    _Job(video, known, fresh=video.slug in self._forced)
+                )
+
+    async def _probe_video(self, job: _Job) -> None:
+        use_case = self._use_case
+        async with use_case._errors(job.video, self._stats):
+            if not job.fresh and (
+                status := use_case._discovered(job.video, self._stats)
+            ):
+                job.status = status
+                await self._decide.put(job)
+                return
+            if use_case._verdicts is not None:
+                async with self._probe.request():
+                    job.status = await use_case._verdicts.get_or_check(
+                        job.video.yt_id, use_case._probe, fresh=job.fresh
+                    )
+                await self._decide.put(job)
+                return
+            try:
+                async with self._probe.request():
+                    job.status = await use_case._meta_repo.is_exists(job.video.yt_id)
+            except (UnauthorizedError, MetaRepositoryUnavailableError):
+                await self._fallback.put(job)
+            else:
+                await self._decide.put(job)
+
+    async def _fallback_video(self, job: _Job) -> None:
+        async with self._use_case._errors(job.video, self._stats):
+            async with self._fallback.request():
+                job.status = await self._use_case._fallback(job.video.yt_id)
+            await self._decide.put(job)
+
+    async def _decide_video(self, job: _Job) -> None:
+        if job.status is None:
+            self._stats.unchanged += 1
+            return
+        self._stats.verdict()
+        if job.audit:
+            await self._audit.put(job)
+        if lane := self._lane(job.video, job.status):
+            await lane.put(job)
+        else:
+            await self._mutate_video(job)
+
+    def _lane(self, video: Video, status: ExistsStatus) -> Stage[_Job] | None:
+        """Полоса изменения видео (None, если изменение не требуется)."""
+        if video.deleted and status == ExistsStatus.EXISTS:
+            return self._restore
+        if status == ExistsStatus.REMOVED:
+            return self._delete
+        if not video.deleted and status == ExistsStatus.HIDDEN:
+            return self._hide
+        return None
+
+    async def _mutate_video(self, job: _Job) -> None:
+        if job.status is None:
+            return
+        lane = self._lane(job.video, job.status)
+        async with (
+            self._use_case._errors(job.video, self._stats),
+            lane.request() if lane else nullcontext(),
+        ):
+            await self._use_case._process_video(job.video, job.status, self._stats)
+
+    async def _audit_video(self, job: _Job) -> None:
+        if job.status is None or not self._use_case._claim_observation(job.video.yt_id):
+            return
+        now = datetime.now(UTC)
+        self.observed.append(
+            job.known.observe(job.status, now)
+            if job.known
+            else CheckHistory.first(job.video.yt_id, job.status, now)
+        )
+        if len(self.observed) >= self._use_case.settings.batch_size:
+            batch, self.observed = self.observed, []
+            await self._use_case._history_repo.save_many(batch)
+
+
+async def _whole[T](items: list[T]) -> AsyncIterator[list[T]]:
+    yield items
+
+
+async def _batched[T](items: AsyncIterator[T], size: int) -> AsyncIterator[list[T]]:
+    batch: list[T] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,4 +1,112 @@
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Self
+
+
+@dataclass(frozen=True)
+class PageProfile:
+    """Замеры обработки одной страницы API видео."""
+
+    offset: int
+    size: int
+    received: int
+    fetch_time: float
+    check_time: float
+
+
+@dataclass
+class StageMetrics:
+    """Замеры стадии конвейера.
+
+    `max_wait` — наибольшее время от постановки элемента в очередь до начала
+    его обработки (включая ожидание места для запроса).
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    max_depth: int = 0
+    max_wait: float = 0.0
+    busy_time: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Элементов в секунду."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Доля времени, в которую обработчики были заняты."""
+        capacity = self.elapsed * self.workers
+        return self.busy_time / capacity if capacity else 0.0
+
+    def merge(self, other: "StageMetrics") -> None:
+        """Добавить замеры той же стадии другого обхода."""
+        self.workers = max(self.workers, other.workers)
+        self.processed += other.processed
+        self.max_depth = max(self.max_depth, other.max_depth)
+        self.max_wait = max(self.max_wait, other.max_wait)
+        self.busy_time += other.busy_time
+        self.elapsed += other.elapsed
+
+
+@dataclass(frozen=True)
+class HedgeCounters:
+    """Счётчики дублирующих (hedged) запросов."""
+
+    requests: int = 0
+    hedges: int = 0
+    wins: int = 0
+
+    def __sub__(self, other: "HedgeCounters") -> "HedgeCounters":
+        """Разница счётчиков (например, за время одного обхода)."""
+        return HedgeCounters(
+            self.requests - other.requests,
+            self.hedges - other.hedges,
+            self.wins - other.wins,
+        )
+
+
+@dataclass(frozen=True)
+class ProgressSnapshot:
+    """Ход обхода на момент отчёта."""
+
+    target: str
+    processed: int
+    expected: int | None
+    rate: float
+    eta: float | None
+    elapsed: float
+    counters: dict[str, int]
+    in_flight: dict[str, int] = field(default_factory=dict)
+    finished: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        """Доля обработанных видео (None, если общее количество неизвестно)."""
+        if not self.expected:
+            return None
+        return min(1.0, self.processed / self.expected)
+
+
+def _min[T: float](first: T | None, second: T | None) -> T | None:
+    """Меньшее из значений (None — значение неизвестно)."""
+    if first is None or second is None:
+        return first if second is None else second
+    return min(first, second)
+
+
+COUNTERS = (
+    "hidden",
+    "deleted",
+    "unchanged",
+    "restored",
+    "skipped",
+    "pending",
+    "reconciled",
+    "failed",
+)
 
 
 @dataclass
@@ -9,8 +117,85 @@ class VideoCleanerStats:
     deleted: int = 0
     unchanged: int = 0
     restored: int = 0
+    skipped: int = 0
+    pending: int = 0
+    reconciled: int = 0
+    failed: int = 0
+    discovered: int = 0
+    total_count: int | None = None
+    hedges: int = 0
+    hedge_wins: int = 0
+    quota_remaining: int | None = None
+    pages: list[PageProfile] = field(default_factory=list)
+    time_to_first_verdict: float | None = None
+    stages: list[StageMetrics] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter, repr=False)
 
     @property
     def total(self) -> int:
         """Всего обработано."""
-        return self.hidden + self.deleted + self.unchanged + self.restored
+        return (
+            self.hidden
+            + self.deleted
+            + self.unchanged
+            + self.restored
+            + self.skipped
+            + self.pending
+            + self.reconciled
+            + self.failed
+        )
+
+    def verdict(self) -> None:
+        """Отметить получение результата проверки."""
+        if self.time_to_first_verdict is None:
+            self.time_to_first_verdict = time.perf_counter() - self.started
+
+    def counters(self) -> dict[str, int]:
+        """Счётчики обработанных видео."""
+        return {name: getattr(self, name) for name in COUNTERS}
+
+    def merge(self, other: "VideoCleanerStats") -> None:
+        """Добавить статистику другого обхода (например, другого обработчика).
+
+        Счётчики и замеры стадий складываются, для общего количества видео
+        берётся наибольшее значение, для остатка квоты и времени до первого
+        результата — наименьшее.
+        """
+        for name, value in other.counters().items():
+            setattr(self, name, getattr(self, name) + value)
+        self.discovered += other.discovered
+        self.hedges += other.hedges
+        self.hedge_wins += other.hedge_wins
+        if other.total_count is not None:
+            self.total_count = max(self.total_count or 0, other.total_count)
+        self.quota_remaining = _min(self.quota_remaining, other.quota_remaining)
+        self.time_to_first_verdict = _min(
+            self.time_to_first_verdict, other.time_to_first_verdict
+        )
+        self.pages.extend(other.pages)
+        stages = {stage.name: stage for stage in self.stages}
+        for stage in other.stages:
+            if stage.name in stages:
+                stages[stage.name].merge(stage)
+            else:
+                stages[stage.name] = replace(stage)
+                self.stages.append(stages[stage.name])
+        self.started = min(self.started, other.started)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Статистика в виде, пригодном для JSON."""
+        data = asdict(self)
+        del data["started"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Восстановить статистику, сохранённую `as_dict`."""
+        pages = [PageProfile(**page) for page in data.pop("pages", [])]
+        stages = [StageMetrics(**stage) for stage in data.pop("stages", [])]
+        return cls(**data, pages=pages, stages=stages)
+
+    @property
+    def batch_sizes(self) -> list[int]:
+        """Размеры запрошенных страниц по порядку."""
+        return [page.size for page in self.pages]
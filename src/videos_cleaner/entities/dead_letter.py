@@ -0,0 +1,38 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Self
+
+from videos_cleaner.entities.video import Video
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """Видео, обработка которого не удалась из-за ошибки источников или API."""
+
+    slug: str
+    yt_id: str
+    deleted: bool
+    error: str
+    first_failed: datetime
+    last_failed: datetime
+    attempts: int = 1
+
+    @classmethod
+    def first(cls, video: Video, error: str, now: datetime) -> Self:
+        """Первая неудачная попытка."""
+        return cls(video.slug, video.yt_id, video.deleted, error, now, now)
+
+    def fail(self, video: Video, error: str, now: datetime) -> Self:
+        """Учесть очередную неудачную попытку."""
+        return replace(
+            self,
+            deleted=video.deleted,
+            error=error,
+            last_failed=now,
+            attempts=self.attempts + 1,
+        )
+
+    @property
+    def video(self) -> Video:
+        """Видео в состоянии на момент последней попытки."""
+        return Video(deleted=self.deleted, slug=self.slug, yt_id=self.yt_id)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Self
+
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+
+
+@dataclass(frozen=True)
+class CheckHistory:
+    """История проверок youtube видео."""
+
+    yt_id: str
+    status: ExistsStatus
+    first_seen: datetime
+    last_checked: datetime
+    last_change: datetime
+    streak: int = 1
+    changes: int = 0
+
+    @classmethod
+    def first(cls, yt_id: str, status: ExistsStatus, now: datetime) -> Self:
+        """История после первой проверки."""
+        return cls(yt_id, status, now, now, now)
+
+    def observe(self, status: ExistsStatus, now: datetime) -> Self:
+        """История с учётом нового результата проверки."""
+        if status == self.status:
+            return replace(self, last_checked=now, streak=self.streak + 1)
+        return replace(
+            self,
+            status=status,
+            last_checked=now,
+            last_change=now,
+            streak=1,
+            changes=self.changes + 1,
+        )
+
+
+@dataclass(frozen=True)
+class StabilityPolicy:
+    """Расписание повторных проверок.
+
+    Интервал удваивается с каждым одинаковым результатом подряд и делится
+    пополам за каждую смену статуса, чтобы «мигающие» видео проверялись чаще.
+    """
+
+    base_interval: timedelta = timedelta(days=1)
+    min_interval: timedelta = timedelta(hours=1)
+    max_interval: timedelta = timedelta(days=30)
+    max_flaps: int = 4
+
+    def interval(self, history: CheckHistory) -> timedelta:
+        """Интервал до следующей проверки."""
+        interval = self.base_interval * 2 ** (history.streak - 1)
+        interval /= 2 ** min(history.changes, self.max_flaps)
+        return max(self.min_interval, min(interval, self.max_interval))
+
+    def is_due(self, history: CheckHistory, now: datetime) -> bool:
+        """Пора ли проверить видео снова."""
+        return now - history.last_checked >= self.interval(history)
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class MutationKind(StrEnum):
+    """Изменение видео в API."""
+
+    HIDE = "hide"
+    DELETE = "delete"
+    RESTORE = "restore"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """Решённое изменение видео, ожидающее применения к API.
+
+    `enqueued` служит версией записи: новое решение по тому же видео
+    заменяет запись, и применённая ранее версия её не удалит.
+    """
+
+    slug: str
+    kind: MutationKind
+    enqueued: datetime
+    attempts: int = 0
+    next_attempt: datetime | None = None
+    last_error: str | None = None
+
+
+@dataclass
+class FlushStats:
+    """Счётчики применения отложенных изменений."""
+
+    applied: int = 0
+    retried: int = 0
+    dropped: int = 0
+    reconciled: int = 0
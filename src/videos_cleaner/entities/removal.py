@@ -0,0 +1,36 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Self
+
+from videos_cleaner.entities.video import Video
+
+
+@dataclass(frozen=True)
+class PendingRemoval:
+    """Видео, ожидающее подтверждения окончательного удаления."""
+
+    slug: str
+    yt_id: str
+    deleted: bool
+    first_seen: datetime
+    last_confirmed: datetime
+    confirmations: int = 1
+
+    @classmethod
+    def first(cls, video: Video, now: datetime) -> Self:
+        """Первое наблюдение удаления видео."""
+        return cls(video.slug, video.yt_id, video.deleted, now, now)
+
+    def confirm(self, video: Video, now: datetime) -> Self:
+        """Учесть очередное подтверждение удаления."""
+        return replace(
+            self,
+            deleted=video.deleted,
+            last_confirmed=now,
+            confirmations=self.confirmations + 1,
+        )
+
+    @property
+    def video(self) -> Video:
+        """Видео в состоянии на момент последнего подтверждения."""
+        return Video(deleted=self.deleted, slug=self.slug, yt_id=self.yt_id)
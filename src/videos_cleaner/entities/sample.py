@@ -0,0 +1,77 @@
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+
+
+@dataclass(frozen=True)
+class Proportion:
+    """Оценка доли видео в каталоге с доверительным интервалом."""
+
+    count: int
+    total: int
+    low: float
+    high: float
+
+    @property
+    def share(self) -> float:
+        """Доля в выборке."""
+        return self.count / self.total if self.total else 0.0
+
+    @classmethod
+    def estimate(
+        cls, count: int, total: int, population: int, confidence: float = 0.95
+    ) -> "Proportion":
+        """Оценить долю по выборке без возвращения.
+
+        Используется интервал Уилсона с поправкой на конечность каталога:
+        чем большая часть каталога попала в выборку, тем уже интервал.
+
+        Args:
+            count: Количество видео с признаком в выборке.
+            total: Размер выборки.
+            population: Размер каталога.
+            confidence: Уровень доверия.
+        """
+        if total == 0:
+            return cls(0, 0, 0.0, 1.0)
+        share = count / total
+        if total >= population:
+            return cls(count, total, share, share)
+
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        n = total * (population - 1) / (population - total)
+        center = (share + z**2 / (2 * n)) / (1 + z**2 / n)
+        margin = (
+            z / (1 + z**2 / n) * math.sqrt(share * (1 - share) / n + z**2 / (4 * n**2))
+        )
+        return cls(count, total, max(0.0, center - margin), min(1.0, center + margin))
+
+    def __str__(self) -> str:
+        """Доля и интервал в процентах."""
+        return f"{self.share:.1%} [{self.low:.1%}; {self.high:.1%}]"
+
+
+@dataclass
+class SampleReport:
+    """Оценка состояния каталога по случайной выборке."""
+
+    population: int
+    size: int
+    confidence: float = 0.95
+    counts: dict[ExistsStatus, int] = field(
+        default_factory=lambda: dict.fromkeys(ExistsStatus, 0)
+    )
+    failed: int = 0
+
+    @property
+    def checked(self) -> int:
+        """Количество видео выборки с установленным статусом."""
+        return sum(self.counts.values())
+
+    def estimate(self, status: ExistsStatus) -> Proportion:
+        """Оценить долю видео со статусом во всём каталоге."""
+        return Proportion.estimate(
+            self.counts[status], self.checked, self.population, self.confidence
+        )
@@ -0,0 +1,84 @@
+import math
+import random
+import statistics
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+
+# Квантиль стандартного нормального распределения уровня 0.95.
+Z_95 = 1.6449
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Логнормальное распределение длительности запросов к сервису."""
+
+    median: float = 0.1
+    p95: float = 0.3
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float]) -> "LatencyProfile | None":
+        """Оценить распределение по замеренным длительностям.
+
+        Args:
+            samples: Длительности запросов в секундах.
+
+        Returns:
+            Распределение (None, если замеров нет).
+        """
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return cls(statistics.median(ordered), p95)
+
+    def sample(self, rng: random.Random) -> float:
+        """Случайная длительность запроса."""
+        if self.median <= 0:
+            return 0.0
+        sigma = math.log(max(self.p95, self.median) / self.median) / Z_95
+        return rng.lognormvariate(math.log(self.median), sigma)
+
+
+@dataclass(frozen=True)
+class SimulationProfile:
+    """Каталог и поведение сервисов для имитации обхода."""
+
+    catalogue_size: int = 10_000
+    deleted_share: float = 0.0
+    hidden_share: float = 0.0
+    removed_share: float = 0.0
+    unauthorized_share: float = 0.0
+    video_api: LatencyProfile = field(default_factory=LatencyProfile)
+    oembed: LatencyProfile = field(default_factory=LatencyProfile)
+    data_api: LatencyProfile = field(default_factory=LatencyProfile)
+
+
+@dataclass
+class UpstreamLoad:
+    """Нагрузка на имитируемый сервис."""
+
+    requests: int = 0
+    in_flight: int = 0
+    peak_concurrency: int = 0
+
+    def enter(self) -> None:
+        """Отметить начало запроса."""
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_concurrency = max(self.peak_concurrency, self.in_flight)
+
+    def leave(self) -> None:
+        """Отметить окончание запроса."""
+        self.in_flight -= 1
+
+
+@dataclass
+class SimulationReport:
+    """Результат имитации обхода."""
+
+    wall_time: float
+    total: UpstreamLoad
+    upstreams: dict[str, UpstreamLoad]
+    stats: VideoCleanerStats
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from videos_cleaner.entities.video import Video
+
+
+@dataclass(frozen=True)
+class VideoSnapshot:
+    """Состояние видео в API, известное из ответа на изменение.
+
+    Используется, пока список видео API не отражает это состояние.
+    """
+
+    slug: str
+    deleted: bool
+    observed: datetime
+
+    def apply(self, video: Video) -> Video:
+        """Видео из списка с учётом известного состояния."""
+        return video.model_copy(update={"deleted": self.deleted})
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 
@@ -14,3 +17,11 @@ class VideoList(BaseModel):
 
     total_count: int
     videos: list[Video]
+
+
+@dataclass(frozen=True)
+class VideoStream:
+    """Страница видео, получаемая по мере загрузки."""
+
+    total_count: int
+    videos: AsyncIterator[Video]
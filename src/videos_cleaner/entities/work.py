@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import uuid4
+
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+
+
+@dataclass(frozen=True)
+class PageRange:
+    """Страница API видео, поставленная в очередь."""
+
+    offset: int
+    size: int
+
+
+@dataclass(frozen=True)
+class WorkLease:
+    """Страница, взятая обработчиком в работу до `expires`.
+
+    `token` отличает эту аренду от других аренд той же страницы, в том
+    числе у обработчиков с тем же именем.
+    """
+
+    page: PageRange
+    worker: str
+    expires: datetime
+    attempts: int = 1
+    token: str = field(default_factory=lambda: uuid4().hex)
+
+
+@dataclass
+class QueueSummary:
+    """Состояние очереди и статистика всех обработчиков."""
+
+    pending: int = 0
+    leased: int = 0
+    done: int = 0
+    failed: int = 0
+    stats: VideoCleanerStats = field(default_factory=VideoCleanerStats)
+
+    @property
+    def finished(self) -> bool:
+        """Все страницы обработаны или отложены после ошибок."""
+        return self.pending == 0 and self.leased == 0
+
+
+@dataclass(frozen=True)
+class RunLease:
+    """Обход API видео, выполняемый владельцем до `expires`."""
+
+    target: str
+    owner: str
+    started: datetime
+    expires: datetime
@@ -1,18 +1,20 @@
-from typing import TYPE_CHECKING, cast
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import structlog
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
-from videos_cleaner.adapters.repositories.meta_repository import (
-    YoutubeDataApiRepository,
-)
-from videos_cleaner.controller.cli import app, container
-from videos_cleaner.domain.use_cases.video_use_case import VideoCleanerUseCase
+from videos_cleaner.adapters.repositories.cassette import CASSETTE
+from videos_cleaner.controller.cli import app
+from videos_cleaner.controller.runner import CleanerRunner, SweepSettings
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+from videos_cleaner.domain.interfaces.video_repository import VideoRepostiryError
+from videos_cleaner.domain.use_cases.run_guard import RunInProgressError
 from videos_cleaner.entities.cleaner import VideoCleanerStats
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
+from videos_cleaner.entities.sample import SampleReport
+from videos_cleaner.entities.work import QueueSummary, RunLease
 
 runner = CliRunner()
 
@@ -21,16 +23,7 @@ class TestCliController:
     def test_clean(self, mocker: MockerFixture) -> None:
         # Given
         stats = VideoCleanerStats(0, 0, 1, 0)
-        mock_use_case = mocker.AsyncMock(spec=VideoCleanerUseCase)
-        mock_execute = mocker.AsyncMock(return_value=stats)
-        mock_use_case.execute = cast(
-            "Callable[[int | None], VideoCleanerStats]", mock_execute
-        )
-
-        async def mock_get(_service: VideoCleanerUseCase) -> VideoCleanerUseCase:
-            return mock_use_case
-
-        _ = mocker.patch.object(container, "get", side_effect=mock_get)
+        mock_sweep = mocker.patch.object(CleanerRunner, "sweep", return_value=stats)
 
         mock_logger = mocker.Mock()
         mock_logger.info = mocker.Mock()
@@ -42,6 +35,9 @@ class TestCliController:
         result = runner.invoke(app, ["--main-api-url", "http://test"])
 
         # Then
+        settings: SweepSettings = mock_sweep.call_args[0][0]
+        assert settings.main_api_url == "http://test"
+        assert settings.limit == 500
         mock_get_logger.assert_called_once()
         mock_logger.info.assert_called_once_with(
             "Обработка видео завершена",
@@ -49,27 +45,26 @@ class TestCliController:
             hidden=stats.hidden,
             deleted=stats.deleted,
             restored=stats.restored,
+            skipped=stats.skipped,
+            pending=stats.pending,
+            reconciled=stats.reconciled,
+            failed=stats.failed,
+            discovered=stats.discovered,
+            hedges=stats.hedges,
+            hedge_wins=stats.hedge_wins,
+            quota_remaining=stats.quota_remaining,
+            batch_sizes=stats.batch_sizes,
+            time_to_first_verdict=stats.time_to_first_verdict,
         )
         assert result.exit_code == 0
 
     def test_with_youtube_data_api_key(self, mocker: MockerFixture) -> None:
         # Given
         stats = VideoCleanerStats(0, 0, 1, 0)
-        mock_use_case = mocker.AsyncMock(spec=VideoCleanerUseCase)
-        mock_execute = mocker.AsyncMock(return_value=stats)
-        mock_use_case.execute = cast(
-            "Callable[[int | None], VideoCleanerStats]", mock_execute
-        )
+        _ = mocker.patch.object(CleanerRunner, "sweep", return_value=stats)
 
-        async def mock_get(_service: VideoCleanerUseCase) -> VideoCleanerUseCase:
-            return mock_use_case
-
-        _ = mocker.patch.object(container, "get", side_effect=mock_get)
-
-        mock_repository = mocker.MagicMock(spec=YoutubeDataApiRepository)
         mock_repo_constructor = mocker.patch(
-            "videos_cleaner.controller.cli.YoutubeDataApiRepository",
-            return_value=mock_repository,
+            "videos_cleaner.controller.runner.YoutubeDataApiRepository",
         )
 
         # When
@@ -85,6 +80,273 @@ class TestCliController:
 
         # Then
         mock_repo_constructor.assert_called_once_with(
-            "secretkey", *mock_repo_constructor.call_args[0][1:]
+            ("secretkey",), *mock_repo_constructor.call_args[0][1:]
+        )
+        assert result.exit_code == 0
+
+    def test_multiple_targets(self, mocker: MockerFixture) -> None:
+        # Given
+        mock_sweep_targets = mocker.patch.object(
+            CleanerRunner,
+            "sweep_targets",
+            return_value={
+                "http://first": VideoCleanerStats(0, 0, 1, 0),
+                "http://second": VideoRepostiryError("Ошибка", 500),
+            },
+        )
+
+        # When
+        result = runner.invoke(
+            app,
+            ["--main-api-url", "http://first", "--main-api-url", "http://second"],
+        )
+
+        # Then
+        settings: list[SweepSettings] = mock_sweep_targets.call_args[0][0]
+        assert [item.main_api_url for item in settings] == [
+            "http://first",
+            "http://second",
+        ]
+        assert result.exit_code == 1
+
+    def test_clean_command(self, mocker: MockerFixture) -> None:
+        # Given
+        mock_sweep = mocker.patch.object(
+            CleanerRunner, "sweep", return_value=VideoCleanerStats(0, 0, 1, 0)
+        )
+
+        # When
+        result = runner.invoke(app, ["clean", "--main-api-url", "http://test"])
+
+        # Then
+        mock_sweep.assert_awaited_once()
+        assert result.exit_code == 0
+
+    def test_sample(self, mocker: MockerFixture) -> None:
+        # Given
+        report = SampleReport(population=1000, size=4)
+        report.counts[ExistsStatus.EXISTS] = 3
+        report.counts[ExistsStatus.REMOVED] = 1
+        mock_sample = mocker.patch.object(CleanerRunner, "sample", return_value=report)
+        mock_sweep = mocker.patch.object(CleanerRunner, "sweep")
+
+        mock_logger = mocker.Mock()
+        _ = mocker.patch.object(
+            structlog.stdlib, "get_logger", return_value=mock_logger
+        )
+
+        # When
+        result = runner.invoke(
+            app,
+            ["sample", "--main-api-url", "http://test", "--size", "4", "--seed", "1"],
+        )
+
+        # Then
+        mock_sample.assert_awaited_once_with("http://test", 4, confidence=0.95, seed=1)
+        mock_sweep.assert_not_called()
+        kwargs = mock_logger.info.call_args.kwargs
+        assert kwargs["population"] == 1000
+        assert kwargs["removed"] == str(report.estimate(ExistsStatus.REMOVED))
+        assert result.exit_code == 0
+
+    def test_simulate(self, mocker: MockerFixture) -> None:
+        # Given
+        mock_sweep = mocker.patch.object(CleanerRunner, "sweep")
+        mock_logger = mocker.Mock()
+        _ = mocker.patch.object(
+            structlog.stdlib, "get_logger", return_value=mock_logger
+        )
+
+        # When
+        result = runner.invoke(
+            app,
+            ["simulate", "--size", "120", "--hidden-share", "0.5", "--seed", "1"],
+        )
+
+        # Then
+        mock_sweep.assert_not_called()
+        calls = {call.args[0]: call.kwargs for call in mock_logger.info.call_args_list}
+        assert calls["Оценка обхода"]["catalogue_size"] == 120
+        assert calls["Оценка обхода"]["total"] == 120
+        assert calls["Оценка обхода"]["hidden"] > 0
+        assert calls["Нагрузка на сервис"]["upstream"] == "data_api"
+        assert result.exit_code == 0
+
+    def test_simulate_recording(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        # Given
+        oembed = {
+            "method": "HEAD",
+            "url": "https://www.youtube.com/oembed?url=x",
+            "status": 403,
+            "headers": [],
+            "content": "",
+            "elapsed": 0.1,
+        }
+        (tmp_path / CASSETTE).write_text(json.dumps(oembed) + "\n")
+        mock_logger = mocker.Mock()
+        _ = mocker.patch.object(
+            structlog.stdlib, "get_logger", return_value=mock_logger
+        )
+
+        # When
+        result = runner.invoke(
+            app,
+            ["simulate", "--recording", str(tmp_path), "--size", "30", "--seed", "1"],
+        )
+
+        # Then
+        assert result.exit_code == 0, result.output
+        calls = {call.args[0]: call.kwargs for call in mock_logger.info.call_args_list}
+        assert calls["Оценка обхода"]["catalogue_size"] == 30
+        assert calls["Оценка обхода"]["hidden"] == 30
+
+    def test_run_in_progress(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        # Given
+        started = datetime(2025, 1, 1, tzinfo=UTC)
+        holder = RunLease("http://test", "other", started, started)
+        mock_sweep = mocker.patch.object(
+            CleanerRunner, "sweep", side_effect=RunInProgressError(holder)
+        )
+        mock_logger = mocker.Mock()
+        _ = mocker.patch.object(
+            structlog.stdlib, "get_logger", return_value=mock_logger
+        )
+
+        # When
+        result = runner.invoke(
+            app,
+            [
+                "--main-api-url",
+                "http://test",
+                "--on-overlap",
+                "skip",
+                "--state",
+                str(tmp_path / "state.sqlite3"),
+            ],
+        )
+
+        # Then
+        mock_sweep.assert_awaited_once()
+        mock_logger.info.assert_called_once_with(
+            "Обход пропущен",
+            target="http://test",
+            owner="other",
+            started=started.isoformat(),
+        )
+        assert result.exit_code == 0
+
+    def test_overlap_needs_state(self, mocker: MockerFixture) -> None:
+        # Given
+        mock_sweep = mocker.patch.object(CleanerRunner, "sweep")
+
+        # When
+        result = runner.invoke(
+            app, ["--main-api-url", "http://test", "--on-overlap", "skip"]
+        )
+
+        # Then
+        mock_sweep.assert_not_called()
+        assert result.exit_code == 2
+        assert "--state" in result.output
+
+    def test_loops_need_single_target(self, mocker: MockerFixture) -> None:
+        # Given
+        mock_sweep = mocker.patch.object(CleanerRunner, "sweep")
+
+        # When
+        result = runner.invoke(
+            app,
+            [
+                "--main-api-url",
+                "http://first",
+                "--main-api-url",
+                "http://second",
+                "--loops",
+                "2",
+            ],
+        )
+
+        # Then
+        mock_sweep.assert_not_called()
+        assert result.exit_code == 2
+        assert "--loops" in result.output
+
+    def test_enqueue(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        # Given
+        mock_enqueue = mocker.patch.object(CleanerRunner, "enqueue", return_value=2)
+
+        # When
+        result = runner.invoke(
+            app,
+            [
+                "enqueue",
+                "--main-api-url",
+                "http://test",
+                "--state",
+                str(tmp_path / "state.sqlite3"),
+                "--batch-size",
+                "20",
+            ],
+        )
+
+        # Then
+        settings: SweepSettings = mock_enqueue.call_args[0][0]
+        assert (settings.limit, settings.batch_size) == (0, 20)
+        assert result.exit_code == 0
+
+    def test_queue_needs_state(self, mocker: MockerFixture) -> None:
+        # Given
+        mock_enqueue = mocker.patch.object(CleanerRunner, "enqueue")
+        mock_work = mocker.patch.object(CleanerRunner, "work")
+
+        # When
+        results = [
+            runner.invoke(app, [command, "--main-api-url", "http://test"])
+            for command in ("enqueue", "worker")
+        ]
+
+        # Then
+        mock_enqueue.assert_not_called()
+        mock_work.assert_not_called()
+        assert [result.exit_code for result in results] == [2, 2]
+
+    def test_worker(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        # Given
+        mock_work = mocker.patch.object(
+            CleanerRunner, "work", return_value=VideoCleanerStats(unchanged=3)
+        )
+        _ = mocker.patch.object(
+            CleanerRunner,
+            "queue_summary",
+            return_value=QueueSummary(done=2, stats=VideoCleanerStats(unchanged=5)),
+        )
+        mock_logger = mocker.Mock()
+        _ = mocker.patch.object(
+            structlog.stdlib, "get_logger", return_value=mock_logger
+        )
+
+        # When
+        result = runner.invoke(
+            app,
+            [
+                "worker",
+                "--main-api-url",
+                "http://test",
+                "--state",
+                str(tmp_path / "state.sqlite3"),
+                "--name",
+                "first",
+                "--lease-time",
+                "60",
+            ],
         )
+
+        # Then
+        settings, name, lease_time = mock_work.call_args[0]
+        assert settings.main_api_url == "http://test"
+        assert name == "first"
+        assert lease_time == timedelta(seconds=60)
+        summary = mock_logger.info.call_args_list[-1]
+        assert summary.kwargs["pages"] == 2
+        assert summary.kwargs["unchanged"] == 5
         assert result.exit_code == 0
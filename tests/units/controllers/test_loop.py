@@ -0,0 +1,35 @@
+import asyncio
+import importlib.util
+
+import pytest
+from pytest_mock import MockerFixture
+
+from videos_cleaner.controller.loop import run
+
+
+async def loop_name() -> str:
+    return type(asyncio.get_running_loop()).__module__
+
+
+class TestRun:
+    def test_default_loop(self) -> None:
+        assert run(loop_name).startswith("asyncio")
+
+    def test_fast_loop(self) -> None:
+        _ = pytest.importorskip("uvloop")
+
+        assert run(loop_name, fast_loop=True).startswith("uvloop")
+
+    def test_fast_loop_fallback(self, mocker: MockerFixture) -> None:
+        _ = mocker.patch.object(importlib.util, "find_spec", return_value=None)
+
+        assert run(loop_name, fast_loop=True).startswith("asyncio")
+
+    def test_virtual_clock(self) -> None:
+        async def sleep() -> tuple[float, str]:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            _ = await asyncio.gather(asyncio.sleep(60), asyncio.sleep(3600))
+            return loop.time() - started, type(loop).__name__
+
+        assert run(sleep, virtual_clock=True) == (3600, "VirtualClockEventLoop")
@@ -0,0 +1,41 @@
+import io
+
+from videos_cleaner.controller.progress import ProgressBar
+from videos_cleaner.entities.cleaner import ProgressSnapshot
+
+
+def snapshot(*, finished: bool = False) -> ProgressSnapshot:
+    return ProgressSnapshot(
+        target="http://test",
+        processed=50,
+        expected=100,
+        rate=12.5,
+        eta=3725,
+        elapsed=4,
+        counters={"hidden": 2, "deleted": 0, "unchanged": 48},
+        in_flight={"www.youtube.com": 3, "test": 1},
+        finished=finished,
+    )
+
+
+class TestProgressBar:
+    def test_render(self) -> None:
+        line = ProgressBar(io.StringIO()).render(snapshot())
+
+        assert line == (
+            f"[{'#' * 15}{'.' * 15}] 50/100 12.5/с ETA 01:02:05 "
+            "запросов 4 hidden=2 unchanged=48"
+        )
+
+    def test_redraws_in_place(self) -> None:
+        stream = io.StringIO()
+        bar = ProgressBar(stream)
+
+        bar(snapshot())
+        bar(snapshot(finished=True))
+
+        output = stream.getvalue()
+        assert output.startswith("\r")
+        assert output.count("\r") == 2
+        assert output.endswith("\n")
+        assert output.count("\n") == 1
@@ -0,0 +1,452 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Request, Response
+
+from videos_cleaner.adapters.repositories.mutation_journal import (
+    MutationJournalRepository,
+)
+from videos_cleaner.adapters.repositories.run_lock import RunLockRepository
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.controller.runner import (
+    CleanerConfig,
+    CleanerRunner,
+    SweepSettings,
+)
+from videos_cleaner.domain.interfaces.dirty_set import IDirtySet
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+)
+from videos_cleaner.domain.interfaces.video_repository import VideoRepostiryError
+from videos_cleaner.domain.use_cases.run_guard import (
+    OverlapPolicy,
+    RunInProgressError,
+)
+from videos_cleaner.entities.cleaner import (
+    HedgeCounters,
+    ProgressSnapshot,
+    VideoCleanerStats,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def video(slug: str) -> dict[str, str | bool]:
+    return {"slug": slug, "yt_id": slug, "deleted": False}
+
+
+class TestCleanerRunner:
+    @respx.mock
+    async def test_sweep_many(self) -> None:
+        first = respx.get("http://first/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "1"}
+            )
+        )
+        second = respx.get("http://second/videos").mock(
+            return_value=Response(
+                200, json=[video("b"), video("c")], headers={"x-total-count": "2"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+
+        async with CleanerRunner() as runner:
+            result = await runner.sweep_many(
+                [
+                    SweepSettings(main_api_url="http://first"),
+                    SweepSettings(main_api_url="http://second"),
+                ]
+            )
+
+        assert first.called
+        assert second.called
+        assert [stats.unchanged for stats in result] == [1, 2]
+
+    @respx.mock
+    async def test_repeated_sweeps(self) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "1"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        settings = SweepSettings(main_api_url="http://test")
+
+        async with CleanerRunner() as runner:
+            first = await runner.sweep(settings)
+            second = await runner.sweep(settings)
+
+        assert first.unchanged == 1
+        assert second.skipped == 1
+
+    @respx.mock
+    async def test_sweep_targets(self) -> None:
+        respx.get("http://first/videos").mock(
+            return_value=Response(
+                200, json=[video("a"), video("b")], headers={"x-total-count": "2"}
+            )
+        )
+        respx.get("http://second/videos").mock(
+            return_value=Response(
+                200,
+                json=[{**video("b"), "slug": "other"}],
+                headers={"x-total-count": "1"},
+            )
+        )
+        respx.get("http://broken/videos").mock(return_value=Response(500))
+        oembed = respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(404)
+        )
+        first_delete = respx.delete(url__startswith="http://first/videos/").mock(
+            return_value=Response(204)
+        )
+        second_delete = respx.delete("http://second/videos/other").mock(
+            return_value=Response(204)
+        )
+
+        async with CleanerRunner() as runner:
+            result = await runner.sweep_targets(
+                [
+                    SweepSettings(main_api_url="http://first"),
+                    SweepSettings(main_api_url="http://second"),
+                    SweepSettings(main_api_url="http://broken"),
+                ]
+            )
+
+        assert oembed.call_count == 2
+        assert first_delete.call_count == 2
+        assert second_delete.called
+        first, second = result["http://first"], result["http://second"]
+        assert isinstance(first, VideoCleanerStats)
+        assert isinstance(second, VideoCleanerStats)
+        assert first.deleted == 2
+        assert second.deleted == 1
+        assert isinstance(result["http://broken"], VideoRepostiryError)
+
+    async def test_not_started(self) -> None:
+        with pytest.raises(RuntimeError):
+            _ = await CleanerRunner().sweep(SweepSettings())
+
+    @respx.mock
+    async def test_warm_up(self) -> None:
+        api = respx.head("http://test").mock(return_value=Response(200))
+        youtube = respx.head("https://www.youtube.com").mock(return_value=Response(200))
+
+        async with CleanerRunner(CleanerConfig(warm_connections=2)) as runner:
+            await runner.warm_up(["http://test"])
+
+        assert api.call_count == 2
+        assert youtube.call_count == 2
+
+    @respx.mock
+    async def test_first_verdict_includes_warm_up(self) -> None:
+        respx.head("http://test").mock(return_value=Response(200))
+        respx.head("https://www.youtube.com").mock(return_value=Response(200))
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "1"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+
+        async with CleanerRunner(CleanerConfig(warm_connections=1)) as runner:
+            await runner.warm_up(["http://test"])
+            await asyncio.sleep(0.05)
+            result = await runner.sweep(SweepSettings(main_api_url="http://test"))
+
+        assert result.time_to_first_verdict is not None
+        assert result.time_to_first_verdict >= 0.05
+
+    @respx.mock
+    async def test_warm_up_disabled(self) -> None:
+        api = respx.head("http://test").mock(return_value=Response(200))
+
+        async with CleanerRunner() as runner:
+            await runner.warm_up(["http://test"])
+
+        assert not api.called
+
+    @respx.mock
+    async def test_sample(self) -> None:
+        videos = respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "10"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(404)
+        )
+        deleted = respx.delete(url__startswith="http://test/videos/")
+
+        async with CleanerRunner() as runner:
+            report = await runner.sample("http://test", 4, seed=1)
+
+        assert videos.call_count == 5
+        assert report.counts[ExistsStatus.REMOVED] == 4
+        assert not deleted.called
+
+    @respx.mock
+    async def test_enqueue_and_work(self, tmp_path: Path) -> None:
+        def page(request: Request) -> Response:
+            skip = int(request.url.params["skip"])
+            limit = int(request.url.params["limit"])
+            return Response(
+                200,
+                json=[video(str(i)) for i in range(skip, min(skip + limit, 5))],
+                headers={"x-total-count": "5"},
+            )
+
+        respx.get("http://test/videos").mock(side_effect=page)
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        config = CleanerConfig(state=tmp_path / "state.sqlite3")
+        settings = SweepSettings(main_api_url="http://test", batch_size=2)
+
+        async with CleanerRunner(config) as runner:
+            pages = await runner.enqueue(settings)
+        async with CleanerRunner(config) as first, CleanerRunner(config) as second:
+            results = await asyncio.gather(
+                first.work(settings, "first"), second.work(settings, "second")
+            )
+            summary = await first.queue_summary("http://test")
+
+        assert pages == 3
+        assert sum(stats.unchanged for stats in results) == 5
+        assert summary.done == 3
+        assert summary.stats.unchanged == 5
+
+    @respx.mock
+    async def test_channels(self) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a"), video("b")], headers={"x-total-count": "2"}
+            )
+        )
+        feed = respx.get(
+            "https://www.youtube.com/feeds/videos.xml", params={"channel_id": "UCa"}
+        ).mock(
+            return_value=Response(
+                200,
+                text='<feed xmlns="http://www.w3.org/2005/Atom" '
+                'xmlns:yt="http://www.youtube.com/xml/schemas/2015">'
+                "<entry><yt:videoId>a</yt:videoId></entry></feed>",
+            )
+        )
+        oembed = respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        settings = SweepSettings(main_api_url="http://test")
+
+        async with CleanerRunner(CleanerConfig(channels=("UCa",))) as runner:
+            first = await runner.sweep(settings)
+            second = await runner.sweep(settings)
+
+        assert feed.call_count == 2
+        assert oembed.call_count == 1
+        assert first.discovered == 1
+        assert second.skipped == 2
+
+    @respx.mock
+    async def test_hedging(self) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "1"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        settings = SweepSettings(main_api_url="http://test")
+
+        async with CleanerRunner(CleanerConfig(hedge_percentile=0.95)) as runner:
+            stats = await runner.sweep(settings)
+            counters = (await runner.container.get(IMetaRepository)).hedge_counters()
+
+        assert counters == HedgeCounters(1, 0, 0)
+        assert stats.hedges == 0
+
+    @respx.mock
+    async def test_sweep_dirty(self) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a"), video("b")], headers={"x-total-count": "2"}
+            )
+        )
+        oembed = respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        settings = SweepSettings(main_api_url="http://test")
+
+        async with CleanerRunner() as runner:
+            dirty = await runner.container.get(IDirtySet)
+            _ = await runner.sweep(settings)
+            await dirty.mark(["b"], datetime.now(UTC) - timedelta(seconds=1))
+            oembed.reset()
+            results = await runner.sweep_dirty([settings], dirty, background_sample=0)
+            pending = await dirty.pending()
+
+        stats = results["http://test"]
+        assert isinstance(stats, VideoCleanerStats)
+        assert (stats.unchanged, stats.skipped) == (1, 1)
+        assert oembed.call_count == 1
+        assert "b" in str(oembed.calls.last.request.url)
+        assert pending == frozenset()
+
+    @respx.mock
+    async def test_sweep_dirty_skips_active_run(self, tmp_path: Path) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "1"}
+            )
+        )
+        oembed = respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        state = tmp_path / "state.sqlite3"
+        settings = SweepSettings(main_api_url="http://test")
+        active = RunLockRepository(StateDatabase(str(state)), "http://test")
+        now = datetime.now(UTC)
+        _ = await active.acquire("active", now, now + timedelta(minutes=5))
+
+        async with CleanerRunner(CleanerConfig(state=state)) as runner:
+            dirty = await runner.container.get(IDirtySet)
+            await dirty.mark(["a"], now - timedelta(seconds=1))
+            results = await runner.sweep_dirty([settings], dirty, background_sample=0)
+            pending = await dirty.pending()
+
+        assert isinstance(results["http://test"], RunInProgressError)
+        assert oembed.call_count == 0
+        assert pending == frozenset({"a"})
+
+    @respx.mock
+    async def test_write_behind(self, tmp_path: Path) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a")], headers={"x-total-count": "1"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(404)
+        )
+        deleted = respx.delete("http://test/videos/a").mock(
+            side_effect=[Response(500), Response(204)]
+        )
+        config = CleanerConfig(state=tmp_path / "state.sqlite3", write_behind=True)
+        settings = SweepSettings(main_api_url="http://test")
+
+        async with CleanerRunner(config) as runner:
+            first = await runner.sweep(settings)
+        pending = await MutationJournalRepository(
+            StateDatabase(str(config.state)), "http://test"
+        ).pending()
+        async with CleanerRunner(config) as runner:
+            _ = await runner.sweep(settings)
+        left = await MutationJournalRepository(
+            StateDatabase(str(config.state)), "http://test"
+        ).pending()
+
+        assert first.deleted == 1
+        assert (pending, left) == (1, 0)
+        assert deleted.call_count == 2
+
+    @respx.mock
+    async def test_dead_letters(self, tmp_path: Path) -> None:
+        respx.get("http://test/videos").mock(
+            side_effect=[
+                Response(200, json=[video("a")], headers={"x-total-count": "1"}),
+                Response(200, json=[], headers={"x-total-count": "0"}),
+            ]
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(404)
+        )
+        deleted = respx.delete("http://test/videos/a").mock(
+            side_effect=[Response(500), Response(204)]
+        )
+        config = CleanerConfig(state=tmp_path / "state.sqlite3")
+        settings = SweepSettings(main_api_url="http://test", retry_budget=timedelta(0))
+
+        async with CleanerRunner(config) as runner:
+            first = await runner.sweep(settings)
+        async with CleanerRunner(config) as runner:
+            second = await runner.sweep(settings)
+
+        assert (first.failed, first.deleted) == (1, 0)
+        assert (second.failed, second.deleted) == (0, 1)
+        assert deleted.call_count == 2
+
+    @respx.mock
+    async def test_progress(self) -> None:
+        respx.get("http://test/videos").mock(
+            return_value=Response(
+                200, json=[video("a"), video("b")], headers={"x-total-count": "2"}
+            )
+        )
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        snapshots: list[ProgressSnapshot] = []
+        config = CleanerConfig(progress=snapshots.append, progress_interval=60)
+
+        async with CleanerRunner(config) as runner:
+            stats = await runner.sweep(SweepSettings(main_api_url="http://test"))
+
+        assert stats.total_count == 2
+        assert [snapshot.finished for snapshot in snapshots] == [True]
+        assert snapshots[0].target == "http://test"
+        assert snapshots[0].processed == 2
+        assert snapshots[0].expected == 2
+        assert snapshots[0].in_flight == {}
+
+    @respx.mock
+    async def test_overlap(self, tmp_path: Path) -> None:
+        def page(request: Request) -> Response:
+            skip = int(request.url.params["skip"])
+            limit = int(request.url.params["limit"])
+            return Response(
+                200,
+                json=[video(str(i)) for i in range(skip, min(skip + limit, 5))],
+                headers={"x-total-count": "5"},
+            )
+
+        respx.get("http://test/videos").mock(side_effect=page)
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        state = tmp_path / "state.sqlite3"
+        settings = SweepSettings(main_api_url="http://test", batch_size=2)
+        active = RunLockRepository(StateDatabase(str(state)), "http://test")
+        now = datetime.now(UTC)
+        lease = await active.acquire("active", now, now + timedelta(minutes=5))
+
+        skip = CleanerConfig(state=state, on_overlap=OverlapPolicy.SKIP)
+        async with CleanerRunner(skip) as runner:
+            with pytest.raises(RunInProgressError):
+                _ = await runner.sweep(settings)
+
+        async with CleanerRunner(CleanerConfig(state=state)) as runner:
+            _ = await runner.enqueue(settings)
+        join = CleanerConfig(
+            state=state, on_overlap=OverlapPolicy.JOIN, run_name="joined"
+        )
+        async with CleanerRunner(join) as runner:
+            joined = await runner.sweep(settings)
+        await active.release(lease)
+        async with CleanerRunner(join) as runner:
+            owned = await runner.sweep(settings)
+
+        assert joined.unchanged == 5
+        assert owned.total == 5
+        after = await active.acquire("next", now, now + timedelta(minutes=5))
+        assert after.owner == "next"
@@ -0,0 +1,66 @@
+from functools import partial
+
+import pytest
+
+from videos_cleaner.controller.loop import run
+from videos_cleaner.controller.runner import SweepSettings
+from videos_cleaner.controller.simulation import simulate
+from videos_cleaner.domain.use_cases.pipeline import PipelineSettings
+from videos_cleaner.entities.simulation import LatencyProfile, SimulationProfile
+
+PROFILE = SimulationProfile(
+    catalogue_size=100,
+    deleted_share=0.1,
+    hidden_share=0.1,
+    removed_share=0.1,
+    unauthorized_share=0.1,
+    video_api=LatencyProfile(1, 1),
+    oembed=LatencyProfile(0.5, 0.5),
+    data_api=LatencyProfile(0.25, 0.25),
+)
+
+
+class TestSimulate:
+    def test_sequential(self) -> None:
+        report = run(
+            partial(simulate, SweepSettings(limit=None), PROFILE, seed=1),
+            virtual_clock=True,
+        )
+
+        loads = report.upstreams
+        assert report.stats.total == 100
+        assert loads["oembed"].requests == 100
+        assert loads["data_api"].requests > 0
+        assert report.total.peak_concurrency == 1
+        assert report.wall_time == pytest.approx(
+            loads["video_api"].requests * 1
+            + loads["oembed"].requests * 0.5
+            + loads["data_api"].requests * 0.25
+        )
+
+    def test_pipeline_is_faster(self) -> None:
+        sequential = run(
+            partial(simulate, SweepSettings(limit=None), PROFILE, seed=1),
+            virtual_clock=True,
+        )
+        settings = SweepSettings(limit=None, pipeline=PipelineSettings())
+
+        report = run(partial(simulate, settings, PROFILE, seed=1), virtual_clock=True)
+
+        assert report.stats.counters() == sequential.stats.counters()
+        assert report.upstreams["oembed"].peak_concurrency == 8
+        assert report.wall_time < sequential.wall_time / 4
+
+    def test_reproducible(self) -> None:
+        profile = SimulationProfile(catalogue_size=200, hidden_share=0.2)
+
+        first, second = (
+            run(
+                partial(simulate, SweepSettings(limit=None), profile, seed=7),
+                virtual_clock=True,
+            )
+            for _ in range(2)
+        )
+
+        assert first.wall_time == second.wall_time
+        assert first.stats.counters() == second.stats.counters()
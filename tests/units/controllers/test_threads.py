@@ -0,0 +1,96 @@
+import pytest
+import respx
+from httpx import Request, Response
+
+from videos_cleaner.adapters.repositories.quota import QuotaAccountant
+from videos_cleaner.controller import threads
+from videos_cleaner.controller.runner import (
+    CleanerConfig,
+    CleanerRunner,
+    SweepSettings,
+)
+from videos_cleaner.controller.threads import loop_count, sweep_threaded
+
+
+def page(request: Request) -> Response:
+    skip = int(request.url.params["skip"])
+    limit = int(request.url.params["limit"])
+    return Response(
+        200,
+        json=[
+            {"slug": str(i), "yt_id": str(i), "deleted": False}
+            for i in range(skip, min(skip + limit, 7))
+        ],
+        headers={"x-total-count": "7"},
+    )
+
+
+class TestLoopCount:
+    def test_gil_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(threads, "gil_enabled", lambda: True)
+
+        assert loop_count(4) == 1
+
+    def test_free_threaded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(threads, "gil_enabled", lambda: False)
+
+        assert loop_count(4) == 4
+        assert loop_count(0) == 1
+
+
+class TestSweepThreaded:
+    @respx.mock
+    def test_merges_stats(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(threads, "gil_enabled", lambda: False)
+        videos = respx.get("http://test/videos").mock(side_effect=page)
+        oembed = respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        settings = SweepSettings(main_api_url="http://test", batch_size=2)
+
+        stats = sweep_threaded(CleanerConfig(), settings, 3)
+
+        assert stats.unchanged == 7
+        assert len(stats.pages) == 4
+        assert oembed.call_count == 7
+        # Первая страница — для подсчёта страниц, затем по одной на каждую.
+        assert videos.call_count == 5
+
+    @respx.mock
+    def test_shared_quota(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(threads, "gil_enabled", lambda: False)
+        quotas: list[QuotaAccountant | None] = []
+
+        def make_runner(
+            config: CleanerConfig, *, quota: QuotaAccountant | None = None
+        ) -> CleanerRunner:
+            quotas.append(quota)
+            return CleanerRunner(config, quota=quota)
+
+        monkeypatch.setattr(threads, "CleanerRunner", make_runner)
+        respx.get("http://test/videos").mock(side_effect=page)
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        config = CleanerConfig(youtube_data_api_keys=("key",))
+        settings = SweepSettings(main_api_url="http://test", batch_size=2)
+
+        _ = sweep_threaded(config, settings, 3)
+
+        workers = quotas[1:]
+        assert len(workers) == 3
+        assert workers[0] is not None
+        assert all(quota is workers[0] for quota in workers)
+
+    @respx.mock
+    def test_single_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(threads, "gil_enabled", lambda: True)
+        respx.get("http://test/videos").mock(side_effect=page)
+        respx.head(url__startswith="https://www.youtube.com/oembed").mock(
+            return_value=Response(200)
+        )
+        settings = SweepSettings(main_api_url="http://test", batch_size=2)
+
+        stats = sweep_threaded(CleanerConfig(), settings, 3)
+
+        assert stats.unchanged == 7
@@ -0,0 +1,132 @@
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+
+from videos_cleaner.adapters.repositories.dirty_set import DirtySetRepository
+from videos_cleaner.adapters.repositories.local_hub import LocalHub
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.adapters.repositories.websub import (
+    WebSubSubscriber,
+    channel_topic,
+    notification_feed,
+    sign,
+)
+from videos_cleaner.controller.websub import WebSubCallback, serve_callback
+
+pytestmark = pytest.mark.anyio
+
+HUB_SECRET = "hub-secret"  # noqa: S105
+
+TOPIC = channel_topic("UC1")
+
+
+@pytest.fixture
+def dirty() -> DirtySetRepository:
+    return DirtySetRepository(StateDatabase())
+
+
+@pytest.fixture
+def callback(dirty: DirtySetRepository) -> WebSubCallback:
+    return WebSubCallback(
+        dirty,
+        [TOPIC],
+        secret=HUB_SECRET,
+        clock=lambda: datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+
+class TestWebSubCallback:
+    async def test_verify(self, callback: WebSubCallback) -> None:
+        known = await callback.handle(
+            "GET",
+            f"/websub?hub.mode=subscribe&hub.challenge=abc&hub.topic={TOPIC}",
+            {},
+            b"",
+        )
+        unknown = await callback.handle(
+            "GET",
+            "/websub?hub.mode=subscribe&hub.challenge=abc&hub.topic=other",
+            {},
+            b"",
+        )
+
+        assert known == (200, b"abc")
+        assert unknown[0] == 404
+
+    async def test_notify(
+        self, callback: WebSubCallback, dirty: DirtySetRepository
+    ) -> None:
+        body = notification_feed("UC1", updated=["new"], deleted=["gone"])
+
+        status, _ = await callback.handle(
+            "POST", "/websub", {"x-hub-signature": sign(HUB_SECRET, body)}, body
+        )
+
+        assert status == 204
+        assert await dirty.pending() == {"new", "gone"}
+
+    async def test_bad_signature(
+        self, callback: WebSubCallback, dirty: DirtySetRepository
+    ) -> None:
+        body = notification_feed("UC1", deleted=["gone"])
+
+        status, _ = await callback.handle(
+            "POST", "/websub", {"x-hub-signature": sign("other", body)}, body
+        )
+
+        assert status == 202
+        assert await dirty.pending() == frozenset()
+
+    async def test_malformed(self, callback: WebSubCallback) -> None:
+        body = b"not xml"
+
+        status, _ = await callback.handle(
+            "POST", "/websub", {"x-hub-signature": sign(HUB_SECRET, body)}, body
+        )
+
+        assert status == 400
+
+
+class TestLocalHub:
+    async def test_subscribe_and_publish(
+        self, callback: WebSubCallback, dirty: DirtySetRepository
+    ) -> None:
+        server = await serve_callback(callback, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        hub = LocalHub()
+
+        async with server, AsyncClient(transport=hub) as client:
+            subscriber = WebSubSubscriber(
+                client,
+                f"http://127.0.0.1:{port}/websub",
+                hub_url="http://hub/subscribe",
+                secret=HUB_SECRET,
+            )
+            await subscriber.subscribe(TOPIC, 3600)
+            delivered = await hub.publish(
+                TOPIC, notification_feed("UC1", deleted=["gone"])
+            )
+            await subscriber.unsubscribe(TOPIC)
+
+        assert delivered == 1
+        assert await dirty.pending() == {"gone"}
+        assert hub.subscriptions[TOPIC] == {}
+
+    async def test_unconfirmed_subscription(self, callback: WebSubCallback) -> None:
+        server = await serve_callback(callback, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        hub = LocalHub()
+
+        async with server, AsyncClient(transport=hub) as client:
+            response = await client.post(
+                "http://hub/subscribe",
+                data={
+                    "hub.callback": f"http://127.0.0.1:{port}/websub",
+                    "hub.topic": "https://example.com/other",
+                    "hub.mode": "subscribe",
+                },
+            )
+
+        assert response.status_code == 409
+        assert not hub.subscriptions["https://example.com/other"]
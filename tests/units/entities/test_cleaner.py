@@ -0,0 +1,99 @@
+from dataclasses import fields
+
+from videos_cleaner.entities.cleaner import (
+    PageProfile,
+    StageMetrics,
+    VideoCleanerStats,
+)
+
+
+def stats(scale: int) -> VideoCleanerStats:
+    return VideoCleanerStats(
+        hidden=scale,
+        deleted=scale,
+        unchanged=scale,
+        restored=scale,
+        skipped=scale,
+        pending=scale,
+        reconciled=scale,
+        failed=scale,
+        discovered=scale,
+        total_count=100 * scale,
+        hedges=scale,
+        hedge_wins=scale,
+        quota_remaining=1000 // scale,
+        pages=[PageProfile(scale, 50, 50, 0.1, 0.2)],
+        time_to_first_verdict=float(scale),
+        stages=[
+            StageMetrics(
+                "probe",
+                8,
+                processed=scale,
+                max_depth=scale,
+                max_wait=float(scale),
+                busy_time=float(scale),
+                elapsed=float(scale),
+            )
+        ],
+        started=float(scale),
+    )
+
+
+class TestVideoCleanerStats:
+    def test_merge_keeps_every_field(self) -> None:
+        merged = stats(1)
+
+        merged.merge(stats(2))
+
+        expected = {
+            "hidden": 3,
+            "deleted": 3,
+            "unchanged": 3,
+            "restored": 3,
+            "skipped": 3,
+            "pending": 3,
+            "reconciled": 3,
+            "failed": 3,
+            "discovered": 3,
+            "total_count": 200,
+            "hedges": 3,
+            "hedge_wins": 3,
+            "quota_remaining": 500,
+            "pages": [
+                PageProfile(1, 50, 50, 0.1, 0.2),
+                PageProfile(2, 50, 50, 0.1, 0.2),
+            ],
+            "time_to_first_verdict": 1.0,
+            "stages": [
+                StageMetrics(
+                    "probe",
+                    8,
+                    processed=3,
+                    max_depth=2,
+                    max_wait=2.0,
+                    busy_time=3.0,
+                    elapsed=3.0,
+                )
+            ],
+            "started": 1.0,
+        }
+        assert {field.name for field in fields(merged)} == set(expected)
+        assert {name: getattr(merged, name) for name in expected} == expected
+
+    def test_merge_into_empty(self) -> None:
+        merged = VideoCleanerStats()
+
+        merged.merge(stats(1))
+
+        assert merged.total_count == 100
+        assert merged.quota_remaining == 1000
+        assert merged.time_to_first_verdict == 1.0
+        assert merged.stages == stats(1).stages
+        assert merged.stages[0] is not stats(1).stages[0]
+
+    def test_dict_round_trip(self) -> None:
+        original = stats(1)
+
+        restored = VideoCleanerStats.from_dict(original.as_dict())
+
+        assert restored.as_dict() == original.as_dict()
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime, timedelta
+
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+from videos_cleaner.entities.history import CheckHistory, StabilityPolicy
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class TestCheckHistory:
+    def test_streak(self) -> None:
+        history = CheckHistory.first("test", ExistsStatus.EXISTS, NOW)
+
+        history = history.observe(ExistsStatus.EXISTS, NOW + timedelta(days=1))
+
+        assert history.streak == 2
+        assert history.changes == 0
+        assert history.last_change == NOW
+
+    def test_change(self) -> None:
+        history = CheckHistory.first("test", ExistsStatus.EXISTS, NOW)
+        later = NOW + timedelta(days=1)
+
+        history = history.observe(ExistsStatus.HIDDEN, later)
+
+        assert history.status == ExistsStatus.HIDDEN
+        assert history.streak == 1
+        assert history.changes == 1
+        assert history.last_change == later
+        assert history.first_seen == NOW
+
+
+class TestStabilityPolicy:
+    def test_exponential_backoff(self) -> None:
+        policy = StabilityPolicy()
+        history = CheckHistory.first("test", ExistsStatus.EXISTS, NOW)
+
+        intervals = []
+        for _ in range(4):
+            intervals.append(policy.interval(history))
+            history = history.observe(ExistsStatus.EXISTS, NOW)
+
+        assert intervals == [timedelta(days=d) for d in (1, 2, 4, 8)]
+
+    def test_max_interval(self) -> None:
+        policy = StabilityPolicy()
+        history = CheckHistory("test", ExistsStatus.EXISTS, NOW, NOW, NOW, streak=20)
+
+        assert policy.interval(history) == policy.max_interval
+
+    def test_flapping_is_checked_more_often(self) -> None:
+        policy = StabilityPolicy()
+        stable = CheckHistory("test", ExistsStatus.EXISTS, NOW, NOW, NOW, streak=3)
+        flapping = CheckHistory(
+            "test", ExistsStatus.EXISTS, NOW, NOW, NOW, streak=3, changes=3
+        )
+
+        assert policy.interval(flapping) < policy.interval(stable)
+        assert policy.interval(flapping) >= policy.min_interval
+
+    def test_is_due(self) -> None:
+        policy = StabilityPolicy()
+        history = CheckHistory.first("test", ExistsStatus.EXISTS, NOW)
+
+        assert not policy.is_due(history, NOW + timedelta(hours=23))
+        assert policy.is_due(history, NOW + timedelta(days=1))
@@ -0,0 +1,49 @@
+import pytest
+
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+from videos_cleaner.entities.sample import Proportion, SampleReport
+
+
+class TestProportion:
+    def test_interval(self) -> None:
+        proportion = Proportion.estimate(20, 100, population=1_000_000)
+
+        assert proportion.share == 0.2
+        assert proportion.low == pytest.approx(0.133, abs=0.001)
+        assert proportion.high == pytest.approx(0.289, abs=0.001)
+
+    def test_finite_population(self) -> None:
+        large = Proportion.estimate(20, 100, population=1_000_000)
+        small = Proportion.estimate(20, 100, population=200)
+
+        assert small.high - small.low < large.high - large.low
+
+    def test_whole_population(self) -> None:
+        proportion = Proportion.estimate(3, 10, population=10)
+
+        assert proportion.low == proportion.high == 0.3
+
+    def test_zero_count(self) -> None:
+        proportion = Proportion.estimate(0, 50, population=10_000)
+
+        assert proportion.low == 0
+        assert 0 < proportion.high < 0.1
+
+    def test_empty_sample(self) -> None:
+        proportion = Proportion.estimate(0, 0, population=10)
+
+        assert (proportion.low, proportion.high) == (0, 1)
+
+    def test_str(self) -> None:
+        assert str(Proportion(1, 4, 0.1, 0.5)) == "25.0% [10.0%; 50.0%]"
+
+
+class TestSampleReport:
+    def test_estimate_excludes_failed(self) -> None:
+        report = SampleReport(population=1000, size=10, failed=2)
+        report.counts[ExistsStatus.EXISTS] = 6
+        report.counts[ExistsStatus.REMOVED] = 2
+
+        assert report.checked == 8
+        assert report.estimate(ExistsStatus.REMOVED).share == 0.25
+        assert report.estimate(ExistsStatus.HIDDEN).count == 0
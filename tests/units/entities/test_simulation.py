@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from videos_cleaner.entities.simulation import LatencyProfile, UpstreamLoad
+
+
+def rng() -> random.Random:
+    return random.Random(1)  # noqa: S311
+
+
+class TestLatencyProfile:
+    def test_from_samples(self) -> None:
+        profile = LatencyProfile.from_samples([float(value) for value in range(1, 21)])
+
+        assert profile == LatencyProfile(10.5, 19)
+
+    def test_from_no_samples(self) -> None:
+        assert LatencyProfile.from_samples([]) is None
+
+    def test_constant(self) -> None:
+        profile = LatencyProfile(0.2, 0.2)
+
+        assert profile.sample(rng()) == pytest.approx(0.2)
+
+    def test_sample_percentiles(self) -> None:
+        profile = LatencyProfile(0.1, 0.5)
+        generator = rng()
+
+        samples = sorted(profile.sample(generator) for _ in range(10_000))
+
+        assert samples[5_000] == pytest.approx(0.1, rel=0.1)
+        assert samples[9_500] == pytest.approx(0.5, rel=0.1)
+
+    def test_zero(self) -> None:
+        assert LatencyProfile(0, 0).sample(rng()) == 0
+
+
+class TestUpstreamLoad:
+    def test_peak(self) -> None:
+        load = UpstreamLoad()
+
+        load.enter()
+        load.enter()
+        load.leave()
+        load.enter()
+        load.leave()
+        load.leave()
+
+        assert (load.requests, load.in_flight, load.peak_concurrency) == (3, 0, 2)
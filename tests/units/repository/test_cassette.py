@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient, MockTransport, Request, Response
+
+from videos_cleaner.adapters.repositories.cassette import (
+    CASSETTE,
+    CassetteMissError,
+    RecordingTransport,
+    ReplayLatency,
+    ReplayTransport,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def upstream(request: Request) -> Response:
+    count = len(request.url.params.get("q", ""))
+    return Response(200, json={"count": count}, headers={"x-total-count": "7"})
+
+
+async def record(directory: Path) -> None:
+    transport = RecordingTransport(MockTransport(upstream), directory)
+    async with AsyncClient(transport=transport) as client:
+        _ = await client.get("http://test/videos", params={"q": "a", "key": "secret"})
+        _ = await client.get("http://test/videos", params={"q": "ab", "key": "x"})
+        _ = await client.get("http://test/other")
+
+
+class TestCassette:
+    async def test_record_and_replay(self, tmp_path: Path) -> None:
+        await record(tmp_path)
+
+        transport = ReplayTransport(tmp_path, ReplayLatency.ZERO)
+        async with AsyncClient(transport=transport) as client:
+            first = await client.get("http://test/videos?q=a&key=other")
+            second = await client.get("http://test/videos?q=ab")
+            async with client.stream("GET", "http://test/other") as streamed:
+                _ = await streamed.aread()
+
+        assert first.json() == {"count": 1}
+        assert first.headers["x-total-count"] == "7"
+        assert second.json() == {"count": 2}
+        assert streamed.json() == {"count": 0}
+
+    async def test_keys_are_not_recorded(self, tmp_path: Path) -> None:
+        await record(tmp_path)
+
+        assert "secret" not in (tmp_path / CASSETTE).read_text()
+
+    async def test_repeats_last_response(self, tmp_path: Path) -> None:
+        await record(tmp_path)
+
+        transport = ReplayTransport(tmp_path, ReplayLatency.ZERO)
+        async with AsyncClient(transport=transport) as client:
+            responses = [await client.get("http://test/other") for _ in range(3)]
+
+        assert all(response.status_code == 200 for response in responses)
+
+    async def test_miss(self, tmp_path: Path) -> None:
+        await record(tmp_path)
+
+        transport = ReplayTransport(tmp_path, ReplayLatency.ZERO)
+        async with AsyncClient(transport=transport) as client:
+            with pytest.raises(CassetteMissError):
+                _ = await client.get("http://test/unknown")
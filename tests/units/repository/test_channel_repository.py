@@ -0,0 +1,154 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import respx
+from httpx import AsyncClient, Request, Response
+
+from videos_cleaner.adapters.repositories.channel_repository import (
+    FeedChannelRepository,
+    YoutubeDataApiChannelRepository,
+    uploads_playlist,
+)
+from videos_cleaner.domain.interfaces.meta_repository import (
+    MetaRepositoryError,
+    UnauthorizedError,
+)
+
+pytestmark = pytest.mark.anyio
+
+PLAYLIST_URL = "https://youtube.googleapis.com/youtube/v3/playlistItems"
+VIDEOS_URL = "https://youtube.googleapis.com/youtube/v3/videos"
+FEED_URL = "https://www.youtube.com/feeds/videos.xml"
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns="http://www.w3.org/2005/Atom">
+  <yt:channelId>UCtest</yt:channelId>
+  <entry><id>yt:video:first</id><yt:videoId>first</yt:videoId></entry>
+  <entry><id>yt:video:second</id><yt:videoId>second</yt:videoId></entry>
+</feed>
+"""
+
+
+def item(video_id: str, privacy: str = "public") -> dict[str, dict[str, str]]:
+    return {
+        "contentDetails": {"videoId": video_id},
+        "status": {"privacyStatus": privacy},
+    }
+
+
+def embeddable(request: Request) -> Response:
+    ids = request.url.params["id"].split(",")
+    return Response(
+        200,
+        json={
+            "items": [
+                {"id": video_id, "status": {"embeddable": video_id != "blocked"}}
+                for video_id in ids
+            ]
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+async def client() -> AsyncGenerator[AsyncClient]:
+    async with AsyncClient() as client:
+        yield client
+
+
+def test_uploads_playlist() -> None:
+    assert uploads_playlist("UCabc") == "UUabc"
+
+
+class TestYoutubeDataApiChannelRepository:
+    @respx.mock
+    async def test_pages(self, client: AsyncClient) -> None:
+        route = respx.get(PLAYLIST_URL)
+        route.side_effect = [
+            Response(
+                200,
+                json={
+                    "nextPageToken": "next",
+                    "items": [item("first"), item("private", "private")],
+                },
+            ),
+            Response(200, json={"items": [item("second")]}),
+        ]
+        videos = respx.get(VIDEOS_URL).mock(side_effect=embeddable)
+        repo = YoutubeDataApiChannelRepository("secret", client)
+
+        result = await repo.live_ids("UCtest")
+
+        assert result == {"first", "second"}
+        assert videos.calls.last.request.url.params["id"] == "first,second"
+        assert route.call_count == 2
+        first, second = (call.request.url.params for call in route.calls)
+        assert first["playlistId"] == "UUtest"
+        assert first["maxResults"] == "50"
+        assert second["pageToken"] == "next"
+
+    @respx.mock
+    async def test_quota_exceeded_key(self, client: AsyncClient) -> None:
+        exceeded = respx.get(PLAYLIST_URL, params={"key": "first"})
+        exceeded.return_value = Response(
+            403, json={"error": {"errors": [{"reason": "quotaExceeded"}]}}
+        )
+        route = respx.get(PLAYLIST_URL, params={"key": "second"})
+        route.return_value = Response(200, json={"items": [item("test")]})
+        respx.get(VIDEOS_URL).mock(side_effect=embeddable)
+        repo = YoutubeDataApiChannelRepository(["first", "second"], client)
+
+        assert await repo.live_ids("UCtest") == {"test"}
+        assert exceeded.called
+
+    @respx.mock
+    async def test_skips_not_embeddable(self, client: AsyncClient) -> None:
+        respx.get(PLAYLIST_URL).return_value = Response(
+            200,
+            json={
+                "items": [*(item(str(number)) for number in range(60)), item("blocked")]
+            },
+        )
+        videos = respx.get(VIDEOS_URL).mock(side_effect=embeddable)
+        repo = YoutubeDataApiChannelRepository("secret", client)
+
+        result = await repo.live_ids("UCtest")
+
+        assert result == {str(number) for number in range(60)}
+        assert videos.call_count == 2
+
+    @respx.mock
+    async def test_forbidden(self, client: AsyncClient) -> None:
+        respx.get(PLAYLIST_URL).return_value = Response(
+            403, json={"error": {"errors": [{"reason": "forbidden"}]}}
+        )
+        repo = YoutubeDataApiChannelRepository("secret", client)
+
+        with pytest.raises(UnauthorizedError):
+            _ = await repo.live_ids("UCtest")
+
+    @respx.mock
+    async def test_not_found(self, client: AsyncClient) -> None:
+        respx.get(PLAYLIST_URL).return_value = Response(404)
+        repo = YoutubeDataApiChannelRepository("secret", client)
+
+        with pytest.raises(MetaRepositoryError):
+            _ = await repo.live_ids("UCtest")
+
+
+class TestFeedChannelRepository:
+    @respx.mock
+    async def test_feed(self, client: AsyncClient) -> None:
+        route = respx.get(FEED_URL, params={"channel_id": "UCtest"})
+        route.return_value = Response(200, text=FEED)
+
+        result = await FeedChannelRepository(client).live_ids("UCtest")
+
+        assert result == {"first", "second"}
+
+    @respx.mock
+    async def test_error(self, client: AsyncClient) -> None:
+        respx.get(FEED_URL).return_value = Response(404)
+
+        with pytest.raises(MetaRepositoryError):
+            _ = await FeedChannelRepository(client).live_ids("UCtest")
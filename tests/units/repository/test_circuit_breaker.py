@@ -0,0 +1,212 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from httpx import ConnectTimeout
+from pytest_mock import MockFixture
+
+from videos_cleaner.adapters.repositories.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerMetaRepository,
+    CircuitBreakerVideoRepository,
+    CircuitState,
+)
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+    MetaRepositoryError,
+    MetaRepositoryUnavailableError,
+)
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoNotFoundError,
+    VideoRepositoryUnavailableError,
+)
+from videos_cleaner.entities.video import Video, VideoList, VideoStream
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock: FakeClock) -> CircuitBreaker:
+        return CircuitBreaker(
+            "test",
+            error_ratio=0.5,
+            window=4,
+            min_calls=4,
+            reset_timeout=10,
+            clock=clock,
+        )
+
+    def test_opens_on_error_ratio(self, breaker: CircuitBreaker) -> None:
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_half_open_probe(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 10
+
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 10
+
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestCircuitBreakerMetaRepository:
+    async def test_short_circuit(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IMetaRepository)
+        inner.is_exists.side_effect = MetaRepositoryError("Ошибка", 500)
+        repo = CircuitBreakerMetaRepository(inner, error_ratio=0.5)
+
+        for _ in range(10):
+            with pytest.raises(MetaRepositoryError):
+                _ = await repo.is_exists("test")
+
+        with pytest.raises(MetaRepositoryUnavailableError):
+            _ = await repo.is_exists("test")
+
+        assert inner.is_exists.await_count == 10
+        assert repo.breaker.state == CircuitState.OPEN
+
+    async def test_transport_error(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IMetaRepository)
+        inner.is_exists.side_effect = ConnectTimeout("timeout")
+        repo = CircuitBreakerMetaRepository(inner)
+
+        with pytest.raises(MetaRepositoryUnavailableError):
+            _ = await repo.is_exists("test")
+
+    async def test_client_errors_are_not_failures(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IMetaRepository)
+        inner.is_exists.side_effect = MetaRepositoryError("Ошибка", 400)
+        repo = CircuitBreakerMetaRepository(inner)
+
+        for _ in range(20):
+            with pytest.raises(MetaRepositoryError):
+                _ = await repo.is_exists("test")
+
+        assert repo.breaker.state == CircuitState.CLOSED
+
+    async def test_pass_through(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IMetaRepository)
+        inner.is_exists.return_value = ExistsStatus.HIDDEN
+        repo = CircuitBreakerMetaRepository(inner)
+
+        assert await repo.is_exists("test") == ExistsStatus.HIDDEN
+
+
+@asynccontextmanager
+async def truncated_page(
+    _offset: int = 0, *, limit: int = 50
+) -> AsyncIterator[VideoStream]:
+    async def videos() -> AsyncIterator[Video]:
+        yield Video(deleted=False, slug="first", yt_id="first")
+        raise VideoRepositoryUnavailableError
+
+    yield VideoStream(total_count=limit, videos=videos())
+
+
+class TestCircuitBreakerVideoRepository:
+    async def test_short_circuit(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IVideoRepository)
+        inner.delete.side_effect = ConnectTimeout("timeout")
+        repo = CircuitBreakerVideoRepository(inner)
+
+        for _ in range(10):
+            with pytest.raises(VideoRepositoryUnavailableError):
+                await repo.delete("test")
+
+        with pytest.raises(VideoRepositoryUnavailableError):
+            await repo.restore("test")
+
+        assert inner.delete.await_count == 10
+        inner.restore.assert_not_awaited()
+
+    async def test_reads_have_own_breaker(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IVideoRepository)
+        inner.delete.side_effect = ConnectTimeout("timeout")
+        inner.get_all.return_value = VideoList(total_count=0, videos=[])
+        repo = CircuitBreakerVideoRepository(inner)
+
+        for _ in range(10):
+            with pytest.raises(VideoRepositoryUnavailableError):
+                await repo.delete("test")
+
+        assert await repo.get_all() == VideoList(total_count=0, videos=[])
+        assert repo.breaker.state == CircuitState.OPEN
+        assert repo.read_breaker.state == CircuitState.CLOSED
+
+    async def test_truncated_streams_open_read_breaker(
+        self, mocker: MockFixture
+    ) -> None:
+        inner = mocker.Mock(IVideoRepository)
+        inner.stream.side_effect = truncated_page
+        repo = CircuitBreakerVideoRepository(inner)
+
+        for _ in range(10):
+            with pytest.raises(VideoRepositoryUnavailableError):
+                async with repo.stream() as page:
+                    _ = [video async for video in page.videos]
+
+        assert repo.read_breaker.state == CircuitState.OPEN
+        with pytest.raises(VideoRepositoryUnavailableError):
+            async with repo.stream():
+                pass
+        assert inner.stream.call_count == 10
+
+    async def test_stream_closed_early_is_success(self, mocker: MockFixture) -> None:
+        inner = mocker.Mock(IVideoRepository)
+        inner.stream.side_effect = truncated_page
+        repo = CircuitBreakerVideoRepository(inner)
+
+        for _ in range(10):
+            async with repo.stream() as page:
+                _ = await anext(page.videos)
+
+        assert repo.read_breaker.state == CircuitState.CLOSED
+
+    async def test_not_found_is_not_failure(self, mocker: MockFixture) -> None:
+        inner = mocker.AsyncMock(IVideoRepository)
+        inner.restore.side_effect = VideoNotFoundError
+        repo = CircuitBreakerVideoRepository(inner)
+
+        for _ in range(20):
+            with pytest.raises(VideoNotFoundError):
+                await repo.restore("test")
+
+        assert repo.breaker.state == CircuitState.CLOSED
@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from videos_cleaner.adapters.repositories.dead_letter_repository import (
+    DeadLetterRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.entities.video import Video
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def repository() -> DeadLetterRepository:
+    return DeadLetterRepository(StateDatabase(), "http://test")
+
+
+class TestDeadLetterRepository:
+    async def test_record_counts_attempts(
+        self, repository: DeadLetterRepository
+    ) -> None:
+        video = Video(deleted=False, slug="a", yt_id="a")
+
+        first = await repository.record(video, "MetaRepositoryError", NOW)
+        second = await repository.record(
+            video.model_copy(update={"deleted": True}),
+            "VideoRepostiryError",
+            NOW + timedelta(minutes=1),
+        )
+
+        assert first.attempts == 1
+        assert second.attempts == 2
+        assert second.first_failed == NOW
+        assert second.error == "VideoRepostiryError"
+        assert second.video.deleted
+
+    async def test_due(self, repository: DeadLetterRepository) -> None:
+        for number, slug in enumerate(("old", "new", "late")):
+            _ = await repository.record(
+                Video(deleted=False, slug=slug, yt_id=slug),
+                "MetaRepositoryError",
+                NOW + timedelta(minutes=number),
+            )
+        _ = await repository.record(
+            Video(deleted=False, slug="late", yt_id="late"),
+            "MetaRepositoryError",
+            NOW + timedelta(minutes=5),
+        )
+
+        due = await repository.due(NOW + timedelta(minutes=10), 2, 10)
+
+        assert [letter.slug for letter in due] == ["old", "new"]
+        assert [
+            letter.slug
+            for letter in await repository.due(NOW + timedelta(minutes=1), 5, 10)
+        ] == ["old"]
+
+    async def test_discard(self, repository: DeadLetterRepository) -> None:
+        _ = await repository.record(
+            Video(deleted=False, slug="a", yt_id="a"), "MetaRepositoryError", NOW
+        )
+
+        await repository.discard("a")
+
+        assert await repository.due(NOW + timedelta(minutes=1), 5, 10) == []
+
+    async def test_targets_are_separate(self, repository: DeadLetterRepository) -> None:
+        _ = await repository.record(
+            Video(deleted=False, slug="a", yt_id="a"), "MetaRepositoryError", NOW
+        )
+        other = DeadLetterRepository(repository._state, "http://other")  # pyright: ignore[reportPrivateUsage]
+
+        assert await other.due(NOW + timedelta(minutes=1), 5, 10) == []
@@ -0,0 +1,36 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from videos_cleaner.adapters.repositories.dirty_set import DirtySetRepository
+from videos_cleaner.adapters.repositories.state import StateDatabase
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def dirty() -> DirtySetRepository:
+    return DirtySetRepository(StateDatabase())
+
+
+class TestDirtySetRepository:
+    async def test_mark_and_clear(self, dirty: DirtySetRepository) -> None:
+        await dirty.mark(["a", "b"], NOW)
+        await dirty.mark(["b"], NOW)
+
+        assert await dirty.pending() == {"a", "b"}
+
+        await dirty.clear(["a", "b"], NOW + timedelta(seconds=1))
+
+        assert await dirty.pending() == frozenset()
+
+    async def test_keeps_marks_during_sweep(self, dirty: DirtySetRepository) -> None:
+        await dirty.mark(["a", "b"], NOW)
+        started = NOW + timedelta(minutes=1)
+        await dirty.mark(["b"], started + timedelta(seconds=5))
+
+        await dirty.clear(["a", "b"], started)
+
+        assert await dirty.pending() == {"b"}
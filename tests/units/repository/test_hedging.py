@@ -0,0 +1,127 @@
+import asyncio
+from typing import override
+
+import pytest
+
+from videos_cleaner.adapters.repositories.hedging import (
+    HedgingMetaRepository,
+    LatencyWindow,
+)
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+    MetaRepositoryUnavailableError,
+)
+from videos_cleaner.entities.cleaner import HedgeCounters
+
+pytestmark = pytest.mark.anyio
+
+
+class ScriptedRepository(IMetaRepository):
+    """Отвечает с задержками из списка (по порядку вызовов)."""
+
+    def __init__(self, delays: list[float], *, failures: int = 0) -> None:
+        self.delays = delays
+        self.failures = failures
+        self.calls = 0
+        self.cancelled = 0
+
+    @override
+    async def is_exists(self, yt_id: str) -> ExistsStatus:
+        call = self.calls
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delays[call] if call < len(self.delays) else 0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if call < self.failures:
+            raise MetaRepositoryUnavailableError
+        return ExistsStatus.EXISTS
+
+    @override
+    async def is_embeddable(self, yt_id: str) -> bool:
+        return True
+
+
+def warm_window(value: float = 0.01, count: int = 20) -> LatencyWindow:
+    window = LatencyWindow(size=50, min_samples=count)
+    for _ in range(count):
+        window.add(value)
+    return window
+
+
+class TestLatencyWindow:
+    def test_needs_min_samples(self) -> None:
+        window = LatencyWindow(min_samples=3)
+        window.add(1)
+        window.add(2)
+
+        assert window.percentile(0.5) is None
+
+    def test_percentile(self) -> None:
+        window = LatencyWindow(min_samples=1)
+        for value in range(1, 101):
+            window.add(value)
+
+        assert window.percentile(0.95) == 95
+        assert window.percentile(1) == 100
+
+    def test_keeps_last_samples(self) -> None:
+        window = LatencyWindow(size=2, min_samples=1)
+        for value in (100, 1, 2):
+            window.add(value)
+
+        assert window.percentile(1) == 2
+
+
+class TestHedgingMetaRepository:
+    async def test_no_hedge_without_samples(self) -> None:
+        repo = ScriptedRepository([0.05])
+        hedging = HedgingMetaRepository(repo, budget=1)
+
+        assert await hedging.is_exists("yt") == ExistsStatus.EXISTS
+        assert repo.calls == 1
+        assert hedging.hedge_counters() == HedgeCounters(1, 0, 0)
+
+    async def test_hedge_wins(self) -> None:
+        repo = ScriptedRepository([1, 0])
+        hedging = HedgingMetaRepository(repo, budget=1, window=warm_window())
+
+        assert await hedging.is_exists("yt") == ExistsStatus.EXISTS
+        assert repo.calls == 2
+        assert repo.cancelled == 1
+        assert hedging.hedge_counters() == HedgeCounters(1, 1, 1)
+
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        repo = ScriptedRepository([0])
+        hedging = HedgingMetaRepository(repo, budget=1, window=warm_window(1))
+
+        _ = await hedging.is_exists("yt")
+
+        assert repo.calls == 1
+        assert hedging.hedge_counters() == HedgeCounters(1, 0, 0)
+
+    async def test_budget_limits_hedges(self) -> None:
+        repo = ScriptedRepository([0.05, 0.05, 0, 0.05])
+        hedging = HedgingMetaRepository(repo, budget=0.5, window=warm_window())
+
+        for yt_id in ("first", "second", "third"):
+            _ = await hedging.is_exists(yt_id)
+
+        assert repo.calls == 4
+        assert hedging.hedge_counters() == HedgeCounters(3, 1, 1)
+
+    async def test_failed_request_waits_for_other(self) -> None:
+        repo = ScriptedRepository([0.05, 0.1], failures=1)
+        hedging = HedgingMetaRepository(repo, budget=1, window=warm_window())
+
+        assert await hedging.is_exists("yt") == ExistsStatus.EXISTS
+        assert hedging.hedge_counters() == HedgeCounters(1, 1, 1)
+
+    async def test_both_failed(self) -> None:
+        repo = ScriptedRepository([0.05, 0.1], failures=2)
+        hedging = HedgingMetaRepository(repo, budget=1, window=warm_window())
+
+        with pytest.raises(MetaRepositoryUnavailableError):
+            _ = await hedging.is_exists("yt")
@@ -0,0 +1,41 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from videos_cleaner.adapters.repositories.history_repository import (
+    HistoryRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.meta_repository import ExistsStatus
+from videos_cleaner.entities.history import CheckHistory
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def repo() -> HistoryRepository:
+    return HistoryRepository(StateDatabase())
+
+
+class TestHistoryRepository:
+    async def test_save_and_get(self, repo: HistoryRepository) -> None:
+        history = CheckHistory.first("test", ExistsStatus.HIDDEN, NOW)
+
+        await repo.save_many([history])
+        result = await repo.get_many(["test", "unknown"])
+
+        assert result == {"test": history}
+
+    async def test_update(self, repo: HistoryRepository) -> None:
+        history = CheckHistory.first("test", ExistsStatus.HIDDEN, NOW)
+        await repo.save_many([history])
+
+        await repo.save_many([history.observe(ExistsStatus.HIDDEN, NOW)])
+        result = await repo.get_many(["test"])
+
+        assert result["test"].streak == 2
+
+    async def test_empty(self, repo: HistoryRepository) -> None:
+        assert await repo.get_many([]) == {}
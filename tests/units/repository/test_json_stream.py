@@ -0,0 +1,36 @@
+from collections.abc import AsyncIterator
+from json import JSONDecodeError
+
+import pytest
+
+from videos_cleaner.adapters.repositories.json_stream import iter_json_array
+
+pytestmark = pytest.mark.anyio
+
+DOCUMENT = '[ {"slug": "a", "tags": [1, 2]}, {"slug": "b,]"} ,3, "x"\n]'
+
+
+async def chunked(text: str, size: int) -> AsyncIterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+async def collect(chunks: AsyncIterator[str]) -> list[object]:
+    return [item async for item in iter_json_array(chunks)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(DOCUMENT)])
+async def test_iter_json_array(size: int) -> None:
+    items = await collect(chunked(DOCUMENT, size))
+
+    assert items == [{"slug": "a", "tags": [1, 2]}, {"slug": "b,]"}, 3, "x"]
+
+
+async def test_empty_array() -> None:
+    assert await collect(chunked(" [ ] ", 1)) == []
+
+
+@pytest.mark.parametrize("text", ['{"slug": "a"}', '[{"slug": "a"}', ""])
+async def test_invalid_document(text: str) -> None:
+    with pytest.raises(JSONDecodeError):
+        _ = await collect(chunked(text, 2))
@@ -9,8 +9,10 @@ from videos_cleaner.adapters.repositories.meta_repository import (
     MetaRepostiory,
     YoutubeDataApiRepository,
 )
+from videos_cleaner.adapters.repositories.quota import QuotaAccountant
 from videos_cleaner.domain.interfaces.meta_repository import (
     ExistsStatus,
+    QuotaExceededError,
     UnauthorizedError,
 )
 
@@ -101,3 +103,41 @@ class TestYouTubeDataAPIRepository:
 
         assert route.called
         assert expected is result
+
+    @respx.mock
+    async def test_rotates_key_on_quota_exceeded(self, client: AsyncClient) -> None:
+        repo = YoutubeDataApiRepository(["first", "second"], client)
+        exceeded = respx.get(url__regex=r".*key=first$")
+        exceeded.return_value = Response(
+            403, json={"error": {"errors": [{"reason": "quotaExceeded"}]}}
+        )
+        route = respx.get(url__regex=r".*key=second$")
+        route.return_value = Response(200, json={"items": []})
+
+        result = await repo.is_embeddable("test")
+
+        assert exceeded.called
+        assert route.called
+        assert result is False
+
+    @respx.mock
+    async def test_quota_exhausted(self, client: AsyncClient) -> None:
+        quota = QuotaAccountant(["secret"], daily_limit=1, reserve=1)
+        repo = YoutubeDataApiRepository("secret", client, quota)
+        route = respx.get(url__regex=r".*key=secret$")
+
+        with pytest.raises(QuotaExceededError):
+            _ = await repo.is_embeddable("test")
+
+        assert not route.called
+        assert repo.remaining_quota() == 0
+
+    @respx.mock
+    async def test_forbidden(self, repo: YoutubeDataApiRepository) -> None:
+        route = respx.get(url__regex=r".*key=secret$")
+        route.return_value = Response(
+            403, json={"error": {"errors": [{"reason": "forbidden"}]}}
+        )
+
+        with pytest.raises(UnauthorizedError):
+            _ = await repo.is_embeddable("test")
@@ -0,0 +1,73 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from videos_cleaner.adapters.repositories.mutation_journal import (
+    MutationJournalRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.entities.journal import MutationKind
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+SECOND = timedelta(seconds=1)
+
+
+@pytest.fixture
+def journal() -> MutationJournalRepository:
+    return MutationJournalRepository(StateDatabase(), "http://test")
+
+
+class TestMutationJournalRepository:
+    async def test_append_and_complete(
+        self, journal: MutationJournalRepository
+    ) -> None:
+        await journal.append("b", MutationKind.HIDE, NOW + SECOND)
+        await journal.append("a", MutationKind.RESTORE, NOW)
+        await journal.append("a", MutationKind.RESTORE, NOW + SECOND * 2)
+
+        entries = await journal.due(NOW + SECOND * 2, 10)
+
+        assert [(entry.slug, entry.kind) for entry in entries] == [
+            ("a", MutationKind.RESTORE),
+            ("b", MutationKind.HIDE),
+        ]
+        assert entries[0].enqueued == NOW
+
+        await journal.complete(entries[0])
+
+        assert await journal.pending() == 1
+
+    async def test_superseded(self, journal: MutationJournalRepository) -> None:
+        await journal.append("a", MutationKind.HIDE, NOW)
+        (stale,) = await journal.due(NOW, 10)
+        await journal.append("a", MutationKind.RESTORE, NOW + SECOND)
+
+        await journal.complete(stale)
+
+        (entry,) = await journal.due(NOW + SECOND, 10)
+        assert entry.kind == MutationKind.RESTORE
+
+    async def test_retry_and_resume(self, journal: MutationJournalRepository) -> None:
+        await journal.append("a", MutationKind.DELETE, NOW)
+        (entry,) = await journal.due(NOW, 10)
+
+        await journal.retry(entry, NOW + SECOND * 10, "Сервис недоступен")
+
+        assert await journal.due(NOW + SECOND, 10) == []
+        (retried,) = await journal.due(NOW + SECOND * 10, 10)
+        assert retried.attempts == 1
+        assert retried.last_error == "Сервис недоступен"
+
+        assert await journal.resume(NOW + SECOND) == 1
+        assert len(await journal.due(NOW + SECOND, 10)) == 1
+
+    async def test_targets(self) -> None:
+        state = StateDatabase()
+        first = MutationJournalRepository(state, "http://first")
+        second = MutationJournalRepository(state, "http://second")
+
+        await first.append("a", MutationKind.HIDE, NOW)
+
+        assert await second.due(NOW, 10) == []
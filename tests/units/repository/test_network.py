@@ -0,0 +1,163 @@
+import asyncio
+import socket
+
+import httpcore
+import pytest
+import respx
+from httpx import AsyncClient, AsyncHTTPTransport, ConnectError, Response
+from pytest_mock import MockFixture
+
+from videos_cleaner.adapters.repositories import network
+from videos_cleaner.adapters.repositories.network import (
+    AsyncLookup,
+    CachingNetworkBackend,
+    CachingResolver,
+    GaugedTransport,
+    RequestGauge,
+    warm_up,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def address_info(address: str) -> list[tuple[object, ...]]:
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 443))]
+
+
+class TestCachingResolver:
+    async def test_cache_with_ttl(self, mocker: MockFixture) -> None:
+        getaddrinfo = mocker.patch.object(
+            network.anyio,
+            "getaddrinfo",
+            side_effect=[address_info("10.0.0.1"), address_info("10.0.0.2")],
+        )
+        clock = FakeClock()
+        resolver = CachingResolver(60, clock=clock)
+
+        first = await resolver.resolve("www.youtube.com", 443)
+        cached = await resolver.resolve("www.youtube.com", 443)
+        clock.now = 60
+        expired = await resolver.resolve("www.youtube.com", 443)
+
+        assert (first, cached, expired) == ("10.0.0.1", "10.0.0.1", "10.0.0.2")
+        assert getaddrinfo.await_count == 2
+
+    async def test_without_cache(self) -> None:
+        calls: list[str] = []
+
+        async def lookup(host: str, _port: int) -> str:
+            calls.append(host)
+            return "10.0.0.1"
+
+        resolver = CachingResolver(0, lookup=lookup)
+
+        _ = await resolver.resolve("www.youtube.com", 443)
+        _ = await resolver.resolve("www.youtube.com", 443)
+
+        assert len(calls) == 2
+
+    async def test_concurrent_lookups_shared(self) -> None:
+        calls: list[str] = []
+
+        async def lookup(host: str, _port: int) -> str:
+            calls.append(host)
+            await asyncio.sleep(0.01)
+            return "10.0.0.1"
+
+        resolver = CachingResolver(0, lookup=lookup)
+
+        addresses = await asyncio.gather(
+            *(resolver.resolve("www.youtube.com", 443) for _ in range(5))
+        )
+
+        assert addresses == ["10.0.0.1"] * 5
+        assert calls == ["www.youtube.com"]
+
+    async def test_lookup_error(self) -> None:
+        async def lookup(_host: str, _port: int) -> str:
+            raise socket.gaierror
+
+        resolver = CachingResolver(lookup=lookup)
+
+        with pytest.raises(httpcore.ConnectError):
+            _ = await resolver.resolve("unknown", 443)
+
+    async def test_async_lookup(self) -> None:
+        _ = pytest.importorskip("aiodns")
+
+        address = await AsyncLookup()("localhost", 443)
+
+        assert address in {"127.0.0.1", "::1"}
+
+    async def test_backend_connects_to_address(self, mocker: MockFixture) -> None:
+        resolver = mocker.AsyncMock(CachingResolver)
+        resolver.resolve.return_value = "10.0.0.1"
+        inner = mocker.AsyncMock(httpcore.AsyncNetworkBackend)
+        backend = CachingNetworkBackend(resolver, inner)
+
+        _ = await backend.connect_tcp("www.youtube.com", 443, 5.0)
+
+        inner.connect_tcp.assert_awaited_once_with("10.0.0.1", 443, 5.0, None, None)
+
+
+class TestWarmUp:
+    @respx.mock
+    async def test_warm_up(self) -> None:
+        youtube = respx.head("https://www.youtube.com").mock(return_value=Response(200))
+        api = respx.head("http://test").mock(side_effect=ConnectError("refused"))
+
+        async with AsyncClient() as client:
+            await warm_up(client, ["https://www.youtube.com", "http://test"], 3)
+
+        assert youtube.call_count == 3
+        assert api.call_count == 3
+
+    @respx.mock
+    async def test_capped_by_keepalive(self) -> None:
+        youtube = respx.head("https://www.youtube.com").mock(return_value=Response(200))
+        api = respx.head("http://test").mock(return_value=Response(200))
+
+        async with AsyncClient() as client:
+            await warm_up(
+                client, ["https://www.youtube.com", "http://test"], 30, keepalive=20
+            )
+
+        assert youtube.call_count == 10
+        assert api.call_count == 10
+
+
+class TestGaugedTransport:
+    @respx.mock
+    async def test_counts_requests_until_closed(self) -> None:
+        respx.get("https://www.youtube.com/oembed").mock(return_value=Response(200))
+        gauge = RequestGauge()
+        transport = GaugedTransport(AsyncHTTPTransport(), gauge)
+
+        async with AsyncClient(transport=transport) as client:
+            async with client.stream("GET", "https://www.youtube.com/oembed"):
+                during = gauge.snapshot()
+            after = gauge.snapshot()
+
+        assert during == {"www.youtube.com": 1}
+        assert after == {}
+
+    @respx.mock
+    async def test_failed_request(self) -> None:
+        respx.get("https://www.youtube.com/oembed").mock(side_effect=ConnectError)
+        gauge = RequestGauge()
+
+        async with AsyncClient(
+            transport=GaugedTransport(AsyncHTTPTransport(), gauge)
+        ) as client:
+            with pytest.raises(ConnectError):
+                _ = await client.get("https://www.youtube.com/oembed")
+
+        assert gauge.snapshot() == {}
@@ -0,0 +1,145 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from videos_cleaner.adapters.repositories.quota import KeyRotation, QuotaAccountant
+from videos_cleaner.domain.interfaces.meta_repository import QuotaExceededError
+
+
+class TestQuotaAccountant:
+    def test_stops_before_limit(self) -> None:
+        quota = QuotaAccountant(["a"], daily_limit=3, reserve=1)
+
+        assert quota.acquire() == "a"
+        assert quota.acquire() == "a"
+        with pytest.raises(QuotaExceededError):
+            _ = quota.acquire()
+        assert quota.remaining == 0
+
+    def test_round_robin(self) -> None:
+        quota = QuotaAccountant(["a", "b"], daily_limit=10, reserve=0)
+
+        assert [quota.acquire() for _ in range(4)] == ["a", "b", "a", "b"]
+
+    def test_least_used(self) -> None:
+        quota = QuotaAccountant(
+            ["a", "b"], daily_limit=10, reserve=0, rotation=KeyRotation.LEAST_USED
+        )
+        quota.exhaust("a")
+
+        assert [quota.acquire() for _ in range(3)] == ["b", "b", "b"]
+
+    def test_skips_exhausted_key(self) -> None:
+        quota = QuotaAccountant(["a", "b"], daily_limit=10, reserve=0)
+        quota.exhaust("a")
+
+        assert quota.acquire() == "b"
+        assert quota.acquire() == "b"
+        assert quota.remaining == 8
+
+    def test_state_file(self, tmp_path: Path) -> None:
+        state = tmp_path / "quota.json"
+        today = date(2025, 1, 1)
+        quota = QuotaAccountant(
+            ["a"], state_path=state, daily_limit=10, reserve=0, today=lambda: today
+        )
+        _ = quota.acquire()
+        _ = quota.acquire()
+        assert not state.exists()
+        quota.save()
+
+        restored = QuotaAccountant(
+            ["a"], state_path=state, daily_limit=10, reserve=0, today=lambda: today
+        )
+
+        assert restored.remaining == 8
+        assert "a" not in json.loads(state.read_text())["spent"]
+
+    def test_daily_reset(self) -> None:
+        days = [date(2025, 1, 1)]
+        quota = QuotaAccountant(
+            ["a"], daily_limit=10, reserve=0, today=lambda: days[-1]
+        )
+        _ = quota.acquire()
+        assert quota.remaining == 9
+
+        days.append(date(2025, 1, 2))
+
+        assert quota.remaining == 10
+
+    def test_shared_between_threads(self, tmp_path: Path) -> None:
+        state = tmp_path / "quota.json"
+        today = date(2025, 1, 1)
+        quota = QuotaAccountant(
+            ["a", "b"],
+            state_path=state,
+            daily_limit=100,
+            reserve=0,
+            today=lambda: today,
+        )
+
+        def spend() -> list[str]:
+            keys: list[str] = []
+            for _ in range(50):
+                try:
+                    keys.append(quota.acquire())
+                except QuotaExceededError:
+                    break
+            return keys
+
+        with ThreadPoolExecutor(8) as pool:
+            spent = sum(len(keys) for keys in pool.map(lambda _: spend(), range(8)))
+        quota.save()
+
+        restored = QuotaAccountant(
+            ["a", "b"],
+            state_path=state,
+            daily_limit=100,
+            reserve=0,
+            today=lambda: today,
+        )
+        assert spent == 200
+        assert quota.remaining == restored.remaining == 0
+
+    def test_processes_add_up(self, tmp_path: Path) -> None:
+        state = tmp_path / "quota.json"
+        today = date(2025, 1, 1)
+        first, second = (
+            QuotaAccountant(
+                ["a"], state_path=state, daily_limit=10, reserve=0, today=lambda: today
+            )
+            for _ in range(2)
+        )
+        for _ in range(3):
+            _ = first.acquire()
+        for _ in range(2):
+            _ = second.acquire()
+        second.exhaust("a")
+
+        first.save()
+        second.save()
+        first.save()
+
+        assert first.remaining == second.remaining == 0
+        third = QuotaAccountant(
+            ["a"], state_path=state, daily_limit=20, reserve=0, today=lambda: today
+        )
+        assert third.remaining == 10
+
+    @pytest.mark.anyio
+    async def test_keep_saved_saves_on_cancel(self, tmp_path: Path) -> None:
+        state = tmp_path / "quota.json"
+        quota = QuotaAccountant(["a"], state_path=state, daily_limit=10, reserve=0)
+        saver = asyncio.create_task(quota.keep_saved(60))
+        await asyncio.sleep(0)
+        _ = quota.acquire()
+
+        _ = saver.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await saver
+
+        assert sum(json.loads(state.read_text())["spent"].values()) == 1
@@ -0,0 +1,49 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from videos_cleaner.adapters.repositories.removal_repository import (
+    RemovalRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.entities.removal import PendingRemoval
+from videos_cleaner.entities.video import Video
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def repo() -> RemovalRepository:
+    return RemovalRepository(StateDatabase())
+
+
+def removal(slug: str, confirmed: datetime) -> PendingRemoval:
+    return PendingRemoval.first(Video(deleted=True, slug=slug, yt_id=slug), confirmed)
+
+
+class TestRemovalRepository:
+    async def test_save_and_get(self, repo: RemovalRepository) -> None:
+        pending = removal("test", NOW)
+
+        await repo.save(pending)
+
+        assert await repo.get("test") == pending
+        assert await repo.get("unknown") is None
+
+    async def test_discard(self, repo: RemovalRepository) -> None:
+        await repo.save(removal("test", NOW))
+
+        await repo.discard("test")
+
+        assert await repo.get("test") is None
+
+    async def test_due(self, repo: RemovalRepository) -> None:
+        await repo.save(removal("late", NOW + timedelta(hours=1)))
+        await repo.save(removal("second", NOW - timedelta(minutes=1)))
+        await repo.save(removal("first", NOW - timedelta(hours=1)))
+
+        result = await repo.due(NOW, limit=10)
+
+        assert [item.slug for item in result] == ["first", "second"]
@@ -0,0 +1,69 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from videos_cleaner.adapters.repositories.run_lock import RunLockRepository
+from videos_cleaner.adapters.repositories.state import StateDatabase
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+LEASE = timedelta(minutes=5)
+
+
+@pytest.fixture
+def lock() -> RunLockRepository:
+    return RunLockRepository(StateDatabase(), "http://test")
+
+
+class TestRunLockRepository:
+    async def test_acquire(self, lock: RunLockRepository) -> None:
+        lease = await lock.acquire("a", NOW, NOW + LEASE)
+
+        assert (lease.target, lease.owner) == ("http://test", "a")
+        assert (lease.started, lease.expires) == (NOW, NOW + LEASE)
+
+    async def test_held_by_other(self, lock: RunLockRepository) -> None:
+        _ = await lock.acquire("a", NOW, NOW + LEASE)
+
+        lease = await lock.acquire("b", NOW + LEASE / 2, NOW + LEASE * 2)
+
+        assert lease.owner == "a"
+        assert lease.expires == NOW + LEASE
+
+    async def test_expired(self, lock: RunLockRepository) -> None:
+        stale = await lock.acquire("a", NOW, NOW + LEASE)
+
+        lease = await lock.acquire("b", NOW + LEASE, NOW + LEASE * 2)
+
+        assert lease.owner == "b"
+        assert not await lock.extend(stale, NOW + LEASE * 3)
+
+    async def test_extend(self, lock: RunLockRepository) -> None:
+        lease = await lock.acquire("a", NOW, NOW + LEASE)
+
+        assert await lock.extend(lease, NOW + LEASE * 2)
+        other = await lock.acquire("b", NOW + LEASE, NOW + LEASE * 3)
+
+        assert other.owner == "a"
+
+    async def test_release(self, lock: RunLockRepository) -> None:
+        lease = await lock.acquire("a", NOW, NOW + LEASE)
+
+        await lock.release(lease)
+        other = await lock.acquire("b", NOW, NOW + LEASE)
+
+        assert other.owner == "b"
+        assert not await lock.extend(lease, NOW + LEASE)
+
+    async def test_targets_are_independent(self) -> None:
+        state = StateDatabase()
+        _ = await RunLockRepository(state, "http://first").acquire(
+            "a", NOW, NOW + LEASE
+        )
+
+        lease = await RunLockRepository(state, "http://second").acquire(
+            "b", NOW, NOW + LEASE
+        )
+
+        assert lease.owner == "b"
@@ -0,0 +1,171 @@
+import base64
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from videos_cleaner.adapters.repositories.cassette import CASSETTE, Interaction
+from videos_cleaner.adapters.repositories.simulated import (
+    SimulatedMetaRepository,
+    SimulatedVideo,
+    SimulatedVideoRepository,
+    Upstream,
+    make_catalogue,
+    profile_from_recording,
+)
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    UnauthorizedError,
+)
+from videos_cleaner.domain.interfaces.video_repository import (
+    VideoIsAlreadyDeletedError,
+    VideoIsNotDeletedError,
+    VideoNotFoundError,
+)
+from videos_cleaner.entities.simulation import (
+    LatencyProfile,
+    SimulationProfile,
+    UpstreamLoad,
+)
+from videos_cleaner.entities.video import Video
+
+pytestmark = pytest.mark.anyio
+
+
+def rng() -> random.Random:
+    return random.Random(1)  # noqa: S311
+
+
+def upstream() -> Upstream:
+    return Upstream(LatencyProfile(0, 0), rng(), UpstreamLoad())
+
+
+@pytest.fixture
+def catalogue() -> list[SimulatedVideo]:
+    return [
+        SimulatedVideo(Video(deleted=False, slug="a", yt_id="a"), ExistsStatus.EXISTS),
+        SimulatedVideo(Video(deleted=True, slug="b", yt_id="b"), ExistsStatus.HIDDEN),
+        SimulatedVideo(
+            Video(deleted=False, slug="c", yt_id="c"),
+            ExistsStatus.REMOVED,
+            unauthorized=True,
+        ),
+    ]
+
+
+def test_make_catalogue() -> None:
+    profile = SimulationProfile(
+        catalogue_size=10_000,
+        deleted_share=0.1,
+        hidden_share=0.2,
+        removed_share=0.3,
+        unauthorized_share=0.05,
+    )
+
+    catalogue = make_catalogue(profile, rng())
+
+    assert len(catalogue) == 10_000
+    statuses = [item.status for item in catalogue]
+    assert statuses.count(ExistsStatus.HIDDEN) == pytest.approx(2_000, rel=0.1)
+    assert statuses.count(ExistsStatus.REMOVED) == pytest.approx(3_000, rel=0.1)
+    deleted = sum(item.video.deleted for item in catalogue)
+    assert deleted == pytest.approx(1_000, rel=0.1)
+    unauthorized = sum(item.unauthorized for item in catalogue)
+    assert unauthorized == pytest.approx(500, rel=0.15)
+
+
+class TestSimulatedVideoRepository:
+    async def test_pages(self, catalogue: list[SimulatedVideo]) -> None:
+        service = upstream()
+        repo = SimulatedVideoRepository(catalogue, service)
+
+        page = await repo.get_all(1, limit=5)
+        async with repo.stream(0, limit=1) as stream:
+            streamed = [video async for video in stream.videos]
+
+        assert page.total_count == 3
+        assert [video.slug for video in page.videos] == ["b", "c"]
+        assert [video.slug for video in streamed] == ["a"]
+        assert service.load.requests == 2
+
+    async def test_mutations(self, catalogue: list[SimulatedVideo]) -> None:
+        repo = SimulatedVideoRepository(catalogue, upstream())
+
+        await repo.delete("a")
+        await repo.restore("b")
+
+        page = await repo.get_all()
+        assert [video.deleted for video in page.videos] == [True, False, False]
+
+    async def test_conflicts(self, catalogue: list[SimulatedVideo]) -> None:
+        repo = SimulatedVideoRepository(catalogue, upstream())
+
+        with pytest.raises(VideoIsAlreadyDeletedError):
+            await repo.delete("b")
+        with pytest.raises(VideoIsNotDeletedError):
+            await repo.restore("a")
+        with pytest.raises(VideoNotFoundError):
+            await repo.delete("missing", temporary=False)
+
+
+class TestSimulatedMetaRepository:
+    async def test_statuses(self, catalogue: list[SimulatedVideo]) -> None:
+        repo = SimulatedMetaRepository(catalogue, upstream())
+
+        assert await repo.is_exists("b") == ExistsStatus.HIDDEN
+        with pytest.raises(UnauthorizedError):
+            _ = await repo.is_exists("c")
+
+    async def test_fallback(self, catalogue: list[SimulatedVideo]) -> None:
+        repo = SimulatedMetaRepository(catalogue, upstream(), fallback=True)
+
+        assert await repo.is_exists("c") == ExistsStatus.REMOVED
+        assert await repo.is_embeddable("a")
+        assert not await repo.is_embeddable("c")
+
+
+def interaction(
+    url: str, elapsed: float, status: int = 200, content: bytes = b""
+) -> Interaction:
+    return Interaction(
+        method="GET" if "videos" in url else "HEAD",
+        url=url,
+        status=status,
+        headers=[("x-total-count", "40")] if "videos" in url else [],
+        content=base64.b64encode(content).decode(),
+        elapsed=elapsed,
+    )
+
+
+def test_profile_from_recording(tmp_path: Path) -> None:
+    page = json.dumps(
+        [
+            {"slug": "a", "yt_id": "a", "deleted": True},
+            {"slug": "b", "yt_id": "b", "deleted": False},
+        ]
+    ).encode()
+    oembed = "https://www.youtube.com/oembed?url=x"
+    interactions = [
+        interaction("http://api/videos?skip=0", 0.4, content=page),
+        interaction(oembed, 0.1),
+        interaction(oembed, 0.1, 403),
+        interaction(oembed, 0.2, 404),
+        interaction(oembed, 0.3, 401),
+        interaction("https://www.youtube.com/feeds/videos.xml", 5),
+    ]
+    (tmp_path / CASSETTE).write_text(
+        "".join(json.dumps(item) + "\n" for item in interactions)
+    )
+
+    profile = profile_from_recording(tmp_path)
+
+    assert profile.catalogue_size == 40
+    assert profile.deleted_share == 0.5
+    assert (profile.hidden_share, profile.removed_share) == (0.25, 0.25)
+    assert profile.unauthorized_share == 0.25
+    assert profile.video_api == LatencyProfile(0.4, 0.4)
+    assert profile.oembed.median == pytest.approx(0.15)
+    assert profile.oembed.p95 == 0.3
+    assert profile.data_api == SimulationProfile().data_api
+    assert profile_from_recording(tmp_path, 500).catalogue_size == 500
@@ -0,0 +1,40 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from videos_cleaner.adapters.repositories.snapshot_repository import (
+    SnapshotRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.entities.snapshot import VideoSnapshot
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class TestSnapshotRepository:
+    async def test_save_and_get(self) -> None:
+        repo = SnapshotRepository(StateDatabase())
+        snapshot = VideoSnapshot("test", deleted=True, observed=NOW)
+
+        await repo.save(snapshot)
+
+        assert await repo.get_many(["test", "unknown"]) == {"test": snapshot}
+
+    async def test_discard(self) -> None:
+        repo = SnapshotRepository(StateDatabase())
+        await repo.save(VideoSnapshot("first", deleted=True, observed=NOW))
+        await repo.save(VideoSnapshot("second", deleted=False, observed=NOW))
+
+        await repo.discard_many(["first"])
+
+        assert list(await repo.get_many(["first", "second"])) == ["second"]
+
+    async def test_targets_are_separate(self) -> None:
+        state = StateDatabase()
+        await SnapshotRepository(state, "http://first").save(
+            VideoSnapshot("test", deleted=True, observed=NOW)
+        )
+
+        assert await SnapshotRepository(state, "http://second").get_many(["test"]) == {}
@@ -9,6 +9,7 @@ from videos_cleaner.domain.interfaces.video_repository import (
     VideoIsAlreadyDeletedError,
     VideoIsNotDeletedError,
     VideoNotFoundError,
+    VideoRepositoryUnavailableError,
     VideoRepostiryError,
 )
 
@@ -63,6 +64,46 @@ class TestVideoRepository:
         assert videos.total_count == 1
         assert videos.videos[0].slug == "active-video"
 
+    @respx.mock
+    async def test_stream(self, repo: VideoRepository) -> None:
+        route = respx.get("http://test/videos?include_deleted=true&skip=0&limit=2")
+        route.return_value = Response(
+            200,
+            json=[
+                {"slug": "first", "deleted": False, "yt_id": "abc123"},
+                {"slug": "second", "deleted": True, "yt_id": "def456"},
+            ],
+            headers={"x-total-count": "10"},
+        )
+
+        async with repo.stream(limit=2) as page:
+            videos = [video async for video in page.videos]
+
+        assert page.total_count == 10
+        assert [video.slug for video in videos] == ["first", "second"]
+
+    @respx.mock
+    async def test_stream_error(self, repo: VideoRepository) -> None:
+        route = respx.get("http://test/videos?include_deleted=true&skip=0&limit=50")
+        route.return_value = Response(500, json={"detail": "Ошибка"})
+
+        with pytest.raises(VideoRepostiryError):
+            async with repo.stream():
+                pass
+
+    @respx.mock
+    async def test_stream_truncated(self, repo: VideoRepository) -> None:
+        route = respx.get("http://test/videos?include_deleted=true&skip=0&limit=50")
+        route.return_value = Response(
+            200,
+            content=b'[{"slug": "first", "deleted": false, "yt_id": "abc123"}, {"sl',
+            headers={"x-total-count": "2"},
+        )
+
+        with pytest.raises(VideoRepositoryUnavailableError):
+            async with repo.stream() as page:
+                _ = [video async for video in page.videos]
+
     @respx.mock
     async def test_delete(self, repo: VideoRepository) -> None:
         route = respx.delete("http://test/videos/test")
@@ -0,0 +1,77 @@
+from urllib.parse import parse_qs
+
+import pytest
+import respx
+from httpx import AsyncClient, HTTPStatusError, Response
+
+from videos_cleaner.adapters.repositories.websub import (
+    HUB_URL,
+    WebSubSubscriber,
+    channel_topic,
+    notification_feed,
+    parse_notification,
+    sign,
+    verify_signature,
+)
+
+pytestmark = pytest.mark.anyio
+
+HUB_SECRET = "hub-secret"  # noqa: S105
+
+DELETED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:at="http://purl.org/atompub/tombstones/1.0"
+      xmlns="http://www.w3.org/2005/Atom">
+  <at:deleted-entry ref="yt:video:gone" when="2025-01-01T00:00:00+00:00">
+    <link href="https://www.youtube.com/watch?v=gone"/>
+  </at:deleted-entry>
+</feed>
+"""
+
+
+class TestNotification:
+    def test_parse_deleted(self) -> None:
+        assert parse_notification(DELETED) == {"gone"}
+
+    def test_round_trip(self) -> None:
+        body = notification_feed("UC1", updated=["new", "edited"], deleted=["gone"])
+
+        assert parse_notification(body) == {"new", "edited", "gone"}
+
+    def test_signature(self) -> None:
+        body = notification_feed("UC1", updated=["new"])
+
+        assert verify_signature(HUB_SECRET, body, sign(HUB_SECRET, body))
+        assert not verify_signature("other", body, sign(HUB_SECRET, body))
+        assert not verify_signature(HUB_SECRET, body, None)
+
+
+class TestWebSubSubscriber:
+    @respx.mock
+    async def test_subscribe(self) -> None:
+        hub = respx.post(HUB_URL).mock(return_value=Response(202))
+        topic = channel_topic("UC1")
+
+        async with AsyncClient() as client:
+            subscriber = WebSubSubscriber(
+                client, "https://cleaner.example/websub", secret=HUB_SECRET
+            )
+            await subscriber.subscribe(topic, 3600)
+
+        form = parse_qs(hub.calls.last.request.content.decode())
+        assert form == {
+            "hub.callback": ["https://cleaner.example/websub"],
+            "hub.topic": [topic],
+            "hub.mode": ["subscribe"],
+            "hub.verify": ["async"],
+            "hub.lease_seconds": ["3600"],
+            "hub.secret": [HUB_SECRET],
+        }
+
+    @respx.mock
+    async def test_rejected(self) -> None:
+        _ = respx.post(HUB_URL).mock(return_value=Response(400))
+
+        async with AsyncClient() as client:
+            subscriber = WebSubSubscriber(client, "https://cleaner.example/websub")
+            with pytest.raises(HTTPStatusError):
+                await subscriber.subscribe(channel_topic("UC1"), 3600)
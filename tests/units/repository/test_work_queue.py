@@ -0,0 +1,241 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.adapters.repositories.work_queue import (
+    MemoryWorkQueue,
+    WorkQueueRepository,
+)
+from videos_cleaner.entities.cleaner import VideoCleanerStats
+from videos_cleaner.entities.work import PageRange
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+LEASE = timedelta(minutes=5)
+
+
+@pytest.fixture
+async def queue() -> WorkQueueRepository:
+    queue = WorkQueueRepository(StateDatabase(), "http://test")
+    await queue.put_many([PageRange(0, 50), PageRange(50, 50), PageRange(100, 10)])
+    return queue
+
+
+class TestWorkQueueRepository:
+    async def test_lease_in_order(self, queue: WorkQueueRepository) -> None:
+        first = await queue.lease("a", NOW, NOW + LEASE)
+        second = await queue.lease("b", NOW, NOW + LEASE)
+
+        assert first is not None
+        assert second is not None
+        assert first.page == PageRange(0, 50)
+        assert second.page == PageRange(50, 50)
+        assert second.worker == "b"
+
+    async def test_empty(self, queue: WorkQueueRepository) -> None:
+        for _ in range(3):
+            assert await queue.lease("a", NOW, NOW + LEASE)
+
+        assert await queue.lease("a", NOW, NOW + LEASE) is None
+        summary = await queue.summary(NOW)
+        assert (summary.pending, summary.leased, summary.done) == (0, 3, 0)
+        assert not summary.finished
+
+    async def test_expired_lease_reclaimed(self, queue: WorkQueueRepository) -> None:
+        await queue.put_many([PageRange(0, 50)])
+        dead = await queue.lease("dead", NOW, NOW + LEASE)
+        assert dead is not None
+
+        later = NOW + LEASE
+        reclaimed = await queue.lease("alive", later, later + LEASE)
+
+        assert reclaimed is not None
+        assert reclaimed.page == dead.page
+        assert reclaimed.attempts == 2
+        assert not await queue.extend(dead, later + LEASE)
+
+    async def test_extend(self, queue: WorkQueueRepository) -> None:
+        await queue.put_many([PageRange(0, 50)])
+        lease = await queue.lease("a", NOW, NOW + LEASE)
+        assert lease is not None
+
+        assert await queue.extend(lease, NOW + 2 * LEASE)
+        assert await queue.lease("b", NOW + LEASE, NOW + 2 * LEASE) is None
+
+    async def test_release(self, queue: WorkQueueRepository) -> None:
+        lease = await queue.lease("a", NOW, NOW + LEASE)
+        assert lease is not None
+
+        await queue.release(lease)
+
+        again = await queue.lease("b", NOW, NOW + LEASE)
+        assert again is not None
+        assert again.page == lease.page
+
+    async def test_ack_once(self, queue: WorkQueueRepository) -> None:
+        await queue.put_many([PageRange(0, 50)])
+        dead = await queue.lease("dead", NOW, NOW + LEASE)
+        alive = await queue.lease("alive", NOW + LEASE, NOW + 2 * LEASE)
+        assert dead is not None
+        assert alive is not None
+
+        assert await queue.ack(alive, VideoCleanerStats(hidden=2))
+        assert not await queue.ack(dead, VideoCleanerStats(hidden=2))
+
+        summary = await queue.summary(NOW)
+        assert summary.finished
+        assert summary.stats.hidden == 2
+
+    async def test_same_name_does_not_own(self, queue: WorkQueueRepository) -> None:
+        await queue.put_many([PageRange(0, 50)])
+        stale = await queue.lease("a", NOW, NOW + LEASE)
+        current = await queue.lease("a", NOW + LEASE, NOW + 2 * LEASE)
+        assert stale is not None
+        assert current is not None
+
+        assert not await queue.ack(stale, VideoCleanerStats(hidden=1))
+        await queue.release(stale)
+        assert not await queue.extend(stale, NOW + 3 * LEASE)
+        assert await queue.ack(current, VideoCleanerStats(hidden=2))
+
+        assert (await queue.summary(NOW)).stats.hidden == 2
+
+    async def test_dead_letter(self, queue: WorkQueueRepository) -> None:
+        lease = await queue.lease("a", NOW, NOW + LEASE)
+        assert lease is not None
+
+        assert await queue.dead_letter(lease, "error")
+        assert not await queue.ack(lease, VideoCleanerStats())
+
+        summary = await queue.summary(NOW)
+        assert (summary.pending, summary.done, summary.failed) == (2, 0, 1)
+        again = await queue.lease("b", NOW, NOW + LEASE)
+        assert again is not None
+        assert again.page != lease.page
+
+    async def test_summary_aggregates(self, queue: WorkQueueRepository) -> None:
+        for worker, stats in (
+            ("a", VideoCleanerStats(hidden=1, unchanged=49)),
+            ("b", VideoCleanerStats(deleted=2, skipped=48)),
+        ):
+            lease = await queue.lease(worker, NOW, NOW + LEASE)
+            assert lease is not None
+            assert await queue.ack(lease, stats)
+
+        summary = await queue.summary(NOW)
+
+        assert (summary.pending, summary.leased, summary.done) == (1, 0, 2)
+        assert summary.stats.total == 100
+        assert (summary.stats.hidden, summary.stats.deleted) == (1, 2)
+
+    async def test_put_many_resets(self, queue: WorkQueueRepository) -> None:
+        lease = await queue.lease("a", NOW, NOW + LEASE)
+        assert lease is not None
+        _ = await queue.ack(lease, VideoCleanerStats())
+
+        await queue.put_many([PageRange(0, 20)])
+
+        summary = await queue.summary(NOW)
+        assert (summary.pending, summary.done) == (1, 0)
+
+    async def test_shared_file(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "state.sqlite3")
+        first = WorkQueueRepository(StateDatabase(path), "http://test")
+        second = WorkQueueRepository(StateDatabase(path), "http://test")
+        await first.put_many([PageRange(0, 50), PageRange(50, 50)])
+
+        leases = [
+            await first.lease("a", NOW, NOW + LEASE),
+            await second.lease("b", NOW, NOW + LEASE),
+            await first.lease("a", NOW, NOW + LEASE),
+        ]
+
+        assert [lease.page.offset if lease else None for lease in leases] == [
+            0,
+            50,
+            None,
+        ]
+
+    async def test_targets_are_separate(self, queue: WorkQueueRepository) -> None:
+        other = WorkQueueRepository(queue._state, "http://other")  # pyright: ignore[reportPrivateUsage]
+
+        assert await other.lease("a", NOW, NOW + LEASE) is None
+
+
+@pytest.fixture
+async def memory_queue() -> MemoryWorkQueue:
+    queue = MemoryWorkQueue()
+    await queue.put_many([PageRange(0, 50), PageRange(50, 50)])
+    return queue
+
+
+class TestMemoryWorkQueue:
+    async def test_lease_in_order(self, memory_queue: MemoryWorkQueue) -> None:
+        first = await memory_queue.lease("a", NOW, NOW + LEASE)
+        second = await memory_queue.lease("b", NOW, NOW + LEASE)
+
+        assert first is not None
+        assert second is not None
+        assert (first.page, second.page) == (PageRange(0, 50), PageRange(50, 50))
+        assert await memory_queue.lease("c", NOW, NOW + LEASE) is None
+
+    async def test_expired_lease(self, memory_queue: MemoryWorkQueue) -> None:
+        dead = await memory_queue.lease("dead", NOW, NOW + LEASE)
+        assert dead is not None
+        _ = await memory_queue.lease("b", NOW, NOW + LEASE)
+
+        again = await memory_queue.lease("alive", NOW + LEASE, NOW + 2 * LEASE)
+
+        assert again is not None
+        assert again.page == dead.page
+        assert again.attempts == 2
+        assert not await memory_queue.extend(dead, NOW + 3 * LEASE)
+
+    async def test_release(self, memory_queue: MemoryWorkQueue) -> None:
+        lease = await memory_queue.lease("a", NOW, NOW + LEASE)
+        assert lease is not None
+
+        await memory_queue.release(lease)
+
+        again = await memory_queue.lease("b", NOW, NOW + LEASE)
+        assert again is not None
+        assert again.page == lease.page
+
+    async def test_stale_lease(self, memory_queue: MemoryWorkQueue) -> None:
+        stale = await memory_queue.lease("a", NOW, NOW + LEASE)
+        assert stale is not None
+        _ = await memory_queue.lease("a", NOW, NOW + LEASE)
+        current = await memory_queue.lease("a", NOW + LEASE, NOW + 2 * LEASE)
+        assert current is not None
+
+        assert not await memory_queue.ack(stale, VideoCleanerStats(hidden=1))
+        assert not await memory_queue.dead_letter(stale, "error")
+        assert await memory_queue.ack(current, VideoCleanerStats(hidden=2))
+
+    async def test_dead_letter(self, memory_queue: MemoryWorkQueue) -> None:
+        lease = await memory_queue.lease("a", NOW, NOW + LEASE)
+        assert lease is not None
+
+        assert await memory_queue.dead_letter(lease, "error")
+
+        summary = await memory_queue.summary(NOW)
+        assert (summary.pending, summary.failed) == (1, 1)
+
+    async def test_ack_merges_stats(self, memory_queue: MemoryWorkQueue) -> None:
+        for worker, stats in (
+            ("a", VideoCleanerStats(hidden=1, unchanged=49)),
+            ("b", VideoCleanerStats(deleted=2, skipped=48)),
+        ):
+            lease = await memory_queue.lease(worker, NOW, NOW + LEASE)
+            assert lease is not None
+            assert await memory_queue.ack(lease, stats)
+            assert not await memory_queue.ack(lease, stats)
+
+        summary = await memory_queue.summary(NOW)
+
+        assert summary.finished
+        assert summary.stats.total == 100
+        assert (summary.stats.hidden, summary.stats.deleted) == (1, 2)
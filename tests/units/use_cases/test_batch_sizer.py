@@ -0,0 +1,40 @@
+from videos_cleaner.domain.use_cases.batch_sizer import AdaptiveBatchSize
+from videos_cleaner.entities.cleaner import PageProfile
+
+
+def page(size: int, fetch_time: float, check_time: float) -> PageProfile:
+    return PageProfile(
+        offset=0,
+        size=size,
+        received=size,
+        fetch_time=fetch_time,
+        check_time=check_time,
+    )
+
+
+class TestAdaptiveBatchSize:
+    def test_grows_while_fetch_dominates(self) -> None:
+        sizer = AdaptiveBatchSize(50, maximum=150)
+
+        assert sizer.observe(page(50, 1.0, 1.0)) == 100
+        assert sizer.observe(page(100, 1.0, 1.0)) == 150
+
+    def test_keeps_size_when_checks_dominate(self) -> None:
+        sizer = AdaptiveBatchSize(50)
+
+        assert sizer.observe(page(50, 0.1, 10.0)) == 50
+
+    def test_shrinks_slow_pages(self) -> None:
+        sizer = AdaptiveBatchSize(100, minimum=40)
+
+        assert sizer.observe(page(100, 10.0, 1.0)) == 50
+        assert sizer.observe(page(50, 0.1, 120.0)) == 40
+
+    def test_ignores_last_page(self) -> None:
+        sizer = AdaptiveBatchSize(50)
+
+        last = PageProfile(
+            offset=0, size=50, received=3, fetch_time=1.0, check_time=0.0
+        )
+
+        assert sizer.observe(last) == 50
@@ -0,0 +1,27 @@
+import pytest
+from pytest_mock import MockFixture
+
+from videos_cleaner.domain.interfaces.channel_repository import IChannelRepository
+from videos_cleaner.domain.interfaces.meta_repository import MetaRepositoryError
+from videos_cleaner.domain.use_cases.channel_discovery import discover_live
+
+pytestmark = pytest.mark.anyio
+
+
+class TestDiscoverLive:
+    async def test_union(self, mocker: MockFixture) -> None:
+        repo = mocker.AsyncMock(IChannelRepository)
+        repo.live_ids.side_effect = [{"a", "b"}, {"b", "c"}]
+
+        result = await discover_live(repo, ["first", "second", "first"])
+
+        assert result == {"a", "b", "c"}
+        assert repo.live_ids.await_count == 2
+
+    async def test_channel_error(self, mocker: MockFixture) -> None:
+        repo = mocker.AsyncMock(IChannelRepository)
+        repo.live_ids.side_effect = [MetaRepositoryError("Ошибка", 500), {"c"}]
+
+        result = await discover_live(repo, ["broken", "second"])
+
+        assert result == {"c"}
@@ -1,19 +1,55 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
 import pytest
 from pytest_mock import MockFixture
 
+from videos_cleaner.adapters.repositories.dead_letter_repository import (
+    DeadLetterRepository,
+)
+from videos_cleaner.adapters.repositories.mutation_journal import (
+    MutationJournalRepository,
+)
+from videos_cleaner.adapters.repositories.removal_repository import (
+    RemovalRepository,
+)
+from videos_cleaner.adapters.repositories.snapshot_repository import (
+    SnapshotRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.history_repository import IHistoryRepository
 from videos_cleaner.domain.interfaces.meta_repository import (
     ExistsStatus,
     IMetaRepository,
     MetaRepositoryError,
+    MetaRepositoryUnavailableError,
     UnauthorizedError,
 )
+from videos_cleaner.domain.interfaces.removal_repository import IRemovalRepository
+from videos_cleaner.domain.interfaces.snapshot_repository import ISnapshotRepository
 from videos_cleaner.domain.interfaces.video_repository import (
     IVideoRepository,
     VideoIsAlreadyDeletedError,
     VideoIsNotDeletedError,
+    VideoRepositoryUnavailableError,
+)
+from videos_cleaner.domain.use_cases.batch_sizer import AdaptiveBatchSize
+from videos_cleaner.domain.use_cases.pipeline import PipelineSettings
+from videos_cleaner.domain.use_cases.verdict_cache import VerdictCache
+from videos_cleaner.domain.use_cases.video_use_case import (
+    CleanerSettings,
+    VideoCleanerUseCase,
 )
-from videos_cleaner.domain.use_cases.video_use_case import VideoCleanerUseCase
-from videos_cleaner.entities.video import Video, VideoList
+from videos_cleaner.entities.cleaner import HedgeCounters, PageProfile
+from videos_cleaner.entities.history import CheckHistory
+from videos_cleaner.entities.journal import MutationKind
+from videos_cleaner.entities.removal import PendingRemoval
+from videos_cleaner.entities.snapshot import VideoSnapshot
+from videos_cleaner.entities.video import Video, VideoList, VideoStream
 
 pytestmark = pytest.mark.anyio
 
@@ -34,16 +70,50 @@ def youtube_data_api_repository(mocker: MockFixture) -> IMetaRepository:
 
 
 @pytest.fixture
-def use_case(
+def history_repository(mocker: MockFixture) -> IHistoryRepository:
+    repo = mocker.AsyncMock(IHistoryRepository)
+    repo.get_many.return_value = {}
+    return repo
+
+
+@pytest.fixture
+def removal_repository() -> IRemovalRepository:
+    return RemovalRepository(StateDatabase())
+
+
+@pytest.fixture
+def snapshot_repository() -> ISnapshotRepository:
+    return SnapshotRepository(StateDatabase())
+
+
+type UseCaseFactory = Callable[..., VideoCleanerUseCase]
+
+
+@pytest.fixture
+def make_use_case(  # noqa: PLR0913, PLR0917
     video_repository: IVideoRepository,
     meta_repository: IMetaRepository,
     youtube_data_api_repository: IMetaRepository,
-) -> VideoCleanerUseCase:
-    return VideoCleanerUseCase(
-        video_repository, meta_repository, youtube_data_api_repository
+    history_repository: IHistoryRepository,
+    removal_repository: IRemovalRepository,
+    snapshot_repository: ISnapshotRepository,
+) -> UseCaseFactory:
+    return partial(
+        VideoCleanerUseCase,
+        video_repository,
+        meta_repository,
+        youtube_data_api_repository,
+        history_repository,
+        removal_repository,
+        snapshot_repository,
     )
 
 
+@pytest.fixture
+def use_case(make_use_case: UseCaseFactory) -> VideoCleanerUseCase:
+    return make_use_case()
+
+
 class TestCleanerUseCase:
     async def test_video_cleaner(
         self, use_case: VideoCleanerUseCase, mocker: MockFixture
@@ -168,9 +238,9 @@ class TestCleanerUseCase:
         assert getattr(stats, name) == 1
 
     async def test_multiple_pages(
-        self, use_case: VideoCleanerUseCase, mocker: MockFixture
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
     ) -> None:
-        use_case.batch_size = 1
+        use_case = make_use_case(CleanerSettings(batch_size=1))
         mock_get_all = mocker.patch.object(
             use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
             "get_all",
@@ -189,6 +259,140 @@ class TestCleanerUseCase:
         assert mock_get_all.await_count == 2
         assert stats.total == 2
 
+    async def test_adaptive_batch_size(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        sizer = AdaptiveBatchSize(2, minimum=1)
+        use_case = make_use_case(batch_sizer=sizer)
+
+        def grow(page: PageProfile) -> int:
+            sizer.size = page.size + 1
+            return sizer.size
+
+        _ = mocker.patch.object(sizer, "observe", side_effect=grow)
+
+        async def get_all(offset: int = 0, *, limit: int = 50) -> VideoList:
+            return VideoList(
+                total_count=5,
+                videos=[
+                    Video(deleted=False, slug=str(i), yt_id=str(i))
+                    for i in range(offset, min(offset + limit, 5))
+                ],
+            )
+
+        mock_get_all = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            side_effect=get_all,
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+
+        stats = await use_case.execute()
+
+        assert stats.total == 5
+        assert stats.batch_sizes == [2, 3]
+        _ = mock_get_all.assert_awaited_with(2, limit=3)
+
+    async def test_adaptive_batch_size_capped_by_limit(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(batch_sizer=AdaptiveBatchSize(400))
+        mock_get_all = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(total_count=0, videos=[]),
+        )
+
+        _ = await use_case.execute(30)
+
+        _ = mock_get_all.assert_awaited_once_with(0, limit=30)
+
+    async def test_stream_pages(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(stream_pages=True, stream_chunk_size=2)
+        )
+        parsed: list[str] = []
+
+        async def videos() -> AsyncIterator[Video]:
+            for slug in ("a", "b", "c"):
+                parsed.append(slug)
+                yield Video(deleted=False, slug=slug, yt_id=slug)
+
+        @asynccontextmanager
+        async def stream(
+            _offset: int = 0, *, limit: int = 50
+        ) -> AsyncIterator[VideoStream]:
+            assert limit == use_case.settings.batch_size
+            yield VideoStream(total_count=3, videos=videos())
+
+        _ = mocker.patch.object(use_case._video_repo, "stream", stream)  # pyright: ignore[reportPrivateUsage]
+        checked: list[list[str]] = []
+
+        async def is_exists(_yt_id: str) -> ExistsStatus:
+            checked.append([*parsed])
+            return ExistsStatus.EXISTS
+
+        _ = mocker.patch.object(use_case._meta_repo, "is_exists", is_exists)  # pyright: ignore[reportPrivateUsage]
+        mock_get_all = mocker.spy(use_case._video_repo, "get_all")  # pyright: ignore[reportPrivateUsage]
+
+        stats = await use_case.execute()
+
+        assert stats.unchanged == 3
+        assert checked[0] == ["a", "b"]
+        mock_get_all.assert_not_called()
+
+    async def test_known_live(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(known_live=frozenset({"live", "restored"}))
+        )
+        videos = [
+            Video(deleted=False, slug="live", yt_id="live"),
+            Video(deleted=True, slug="restored", yt_id="restored"),
+            Video(deleted=False, slug="other", yt_id="other"),
+        ]
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(total_count=3, videos=videos),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.HIDDEN,
+        )
+
+        stats = await use_case.execute()
+
+        mock_is_exists.assert_awaited_once_with("other")
+        assert stats.discovered == 2
+        assert (stats.unchanged, stats.restored, stats.hidden) == (1, 1, 1)
+
+    async def test_hedge_counters(
+        self, use_case: VideoCleanerUseCase, mocker: MockFixture
+    ) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(total_count=0, videos=[]),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "hedge_counters",
+            side_effect=[HedgeCounters(10, 1, 1), HedgeCounters(30, 4, 2)],
+        )
+
+        stats = await use_case.execute()
+
+        assert (stats.hedges, stats.hedge_wins) == (3, 1)
+
     async def test_limit(
         self, use_case: VideoCleanerUseCase, mocker: MockFixture
     ) -> None:
@@ -213,6 +417,7 @@ class TestCleanerUseCase:
         _ = mock_get_all.assert_awaited_once()
         _ = mock_is_exists.assert_awaited_once()
         assert stats.total == 1
+        assert stats.time_to_first_verdict is not None
 
     async def test_limit_is_very_biggest_then_total(
         self, use_case: VideoCleanerUseCase, mocker: MockFixture
@@ -267,7 +472,8 @@ class TestUseCaseErrors:
         _ = mock_get_all.assert_awaited_once()
         _ = mock_is_exists.assert_awaited_once()
         _ = mock_delete.assert_awaited_once()
-        assert result.unchanged == 1
+        assert result.reconciled == 1
+        assert result.unchanged == 0
 
     async def test_restore_error(
         self, use_case: VideoCleanerUseCase, mocker: MockFixture
@@ -296,7 +502,8 @@ class TestUseCaseErrors:
         _ = mock_get_all.assert_awaited_once()
         _ = mock_is_exists.assert_awaited_once()
         _ = mock_restore.assert_awaited_once()
-        assert result.unchanged == 1
+        assert result.reconciled == 1
+        assert result.unchanged == 0
 
     async def test_meta_repository_error(
         self, use_case: VideoCleanerUseCase, mocker: MockFixture
@@ -319,7 +526,7 @@ class TestUseCaseErrors:
 
         _ = mock_get_all.assert_awaited_once()
         _ = mock_is_exists.assert_awaited_once()
-        assert result.unchanged == 1
+        assert result.failed == 1
 
     async def test_embeddable_check(
         self, use_case: VideoCleanerUseCase, mocker: MockFixture
@@ -378,3 +585,842 @@ class TestUseCaseErrors:
         _ = mock_is_exists.assert_awaited_once()
         _ = mock_is_embeddable.assert_not_awaited()
         assert result.unchanged == 1
+
+    async def test_fallback_when_meta_repository_unavailable(
+        self, use_case: VideoCleanerUseCase, mocker: MockFixture
+    ) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=MetaRepositoryUnavailableError,
+        )
+        mock_is_embeddable = mocker.patch.object(
+            use_case._youtube_data_api_repo,
+            "is_embeddable",
+            return_value=False,
+        )
+
+        result = await use_case.execute()
+
+        _ = mock_is_embeddable.assert_awaited_once_with("test")
+        assert result.hidden == 1
+
+    async def test_mutation_paused_when_video_repository_unavailable(
+        self, use_case: VideoCleanerUseCase, mocker: MockFixture
+    ) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=2,
+                videos=[
+                    Video(deleted=False, slug="test", yt_id="test") for _ in range(2)
+                ],
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.REMOVED,
+        )
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "delete",
+            side_effect=VideoRepositoryUnavailableError,
+        )
+
+        result = await use_case.execute()
+
+        assert mock_is_exists.await_count == 2
+        assert result.failed == 2
+
+
+class TestCheckHistory:
+    @pytest.fixture
+    def stable(self) -> CheckHistory:
+        now = datetime.now(UTC)
+        return CheckHistory("test", ExistsStatus.EXISTS, now, now, now, streak=5)
+
+    async def test_skip_stable_video(
+        self,
+        use_case: VideoCleanerUseCase,
+        history_repository: IHistoryRepository,
+        stable: CheckHistory,
+        mocker: MockFixture,
+    ) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+        _ = mocker.patch.object(
+            history_repository, "get_many", return_value={"test": stable}
+        )
+
+        result = await use_case.execute()
+
+        _ = mock_is_exists.assert_not_awaited()
+        assert result.skipped == 1
+
+    async def test_force_all(
+        self,
+        use_case: VideoCleanerUseCase,
+        history_repository: IHistoryRepository,
+        stable: CheckHistory,
+        mocker: MockFixture,
+    ) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+        _ = mocker.patch.object(
+            history_repository, "get_many", return_value={"test": stable}
+        )
+        mock_save_many = mocker.spy(history_repository, "save_many")
+
+        result = await use_case.execute(force_all=True)
+
+        _ = mock_is_exists.assert_awaited_once()
+        assert result.unchanged == 1
+        saved = list(mock_save_many.call_args[0][0])
+        assert saved[0].streak == stable.streak + 1
+
+    async def test_shared_sweep_observes_once(
+        self,
+        make_use_case: UseCaseFactory,
+        video_repository: IVideoRepository,
+        meta_repository: IMetaRepository,
+        history_repository: IHistoryRepository,
+        mocker: MockFixture,
+    ) -> None:
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        _ = mocker.patch.object(
+            meta_repository, "is_exists", return_value=ExistsStatus.EXISTS
+        )
+        verdicts = VerdictCache()
+        mock_save_many = mocker.spy(history_repository, "save_many")
+
+        for _ in range(2):
+            _ = await make_use_case(verdicts=verdicts).execute(force_all=True)
+
+        saved = [
+            entry for call in mock_save_many.call_args_list for entry in call.args[0]
+        ]
+        assert [entry.yt_id for entry in saved] == ["test"]
+
+    async def test_dirty(
+        self,
+        make_use_case: UseCaseFactory,
+        history_repository: IHistoryRepository,
+        stable: CheckHistory,
+        mocker: MockFixture,
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(
+                dirty=frozenset({"changed"}),
+                known_live=frozenset({"changed"}),
+                background_sample=0,
+            )
+        )
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=3,
+                videos=[
+                    Video(deleted=False, slug=slug, yt_id=slug)
+                    for slug in ("quiet", "changed", "new")
+                ],
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+        _ = mocker.patch.object(
+            history_repository,
+            "get_many",
+            return_value={
+                "quiet": replace(stable, yt_id="quiet"),
+                "changed": replace(stable, yt_id="changed"),
+            },
+        )
+
+        result = await use_case.execute()
+
+        checked = sorted(call.args[0] for call in mock_is_exists.await_args_list)
+        assert checked == ["changed", "new"]
+        assert result.skipped == 1
+        assert result.discovered == 0
+
+    async def test_dirty_background_sample(
+        self,
+        make_use_case: UseCaseFactory,
+        history_repository: IHistoryRepository,
+        stable: CheckHistory,
+        mocker: MockFixture,
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(
+                dirty=frozenset(), known_live=frozenset({"test"}), background_sample=1
+            )
+        )
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+        _ = mocker.patch.object(
+            history_repository, "get_many", return_value={"test": stable}
+        )
+
+        result = await use_case.execute()
+
+        _ = mock_is_exists.assert_awaited_once_with("test")
+        assert result.unchanged == 1
+        assert result.discovered == 0
+
+    async def test_check_when_state_diverged(
+        self,
+        use_case: VideoCleanerUseCase,
+        history_repository: IHistoryRepository,
+        stable: CheckHistory,
+        mocker: MockFixture,
+    ) -> None:
+        """Видео скрыто в API, хотя по истории существует на youtube."""
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=True, slug="test", yt_id="test")],
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+        _ = mocker.patch.object(
+            history_repository, "get_many", return_value={"test": stable}
+        )
+
+        result = await use_case.execute()
+
+        _ = mock_is_exists.assert_awaited_once()
+        assert result.restored == 1
+
+
+class TestRemovalConfirmation:
+    @pytest.fixture
+    def use_case(self, make_use_case: UseCaseFactory) -> VideoCleanerUseCase:
+        return make_use_case(CleanerSettings(removal_confirmations=2))
+
+    @pytest.fixture(autouse=True)
+    def removed(self, use_case: VideoCleanerUseCase, mocker: MockFixture) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.REMOVED,
+        )
+
+    async def test_first_verdict_is_pending(
+        self,
+        use_case: VideoCleanerUseCase,
+        removal_repository: IRemovalRepository,
+        mocker: MockFixture,
+    ) -> None:
+        mock_delete = mocker.spy(use_case._video_repo, "delete")  # pyright: ignore[reportPrivateUsage]
+
+        result = await use_case.execute()
+
+        _ = mock_delete.assert_not_awaited()
+        assert result.pending == 1
+        pending = await removal_repository.get("test")
+        assert pending is not None
+        assert pending.confirmations == 1
+
+    async def test_confirmation_is_fresh_check(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(
+                removal_confirmations=2, removal_confirmation_gap=timedelta(0)
+            ),
+            verdicts=VerdictCache(),
+        )
+        mock_is_exists = mocker.spy(use_case._meta_repo, "is_exists")  # pyright: ignore[reportPrivateUsage]
+
+        result = await use_case.execute()
+
+        assert mock_is_exists.await_count == 2
+        assert result.deleted == 1
+
+    async def test_confirmation_too_early(
+        self,
+        use_case: VideoCleanerUseCase,
+        removal_repository: IRemovalRepository,
+        mocker: MockFixture,
+    ) -> None:
+        mock_delete = mocker.spy(use_case._video_repo, "delete")  # pyright: ignore[reportPrivateUsage]
+
+        _ = await use_case.execute()
+        result = await use_case.execute()
+
+        _ = mock_delete.assert_not_awaited()
+        assert result.pending == 1
+        pending = await removal_repository.get("test")
+        assert pending is not None
+        assert pending.confirmations == 1
+
+    async def test_confirmed_in_later_run(
+        self,
+        use_case: VideoCleanerUseCase,
+        removal_repository: IRemovalRepository,
+        mocker: MockFixture,
+    ) -> None:
+        earlier = datetime.now(UTC) - timedelta(hours=1)
+        video = Video(deleted=False, slug="old", yt_id="old")
+        await removal_repository.save(PendingRemoval.first(video, earlier))
+        mock_delete = mocker.spy(use_case._video_repo, "delete")  # pyright: ignore[reportPrivateUsage]
+
+        result = await use_case.execute()
+
+        _ = mock_delete.assert_awaited_once_with("old", temporary=False)
+        assert result.deleted == 1
+        assert result.pending == 1
+        assert await removal_repository.get("old") is None
+
+    async def test_failed_recheck_once_per_sweep(
+        self,
+        make_use_case: UseCaseFactory,
+        removal_repository: IRemovalRepository,
+        mocker: MockFixture,
+    ) -> None:
+        use_case = make_use_case(CleanerSettings(batch_size=1, removal_confirmations=2))
+        earlier = datetime.now(UTC) - timedelta(hours=1)
+        video = Video(deleted=False, slug="old", yt_id="old")
+        await removal_repository.save(PendingRemoval.first(video, earlier))
+
+        async def get_all(offset: int = 0, *, limit: int = 50) -> VideoList:
+            del limit
+            slug = f"video-{offset}"
+            return VideoList(
+                total_count=3, videos=[Video(deleted=False, slug=slug, yt_id=slug)]
+            )
+
+        async def is_exists(yt_id: str) -> ExistsStatus:
+            if yt_id == "old":
+                raise MetaRepositoryError("Сервис недоступен", 500)
+            return ExistsStatus.EXISTS
+
+        _ = mocker.patch.object(use_case._video_repo, "get_all", get_all)  # pyright: ignore[reportPrivateUsage]
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=is_exists,
+        )
+
+        result = await use_case.execute()
+
+        assert [call.args[0] for call in mock_is_exists.await_args_list].count(
+            "old"
+        ) == 1
+        assert result.failed == 1
+        assert result.unchanged == 3
+        assert await removal_repository.get("old") is not None
+
+    async def test_cancelled_when_video_exists(
+        self,
+        use_case: VideoCleanerUseCase,
+        removal_repository: IRemovalRepository,
+        mocker: MockFixture,
+    ) -> None:
+        now = datetime.now(UTC)
+        video = Video(deleted=False, slug="test", yt_id="test")
+        await removal_repository.save(PendingRemoval.first(video, now))
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+
+        result = await use_case.execute()
+
+        assert result.unchanged == 1
+        assert await removal_repository.get("test") is None
+
+
+class TestReconciliation:
+    @pytest.fixture
+    def stale_listing(self, use_case: VideoCleanerUseCase, mocker: MockFixture) -> None:
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(
+                total_count=1,
+                videos=[Video(deleted=False, slug="test", yt_id="test")],
+            ),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.HIDDEN,
+        )
+
+    @pytest.mark.usefixtures("stale_listing")
+    async def test_conflict_skips_next_mutation(
+        self, use_case: VideoCleanerUseCase, mocker: MockFixture
+    ) -> None:
+        mock_delete = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "delete",
+            side_effect=VideoIsAlreadyDeletedError,
+        )
+
+        first = await use_case.execute(force_all=True)
+        second = await use_case.execute(force_all=True)
+
+        _ = mock_delete.assert_awaited_once()
+        assert first.reconciled == 1
+        assert second.unchanged == 1
+
+    @pytest.mark.usefixtures("stale_listing")
+    async def test_expired_snapshot(
+        self,
+        use_case: VideoCleanerUseCase,
+        snapshot_repository: ISnapshotRepository,
+        mocker: MockFixture,
+    ) -> None:
+        observed = datetime.now(UTC) - timedelta(days=2)
+        await snapshot_repository.save(
+            VideoSnapshot("test", deleted=True, observed=observed)
+        )
+        mock_delete = mocker.spy(use_case._video_repo, "delete")  # pyright: ignore[reportPrivateUsage]
+
+        stats = await use_case.execute()
+
+        _ = mock_delete.assert_awaited_once_with("test", temporary=True)
+        assert stats.hidden == 1
+        assert await snapshot_repository.get_many(["test"]) == {}
+
+
+class TestPipeline:
+    @pytest.fixture
+    def use_case(self, make_use_case: UseCaseFactory) -> VideoCleanerUseCase:
+        return make_use_case(
+            CleanerSettings(pipeline=PipelineSettings(probe_workers=2, queue_size=2))
+        )
+
+    async def test_statuses(
+        self,
+        use_case: VideoCleanerUseCase,
+        history_repository: IHistoryRepository,
+        mocker: MockFixture,
+    ) -> None:
+        videos = [
+            Video(deleted=False, slug="hidden", yt_id="hidden"),
+            Video(deleted=True, slug="restored", yt_id="restored"),
+            Video(deleted=False, slug="removed", yt_id="removed"),
+            Video(deleted=False, slug="fallback", yt_id="fallback"),
+            Video(deleted=False, slug="exists", yt_id="exists"),
+        ]
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(total_count=len(videos), videos=videos),
+        )
+        statuses = {
+            "hidden": ExistsStatus.HIDDEN,
+            "restored": ExistsStatus.EXISTS,
+            "removed": ExistsStatus.REMOVED,
+            "exists": ExistsStatus.EXISTS,
+        }
+
+        async def is_exists(yt_id: str) -> ExistsStatus:
+            if yt_id not in statuses:
+                raise MetaRepositoryUnavailableError
+            return statuses[yt_id]
+
+        _ = mocker.patch.object(use_case._meta_repo, "is_exists", is_exists)  # pyright: ignore[reportPrivateUsage]
+        _ = mocker.patch.object(
+            use_case.youtube_data_api_repo, "is_embeddable", return_value=False
+        )
+
+        stats = await use_case.execute()
+
+        assert (stats.hidden, stats.restored, stats.deleted, stats.unchanged) == (
+            2,
+            1,
+            1,
+            1,
+        )
+        assert [stage.name for stage in stats.stages] == [
+            "filter",
+            "probe",
+            "fallback",
+            "decide",
+            "restore",
+            "delete",
+            "hide",
+            "audit",
+        ]
+        assert stats.stages[2].processed == 1
+        save_many = history_repository.save_many
+        saved = [
+            history.yt_id
+            for call in save_many.await_args_list  # pyright: ignore[reportAttributeAccessIssue]
+            for history in call.args[0]
+        ]
+        assert sorted(saved) == sorted(video.yt_id for video in videos)
+
+    async def test_fewer_slots_than_workers(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(
+                pipeline=PipelineSettings(
+                    probe_workers=4, fallback_workers=2, queue_size=1, request_slots=2
+                )
+            )
+        )
+        videos = [
+            Video(deleted=False, slug=f"video-{index}", yt_id=f"video-{index}")
+            for index in range(30)
+        ]
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(total_count=len(videos), videos=videos),
+        )
+
+        async def unavailable(_yt_id: str) -> ExistsStatus:
+            await asyncio.sleep(0.001)
+            raise MetaRepositoryUnavailableError
+
+        async def exists(_yt_id: str) -> ExistsStatus:
+            await asyncio.sleep(0.001)
+            return ExistsStatus.EXISTS
+
+        _ = mocker.patch.object(use_case._meta_repo, "is_exists", unavailable)  # pyright: ignore[reportPrivateUsage]
+        _ = mocker.patch.object(use_case.youtube_data_api_repo, "is_exists", exists)
+
+        async with asyncio.timeout(5):
+            stats = await use_case.execute()
+
+        assert stats.unchanged == len(videos)
+
+    async def test_limit_and_duplicates(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(CleanerSettings(batch_size=2))
+        pages = [
+            [Video(deleted=False, slug=slug, yt_id=slug) for slug in page]
+            for page in (["a", "b"], ["b", "c"], ["d", "e"])
+        ]
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            side_effect=[VideoList(total_count=6, videos=page) for page in pages],
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+
+        stats = await use_case.execute(5)
+
+        checked = sorted(call.args[0] for call in mock_is_exists.await_args_list)
+        assert checked == ["a", "b", "c", "d"]
+        assert stats.unchanged == 4
+
+    async def test_known_live(
+        self, make_use_case: UseCaseFactory, mocker: MockFixture
+    ) -> None:
+        use_case = make_use_case(CleanerSettings(known_live=frozenset({"live"})))
+        videos = [
+            Video(deleted=False, slug="live", yt_id="live"),
+            Video(deleted=False, slug="other", yt_id="other"),
+        ]
+        _ = mocker.patch.object(
+            use_case._video_repo,  # pyright: ignore[reportPrivateUsage]
+            "get_all",
+            return_value=VideoList(total_count=2, videos=videos),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            return_value=ExistsStatus.EXISTS,
+        )
+
+        stats = await use_case.execute()
+
+        mock_is_exists.assert_awaited_once_with("other")
+        assert stats.discovered == 1
+        assert stats.unchanged == 2
+
+
+class TestWriteBehind:
+    async def test_mutations_go_to_journal(
+        self,
+        make_use_case: UseCaseFactory,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        journal = MutationJournalRepository(StateDatabase(), "http://test")
+        use_case = make_use_case(journal=journal)
+        videos = [
+            Video(deleted=False, slug="hidden", yt_id="hidden"),
+            Video(deleted=True, slug="restored", yt_id="restored"),
+        ]
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(total_count=2, videos=videos),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=[ExistsStatus.HIDDEN, ExistsStatus.EXISTS],
+        )
+        mock_delete = mocker.spy(video_repository, "delete")
+        mock_restore = mocker.spy(video_repository, "restore")
+
+        stats = await use_case.execute()
+
+        mock_delete.assert_not_awaited()
+        mock_restore.assert_not_awaited()
+        assert (stats.hidden, stats.restored) == (1, 1)
+        entries = await journal.due(datetime.now(UTC), 10)
+        assert {(entry.slug, entry.kind) for entry in entries} == {
+            ("hidden", MutationKind.HIDE),
+            ("restored", MutationKind.RESTORE),
+        }
+
+
+class TestDeadLetters:
+    @pytest.fixture
+    def dead_letters(self) -> DeadLetterRepository:
+        return DeadLetterRepository(StateDatabase(), "http://test")
+
+    @pytest.fixture
+    def use_case(
+        self, make_use_case: UseCaseFactory, dead_letters: DeadLetterRepository
+    ) -> VideoCleanerUseCase:
+        return make_use_case(dead_letters=dead_letters)
+
+    @staticmethod
+    def statuses(*failing: str) -> Callable[[str], Awaitable[ExistsStatus]]:
+        async def is_exists(yt_id: str) -> ExistsStatus:
+            if yt_id in failing:
+                raise MetaRepositoryError("Сервис недоступен", 500)
+            return ExistsStatus.EXISTS
+
+        return is_exists
+
+    async def test_failure_recorded(
+        self,
+        make_use_case: UseCaseFactory,
+        dead_letters: DeadLetterRepository,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(retry_budget=timedelta(0)), dead_letters=dead_letters
+        )
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(
+                total_count=2,
+                videos=[
+                    Video(deleted=False, slug="a", yt_id="a"),
+                    Video(deleted=False, slug="b", yt_id="b"),
+                ],
+            ),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=self.statuses("a"),
+        )
+
+        stats = await use_case.execute()
+
+        assert (stats.failed, stats.unchanged) == (1, 1)
+        letters = await dead_letters.due(datetime.now(UTC), 5, 10)
+        assert [(letter.slug, letter.error, letter.attempts) for letter in letters] == [
+            ("a", "MetaRepositoryError", 1)
+        ]
+
+    async def test_retry_at_end_of_run(
+        self,
+        use_case: VideoCleanerUseCase,
+        dead_letters: DeadLetterRepository,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(
+                total_count=1, videos=[Video(deleted=False, slug="a", yt_id="a")]
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=[
+                MetaRepositoryError("Сервис недоступен", 500),
+                ExistsStatus.EXISTS,
+            ],
+        )
+
+        stats = await use_case.execute()
+
+        assert mock_is_exists.await_count == 2
+        assert (stats.failed, stats.unchanged) == (1, 1)
+        assert await dead_letters.due(datetime.now(UTC), 5, 10) == []
+
+    async def test_retry_first_in_next_run(
+        self,
+        use_case: VideoCleanerUseCase,
+        dead_letters: DeadLetterRepository,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        _ = await dead_letters.record(
+            Video(deleted=False, slug="a", yt_id="a"),
+            "MetaRepositoryError",
+            datetime.now(UTC) - timedelta(minutes=1),
+        )
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(
+                total_count=1, videos=[Video(deleted=False, slug="b", yt_id="b")]
+            ),
+        )
+        mock_is_exists = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=self.statuses(),
+        )
+
+        stats = await use_case.execute(limit=1)
+
+        mock_is_exists.assert_awaited_once_with("a")
+        assert stats.unchanged == 1
+        assert await dead_letters.due(datetime.now(UTC), 5, 10) == []
+
+    async def test_gives_up_after_max_attempts(
+        self,
+        make_use_case: UseCaseFactory,
+        dead_letters: DeadLetterRepository,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(max_failed_attempts=1), dead_letters=dead_letters
+        )
+        _ = await dead_letters.record(
+            Video(deleted=False, slug="a", yt_id="a"),
+            "MetaRepositoryError",
+            datetime.now(UTC) - timedelta(minutes=1),
+        )
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(total_count=0, videos=[]),
+        )
+        mock_is_exists = mocker.spy(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+        )
+
+        _ = await use_case.execute()
+
+        mock_is_exists.assert_not_awaited()
+
+    async def test_pipeline_retries_first(
+        self,
+        make_use_case: UseCaseFactory,
+        dead_letters: DeadLetterRepository,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        use_case = make_use_case(
+            CleanerSettings(pipeline=PipelineSettings()), dead_letters=dead_letters
+        )
+        _ = await dead_letters.record(
+            Video(deleted=False, slug="a", yt_id="a"),
+            "MetaRepositoryError",
+            datetime.now(UTC) - timedelta(minutes=1),
+        )
+        _ = mocker.patch.object(
+            video_repository,
+            "get_all",
+            return_value=VideoList(
+                total_count=1, videos=[Video(deleted=False, slug="b", yt_id="b")]
+            ),
+        )
+        _ = mocker.patch.object(
+            use_case._meta_repo,  # pyright: ignore[reportPrivateUsage]
+            "is_exists",
+            side_effect=self.statuses(),
+        )
+
+        stats = await use_case.execute()
+
+        assert stats.unchanged == 2
+        assert await dead_letters.due(datetime.now(UTC), 5, 10) == []
@@ -0,0 +1,186 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_mock import MockFixture
+
+from videos_cleaner.adapters.repositories.mutation_journal import (
+    MutationJournalRepository,
+)
+from videos_cleaner.adapters.repositories.snapshot_repository import (
+    SnapshotRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoIsAlreadyDeletedError,
+    VideoRepositoryUnavailableError,
+)
+from videos_cleaner.domain.use_cases.mutation_flusher import MutationFlusher
+from videos_cleaner.entities.journal import MutationKind
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def state() -> StateDatabase:
+    return StateDatabase()
+
+
+@pytest.fixture
+def journal(state: StateDatabase) -> MutationJournalRepository:
+    return MutationJournalRepository(state, "http://test")
+
+
+@pytest.fixture
+def video_repository(mocker: MockFixture) -> IVideoRepository:
+    return mocker.AsyncMock(IVideoRepository)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def flusher(
+    video_repository: IVideoRepository,
+    journal: MutationJournalRepository,
+    state: StateDatabase,
+    clock: FakeClock,
+) -> MutationFlusher:
+    return MutationFlusher(
+        video_repository,
+        journal,
+        SnapshotRepository(state, "http://test"),
+        workers=2,
+        clock=clock,
+    )
+
+
+class TestMutationFlusher:
+    async def test_apply(
+        self,
+        flusher: MutationFlusher,
+        journal: MutationJournalRepository,
+        video_repository: IVideoRepository,
+        mocker: MockFixture,
+    ) -> None:
+        await journal.append("a", MutationKind.RESTORE, NOW)
+        await journal.append("b", MutationKind.HIDE, NOW)
+        await journal.append("c", MutationKind.DELETE, NOW)
+
+        assert await flusher.flush_due() == 3
+
+        video_repository.restore.assert_awaited_once_with("a")  # pyright: ignore[reportAttributeAccessIssue]
+        video_repository.delete.assert_has_awaits(  # pyright: ignore[reportAttributeAccessIssue]
+            [
+                mocker.call("b", temporary=True),
+                mocker.call("c", temporary=False),
+            ],
+            any_order=True,
+        )
+        assert flusher.stats.applied == 3
+        assert await journal.pending() == 0
+
+    async def test_conflict_is_reconciled(
+        self,
+        flusher: MutationFlusher,
+        journal: MutationJournalRepository,
+        video_repository: IVideoRepository,
+        state: StateDatabase,
+        mocker: MockFixture,
+    ) -> None:
+        _ = mocker.patch.object(
+            video_repository, "delete", side_effect=VideoIsAlreadyDeletedError
+        )
+        await journal.append("a", MutationKind.HIDE, NOW)
+
+        _ = await flusher.flush_due()
+
+        snapshots = await SnapshotRepository(state, "http://test").get_many(["a"])
+        assert snapshots["a"].deleted
+        assert flusher.stats.reconciled == 1
+        assert await journal.pending() == 0
+
+    async def test_retry_with_backoff(
+        self,
+        flusher: MutationFlusher,
+        journal: MutationJournalRepository,
+        video_repository: IVideoRepository,
+        clock: FakeClock,
+        mocker: MockFixture,
+    ) -> None:
+        restore = mocker.patch.object(
+            video_repository,
+            "restore",
+            side_effect=[VideoRepositoryUnavailableError(), None],
+        )
+        await journal.append("a", MutationKind.RESTORE, NOW)
+
+        _ = await flusher.flush_due()
+        clock.now += timedelta(seconds=1)
+        skipped = await flusher.flush_due()
+        clock.now += timedelta(seconds=1)
+        retried = await flusher.flush_due()
+
+        assert (skipped, retried) == (0, 1)
+        assert restore.await_count == 2
+        assert (flusher.stats.retried, flusher.stats.applied) == (1, 1)
+
+    async def test_dropped_after_attempts(
+        self,
+        flusher: MutationFlusher,
+        journal: MutationJournalRepository,
+        video_repository: IVideoRepository,
+        clock: FakeClock,
+        mocker: MockFixture,
+    ) -> None:
+        _ = mocker.patch.object(
+            video_repository, "restore", side_effect=VideoRepositoryUnavailableError
+        )
+        flusher.max_attempts = 2
+        await journal.append("a", MutationKind.RESTORE, NOW)
+
+        _ = await flusher.flush_due()
+        clock.now += timedelta(minutes=10)
+        _ = await flusher.flush_due()
+
+        assert flusher.stats.dropped == 1
+        assert await journal.pending() == 0
+
+    async def test_running_drains_journal(
+        self,
+        flusher: MutationFlusher,
+        journal: MutationJournalRepository,
+        video_repository: IVideoRepository,
+    ) -> None:
+        async with flusher.running():
+            await journal.append("a", MutationKind.HIDE, NOW)
+
+        video_repository.delete.assert_awaited_once_with("a", temporary=True)  # pyright: ignore[reportAttributeAccessIssue]
+        assert await journal.pending() == 0
+
+    async def test_replay(
+        self,
+        flusher: MutationFlusher,
+        journal: MutationJournalRepository,
+        video_repository: IVideoRepository,
+    ) -> None:
+        await journal.append("a", MutationKind.HIDE, NOW)
+        (entry,) = await journal.due(NOW, 10)
+        await journal.retry(entry, NOW + timedelta(hours=1), "Сервис недоступен")
+
+        async with flusher.running(replay=True):
+            pass
+
+        video_repository.delete.assert_awaited_once_with("a", temporary=True)  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,199 @@
+import asyncio
+
+import pytest
+
+from videos_cleaner.domain.use_cases.pipeline import (
+    Priority,
+    PriorityLimiter,
+    Stage,
+    run_pipeline,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class StageError(Exception):
+    pass
+
+
+class TestPipeline:
+    async def test_items_pass_all_stages(self) -> None:
+        results: list[int] = []
+
+        async def double(item: int) -> None:
+            await asyncio.sleep(0)
+            await second.put(item * 2)
+
+        async def collect(item: int) -> None:
+            results.append(item)
+
+        first = Stage("double", double, workers=3, queue_size=2)
+        second = Stage("collect", collect, queue_size=1)
+
+        async def source() -> None:
+            for item in range(10):
+                await first.put(item)
+
+        await run_pipeline(source, [first, second])
+
+        assert sorted(results) == [item * 2 for item in range(10)]
+        assert first.metrics.processed == 10
+        assert second.metrics.processed == 10
+        assert first.metrics.max_depth <= 2
+        assert first.metrics.throughput > 0
+
+    async def test_handler_error(self) -> None:
+        async def fail(_item: int) -> None:
+            raise StageError
+
+        stage = Stage("fail", fail)
+
+        async def source() -> None:
+            await stage.put(1)
+
+        with pytest.raises(StageError):
+            await run_pipeline(source, [stage])
+
+
+class TestPriorityLimiter:
+    async def test_priority_order(self) -> None:
+        limiter = PriorityLimiter(1)
+        order: list[Priority] = []
+
+        async def request(priority: Priority) -> None:
+            async with limiter.slot(priority):
+                order.append(priority)
+                await asyncio.sleep(0)
+
+        async with asyncio.TaskGroup() as group, limiter.slot(Priority.PROBE):
+            for priority in (
+                Priority.PROBE,
+                Priority.HIDE,
+                Priority.RESTORE,
+                Priority.DELETE,
+            ):
+                _ = group.create_task(request(priority))
+            await asyncio.sleep(0)
+
+        assert order == [
+            Priority.RESTORE,
+            Priority.DELETE,
+            Priority.HIDE,
+            Priority.PROBE,
+        ]
+
+    async def test_capacity(self) -> None:
+        limiter = PriorityLimiter(2)
+        active = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal active, peak
+            async with limiter.slot(Priority.PROBE):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.001)
+                active -= 1
+
+        _ = await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+
+    async def test_cancelled_waiter(self) -> None:
+        limiter = PriorityLimiter(1)
+        acquired: list[str] = []
+
+        async def request(name: str) -> None:
+            async with limiter.slot(Priority.PROBE):
+                acquired.append(name)
+
+        async with limiter.slot(Priority.PROBE):
+            cancelled = asyncio.create_task(request("cancelled"))
+            waiting = asyncio.create_task(request("waiting"))
+            await asyncio.sleep(0)
+            _ = cancelled.cancel()
+            await asyncio.sleep(0)
+        await waiting
+
+        assert acquired == ["waiting"]
+
+    async def test_cancelled_waiter_skipped_by_release(self) -> None:
+        limiter = PriorityLimiter(1)
+
+        async def request() -> None:
+            async with limiter.slot(Priority.PROBE):
+                pass
+
+        async with limiter.slot(Priority.PROBE):
+            cancelled = asyncio.create_task(request())
+            await asyncio.sleep(0)
+            _ = cancelled.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        async with asyncio.timeout(1):
+            await request()
+
+    async def test_stage_lanes(self) -> None:
+        limiter = PriorityLimiter(1)
+        order: list[str] = []
+
+        async def handle(item: str) -> None:
+            async with (restore if item == "restore" else probe).request():
+                order.append(item)
+                await asyncio.sleep(0)
+
+        probe = Stage(
+            "probe", handle, workers=4, limiter=limiter, priority=Priority.PROBE
+        )
+        restore = Stage("restore", handle, limiter=limiter, priority=Priority.RESTORE)
+
+        async def source() -> None:
+            for item in range(4):
+                await probe.put(f"probe-{item}")
+            await restore.put("restore")
+
+        await run_pipeline(source, [probe, restore])
+
+        assert order.index("restore") == 1
+        assert restore.metrics.max_wait >= 0
+
+    async def test_slot_released_before_forwarding(self) -> None:
+        limiter = PriorityLimiter(2)
+        results: list[int] = []
+
+        async def probe_item(item: int) -> None:
+            async with probe.request():
+                await asyncio.sleep(0)
+            await fallback.put(item)
+
+        async def fallback_item(item: int) -> None:
+            async with fallback.request():
+                await asyncio.sleep(0)
+            results.append(item)
+
+        probe = Stage(
+            "probe",
+            probe_item,
+            workers=4,
+            queue_size=1,
+            limiter=limiter,
+            priority=Priority.PROBE,
+        )
+        fallback = Stage(
+            "fallback",
+            fallback_item,
+            workers=2,
+            queue_size=1,
+            limiter=limiter,
+            priority=Priority.PROBE,
+        )
+
+        async def source() -> None:
+            for item in range(20):
+                await probe.put(item)
+
+        async with asyncio.timeout(5):
+            await run_pipeline(source, [probe, fallback])
+
+        assert sorted(results) == list(range(20))
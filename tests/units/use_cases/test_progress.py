@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from videos_cleaner.domain.use_cases.progress import ProgressReporter
+from videos_cleaner.entities.cleaner import ProgressSnapshot, VideoCleanerStats
+
+pytestmark = pytest.mark.anyio
+
+
+class TestProgressReporter:
+    def test_smoothed_rate_and_eta(self) -> None:
+        reporter = ProgressReporter(
+            lambda _: None,
+            smoothing=0.5,
+            in_flight=lambda: {"www.youtube.com": 3},
+            target="http://test",
+        )
+        stats = VideoCleanerStats(total_count=100)
+        reporter.start(0.0)
+
+        stats.unchanged = 10
+        first = reporter.snapshot(stats, None, 1.0)
+        stats.unchanged = 40
+        second = reporter.snapshot(stats, None, 2.0)
+
+        assert first.rate == 10
+        assert second.rate == 20
+        assert second.eta == 3
+        assert second.fraction == 0.4
+        assert second.elapsed == 2
+        assert second.in_flight == {"www.youtube.com": 3}
+        assert second.counters["unchanged"] == 40
+
+    def test_limit_caps_expected(self) -> None:
+        reporter = ProgressReporter(lambda _: None)
+        reporter.start(0.0)
+
+        unknown = reporter.snapshot(VideoCleanerStats(), None, 1.0)
+        limited = reporter.snapshot(VideoCleanerStats(total_count=100), 20, 2.0)
+
+        assert unknown.expected is None
+        assert unknown.eta is None
+        assert unknown.fraction is None
+        assert limited.expected == 20
+
+    async def test_running(self) -> None:
+        snapshots: list[ProgressSnapshot] = []
+        reporter = ProgressReporter(snapshots.append, interval=0.01)
+        stats = VideoCleanerStats(total_count=2)
+
+        async with reporter.running(stats, None):
+            await asyncio.sleep(0.035)
+            stats.hidden = 2
+
+        assert len(snapshots) >= 3
+        assert not any(snapshot.finished for snapshot in snapshots[:-1])
+        assert snapshots[-1].finished
+        assert snapshots[-1].processed == 2
+        assert snapshots[-1].eta == 0
@@ -0,0 +1,213 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_mock import MockFixture
+
+from videos_cleaner.adapters.repositories.removal_repository import (
+    RemovalRepository,
+)
+from videos_cleaner.adapters.repositories.snapshot_repository import (
+    SnapshotRepository,
+)
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.adapters.repositories.work_queue import WorkQueueRepository
+from videos_cleaner.domain.interfaces.history_repository import IHistoryRepository
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+)
+from videos_cleaner.domain.interfaces.video_repository import (
+    IVideoRepository,
+    VideoRepositoryUnavailableError,
+)
+from videos_cleaner.domain.use_cases.queue_worker import QueueWorker, enqueue_pages
+from videos_cleaner.domain.use_cases.video_use_case import VideoCleanerUseCase
+from videos_cleaner.entities.video import Video, VideoList
+from videos_cleaner.entities.work import PageRange
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+LEASE = timedelta(minutes=5)
+CATALOGUE = [Video(deleted=False, slug=str(i), yt_id=str(i)) for i in range(120)]
+
+
+@pytest.fixture
+def video_repository(mocker: MockFixture) -> IVideoRepository:
+    async def get_all(offset: int = 0, *, limit: int = 50) -> VideoList:
+        await asyncio.sleep(0)
+        return VideoList(
+            total_count=len(CATALOGUE), videos=CATALOGUE[offset : offset + limit]
+        )
+
+    repo = mocker.AsyncMock(IVideoRepository)
+    repo.get_all.side_effect = get_all
+    return repo
+
+
+@pytest.fixture
+def state() -> StateDatabase:
+    return StateDatabase()
+
+
+@pytest.fixture
+def queue(state: StateDatabase) -> WorkQueueRepository:
+    return WorkQueueRepository(state, "http://test")
+
+
+@pytest.fixture
+def use_case(
+    mocker: MockFixture, video_repository: IVideoRepository, state: StateDatabase
+) -> VideoCleanerUseCase:
+    meta_repo = mocker.AsyncMock(IMetaRepository)
+    meta_repo.is_exists.return_value = ExistsStatus.EXISTS
+    meta_repo.hedge_counters.return_value = None
+    history_repo = mocker.AsyncMock(IHistoryRepository)
+    history_repo.get_many.return_value = {}
+    return VideoCleanerUseCase(
+        video_repository,
+        meta_repo,
+        None,
+        history_repo,
+        RemovalRepository(state),
+        SnapshotRepository(state),
+    )
+
+
+class TestEnqueuePages:
+    async def test_pages(
+        self, queue: WorkQueueRepository, video_repository: IVideoRepository
+    ) -> None:
+        pages = await enqueue_pages(queue, video_repository, batch_size=50)
+
+        assert pages == 3
+        leases = [await queue.lease("a", NOW, NOW + LEASE) for _ in range(3)]
+        assert [lease.page if lease else None for lease in leases] == [
+            PageRange(0, 50),
+            PageRange(50, 50),
+            PageRange(100, 20),
+        ]
+
+    async def test_limit(
+        self, queue: WorkQueueRepository, video_repository: IVideoRepository
+    ) -> None:
+        pages = await enqueue_pages(queue, video_repository, batch_size=50, limit=60)
+
+        assert pages == 2
+        assert (await queue.summary(NOW)).pending == 2
+
+
+class TestQueueWorker:
+    async def test_workers_share_queue(
+        self,
+        queue: WorkQueueRepository,
+        video_repository: IVideoRepository,
+        use_case: VideoCleanerUseCase,
+    ) -> None:
+        _ = await enqueue_pages(queue, video_repository, batch_size=10)
+        workers = [QueueWorker(queue, use_case, name) for name in ("a", "b", "c")]
+        for worker in workers:
+            worker.poll_interval = 0.01
+
+        results = await asyncio.gather(*(worker.execute() for worker in workers))
+
+        assert sum(stats.unchanged for stats in results) == len(CATALOGUE)
+        assert all(stats.unchanged for stats in results)
+        summary = await queue.summary(datetime.now(UTC))
+        assert summary.finished
+        assert summary.done == 12
+        assert summary.stats.unchanged == len(CATALOGUE)
+
+    async def test_reclaims_expired_lease(
+        self,
+        queue: WorkQueueRepository,
+        use_case: VideoCleanerUseCase,
+    ) -> None:
+        await queue.put_many([PageRange(0, 10)])
+        _ = await queue.lease("dead", NOW, NOW + 2 * LEASE)
+        times = iter(NOW + step * LEASE for step in range(10))
+        worker = QueueWorker(queue, use_case, "alive", clock=lambda: next(times))
+        worker.poll_interval = 0
+
+        stats = await worker.execute()
+
+        assert stats.unchanged == 10
+        assert (await queue.summary(NOW)).finished
+
+    async def test_error_retries_page(
+        self,
+        queue: WorkQueueRepository,
+        video_repository: IVideoRepository,
+        use_case: VideoCleanerUseCase,
+    ) -> None:
+        await queue.put_many([PageRange(0, 10)])
+        video_repository.get_all.side_effect = [  # pyright: ignore[reportAttributeAccessIssue]
+            VideoRepositoryUnavailableError,
+            VideoList(total_count=10, videos=CATALOGUE[:10]),
+        ]
+        worker = QueueWorker(queue, use_case, "a")
+        worker.retry_delay = timedelta(0)
+
+        stats = await worker.execute()
+
+        assert stats.unchanged == 10
+        assert (await queue.summary(NOW)).done == 1
+
+    def test_backoff(
+        self, queue: WorkQueueRepository, use_case: VideoCleanerUseCase
+    ) -> None:
+        worker = QueueWorker(queue, use_case, "a")
+
+        delays = [worker._backoff(attempts) for attempts in (1, 2, 3, 10)]  # pyright: ignore[reportPrivateUsage]
+
+        assert delays == [
+            timedelta(seconds=1),
+            timedelta(seconds=2),
+            timedelta(seconds=4),
+            timedelta(minutes=1),
+        ]
+
+    async def test_dead_letters_page(
+        self,
+        queue: WorkQueueRepository,
+        video_repository: IVideoRepository,
+        use_case: VideoCleanerUseCase,
+    ) -> None:
+        await queue.put_many([PageRange(0, 10), PageRange(10, 10)])
+        calls = 0
+
+        async def get_all(offset: int = 0, *, limit: int = 50) -> VideoList:
+            nonlocal calls
+            if offset == 0:
+                calls += 1
+                raise VideoRepositoryUnavailableError
+            return VideoList(total_count=20, videos=CATALOGUE[offset : offset + limit])
+
+        video_repository.get_all.side_effect = get_all  # pyright: ignore[reportAttributeAccessIssue]
+        worker = QueueWorker(queue, use_case, "a")
+        worker.max_attempts = 3
+        worker.retry_delay = timedelta(0)
+
+        stats = await worker.execute()
+
+        summary = await queue.summary(NOW)
+        assert calls == 3
+        assert stats.unchanged == 10
+        assert (summary.done, summary.failed) == (1, 1)
+        assert summary.finished
+
+    async def test_cancel_releases_lease(
+        self,
+        queue: WorkQueueRepository,
+        video_repository: IVideoRepository,
+        use_case: VideoCleanerUseCase,
+    ) -> None:
+        await queue.put_many([PageRange(0, 10)])
+        video_repository.get_all.side_effect = asyncio.CancelledError  # pyright: ignore[reportAttributeAccessIssue]
+        worker = QueueWorker(queue, use_case, "a")
+
+        with pytest.raises(asyncio.CancelledError):
+            _ = await worker.execute()
+
+        assert (await queue.summary(NOW)).pending == 1
@@ -0,0 +1,64 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from videos_cleaner.adapters.repositories.run_lock import RunLockRepository
+from videos_cleaner.adapters.repositories.state import StateDatabase
+from videos_cleaner.domain.use_cases.run_guard import RunGuard
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def lock() -> RunLockRepository:
+    return RunLockRepository(StateDatabase(), "http://test")
+
+
+def guard(lock: RunLockRepository, owner: str) -> RunGuard:
+    guard = RunGuard(lock, owner, clock=lambda: NOW)
+    guard.poll_interval = 0.01
+    return guard
+
+
+class TestRunGuard:
+    async def test_skip(self, lock: RunLockRepository) -> None:
+        first, second = guard(lock, "first"), guard(lock, "second")
+
+        lease = await first.acquire()
+        other = await second.acquire()
+
+        assert first.owns(lease)
+        assert not second.owns(other)
+        assert other.owner == "first"
+
+    async def test_wait(self, lock: RunLockRepository) -> None:
+        first, second = guard(lock, "first"), guard(lock, "second")
+        lease = await first.acquire()
+
+        async def finish() -> None:
+            async with first.holding(lease):
+                await asyncio.sleep(0.05)
+
+        releasing = asyncio.create_task(finish())
+        acquired = await second.acquire(wait=True)
+        await releasing
+
+        assert second.owns(acquired)
+
+    async def test_keep_alive(self, lock: RunLockRepository) -> None:
+        now = NOW
+        first = RunGuard(lock, "first", clock=lambda: now)
+        first.lease_time = timedelta(seconds=0.03)
+        second = RunGuard(lock, "second", clock=lambda: now)
+        lease = await first.acquire()
+
+        async with first.holding(lease):
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                now += timedelta(seconds=0.02)
+                assert not second.owns(await second.acquire())
+
+        assert second.owns(await second.acquire())
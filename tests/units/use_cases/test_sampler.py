@@ -0,0 +1,105 @@
+import pytest
+from pytest_mock import MockFixture
+
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    IMetaRepository,
+    MetaRepositoryError,
+    MetaRepositoryUnavailableError,
+)
+from videos_cleaner.domain.interfaces.video_repository import IVideoRepository
+from videos_cleaner.domain.use_cases.sampler import CatalogueSampler
+from videos_cleaner.entities.video import Video, VideoList
+
+pytestmark = pytest.mark.anyio
+
+STATUSES = {
+    "0": ExistsStatus.EXISTS,
+    "1": ExistsStatus.HIDDEN,
+    "2": ExistsStatus.REMOVED,
+}
+
+
+@pytest.fixture
+def video_repository(mocker: MockFixture) -> IVideoRepository:
+    async def get_all(offset: int = 0, *, limit: int = 50) -> VideoList:  # noqa: ARG001
+        slug = str(offset % 3)
+        return VideoList(
+            total_count=30, videos=[Video(slug=slug, yt_id=slug, deleted=False)]
+        )
+
+    repo = mocker.AsyncMock(spec=IVideoRepository)
+    repo.get_all.side_effect = get_all
+    return repo
+
+
+@pytest.fixture
+def meta_repository(mocker: MockFixture) -> IMetaRepository:
+    repo = mocker.AsyncMock(spec=IMetaRepository)
+    repo.is_exists.side_effect = STATUSES.get
+    return repo
+
+
+class TestCatalogueSampler:
+    async def test_sample(
+        self, video_repository: IVideoRepository, meta_repository: IMetaRepository
+    ) -> None:
+        sampler = CatalogueSampler(video_repository, meta_repository)
+
+        report = await sampler.execute(12, seed=1)
+
+        assert report.population == 30
+        assert report.size == 12
+        assert report.checked == 12
+        assert sum(report.counts.values()) == 12
+        offsets = [call.args[0] for call in video_repository.get_all.await_args_list]
+        assert len(set(offsets[1:])) == 12
+        assert all(0 <= offset < 30 for offset in offsets)
+
+    async def test_reproducible(
+        self, video_repository: IVideoRepository, meta_repository: IMetaRepository
+    ) -> None:
+        sampler = CatalogueSampler(video_repository, meta_repository)
+
+        first = await sampler.execute(10, seed=42)
+        second = await sampler.execute(10, seed=42)
+
+        assert first.counts == second.counts
+
+    async def test_whole_catalogue(
+        self, video_repository: IVideoRepository, meta_repository: IMetaRepository
+    ) -> None:
+        sampler = CatalogueSampler(video_repository, meta_repository)
+
+        report = await sampler.execute(100)
+
+        assert report.size == 30
+        assert report.counts == dict.fromkeys(ExistsStatus, 10)
+        estimate = report.estimate(ExistsStatus.HIDDEN)
+        assert estimate.low == estimate.high == pytest.approx(1 / 3)
+
+    async def test_fallback(
+        self,
+        mocker: MockFixture,
+        video_repository: IVideoRepository,
+        meta_repository: IMetaRepository,
+    ) -> None:
+        meta_repository.is_exists.side_effect = MetaRepositoryUnavailableError
+        data_api = mocker.AsyncMock(spec=IMetaRepository)
+        data_api.is_embeddable.return_value = False
+        sampler = CatalogueSampler(video_repository, meta_repository, data_api)
+
+        report = await sampler.execute(5)
+
+        assert report.counts[ExistsStatus.HIDDEN] == 5
+
+    async def test_failed(
+        self, video_repository: IVideoRepository, meta_repository: IMetaRepository
+    ) -> None:
+        meta_repository.is_exists.side_effect = MetaRepositoryError("Ошибка", 500)
+        sampler = CatalogueSampler(video_repository, meta_repository)
+
+        report = await sampler.execute(5)
+
+        assert report.failed == 5
+        assert report.checked == 0
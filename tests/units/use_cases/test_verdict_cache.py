@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockFixture
+
+from videos_cleaner.domain.interfaces.meta_repository import (
+    ExistsStatus,
+    MetaRepositoryError,
+)
+from videos_cleaner.domain.use_cases.verdict_cache import VerdictCache
+
+pytestmark = pytest.mark.anyio
+
+
+class TestVerdictCache:
+    async def test_single_check(self, mocker: MockFixture) -> None:
+        cache = VerdictCache()
+        check = mocker.AsyncMock(return_value=ExistsStatus.HIDDEN)
+
+        results = await asyncio.gather(
+            *(cache.get_or_check("test", check) for _ in range(3))
+        )
+
+        assert results == [ExistsStatus.HIDDEN] * 3
+        check.assert_awaited_once_with("test")
+        assert cache.hits == 2
+        assert len(cache) == 1
+
+    async def test_shared_error(self, mocker: MockFixture) -> None:
+        cache = VerdictCache()
+        check = mocker.AsyncMock(side_effect=MetaRepositoryError("Ошибка", 500))
+
+        results = await asyncio.gather(
+            *(cache.get_or_check("test", check) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, MetaRepositoryError) for result in results)
+        check.assert_awaited_once()
+
+    async def test_failures_not_cached(self, mocker: MockFixture) -> None:
+        cache = VerdictCache()
+        check = mocker.AsyncMock(
+            side_effect=[MetaRepositoryError("Ошибка", 500), None, ExistsStatus.HIDDEN]
+        )
+
+        with pytest.raises(MetaRepositoryError):
+            _ = await cache.get_or_check("test", check)
+        assert await cache.get_or_check("test", check) is None
+        assert await cache.get_or_check("test", check) == ExistsStatus.HIDDEN
+        assert await cache.get_or_check("test", check) == ExistsStatus.HIDDEN
+
+        assert check.await_count == 3
+        assert cache.hits == 1
+
+    async def test_fresh(self, mocker: MockFixture) -> None:
+        cache = VerdictCache()
+        check = mocker.AsyncMock(
+            side_effect=[ExistsStatus.REMOVED, ExistsStatus.EXISTS]
+        )
+
+        _ = await cache.get_or_check("test", check)
+        fresh = await cache.get_or_check("test", check, fresh=True)
+
+        assert fresh == ExistsStatus.EXISTS
+        assert await cache.get_or_check("test", check) == ExistsStatus.EXISTS
+        assert check.await_count == 2
+
+    def test_claim_observation(self) -> None:
+        cache = VerdictCache()
+
+        assert cache.claim_observation("test")
+        assert not cache.claim_observation("test")
+        assert cache.claim_observation("other")